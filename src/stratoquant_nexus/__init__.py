@@ -3,8 +3,20 @@
 Multi-layer architecture from data → signals → risk → execution.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from stratoquant_nexus.engine import TradingEngine
+if TYPE_CHECKING:
+    from stratoquant_nexus.engine import TradingEngine
 
 __all__ = ["TradingEngine", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the engine on first use so light tooling starts fast."""
+    if name == "TradingEngine":
+        from stratoquant_nexus.engine import TradingEngine
+
+        return TradingEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,218 @@
+"""Admission control and load shedding in front of the trading engine."""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from pydantic import BaseModel, Field
+
+from stratoquant_nexus.layers.l0_data import OHLCV
+
+if TYPE_CHECKING:
+    from stratoquant_nexus.engine import TradingEngine
+
+logger = structlog.get_logger()
+
+
+class AdmissionConfig(BaseModel):
+    """Configuration for the admission controller."""
+
+    max_staleness_seconds: float | None = Field(
+        default=5.0,
+        gt=0,
+        description="Drop updates that waited longer than this before a cycle "
+        "could take them (None to never drop)",
+    )
+
+
+class AdmissionStats(BaseModel):
+    """Admission and load-shedding counters."""
+
+    submitted: int = Field(default=0, description="Symbol updates submitted")
+    processed: int = Field(default=0, description="Symbol updates processed")
+    cycles: int = Field(default=0, description="Engine cycles run")
+    failed_cycles: int = Field(default=0, description="Engine cycles that raised")
+    coalesced: int = Field(
+        default=0, description="Updates superseded by a newer bar before processing"
+    )
+    dropped_stale: int = Field(
+        default=0, description="Updates dropped for exceeding the staleness budget"
+    )
+    pending: int = Field(default=0, description="Updates waiting for a cycle")
+    last_lag_seconds: float = Field(
+        default=0.0, description="Queueing delay of the oldest update in the last cycle"
+    )
+    max_lag_seconds: float = Field(default=0.0, description="Worst queueing delay")
+
+    @property
+    def shed(self) -> int:
+        """Get the total number of updates shed."""
+        return self.coalesced + self.dropped_stale
+
+
+class AdmissionController:
+    """Feed market data to an engine without letting it fall behind.
+
+    ``submit`` never blocks: each update (the candles of one symbol and
+    timeframe) replaces any pending update for the same symbol and timeframe,
+    so while a cycle runs only the newest bar per symbol is kept. When the
+    cycle finishes, everything pending runs as the next cycle, minus updates
+    that waited past ``max_staleness_seconds``. Queueing delay therefore
+    stays bounded by roughly one cycle time, however bursty the feed.
+
+    Example:
+        >>> admission = AdmissionController(engine)
+        >>> await admission.start()
+        >>> admission.submit(candles)  # from the feed handler
+        >>> await admission.stop()
+    """
+
+    def __init__(
+        self, engine: "TradingEngine", config: AdmissionConfig | None = None
+    ) -> None:
+        """Initialize the admission controller.
+
+        Args:
+            engine: Engine to feed (started separately)
+            config: Admission configuration
+        """
+        self.engine = engine
+        self.config = config or AdmissionConfig()
+        self._stats = AdmissionStats()
+        self._pending: dict[tuple[str, str], tuple[int, list[OHLCV]]] = {}
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+
+        self._shed_metric: Any = None
+        self._lag_metric: Any = None
+        if engine.config.enable_metrics:
+            registry = engine.metrics
+            self._shed_metric = registry.counter(
+                "admission_shed_total", "Market data updates shed", ("reason",)
+            )
+            self._lag_metric = registry.gauge(
+                "admission_lag_seconds", "Queueing delay of the last admitted cycle"
+            )
+            registry.gauge(
+                "queue_depth", "Items waiting in engine queues", ("queue",)
+            ).set_function(lambda: len(self._pending), queue="admission_pending")
+
+    @property
+    def stats(self) -> AdmissionStats:
+        """Get a snapshot of the admission counters."""
+        return self._stats.model_copy(update={"pending": len(self._pending)})
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the admission loop is running."""
+        return self._task is not None
+
+    def submit(self, candles: list[OHLCV]) -> None:
+        """Queue market data for the next cycle.
+
+        Args:
+            candles: Candles for one or more symbols; each symbol and
+                timeframe's candles form one update
+        """
+        now = time.monotonic_ns()
+        updates: dict[tuple[str, str], list[OHLCV]] = {}
+        for candle in candles:
+            updates.setdefault((candle.symbol, candle.timeframe.value), []).append(
+                candle
+            )
+        for key, window in updates.items():
+            self._stats.submitted += 1
+            pending = self._pending.get(key)
+            if pending is not None:
+                self._shed("coalesced")
+                newest = max(c.timestamp for c in window)
+                if newest < max(c.timestamp for c in pending[1]):
+                    continue  # Out-of-order update older than the pending one
+            self._pending[key] = (now, window)
+        if updates:
+            self._idle.clear()
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start the admission loop."""
+        if self._task is not None:
+            return
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            "Admission controller started",
+            max_staleness_seconds=self.config.max_staleness_seconds,
+        )
+
+    async def stop(self, drain: bool = True) -> None:
+        """Stop the admission loop.
+
+        Args:
+            drain: Run a final cycle for pending updates first
+        """
+        if self._task is None:
+            return
+        if not drain:
+            self._pending.clear()
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        self._idle.set()
+        logger.info("Admission controller stopped", **self._stats.model_dump())
+
+    async def wait_idle(self) -> None:
+        """Wait until every submitted update has been processed or shed."""
+        await self._idle.wait()
+
+    def _shed(self, reason: str) -> None:
+        """Count a shed update."""
+        if reason == "coalesced":
+            self._stats.coalesced += 1
+        else:
+            self._stats.dropped_stale += 1
+        if self._shed_metric is not None:
+            self._shed_metric.inc(reason=reason)
+
+    async def _run(self) -> None:
+        """Admission loop: run one cycle per batch of pending updates."""
+        budget = self.config.max_staleness_seconds
+        budget_ns = None if budget is None else int(budget * 1e9)
+        while True:
+            if not self._pending:
+                self._idle.set()
+                if self._stopping:
+                    return
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            batch, self._pending = self._pending, {}
+            now = time.monotonic_ns()
+            candles: list[OHLCV] = []
+            oldest = now
+            for arrival, window in batch.values():
+                if budget_ns is not None and now - arrival > budget_ns:
+                    self._shed("stale")
+                    continue
+                candles.extend(window)
+                oldest = min(oldest, arrival)
+                self._stats.processed += 1
+            if not candles:
+                continue
+
+            lag = (now - oldest) / 1e9
+            self._stats.last_lag_seconds = lag
+            self._stats.max_lag_seconds = max(self._stats.max_lag_seconds, lag)
+            if self._lag_metric is not None:
+                self._lag_metric.set(lag)
+            self._stats.cycles += 1
+            try:
+                await self.engine.process_cycle(candles)
+            except Exception as e:
+                self._stats.failed_cycles += 1
+                logger.error("Admitted cycle failed", error=str(e))
@@ -0,0 +1,339 @@
+"""Memory-mappable engine state checkpoints for warm restarts.
+
+A checkpoint file is a small JSON directory followed by 8-byte aligned
+sections::
+
+    file    = b"SQCK\\x01\\x00\\x00\\x00" | u64 header_length | header | sections
+    header  = JSON {"version", "created_at", "sections": {name: entry}}
+    entry   = {"kind": "array", "dtype", "offset", "count"}
+            | {"kind": "json", "offset", "length"}
+
+Array sections are read straight from the mapped file with
+``numpy.frombuffer``, so opening a checkpoint costs one ``mmap`` and a JSON
+parse regardless of its size. Candle histories are stored column by column
+(timestamps, symbol and timeframe codes, and the decimal fields as UTF-8
+strings so no precision is lost).
+
+Layers decide what to save by overriding ``BaseLayer.save_checkpoint`` and
+``BaseLayer.load_checkpoint``.
+"""
+
+import json
+import mmap
+import os
+import struct
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from stratoquant_nexus.layers.l0_data import OHLCV, Timeframe
+from stratoquant_nexus.utils.binary import from_micros, to_micros
+
+MAGIC = b"SQCK\x01\x00\x00\x00"
+
+_HEADER_LENGTH = struct.Struct("<Q")
+_ALIGN = 8
+_TIMEFRAMES = list(Timeframe)
+_TIMEFRAME_CODES = {timeframe: code for code, timeframe in enumerate(_TIMEFRAMES)}
+_DECIMAL_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+class CheckpointWriter:
+    """Collect checkpoint sections and serialize them.
+
+    Example:
+        >>> writer = CheckpointWriter()
+        >>> writer.add_candles("DataLayer.candles", candles)
+        >>> writer.add_json("RiskLayer.state", {"portfolio_value": "100000"})
+        >>> writer.write("engine.ckpt")
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty checkpoint."""
+        self._sections: dict[str, dict[str, Any]] = {}
+        self._chunks: list[bytes] = []
+        self._size = 0
+
+    def _append(self, data: bytes) -> int:
+        """Append an aligned chunk and return its offset."""
+        offset = self._size
+        padding = -len(data) % _ALIGN
+        self._chunks.append(data + b"\x00" * padding)
+        self._size += len(data) + padding
+        return offset
+
+    def _check_name(self, name: str) -> None:
+        """Reject duplicate section names."""
+        if name in self._sections:
+            raise ValueError(f"Duplicate checkpoint section: {name}")
+
+    def add_array(self, name: str, array: np.ndarray) -> None:
+        """Add a one-dimensional numpy array.
+
+        Args:
+            name: Section name
+            array: Array to store (converted to little-endian)
+
+        Raises:
+            ValueError: If the section name is taken
+        """
+        self._check_name(name)
+        array = np.ascontiguousarray(array)
+        dtype = array.dtype.newbyteorder("<")
+        self._sections[name] = {
+            "kind": "array",
+            "dtype": dtype.str,
+            "offset": self._append(array.astype(dtype, copy=False).tobytes()),
+            "count": len(array),
+        }
+
+    def add_strings(self, name: str, values: list[str]) -> None:
+        """Add a list of strings as an offsets array and a UTF-8 blob.
+
+        Args:
+            name: Section name
+            values: Strings to store
+        """
+        encoded = [value.encode() for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        self.add_array(f"{name}.offsets", offsets)
+        self.add_array(f"{name}.data", np.frombuffer(b"".join(encoded), np.uint8))
+
+    def add_json(self, name: str, value: Any) -> None:
+        """Add a JSON-serializable value.
+
+        Args:
+            name: Section name
+            value: Value to store
+
+        Raises:
+            ValueError: If the section name is taken
+        """
+        self._check_name(name)
+        data = json.dumps(value, separators=(",", ":")).encode()
+        self._sections[name] = {
+            "kind": "json",
+            "offset": self._append(data),
+            "length": len(data),
+        }
+
+    def add_candles(self, name: str, candles: list[OHLCV]) -> None:
+        """Add candles as columns.
+
+        Args:
+            name: Section name prefix
+            candles: Candles to store, in order
+        """
+        symbols: dict[str, int] = {}
+        timestamps = np.empty(len(candles), dtype=np.int64)
+        aware = np.empty(len(candles), dtype=np.uint8)
+        codes = np.empty(len(candles), dtype=np.uint32)
+        timeframes = np.empty(len(candles), dtype=np.uint8)
+        for i, candle in enumerate(candles):
+            aware[i] = candle.timestamp.tzinfo is not None
+            timestamps[i] = to_micros(candle.timestamp)
+            codes[i] = symbols.setdefault(candle.symbol, len(symbols))
+            timeframes[i] = _TIMEFRAME_CODES[candle.timeframe]
+        self.add_json(f"{name}.symbols", list(symbols))
+        self.add_array(f"{name}.timestamp", timestamps)
+        self.add_array(f"{name}.aware", aware)
+        self.add_array(f"{name}.symbol", codes)
+        self.add_array(f"{name}.timeframe", timeframes)
+        for field in _DECIMAL_FIELDS:
+            self.add_strings(
+                f"{name}.{field}", [str(getattr(c, field)) for c in candles]
+            )
+
+    def to_bytes(self) -> bytes:
+        """Serialize the checkpoint.
+
+        Returns:
+            Complete file contents
+        """
+        header = json.dumps(
+            {
+                "version": 1,
+                "created_at": datetime.now(UTC).isoformat(),
+                "sections": self._sections,
+            },
+            separators=(",", ":"),
+        ).encode()
+        header += b" " * (-len(header) % _ALIGN)
+        return b"".join(
+            [MAGIC, _HEADER_LENGTH.pack(len(header)), header, *self._chunks]
+        )
+
+    def write(self, path: str | Path) -> None:
+        """Write the checkpoint atomically (temporary file, fsync, rename).
+
+        Args:
+            path: Checkpoint file
+        """
+        write_atomic(Path(path), self.to_bytes())
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace a file's contents atomically.
+
+    Args:
+        path: Destination file
+        data: New contents
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class Checkpoint:
+    """Read-only, memory-mapped view of a checkpoint file.
+
+    Example:
+        >>> with Checkpoint.open("engine.ckpt") as checkpoint:
+        ...     candles = checkpoint.candles("DataLayer.candles")
+    """
+
+    def __init__(self, buffer: mmap.mmap | bytes, path: Path | None = None) -> None:
+        """Initialize the view.
+
+        Args:
+            buffer: Checkpoint contents
+            path: File the contents were mapped from
+
+        Raises:
+            ValueError: If the contents are not a checkpoint
+        """
+        if bytes(buffer[: len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a StratoQuant checkpoint")
+        (length,) = _HEADER_LENGTH.unpack_from(buffer, len(MAGIC))
+        start = len(MAGIC) + _HEADER_LENGTH.size
+        header = json.loads(bytes(buffer[start : start + length]))
+        self.path = path
+        self.created_at = datetime.fromisoformat(header["created_at"])
+        self._sections: dict[str, dict[str, Any]] = header["sections"]
+        self._data_start = start + length
+        self._buffer = buffer
+
+    @classmethod
+    def open(cls, path: str | Path) -> "Checkpoint":
+        """Map a checkpoint file.
+
+        Args:
+            path: Checkpoint file
+
+        Returns:
+            Checkpoint view (close it when done)
+        """
+        path = Path(path)
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, path)
+
+    def close(self) -> None:
+        """Unmap the file."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> "Checkpoint":
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Unmap the file on exit."""
+        self.close()
+
+    def __contains__(self, name: object) -> bool:
+        """Check if a section exists."""
+        return name in self._sections or f"{name}.symbols" in self._sections
+
+    @property
+    def names(self) -> list[str]:
+        """Get the section names."""
+        return list(self._sections)
+
+    def array(self, name: str) -> np.ndarray:
+        """Get an array section without copying.
+
+        The array is only valid while the checkpoint is open.
+
+        Args:
+            name: Section name
+
+        Returns:
+            Read-only array backed by the mapped file
+        """
+        entry = self._sections[name]
+        return np.frombuffer(
+            self._buffer,
+            dtype=np.dtype(entry["dtype"]),
+            count=entry["count"],
+            offset=self._data_start + entry["offset"],
+        )
+
+    def strings(self, name: str) -> list[str]:
+        """Get a string list section.
+
+        Args:
+            name: Section name
+
+        Returns:
+            Stored strings
+        """
+        offsets = self.array(f"{name}.offsets").tolist()
+        blob = self.array(f"{name}.data").tobytes().decode()
+        if blob.isascii():
+            return [blob[a:b] for a, b in zip(offsets, offsets[1:], strict=False)]
+        data = blob.encode()
+        return [data[a:b].decode() for a, b in zip(offsets, offsets[1:], strict=False)]
+
+    def json(self, name: str) -> Any:
+        """Get a JSON section.
+
+        Args:
+            name: Section name
+
+        Returns:
+            Stored value
+        """
+        entry = self._sections[name]
+        start = self._data_start + entry["offset"]
+        return json.loads(bytes(self._buffer[start : start + entry["length"]]))
+
+    def candles(self, name: str) -> list[OHLCV]:
+        """Get a candle section.
+
+        Args:
+            name: Section name prefix used with ``add_candles``
+
+        Returns:
+            Candles in stored order
+        """
+        symbols = self.json(f"{name}.symbols")
+        timestamps = self.array(f"{name}.timestamp").tolist()
+        aware = self.array(f"{name}.aware").tolist()
+        codes = self.array(f"{name}.symbol").tolist()
+        timeframes = self.array(f"{name}.timeframe").tolist()
+        columns = [self.strings(f"{name}.{field}") for field in _DECIMAL_FIELDS]
+        candles = []
+        for i, ts in enumerate(timestamps):
+            # Values come from validated candles, so skip re-validation
+            candles.append(
+                OHLCV.model_construct(
+                    timestamp=from_micros(ts, bool(aware[i])),
+                    open=Decimal(columns[0][i]),
+                    high=Decimal(columns[1][i]),
+                    low=Decimal(columns[2][i]),
+                    close=Decimal(columns[3][i]),
+                    volume=Decimal(columns[4][i]),
+                    symbol=symbols[codes[i]],
+                    timeframe=_TIMEFRAMES[timeframes[i]],
+                )
+            )
+        return candles
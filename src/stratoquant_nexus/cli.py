@@ -1,32 +1,125 @@
-"""Command-line interface for StratoQuant Nexus."""
+"""Command-line interface for StratoQuant Nexus.
 
-import asyncio
+Heavy modules (the engine, layers, pydantic settings) are imported inside
+the commands that need them, so light commands start instantly.
+"""
+
+import argparse
 import sys
+from typing import TYPE_CHECKING
 
-import structlog
+from stratoquant_nexus import __version__
 
-from stratoquant_nexus import TradingEngine
-from stratoquant_nexus.utils import get_settings, setup_logging
+if TYPE_CHECKING:
+    from stratoquant_nexus.engine import TradingEngine
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     """Main entry point for the CLI.
 
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(prog="stratoquant", description=__doc__)
+    parser.add_argument("--version", action="version", version=__version__)
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("run", help="Run the trading engine (default)")
+    imports = commands.add_parser(
+        "imports", help="Show where package import time is spent"
+    )
+    imports.add_argument(
+        "module",
+        nargs="?",
+        default="stratoquant_nexus.engine",
+        help="Module to import (default: %(default)s)",
+    )
+    imports.add_argument(
+        "--top", type=int, default=15, help="Number of modules to list"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "imports":
+        return _report_imports(args.module, args.top)
+    return _run()
+
+
+def _report_imports(module: str, top: int) -> int:
+    """Print an import-time breakdown for a module.
+
+    Args:
+        module: Module to import in a fresh interpreter
+        top: Number of slowest modules to list
+
+    Returns:
+        Exit code
+    """
+    from stratoquant_nexus.utils.importtime import measure_imports, package_totals
+
+    try:
+        timings = measure_imports(module)
+    except (ValueError, RuntimeError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    total = sum(t.self_us for t in timings)
+    print(f"import {module}: {total / 1000:.1f} ms, {len(timings)} modules")
+    print("\nBy package (self time):")
+    for package, micros in list(package_totals(timings).items())[:top]:
+        print(f"  {micros / 1000:9.1f} ms  {package}")
+    print("\nSlowest modules (cumulative):")
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        print(
+            f"  {timing.cumulative_us / 1000:9.1f} ms"
+            f"  {timing.self_us / 1000:7.1f} ms self  {timing.module}"
+        )
+    return 0
+
+
+def _run() -> int:
+    """Run the trading engine until interrupted.
+
     Returns:
         Exit code
     """
+    import asyncio
+
+    import structlog
+
+    from stratoquant_nexus.engine import EngineConfig, TradingEngine
+    from stratoquant_nexus.monitoring import MetricsServer
+    from stratoquant_nexus.utils import get_settings, setup_logging
+    from stratoquant_nexus.utils.log_sampling import HOT_PATH_SAMPLING
+    from stratoquant_nexus.utils.logging import shutdown_logging
+
     settings = get_settings()
-    setup_logging(log_level=settings.log_level)
+    setup_logging(
+        log_level=settings.log_level,
+        json_output=settings.log_json,
+        queued=settings.log_queued,
+        queue_size=settings.log_queue_size,
+        sampling=HOT_PATH_SAMPLING if settings.log_sample_hot_paths else None,
+    )
     logger = structlog.get_logger()
 
     logger.info(
         "Starting StratoQuant Nexus",
-        version="0.1.0",
+        version=__version__,
         paper_trading=settings.paper_trading,
     )
 
+    metrics_server = None
     try:
-        engine = TradingEngine()
+        engine = TradingEngine(EngineConfig(enable_metrics=settings.metrics_enabled))
+        if settings.metrics_enabled:
+            metrics_server = MetricsServer(
+                engine.metrics,
+                host=settings.metrics_host,
+                port=settings.metrics_port,
+            )
+            metrics_server.start()
         asyncio.run(_run_engine(engine))
         return 0
     except KeyboardInterrupt:
@@ -35,24 +128,51 @@ def main() -> int:
     except Exception as e:
         logger.error("Fatal error", error=str(e))
         return 1
+    finally:
+        if metrics_server is not None:
+            metrics_server.stop()
+        shutdown_logging()
 
 
-async def _run_engine(engine: TradingEngine) -> None:
+async def _run_engine(engine: "TradingEngine") -> None:
     """Run the trading engine.
 
     Args:
         engine: Trading engine instance
     """
-    logger = structlog.get_logger()
+    import asyncio
+    from pathlib import Path
+
+    import structlog
 
-    await engine.start()
-    logger.info("Engine started, press Ctrl+C to stop")
+    from stratoquant_nexus.config_reload import ConfigReloader
+    from stratoquant_nexus.utils import get_settings
 
-    # Keep running until interrupted
+    logger = structlog.get_logger()
+    settings = get_settings()
+
+    reloader = None
     try:
+        if (Path(settings.config_dir) / "default.yaml").exists():
+            reloader = ConfigReloader(
+                engine,
+                settings.config_dir,
+                settings.environment,
+                settings.config_reload_interval_seconds,
+            )
+            # Applied before starting, so startup-only settings take effect
+            reloader.reload()
+        await engine.start()
+        if reloader is not None and settings.config_reload_interval_seconds > 0:
+            await reloader.start()
+        logger.info("Engine started, press Ctrl+C to stop")
+
+        # Keep running until interrupted
         while True:
             await asyncio.sleep(1)
     finally:
+        if reloader is not None:
+            await reloader.stop()
         await engine.stop()
 
 
@@ -0,0 +1,202 @@
+"""Hot reload of layer settings from the layered YAML configuration."""
+
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from stratoquant_nexus.utils.config import config_files, load_yaml_config
+
+if TYPE_CHECKING:
+    from stratoquant_nexus.engine import TradingEngine
+
+logger = structlog.get_logger()
+
+# YAML path -> layer config field, per core layer (found by result key)
+LAYER_FIELDS: dict[str, dict[tuple[str, ...], str]] = {
+    "market_data": {
+        ("layers", "data", "enabled"): "enabled",
+        ("layers", "data", "max_candles_per_symbol"): "max_candles",
+        ("trading", "symbols"): "symbols",
+        ("trading", "timeframes"): "timeframes",
+    },
+    "signals": {
+        ("layers", "signal", "enabled"): "enabled",
+        ("layers", "signal", "rsi_period"): "rsi_period",
+        ("layers", "signal", "rsi_overbought"): "rsi_overbought",
+        ("layers", "signal", "rsi_oversold"): "rsi_oversold",
+        ("layers", "signal", "sma_short_period"): "sma_short_period",
+        ("layers", "signal", "sma_long_period"): "sma_long_period",
+    },
+    "risk_assessments": {
+        ("layers", "risk", "enabled"): "enabled",
+        ("risk", "level"): "risk_level",
+        ("risk", "max_position_size_pct"): "max_position_size_pct",
+        ("risk", "max_portfolio_exposure_pct"): "max_portfolio_exposure_pct",
+        ("risk", "default_stop_loss_pct"): "default_stop_loss_pct",
+        ("risk", "default_take_profit_pct"): "default_take_profit_pct",
+        ("risk", "min_risk_reward_ratio"): "min_risk_reward_ratio",
+    },
+    "execution_reports": {
+        ("layers", "execution", "enabled"): "enabled",
+        ("layers", "execution", "simulate"): "simulate_execution",
+        ("execution", "default_order_type"): "default_order_type",
+        ("execution", "slippage_tolerance_pct"): "default_slippage_pct",
+        ("execution", "fee_rate"): "fee_rate",
+    },
+}
+
+_CORE_SECTIONS = {"data", "signal", "risk", "execution"}
+
+
+def _lookup(config: dict[str, Any], path: tuple[str, ...]) -> tuple[bool, Any]:
+    """Get a nested value.
+
+    Returns:
+        Whether the path exists, and its value
+    """
+    value: Any = config
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return False, None
+        value = value[key]
+    return True, value
+
+
+def layer_settings(
+    config: dict[str, Any], engine: "TradingEngine"
+) -> dict[str, dict[str, Any]]:
+    """Map a merged YAML configuration onto the engine's layers.
+
+    Core layers are matched by result key using ``LAYER_FIELDS``. Any other
+    entry under ``layers:`` is matched to a registered layer by name, with
+    its keys used as config field names as they are.
+
+    Args:
+        config: Merged YAML configuration
+        engine: Engine whose layers are configured
+
+    Returns:
+        Field values keyed by layer name
+    """
+    settings: dict[str, dict[str, Any]] = {}
+    for layer in engine.layers:
+        fields = {}
+        for path, field in LAYER_FIELDS.get(layer.result_key or "", {}).items():
+            found, value = _lookup(config, path)
+            if found:
+                fields[field] = value
+        if fields:
+            settings[layer.name] = fields
+    for name, fields in (config.get("layers") or {}).items():
+        if name not in _CORE_SECTIONS and isinstance(fields, dict):
+            settings.setdefault(name, {}).update(fields)
+    return settings
+
+
+class ConfigReloader:
+    """Watch the YAML configuration and apply changes to a running engine.
+
+    Files are polled for changes (modification time and size), so no extra
+    dependency or OS-specific watcher is needed. A change is validated as a
+    whole; an invalid file is logged and the running settings are kept.
+
+    Example:
+        >>> reloader = ConfigReloader(engine, "config", environment="production")
+        >>> reloader.reload()  # apply once at startup
+        >>> await reloader.start()
+    """
+
+    def __init__(
+        self,
+        engine: "TradingEngine",
+        config_dir: str | Path = "config",
+        environment: str | None = None,
+        poll_interval_seconds: float = 2.0,
+    ) -> None:
+        """Initialize the reloader.
+
+        Args:
+            engine: Engine whose layers are reconfigured
+            config_dir: Directory holding ``default.yaml``
+            environment: Environment overlay, e.g. ``production`` (optional)
+            poll_interval_seconds: Seconds between file checks
+        """
+        self.engine = engine
+        self.config_dir = Path(config_dir)
+        self.environment = environment or None
+        self.poll_interval_seconds = poll_interval_seconds
+        self._signature = self._file_signature()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def files(self) -> list[Path]:
+        """Get the watched files, lowest precedence first."""
+        return config_files(self.config_dir, self.environment)
+
+    def _file_signature(self) -> tuple[tuple[int, int] | None, ...]:
+        """Get modification time and size of each watched file."""
+        signature = []
+        for path in self.files:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def reload(self) -> dict[str, set[str]]:
+        """Load the configuration and apply it to the engine's layers.
+
+        Returns:
+            Names of the fields that changed, by layer
+
+        Raises:
+            KeyError: If the configuration names an unknown layer
+            ValueError: If the configuration is invalid
+        """
+        self._signature = self._file_signature()
+        config = load_yaml_config(self.config_dir, self.environment)
+        return self.engine.update_layer_configs(layer_settings(config, self.engine))
+
+    def check(self) -> dict[str, set[str]] | None:
+        """Reload if a watched file changed.
+
+        Returns:
+            Changed fields by layer, or None if no file changed
+        """
+        if self._file_signature() == self._signature:
+            return None
+        return self.reload()
+
+    async def start(self) -> None:
+        """Start watching the configuration files."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._watch())
+            logger.info(
+                "Config reloader started", files=[str(path) for path in self.files]
+            )
+
+    async def stop(self) -> None:
+        """Stop watching the configuration files."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _watch(self) -> None:
+        """Poll the files and apply changes."""
+        while True:
+            await asyncio.sleep(self.poll_interval_seconds)
+            try:
+                changed = self.check()
+            except (KeyError, ValueError) as e:
+                logger.error("Config reload rejected", error=str(e))
+                continue
+            if changed is not None:
+                logger.info(
+                    "Config reloaded",
+                    changed={name: sorted(keys) for name, keys in changed.items()},
+                )
@@ -1,25 +1,51 @@
 """Trading Engine - Main orchestrator for the multi-layer architecture."""
 
 import asyncio
+import time
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 import structlog
 from pydantic import BaseModel, Field
 
+from stratoquant_nexus.events import (
+    CycleCompleteEvent,
+    EngineEvent,
+    EventSubscription,
+    build_events,
+    event_class_for,
+    wants,
+)
 from stratoquant_nexus.layers import (
     DataLayer,
     ExecutionLayer,
     RiskLayer,
     SignalLayer,
 )
+from stratoquant_nexus.layers.base import BaseLayer, LayerConfig, LayerLevel
 from stratoquant_nexus.layers.l0_data import DataLayerConfig
 from stratoquant_nexus.layers.l1_signals import SignalLayerConfig
 from stratoquant_nexus.layers.l2_risk import RiskLayerConfig
 from stratoquant_nexus.layers.l3_execution import ExecutionLayerConfig
+from stratoquant_nexus.layers.registry import LayerRegistry, as_list
+from stratoquant_nexus.monitoring.engine_metrics import EngineMetrics
+from stratoquant_nexus.monitoring.latency import (
+    LatencyRecorder,
+    LatencySnapshot,
+    elapsed_ms,
+)
+from stratoquant_nexus.monitoring.metrics import MetricsRegistry
+from stratoquant_nexus.replay.recorder import CycleRecorder
 
 logger = structlog.get_logger()
 
+# Fields that place a layer in the chain; changing them needs a restart
+_STRUCTURAL_FIELDS = frozenset({"name", "level", "order", "independent", "depends_on"})
+# Fields read once when a layer is initialized; they cannot change while running
+_STARTUP_FIELDS = frozenset({"simulate_execution"})
+
 
 class EngineConfig(BaseModel):
     """Configuration for the trading engine."""
@@ -31,12 +57,47 @@ class EngineConfig(BaseModel):
     enable_execution_layer: bool = Field(
         default=True, description="Enable execution layer"
     )
+    enable_latency_tracking: bool = Field(
+        default=False,
+        description="Record per-layer, per-rule and venue latency histograms",
+    )
+    enable_metrics: bool = Field(
+        default=False,
+        description="Maintain Prometheus metrics (implies latency tracking)",
+    )
+    health_check_timeout_seconds: float = Field(
+        default=5.0, gt=0, description="Per-layer health check timeout"
+    )
+    record_path: str | None = Field(
+        default=None,
+        description="Capture every cycle's inputs and outputs to this file",
+    )
+    checkpoint_path: str | None = Field(
+        default=None,
+        description="Snapshot layer state to this file and restore it on start",
+    )
+    checkpoint_interval_seconds: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds between periodic checkpoints (0 to only save on stop)",
+    )
     data_config: DataLayerConfig | None = None
     signal_config: SignalLayerConfig | None = None
     risk_config: RiskLayerConfig | None = None
     execution_config: ExecutionLayerConfig | None = None
 
 
+class LayerHealth(BaseModel):
+    """Result of one layer's health check."""
+
+    healthy: bool = Field(..., description="Whether the layer reported healthy")
+    latency_ms: float = Field(..., description="Time the check took")
+    timed_out: bool = Field(
+        default=False, description="Whether the check exceeded its timeout"
+    )
+    error: str | None = Field(default=None, description="Error raised by the check")
+
+
 class EngineStatus(BaseModel):
     """Current status of the trading engine."""
 
@@ -91,6 +152,41 @@ class TradingEngine:
         self._execution_layer = ExecutionLayer(
             self.config.execution_config or ExecutionLayerConfig(name="ExecutionLayer")
         )
+        self._latency = LatencyRecorder(
+            enabled=self.config.enable_latency_tracking or self.config.enable_metrics
+        )
+        self._layers = LayerRegistry()
+        for layer, enabled in (
+            (self._data_layer, self.config.enable_data_layer),
+            (self._signal_layer, self.config.enable_signal_layer),
+            (self._risk_layer, self.config.enable_risk_layer),
+            (self._execution_layer, self.config.enable_execution_layer),
+        ):
+            layer.set_latency_recorder(self._latency)
+            if enabled:
+                self._layers.register(layer)
+        self._metrics = MetricsRegistry(namespace="stratoquant")
+        self._engine_metrics: EngineMetrics | None = None
+        if self.config.enable_metrics:
+            self._engine_metrics = EngineMetrics(self._metrics, self._latency)
+            self._engine_metrics.attach_execution_layer(self._execution_layer)
+        # VWAP algorithms size child orders from the L0 volume profile
+        self._execution_layer.set_volume_profile_source(
+            self._data_layer.get_volume_profile
+        )
+        # Child orders of worked parents fill between cycles
+        if self.config.enable_risk_layer:
+            self._execution_layer.set_fill_listener(self._risk_layer.apply_fills)
+        self._recorder: CycleRecorder | None = None
+        if self.config.record_path:
+            self._recorder = CycleRecorder(self.config.record_path)
+        self._cycle = 0
+        self._subscriptions: list[EventSubscription] = []
+        self._checkpoint_task: asyncio.Task[None] | None = None
+        self._cycles_in_flight = 0
+        self._idle = asyncio.Event()  # Set while no cycle is in flight
+        self._idle.set()
+        self._pending_configs: dict[str, tuple[LayerConfig, set[str]]] = {}
 
     @property
     def status(self) -> EngineStatus:
@@ -102,35 +198,174 @@ class TradingEngine:
         """Check if engine is running."""
         return self._running
 
+    @property
+    def latency(self) -> LatencyRecorder:
+        """Get the latency recorder shared by the engine and its layers."""
+        return self._latency
+
+    def latency_snapshot(self, prefix: str = "") -> dict[str, LatencySnapshot]:
+        """Get p50/p99/p999 latency summaries.
+
+        Histograms are named ``engine.cycle``, ``layer.<LayerName>``,
+        ``risk.rule.<rule>``, ``venue.<exchange>.<call>`` and
+        ``order.create_to_report``.
+
+        Args:
+            prefix: Only include histograms whose name starts with this
+
+        Returns:
+            Snapshots keyed by histogram name (empty when tracking is off)
+        """
+        return self._latency.snapshot(prefix)
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Get the metrics registry (populated when ``enable_metrics`` is set)."""
+        return self._metrics
+
+    @property
+    def layers(self) -> LayerRegistry:
+        """Get the registry of enabled layers, in processing order."""
+        return self._layers
+
+    def add_layer(self, layer: BaseLayer) -> None:
+        """Insert an additional layer into the processing chain.
+
+        The layer's ``level`` (L0-L100) and ``order`` place it in the chain;
+        e.g. level ``LayerLevel.SIGNALS`` with ``order=1`` receives the
+        signals before the risk layer does.
+
+        Args:
+            layer: Layer to add
+
+        Raises:
+            RuntimeError: If the engine is running
+            ValueError: If the layer clashes with a registered one
+        """
+        if self._running:
+            raise RuntimeError("Cannot add layers while the engine is running")
+        layer.set_latency_recorder(self._latency)
+        self._layers.register(layer)
+        self._status.total_layers += 1
+
+    def update_layer_configs(
+        self, changes: dict[str, dict[str, Any]]
+    ) -> dict[str, set[str]]:
+        """Validate new settings for running layers and swap them in.
+
+        All layers are validated before any is changed. The swap happens
+        immediately when no cycle is in flight, otherwise as soon as the
+        in-flight cycles finish, so a cycle never sees a mix of settings.
+
+        Args:
+            changes: New field values keyed by layer name
+
+        Returns:
+            Names of the fields that changed, by layer (unchanged layers omitted)
+
+        Raises:
+            KeyError: If a layer is not registered
+            ValueError: If a field is unknown, fixes the layer's place in the
+                chain, is only read at startup while the engine is running, or
+                fails validation
+        """
+        updates: dict[str, tuple[LayerConfig, set[str]]] = {}
+        for name, fields in changes.items():
+            layer = self._layers.get(name)
+            if layer is None:
+                raise KeyError(f"Unknown layer: {name}")
+            current = self._pending_configs.get(name, (layer.config, set()))[0]
+            config_cls = type(current)
+            unknown = fields.keys() - config_cls.model_fields.keys()
+            if unknown:
+                raise ValueError(f"Unknown {name} settings: {sorted(unknown)}")
+            fixed = (
+                _STRUCTURAL_FIELDS | _STARTUP_FIELDS
+                if self._running
+                else _STRUCTURAL_FIELDS
+            )
+            structural = sorted(
+                field
+                for field in fields.keys() & fixed
+                if fields[field] != getattr(current, field)
+            )
+            if structural:
+                raise ValueError(
+                    f"Cannot change {structural} of {name} without a restart"
+                )
+            config = config_cls.model_validate({**current.model_dump(), **fields})
+            changed = {
+                field
+                for field in config_cls.model_fields
+                if getattr(config, field) != getattr(layer.config, field)
+            }
+            if changed:
+                updates[name] = (config, changed)
+
+        self._pending_configs.update(updates)
+        if not self._cycles_in_flight:
+            self._apply_pending_configs()
+        return {name: changed for name, (_, changed) in updates.items()}
+
+    def _apply_pending_configs(self) -> None:
+        """Swap staged layer configurations in."""
+        if not self._pending_configs:
+            return
+        pending, self._pending_configs = self._pending_configs, {}
+        for name, (config, changed) in pending.items():
+            layer = self._layers.get(name)
+            if layer is None:
+                continue
+            layer.reconfigure(config, changed)
+            if "enabled" in changed:
+                self._layers.invalidate()
+            logger.info("Layer reconfigured", layer=name, changed=sorted(changed))
+
+    def _begin_cycle(self) -> int:
+        """Mark a cycle as in flight, applying staged configs first.
+
+        Returns:
+            The new cycle number
+        """
+        if not self._cycles_in_flight:
+            self._apply_pending_configs()
+        self._cycles_in_flight += 1
+        self._idle.clear()
+        self._cycle += 1
+        return self._cycle
+
+    def _end_cycle(self) -> None:
+        """Mark a cycle as finished, applying staged configs once idle."""
+        self._cycles_in_flight -= 1
+        if not self._cycles_in_flight:
+            self._apply_pending_configs()
+            self._idle.set()
+
     async def start(self) -> None:
         """Start the trading engine and initialize all layers."""
         logger.info("Starting trading engine", name=self.config.name)
 
-        layers_initialized = 0
+        await self._layers.initialize()
+        layers_initialized = len(self._layers)
+        logger.info("Layers initialized", layers=[layer.name for layer in self._layers])
 
-        if self.config.enable_data_layer:
-            await self._data_layer.initialize()
-            layers_initialized += 1
-            logger.info("Data layer initialized")
-
-        if self.config.enable_signal_layer:
-            await self._signal_layer.initialize()
-            layers_initialized += 1
-            logger.info("Signal layer initialized")
-
-        if self.config.enable_risk_layer:
-            await self._risk_layer.initialize()
-            layers_initialized += 1
-            logger.info("Risk layer initialized")
+        # Journal-recovered positions below override checkpointed ones
+        self.restore_checkpoint()
 
         if self.config.enable_execution_layer:
-            await self._execution_layer.initialize()
-            layers_initialized += 1
-            logger.info("Execution layer initialized")
+            recovered = self._execution_layer.recovered_positions
+            if recovered and self.config.enable_risk_layer:
+                self._risk_layer.restore_positions(recovered)
+                logger.info("Risk positions restored", positions=len(recovered))
+
+        if self._recorder is not None:
+            self._recorder.open()
 
         self._running = True
         self._status.running = True
         self._status.layers_initialized = layers_initialized
+        if self.config.checkpoint_path and self.config.checkpoint_interval_seconds:
+            self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
 
         logger.info(
             "Trading engine started",
@@ -141,17 +376,129 @@ class TradingEngine:
         """Stop the trading engine and shutdown all layers."""
         logger.info("Stopping trading engine")
 
-        await asyncio.gather(
-            self._data_layer.shutdown(),
-            self._signal_layer.shutdown(),
-            self._risk_layer.shutdown(),
-            self._execution_layer.shutdown(),
-        )
+        if self._checkpoint_task is not None:
+            self._checkpoint_task.cancel()
+            await asyncio.gather(self._checkpoint_task, return_exceptions=True)
+            self._checkpoint_task = None
+        if self._running and self.config.checkpoint_path:
+            await self.save_checkpoint()
+
+        await asyncio.gather(*(layer.shutdown() for layer in self._layers))
+        if self._recorder is not None:
+            self._recorder.close()
+        for subscription in list(self._subscriptions):
+            subscription.close()
 
         self._running = False
         self._status.running = False
         logger.info("Trading engine stopped")
 
+    def build_checkpoint(self) -> bytes:
+        """Snapshot engine and layer state.
+
+        Runs synchronously on the event loop, so called while no cycle is in
+        flight (as ``save_checkpoint`` does) the snapshot matches a cycle
+        boundary.
+
+        Returns:
+            Checkpoint file contents
+        """
+        from stratoquant_nexus.checkpoint import CheckpointWriter
+
+        writer = CheckpointWriter()
+        writer.add_json(
+            "engine.state",
+            {
+                "cycle": self._cycle,
+                "signals_generated": self._status.signals_generated,
+                "orders_executed": self._status.orders_executed,
+            },
+        )
+        for layer in self._layers:
+            layer.save_checkpoint(writer)
+        return writer.to_bytes()
+
+    async def save_checkpoint(self, path: str | Path | None = None) -> Path:
+        """Write a checkpoint, off the event loop.
+
+        The snapshot waits until no cycle is in flight, so a stream must be
+        consumed or closed for it to complete.
+
+        Args:
+            path: Checkpoint file (defaults to ``checkpoint_path``)
+
+        Returns:
+            Path written
+
+        Raises:
+            ValueError: If no path is given or configured
+        """
+        from stratoquant_nexus.checkpoint import write_atomic
+
+        target = path or self.config.checkpoint_path
+        if not target:
+            raise ValueError("No checkpoint path configured")
+        while self._cycles_in_flight:
+            await self._idle.wait()
+        start = time.perf_counter_ns()
+        data = self.build_checkpoint()
+        await asyncio.to_thread(write_atomic, Path(target), data)
+        logger.debug(
+            "Checkpoint saved",
+            path=str(target),
+            size=len(data),
+            duration_ms=round(elapsed_ms(start), 3),
+        )
+        return Path(target)
+
+    def restore_checkpoint(self, path: str | Path | None = None) -> bool:
+        """Restore engine and layer state from a checkpoint.
+
+        Missing or unreadable checkpoints are logged and skipped, so a cold
+        start still works.
+
+        Args:
+            path: Checkpoint file (defaults to ``checkpoint_path``)
+
+        Returns:
+            True if state was restored
+        """
+        from stratoquant_nexus.checkpoint import Checkpoint
+
+        target = path or self.config.checkpoint_path
+        if not target or not Path(target).exists():
+            return False
+        start = time.perf_counter_ns()
+        try:
+            with Checkpoint.open(target) as checkpoint:
+                if "engine.state" in checkpoint:
+                    state = checkpoint.json("engine.state")
+                    self._cycle = state["cycle"]
+                    self._status.signals_generated = state["signals_generated"]
+                    self._status.orders_executed = state["orders_executed"]
+                for layer in self._layers:
+                    layer.load_checkpoint(checkpoint)
+                created_at = checkpoint.created_at
+        except Exception as e:
+            logger.warning("Checkpoint not restored", path=str(target), error=str(e))
+            return False
+        logger.info(
+            "Checkpoint restored",
+            path=str(target),
+            created_at=created_at.isoformat(),
+            duration_ms=round(elapsed_ms(start), 3),
+        )
+        return True
+
+    async def _checkpoint_loop(self) -> None:
+        """Save checkpoints periodically while the engine runs."""
+        while True:
+            await asyncio.sleep(self.config.checkpoint_interval_seconds)
+            try:
+                await self.save_checkpoint()
+            except Exception as e:
+                logger.error("Checkpoint failed", error=str(e))
+
     async def process_cycle(self, raw_data: Any) -> dict[str, list[Any]]:
         """Run a complete processing cycle through all layers.
 
@@ -164,58 +511,253 @@ class TradingEngine:
         if not self._running:
             raise RuntimeError("Engine is not running. Call start() first.")
 
+        self._begin_cycle()
+        cycle_start = self._latency.start()
         results: dict[str, list[Any]] = {
             "market_data": [],
             "signals": [],
             "risk_assessments": [],
             "execution_reports": [],
         }
+        try:
+            await self._run_chain(raw_data, results)
+        finally:
+            self._end_cycle()
+        self._finish_cycle(results, cycle_start)
+        if self._recorder is not None:
+            self._recorder.record(raw_data, results)
+        return results
 
-        # L0: Process raw data
-        if self.config.enable_data_layer:
-            market_data = await self._data_layer.process(raw_data)
-            results["market_data"] = [market_data]
-        else:
-            market_data = raw_data
-
-        # L1: Generate signals
-        if self.config.enable_signal_layer:
-            signals = await self._signal_layer.process(market_data)
-            results["signals"] = signals
-            self._status.signals_generated += len(signals)
-        else:
-            signals = []
-
-        # L2: Assess risk
-        if self.config.enable_risk_layer:
-            risk_assessments = await self._risk_layer.process(signals)
-            results["risk_assessments"] = risk_assessments
-        else:
-            risk_assessments = []
+    async def stream(
+        self, raw_data: Any, *event_types: type[EngineEvent]
+    ) -> AsyncIterator[EngineEvent]:
+        """Run a processing cycle, yielding typed events as layers produce them.
 
-        # L3: Execute orders
-        if self.config.enable_execution_layer:
-            execution_reports = await self._execution_layer.process(risk_assessments)
-            results["execution_reports"] = execution_reports
-            self._status.orders_executed += len(
-                [r for r in execution_reports if r.success]
-            )
+        Only events of the requested types are built and yielded, and the
+        next layer runs only when the consumer asks for more, so e.g. signals
+        can be acted on before risk assessment starts. Subscriptions receive
+        the cycle's events as with ``process_cycle``.
 
-        self._status.last_cycle_at = datetime.now(UTC)
+        Args:
+            raw_data: Raw market data to process
+            *event_types: Event types to yield (all if none given)
+
+        Yields:
+            Engine events, ending with a ``CycleCompleteEvent`` if requested
+
+        Raises:
+            RuntimeError: If the engine is not running
+        """
+        if not self._running:
+            raise RuntimeError("Engine is not running. Call start() first.")
+
+        cycle = self._begin_cycle()
+        cycle_start = self._latency.start()
+        results: dict[str, list[Any]] = {
+            "market_data": [],
+            "signals": [],
+            "risk_assessments": [],
+            "execution_reports": [],
+        }
+        try:
+            async for layer, output in self._layers.iter_run(raw_data, self._latency):
+                key = layer.result_key or layer.name
+                items = as_list(output)
+                results[key] = items
+                if self._subscriptions:
+                    self._publish(key, items)
+                if wants(event_types, event_class_for(key)):
+                    for event in build_events(cycle, key, items):
+                        if not event_types or isinstance(event, event_types):
+                            yield event
+        finally:
+            self._end_cycle()
+        complete = self._finish_cycle(results, cycle_start)
+        if self._recorder is not None:
+            self._recorder.record(raw_data, results)
+        if not event_types or CycleCompleteEvent in event_types:
+            yield complete
+
+    def subscribe(
+        self, *event_types: type[EngineEvent], maxsize: int = 0
+    ) -> EventSubscription:
+        """Receive events of the given types from every following cycle.
+
+        Args:
+            *event_types: Event types to receive (all if none given)
+            maxsize: Maximum queued events before the oldest are dropped
+                (0 for unbounded)
+
+        Returns:
+            Subscription to ``async for`` over; close it when done
+        """
+        subscription = EventSubscription(
+            event_types, maxsize, on_close=self._subscriptions.remove
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    async def process_signals(self, signals: list[Any]) -> dict[str, list[Any]]:
+        """Run signals produced elsewhere through the risk and execution layers.
+
+        Used when L0/L1 run outside this engine, e.g. in shard worker
+        processes feeding a central risk and execution engine.
+
+        Args:
+            signals: Trading signals to assess and execute
+
+        Returns:
+            Dictionary containing results from each layer
+        """
+        if not self._running:
+            raise RuntimeError("Engine is not running. Call start() first.")
+
+        self._begin_cycle()
+        cycle_start = self._latency.start()
+        results: dict[str, list[Any]] = {
+            "market_data": [],
+            "signals": signals,
+            "risk_assessments": [],
+            "execution_reports": [],
+        }
+        try:
+            if signals:
+                if self._subscriptions:
+                    self._publish("signals", signals)
+                await self._run_chain(signals, results, min_level=LayerLevel.RISK)
+        finally:
+            self._end_cycle()
+        self._finish_cycle(results, cycle_start)
         return results
 
+    async def _run_chain(
+        self, data: Any, results: dict[str, list[Any]], min_level: int = 0
+    ) -> None:
+        """Run the layer chain, publishing events when anyone subscribed.
+
+        Args:
+            data: Input for the first stage
+            results: Cycle results, updated in place
+            min_level: Skip stages below this level
+        """
+        if not self._subscriptions:
+            await self._layers.run(data, results, self._latency, min_level)
+            return
+        async for layer, output in self._layers.iter_run(
+            data, self._latency, min_level
+        ):
+            key = layer.result_key or layer.name
+            results[key] = as_list(output)
+            self._publish(key, results[key])
+
+    def _publish(self, result_key: str, items: list[Any]) -> None:
+        """Deliver a layer's output items to matching subscriptions.
+
+        Args:
+            result_key: The layer's result key
+            items: Output items
+        """
+        cls = event_class_for(result_key)
+        subscriptions = [s for s in self._subscriptions if wants(s.event_types, cls)]
+        if not subscriptions or not items:
+            return
+        for event in build_events(self._cycle, result_key, items):
+            for subscription in subscriptions:
+                if subscription.accepts(event):
+                    subscription.put(event)
+
+    def _finish_cycle(
+        self, results: dict[str, list[Any]], cycle_start: int
+    ) -> CycleCompleteEvent:
+        """Update status, latency and metrics after a cycle.
+
+        Args:
+            results: Completed cycle results
+            cycle_start: Cycle start from the latency recorder
+
+        Returns:
+            The cycle's completion event (already published)
+        """
+        signals = results["signals"]
+        execution_reports = results["execution_reports"]
+        orders_executed = len([r for r in execution_reports if r.success])
+        if orders_executed and self.config.enable_risk_layer:
+            self._risk_layer.apply_fills(execution_reports)
+        self._status.signals_generated += len(signals)
+        self._status.orders_executed += orders_executed
+        self._status.last_cycle_at = datetime.now(UTC)
+        self._latency.record("engine.cycle", cycle_start)
+        if self._engine_metrics is not None:
+            self._engine_metrics.observe_cycle(
+                (time.perf_counter_ns() - cycle_start) / 1e9,
+                signals,
+                results["risk_assessments"],
+                execution_reports,
+            )
+        complete = CycleCompleteEvent(self._cycle, len(signals), orders_executed)
+        for subscription in self._subscriptions:
+            if subscription.accepts(complete):
+                subscription.put(complete)
+        return complete
+
     async def health_check(self) -> dict[str, bool]:
         """Check health of all layers.
 
         Returns:
             Dictionary of layer health statuses
         """
-        return {
-            "data_layer": await self._data_layer.health_check(),
-            "signal_layer": await self._signal_layer.health_check(),
-            "risk_layer": await self._risk_layer.health_check(),
-            "execution_layer": await self._execution_layer.health_check(),
+        report = await self.health_report()
+        return {name: health.healthy for name, health in report.items()}
+
+    async def health_report(self) -> dict[str, LayerHealth]:
+        """Check all layers concurrently, each within the timeout budget.
+
+        A check that raises or exceeds ``health_check_timeout_seconds``
+        reports the layer as unhealthy without delaying the others.
+
+        Returns:
+            Health and check latency keyed like ``health_check``
+        """
+        checks: dict[str, BaseLayer] = {
+            "data_layer": self._data_layer,
+            "signal_layer": self._signal_layer,
+            "risk_layer": self._risk_layer,
+            "execution_layer": self._execution_layer,
         }
+        core = {layer.name for layer in checks.values()}
+        for layer in self._layers:
+            if layer.name not in core:
+                checks[layer.name] = layer
+        reports = await asyncio.gather(
+            *(self._check_layer(layer) for layer in checks.values())
+        )
+        return dict(zip(checks, reports, strict=True))
+
+    async def _check_layer(self, layer: BaseLayer) -> LayerHealth:
+        """Run one layer's health check with the timeout budget.
+
+        Args:
+            layer: Layer to check
+
+        Returns:
+            The layer's health
+        """
+        start = time.perf_counter_ns()
+        try:
+            healthy = await asyncio.wait_for(
+                layer.health_check(), self.config.health_check_timeout_seconds
+            )
+        except TimeoutError:
+            logger.warning("Layer health check timed out", layer=layer.name)
+            return LayerHealth(
+                healthy=False, latency_ms=elapsed_ms(start), timed_out=True
+            )
+        except Exception as e:
+            logger.warning("Layer health check failed", layer=layer.name, error=str(e))
+            return LayerHealth(
+                healthy=False, latency_ms=elapsed_ms(start), error=str(e)
+            )
+        return LayerHealth(healthy=bool(healthy), latency_ms=elapsed_ms(start))
 
     # Layer accessors
     @property
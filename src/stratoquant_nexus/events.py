@@ -0,0 +1,286 @@
+"""Typed engine events and subscriptions for streaming cycle results."""
+
+import asyncio
+from collections.abc import Callable, Iterable
+from typing import Any, ClassVar
+
+
+class EngineEvent:
+    """Base class for events produced while a cycle runs.
+
+    Attributes:
+        cycle: Engine cycle number that produced the event
+    """
+
+    __slots__ = ("cycle",)
+
+    result_key: ClassVar[str | None] = None
+
+    def __init__(self, cycle: int) -> None:
+        """Initialize the event."""
+        self.cycle = cycle
+
+    def __repr__(self) -> str:
+        """Get a debug representation."""
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+class MarketDataEvent(EngineEvent):
+    """Normalized market data produced by L0."""
+
+    __slots__ = ("market_data",)
+
+    result_key = "market_data"
+
+    def __init__(self, cycle: int, market_data: Any) -> None:
+        """Initialize the event."""
+        super().__init__(cycle)
+        self.market_data = market_data
+
+
+class SignalEvent(EngineEvent):
+    """Trading signal produced by L1."""
+
+    __slots__ = ("signal",)
+
+    result_key = "signals"
+
+    def __init__(self, cycle: int, signal: Any) -> None:
+        """Initialize the event."""
+        super().__init__(cycle)
+        self.signal = signal
+
+
+class RiskAssessmentEvent(EngineEvent):
+    """Risk assessment produced by L2."""
+
+    __slots__ = ("assessment",)
+
+    result_key = "risk_assessments"
+
+    def __init__(self, cycle: int, assessment: Any) -> None:
+        """Initialize the event."""
+        super().__init__(cycle)
+        self.assessment = assessment
+
+
+class ExecutionReportEvent(EngineEvent):
+    """Execution report produced by L3."""
+
+    __slots__ = ("report",)
+
+    result_key = "execution_reports"
+
+    def __init__(self, cycle: int, report: Any) -> None:
+        """Initialize the event."""
+        super().__init__(cycle)
+        self.report = report
+
+
+class FillEvent(ExecutionReportEvent):
+    """Execution report whose order has (partially) filled.
+
+    Emitted instead of a plain :class:`ExecutionReportEvent`, so subscribing
+    to ``ExecutionReportEvent`` still receives every report.
+    """
+
+    __slots__ = ()
+
+
+class LayerOutputEvent(EngineEvent):
+    """Output item of an additional (L4-L100) layer."""
+
+    __slots__ = ("layer", "item")
+
+    def __init__(self, cycle: int, layer: str, item: Any) -> None:
+        """Initialize the event."""
+        super().__init__(cycle)
+        self.layer = layer
+        self.item = item
+
+
+class CycleCompleteEvent(EngineEvent):
+    """Emitted once a cycle has run through every layer.
+
+    Attributes:
+        signals: Number of signals generated
+        orders_executed: Number of successful execution reports
+    """
+
+    __slots__ = ("signals", "orders_executed")
+
+    def __init__(self, cycle: int, signals: int, orders_executed: int) -> None:
+        """Initialize the event."""
+        super().__init__(cycle)
+        self.signals = signals
+        self.orders_executed = orders_executed
+
+
+_CORE_EVENTS: dict[str, type[EngineEvent]] = {
+    cls.result_key: cls
+    for cls in (
+        MarketDataEvent,
+        SignalEvent,
+        RiskAssessmentEvent,
+        ExecutionReportEvent,
+    )
+    if cls.result_key is not None
+}
+
+
+def event_class_for(result_key: str) -> type[EngineEvent]:
+    """Get the event class emitted for a layer's output items.
+
+    Args:
+        result_key: The layer's result key
+
+    Returns:
+        Event class (``LayerOutputEvent`` for additional layers)
+    """
+    return _CORE_EVENTS.get(result_key, LayerOutputEvent)
+
+
+def build_events(
+    cycle: int, result_key: str, items: Iterable[Any]
+) -> Iterable[EngineEvent]:
+    """Wrap a layer's output items in events.
+
+    Args:
+        cycle: Cycle number
+        result_key: The layer's result key
+        items: Output items
+
+    Returns:
+        Events, one per item
+    """
+    cls = event_class_for(result_key)
+    if cls is ExecutionReportEvent:
+        return [
+            (FillEvent if r.order.filled_quantity > 0 else ExecutionReportEvent)(
+                cycle, r
+            )
+            for r in items
+        ]
+    if cls is LayerOutputEvent:
+        return [LayerOutputEvent(cycle, result_key, item) for item in items]
+    return [cls(cycle, item) for item in items]
+
+
+def wants(event_types: tuple[type[EngineEvent], ...], cls: type[EngineEvent]) -> bool:
+    """Check if a filter accepts events of a class, so they must be built.
+
+    Args:
+        event_types: Subscribed event types (empty means all)
+        cls: Event class emitted for a layer (see ``event_class_for``)
+
+    Returns:
+        True if any event of that class may match the filter
+    """
+    if not event_types:
+        return True
+    if cls is ExecutionReportEvent:
+        return any(issubclass(FillEvent, t) for t in event_types)
+    return any(issubclass(cls, t) for t in event_types)
+
+
+class EventSubscription:
+    """Async iterator over the engine events of selected types.
+
+    Events are delivered as each layer finishes. When ``maxsize`` is set
+    and the consumer falls behind, the oldest queued events are dropped
+    and counted in ``dropped`` so a slow consumer never blocks the engine.
+
+    Example:
+        >>> async with engine.subscribe(FillEvent) as fills:
+        ...     async for event in fills:
+        ...         print(event.report.order.order_id)
+    """
+
+    def __init__(
+        self,
+        event_types: tuple[type[EngineEvent], ...],
+        maxsize: int = 0,
+        on_close: Callable[["EventSubscription"], None] | None = None,
+    ) -> None:
+        """Initialize the subscription.
+
+        Args:
+            event_types: Event types to receive (empty means all)
+            maxsize: Maximum queued events (0 for unbounded)
+            on_close: Called once when the subscription is closed
+        """
+        self.event_types = event_types
+        self.dropped = 0
+        self._queue: asyncio.Queue[EngineEvent | None] = asyncio.Queue(maxsize)
+        self._closed = False
+        self._on_close = on_close
+
+    @property
+    def closed(self) -> bool:
+        """Check if the subscription has been closed."""
+        return self._closed
+
+    def accepts(self, event: EngineEvent) -> bool:
+        """Check if the subscription wants an event.
+
+        Args:
+            event: Event to check
+
+        Returns:
+            True if the event matches the subscribed types
+        """
+        return not self.event_types or isinstance(event, self.event_types)
+
+    def put(self, event: EngineEvent) -> None:
+        """Queue an event without blocking.
+
+        Args:
+            event: Event to deliver
+        """
+        if self._closed:
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    def close(self) -> None:
+        """Stop the subscription; iteration ends once the queue drains."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(None)
+        if self._on_close is not None:
+            self._on_close(self)
+
+    def __aiter__(self) -> "EventSubscription":
+        """Iterate the subscription."""
+        return self
+
+    async def __anext__(self) -> EngineEvent:
+        """Wait for the next event.
+
+        Raises:
+            StopAsyncIteration: Once closed and drained
+        """
+        event = await self._queue.get()
+        if event is None:
+            self._queue.put_nowait(None)
+            raise StopAsyncIteration
+        return event
+
+    async def __aenter__(self) -> "EventSubscription":
+        """Enter the subscription context."""
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        """Close the subscription on exit."""
+        self.close()
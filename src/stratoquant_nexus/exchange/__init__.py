@@ -0,0 +1,28 @@
+"""Exchange connectivity for live order execution.
+
+This package provides the adapter interface the L3 execution layer uses when
+``simulate_execution`` is disabled, a pooled HTTP implementation and a local
+mock exchange for tests and benchmarks.
+"""
+
+from stratoquant_nexus.exchange.base import (
+    ExchangeAdapter,
+    ExchangeError,
+    ExchangeOrderResult,
+)
+from stratoquant_nexus.exchange.http_adapter import (
+    HttpExchangeAdapter,
+    HttpExchangeConfig,
+)
+from stratoquant_nexus.exchange.mock import MockExchangeServer
+from stratoquant_nexus.exchange.rate_limit import WeightRateLimiter
+
+__all__ = [
+    "ExchangeAdapter",
+    "ExchangeError",
+    "ExchangeOrderResult",
+    "HttpExchangeAdapter",
+    "HttpExchangeConfig",
+    "MockExchangeServer",
+    "WeightRateLimiter",
+]
@@ -0,0 +1,137 @@
+"""Exchange adapter interface used by the execution layer for live trading."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from decimal import Decimal
+
+from pydantic import BaseModel, Field
+
+from stratoquant_nexus.layers.l3_models import Order, OrderStatus
+
+
+class ExchangeError(Exception):
+    """Error returned by an exchange or raised while talking to it.
+
+    Attributes:
+        status_code: HTTP status code if the error came from a response
+        retryable: Whether the request may succeed if sent again
+    """
+
+    def __init__(
+        self, message: str, status_code: int | None = None, retryable: bool = False
+    ) -> None:
+        """Initialize the exchange error.
+
+        Args:
+            message: Error message
+            status_code: HTTP status code, if any
+            retryable: Whether the failure is transient
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+
+
+class ExchangeOrderResult(BaseModel):
+    """Exchange acknowledgement for a submitted or cancelled order."""
+
+    client_order_id: str = Field(..., description="Our order ID")
+    exchange_order_id: str | None = Field(
+        default=None, description="Order ID assigned by the exchange"
+    )
+    status: OrderStatus = Field(..., description="Order status on the exchange")
+    filled_quantity: Decimal = Field(
+        default=Decimal("0"), description="Filled quantity"
+    )
+    average_price: Decimal | None = Field(
+        default=None, description="Average fill price"
+    )
+    fees: Decimal = Field(default=Decimal("0"), description="Fees charged")
+    message: str = Field(default="", description="Exchange message")
+
+
+class ExchangeAdapter(ABC):
+    """Abstract base class for exchange connectivity.
+
+    Adapters own their network resources: ``connect`` is called once when the
+    execution layer initializes and ``close`` when it shuts down, so
+    implementations can keep connections open between orders.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Get the exchange name."""
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """Open connections to the exchange."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close connections to the exchange."""
+
+    @abstractmethod
+    async def submit_order(self, order: Order) -> ExchangeOrderResult:
+        """Submit an order to the exchange.
+
+        Args:
+            order: Order to submit
+
+        Returns:
+            Exchange acknowledgement
+
+        Raises:
+            ExchangeError: If the exchange rejects the request
+        """
+
+    async def submit_orders(self, orders: list[Order]) -> list[ExchangeOrderResult]:
+        """Submit several orders, using a batch endpoint where available.
+
+        The default implementation submits the orders concurrently. Orders
+        the exchange rejects individually are returned as ``REJECTED``
+        results, so the output is always aligned with ``orders``.
+
+        Args:
+            orders: Orders to submit
+
+        Returns:
+            Exchange acknowledgements in the same order as ``orders``
+        """
+        outcomes = await asyncio.gather(
+            *(self.submit_order(order) for order in orders), return_exceptions=True
+        )
+        results = []
+        for order, outcome in zip(orders, outcomes, strict=True):
+            if isinstance(outcome, ExchangeError):
+                outcome = ExchangeOrderResult(
+                    client_order_id=order.order_id,
+                    status=OrderStatus.REJECTED,
+                    message=str(outcome),
+                )
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            results.append(outcome)
+        return results
+
+    @abstractmethod
+    async def cancel_order(self, order: Order) -> ExchangeOrderResult:
+        """Cancel an order on the exchange.
+
+        Args:
+            order: Order to cancel
+
+        Returns:
+            Exchange acknowledgement
+
+        Raises:
+            ExchangeError: If the exchange rejects the request
+        """
+
+    async def health_check(self) -> bool:
+        """Check if the exchange is reachable.
+
+        Returns:
+            True if healthy, False otherwise
+        """
+        return True
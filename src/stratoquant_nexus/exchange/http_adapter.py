@@ -0,0 +1,404 @@
+"""HTTP exchange adapter built on a pooled ``httpx.AsyncClient``."""
+
+import hashlib
+import hmac
+import json
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any
+
+import httpx
+import structlog
+from pydantic import BaseModel, Field
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_fixed,
+)
+
+from stratoquant_nexus.exchange.base import (
+    ExchangeAdapter,
+    ExchangeError,
+    ExchangeOrderResult,
+)
+from stratoquant_nexus.exchange.rate_limit import WeightRateLimiter
+from stratoquant_nexus.layers.l3_models import Order, OrderStatus
+
+logger = structlog.get_logger()
+
+
+class HttpExchangeConfig(BaseModel):
+    """Configuration for the HTTP exchange adapter."""
+
+    name: str = Field(default="http", description="Exchange name")
+    base_url: str = Field(..., description="Exchange REST API base URL")
+    api_key: str = Field(default="", description="API key sent with each request")
+    api_secret: str = Field(default="", description="Secret used to sign requests")
+    timeout_seconds: float = Field(default=5.0, description="Request timeout")
+    max_connections: int = Field(default=20, description="Connection pool size")
+    max_keepalive_connections: int = Field(
+        default=10, description="Idle connections kept open for reuse"
+    )
+    keepalive_expiry_seconds: float = Field(
+        default=30.0, description="Idle time before a pooled connection is closed"
+    )
+    rate_limit_weight: int = Field(
+        default=1200, description="Request weight allowed per rate limit window"
+    )
+    rate_limit_interval_seconds: float = Field(
+        default=60.0, description="Rate limit window length"
+    )
+    order_weight: int = Field(default=1, description="Weight of an order request")
+    batch_order_weight: int = Field(
+        default=5, description="Weight of a batch order request"
+    )
+    used_weight_header: str = Field(
+        default="X-SQ-Used-Weight",
+        description="Response header reporting weight used in the current window",
+    )
+    retry_attempts: int = Field(
+        default=3, ge=1, description="Attempts per request, including the first"
+    )
+    retry_delay_seconds: float = Field(
+        default=1.0, ge=0.0, description="Delay between retry attempts"
+    )
+
+    @classmethod
+    def from_execution_section(
+        cls, section: Mapping[str, Any], **overrides: Any
+    ) -> "HttpExchangeConfig":
+        """Build a config from the ``execution`` section of a YAML config file.
+
+        Keys in the section that match field names (``retry_attempts``,
+        ``retry_delay_seconds``, ``base_url``, ...) are used; others ignored.
+
+        Args:
+            section: Parsed ``execution`` section
+            **overrides: Values taking precedence over the section
+
+        Returns:
+            Adapter configuration
+        """
+        values = {k: v for k, v in section.items() if k in cls.model_fields}
+        values.update(overrides)
+        return cls(**values)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Check whether a failed request should be retried.
+
+    Args:
+        exc: Raised exception
+
+    Returns:
+        True for transport errors and transient exchange errors
+    """
+    if isinstance(exc, ExchangeError):
+        return exc.retryable
+    return isinstance(exc, httpx.TransportError)
+
+
+class HttpExchangeAdapter(ExchangeAdapter):
+    """Exchange adapter speaking a JSON REST API over pooled HTTP connections.
+
+    A single ``httpx.AsyncClient`` is created on ``connect`` and reused for
+    every request, so TCP/TLS handshakes are paid once per pooled connection
+    rather than once per order. Each attempt is charged against a
+    :class:`WeightRateLimiter`; transport errors, 429 and 5xx responses are
+    retried with tenacity. Orders carry ``client_order_id`` so a retried
+    submission is idempotent on the exchange side.
+
+    Example:
+        >>> adapter = HttpExchangeAdapter(HttpExchangeConfig(base_url=url))
+        >>> await adapter.connect()
+        >>> result = await adapter.submit_order(order)
+    """
+
+    def __init__(
+        self,
+        config: HttpExchangeConfig,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the HTTP exchange adapter.
+
+        Args:
+            config: Adapter configuration
+            transport: Optional httpx transport (for testing)
+        """
+        self.config = config
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._rate_limiter = WeightRateLimiter(
+            capacity=config.rate_limit_weight,
+            interval_seconds=config.rate_limit_interval_seconds,
+        )
+
+    @property
+    def name(self) -> str:
+        """Get the exchange name."""
+        return self.config.name
+
+    @property
+    def rate_limiter(self) -> WeightRateLimiter:
+        """Get the request rate limiter."""
+        return self._rate_limiter
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the HTTP client is open."""
+        return self._client is not None
+
+    async def connect(self) -> None:
+        """Create the pooled HTTP client."""
+        if self._client is not None:
+            return
+
+        headers = {"Content-Type": "application/json"}
+        if self.config.api_key:
+            headers["X-SQ-API-Key"] = self.config.api_key
+
+        self._client = httpx.AsyncClient(
+            base_url=self.config.base_url,
+            headers=headers,
+            timeout=self.config.timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry_seconds,
+            ),
+            transport=self._transport,
+        )
+        logger.info(
+            "Exchange adapter connected",
+            exchange=self.name,
+            base_url=self.config.base_url,
+        )
+
+    async def close(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("Exchange adapter closed", exchange=self.name)
+
+    def _sign(self, body: bytes) -> str:
+        """Sign a request body with the API secret.
+
+        Args:
+            body: Serialized request body
+
+        Returns:
+            Hex-encoded HMAC-SHA256 signature
+        """
+        return hmac.new(
+            self.config.api_secret.encode(), body, hashlib.sha256
+        ).hexdigest()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        weight: int = 1,
+    ) -> Any:
+        """Send a request with rate limiting and retries.
+
+        Args:
+            method: HTTP method
+            path: Request path relative to the base URL
+            payload: JSON-serializable request body
+            weight: Rate limit weight of the request
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            ExchangeError: If the request fails after all retries
+        """
+        if self._client is None:
+            raise ExchangeError(f"Exchange adapter {self.name} is not connected")
+
+        body = b"" if payload is None else json.dumps(payload).encode()
+        headers = {}
+        if self.config.api_secret:
+            headers["X-SQ-Signature"] = self._sign(body)
+
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(self.config.retry_attempts),
+                wait=wait_fixed(self.config.retry_delay_seconds),
+                retry=retry_if_exception(_is_retryable),
+                reraise=True,
+            ):
+                with attempt:
+                    await self._rate_limiter.acquire(weight)
+                    response = await self._client.request(
+                        method, path, content=body or None, headers=headers
+                    )
+                    return self._handle_response(response)
+        except httpx.HTTPError as e:
+            raise ExchangeError(f"{method} {path} failed: {e!r}", retryable=True) from e
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _handle_response(self, response: httpx.Response) -> Any:
+        """Validate a response and decode its body.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Decoded JSON body
+
+        Raises:
+            ExchangeError: If the response indicates an error or is not JSON
+        """
+        used_weight = response.headers.get(self.config.used_weight_header)
+        if used_weight is not None and used_weight.isdigit():
+            self._rate_limiter.sync_used_weight(int(used_weight))
+
+        if response.status_code >= 400:
+            retryable = response.status_code == 429 or response.status_code >= 500
+            raise ExchangeError(
+                f"Exchange returned {response.status_code}: {response.text}",
+                status_code=response.status_code,
+                retryable=retryable,
+            )
+        try:
+            return response.json()
+        except ValueError as e:
+            raise ExchangeError(
+                f"Exchange returned a non-JSON body: {response.text[:200]!r}",
+                status_code=response.status_code,
+            ) from e
+
+    @staticmethod
+    def _order_payload(order: Order) -> dict[str, Any]:
+        """Serialize an order for the exchange API.
+
+        Args:
+            order: Order to serialize
+
+        Returns:
+            JSON-serializable order payload
+        """
+        return {
+            "client_order_id": order.order_id,
+            "symbol": order.symbol,
+            "side": order.side.value,
+            "type": order.order_type.value,
+            "quantity": str(order.quantity),
+            "price": str(order.price) if order.price is not None else None,
+            "stop_price": (
+                str(order.stop_price) if order.stop_price is not None else None
+            ),
+        }
+
+    @staticmethod
+    def _parse_result(data: dict[str, Any]) -> ExchangeOrderResult:
+        """Parse an exchange order response.
+
+        Args:
+            data: Decoded response body
+
+        Returns:
+            Exchange acknowledgement
+
+        Raises:
+            ExchangeError: If the body is not a valid order response
+        """
+        try:
+            average_price = data.get("average_price")
+            return ExchangeOrderResult(
+                client_order_id=str(data["client_order_id"]),
+                exchange_order_id=data.get("exchange_order_id"),
+                status=OrderStatus(data["status"]),
+                filled_quantity=Decimal(str(data.get("filled_quantity", "0"))),
+                average_price=(
+                    Decimal(str(average_price)) if average_price is not None else None
+                ),
+                fees=Decimal(str(data.get("fees", "0"))),
+                message=str(data.get("message", "")),
+            )
+        except (KeyError, ValueError, TypeError, AttributeError, ArithmeticError) as e:
+            raise ExchangeError(f"Malformed order response: {data!r}") from e
+
+    async def submit_order(self, order: Order) -> ExchangeOrderResult:
+        """Submit an order to the exchange.
+
+        Args:
+            order: Order to submit
+
+        Returns:
+            Exchange acknowledgement
+        """
+        data = await self._request(
+            "POST",
+            "/api/v1/order",
+            payload=self._order_payload(order),
+            weight=self.config.order_weight,
+        )
+        return self._parse_result(data)
+
+    async def submit_orders(self, orders: list[Order]) -> list[ExchangeOrderResult]:
+        """Submit several orders in one batch request.
+
+        Args:
+            orders: Orders to submit
+
+        Returns:
+            Exchange acknowledgements in the same order as ``orders``
+        """
+        if not orders:
+            return []
+        data = await self._request(
+            "POST",
+            "/api/v1/batchOrders",
+            payload={"orders": [self._order_payload(order) for order in orders]},
+            weight=self.config.batch_order_weight,
+        )
+        try:
+            items = data["orders"]
+        except (KeyError, TypeError) as e:
+            raise ExchangeError(f"Malformed batch response: {data!r}") from e
+        by_id = {
+            result.client_order_id: result
+            for result in (self._parse_result(item) for item in items)
+        }
+        return [
+            by_id.get(order.order_id)
+            or ExchangeOrderResult(
+                client_order_id=order.order_id,
+                status=OrderStatus.REJECTED,
+                message="Missing from batch response",
+            )
+            for order in orders
+        ]
+
+    async def cancel_order(self, order: Order) -> ExchangeOrderResult:
+        """Cancel an order on the exchange.
+
+        Args:
+            order: Order to cancel
+
+        Returns:
+            Exchange acknowledgement
+        """
+        data = await self._request(
+            "DELETE",
+            f"/api/v1/order/{order.order_id}",
+            weight=self.config.order_weight,
+        )
+        return self._parse_result(data)
+
+    async def health_check(self) -> bool:
+        """Ping the exchange.
+
+        Returns:
+            True if the exchange answered, False otherwise
+        """
+        try:
+            await self._request("GET", "/api/v1/ping")
+        except ExchangeError:
+            return False
+        return True
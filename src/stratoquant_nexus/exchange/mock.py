@@ -0,0 +1,254 @@
+"""Local mock exchange server for tests and latency benchmarks.
+
+The server speaks the JSON REST API expected by
+:class:`~stratoquant_nexus.exchange.http_adapter.HttpExchangeAdapter` over a
+real TCP socket with HTTP/1.1 keep-alive, so connection pooling, retries and
+rate limiting are exercised end to end without an external venue.
+"""
+
+import asyncio
+import json
+from decimal import Decimal
+from typing import Any
+from uuid import uuid4
+
+import structlog
+
+logger = structlog.get_logger()
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class MockExchangeServer:
+    """In-process HTTP exchange that fills orders immediately.
+
+    Market orders fill at the reference price set with :meth:`set_price`
+    (falling back to the order's own price); limit orders fill at their limit
+    price. Orders are deduplicated by ``client_order_id`` like a real venue.
+
+    Example:
+        >>> server = MockExchangeServer()
+        >>> await server.start()
+        >>> server.set_price("BTC/USD", Decimal("42000"))
+        >>> adapter = HttpExchangeAdapter(HttpExchangeConfig(base_url=server.url))
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        fee_rate: float = 0.001,
+        latency_seconds: float = 0.0,
+    ) -> None:
+        """Initialize the mock exchange server.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            fee_rate: Fee rate charged on fills
+            latency_seconds: Artificial processing delay per request
+        """
+        self.host = host
+        self.port = port
+        self.fee_rate = Decimal(str(fee_rate))
+        self.latency_seconds = latency_seconds
+        self.orders: dict[str, dict[str, Any]] = {}
+        self.request_count = 0
+        self.connections_opened = 0
+        self._prices: dict[str, Decimal] = {}
+        self._failures: list[int] = []
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        """Get the server base URL."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the server is running."""
+        return self._server is not None
+
+    def set_price(self, symbol: str, price: Decimal) -> None:
+        """Set the reference price used to fill market orders.
+
+        Args:
+            symbol: Trading symbol
+            price: Reference price
+        """
+        self._prices[symbol] = price
+
+    def fail_next(self, count: int = 1, status_code: int = 503) -> None:
+        """Make the next requests fail with an error status.
+
+        Args:
+            count: Number of requests to fail
+            status_code: HTTP status code to return
+        """
+        self._failures.extend([status_code] * count)
+
+    async def start(self) -> None:
+        """Start listening for connections."""
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Mock exchange started", url=self.url)
+
+    async def stop(self) -> None:
+        """Stop the server and close open connections."""
+        if self._server is not None:
+            self._server.close()
+            if hasattr(self._server, "close_clients"):
+                self._server.close_clients()
+            await self._server.wait_closed()
+            self._server = None
+            logger.info("Mock exchange stopped")
+
+    async def __aenter__(self) -> "MockExchangeServer":
+        """Start the server on context entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop the server on context exit."""
+        await self.stop()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve keep-alive HTTP/1.1 requests on one connection.
+
+        Args:
+            reader: Connection reader
+            writer: Connection writer
+        """
+        self.connections_opened += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode().split(" ", 2)
+
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    key, _, value = line.decode().partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", "0"))
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self._dispatch(method, path, body)
+                data = json.dumps(payload).encode()
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+                        "Content-Type: application/json\r\n"
+                        f"Content-Length: {len(data)}\r\n"
+                        "Connection: keep-alive\r\n\r\n"
+                    ).encode()
+                    + data
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(
+        self, method: str, path: str, body: bytes
+    ) -> tuple[int, dict[str, Any]]:
+        """Route a request to its handler.
+
+        Args:
+            method: HTTP method
+            path: Request path
+            body: Request body
+
+        Returns:
+            Status code and JSON payload
+        """
+        self.request_count += 1
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        if self._failures:
+            return self._failures.pop(0), {"error": "injected failure"}
+
+        if method == "GET" and path == "/api/v1/ping":
+            return 200, {}
+        if method == "POST" and path == "/api/v1/order":
+            return 200, self._fill(json.loads(body))
+        if method == "POST" and path == "/api/v1/batchOrders":
+            orders = json.loads(body)["orders"]
+            return 200, {"orders": [self._fill(order) for order in orders]}
+        if method == "DELETE" and path.startswith("/api/v1/order/"):
+            return self._cancel(path.rsplit("/", 1)[-1])
+        return 404, {"error": f"No route for {method} {path}"}
+
+    def _fill(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Fill an order immediately.
+
+        Args:
+            payload: Order payload
+
+        Returns:
+            Order result payload
+        """
+        client_order_id = payload["client_order_id"]
+        if client_order_id in self.orders:
+            return self.orders[client_order_id]
+
+        quantity = Decimal(payload["quantity"])
+        price = payload.get("price")
+        if payload.get("type") == "market" or price is None:
+            fill_price = self._prices.get(payload["symbol"])
+            if fill_price is None and price is not None:
+                fill_price = Decimal(price)
+        else:
+            fill_price = Decimal(price)
+
+        if fill_price is None or quantity <= 0:
+            result: dict[str, Any] = {
+                "client_order_id": client_order_id,
+                "exchange_order_id": None,
+                "status": "rejected",
+                "message": f"No price available for {payload['symbol']}",
+            }
+        else:
+            result = {
+                "client_order_id": client_order_id,
+                "exchange_order_id": str(uuid4()),
+                "status": "filled",
+                "filled_quantity": str(quantity),
+                "average_price": str(fill_price),
+                "fees": str(
+                    (quantity * fill_price * self.fee_rate).quantize(Decimal("0.01"))
+                ),
+                "message": "filled",
+            }
+        self.orders[client_order_id] = result
+        return result
+
+    def _cancel(self, client_order_id: str) -> tuple[int, dict[str, Any]]:
+        """Cancel an order.
+
+        Args:
+            client_order_id: Order to cancel
+
+        Returns:
+            Status code and order result payload
+        """
+        order = self.orders.get(client_order_id)
+        if order is None:
+            return 404, {"error": f"Unknown order {client_order_id}"}
+        if order["status"] not in ("filled", "rejected"):
+            order["status"] = "cancelled"
+        return 200, order
@@ -0,0 +1,78 @@
+"""Weight-based request rate limiting for exchange APIs."""
+
+import asyncio
+import time
+
+
+class WeightRateLimiter:
+    """Token-bucket rate limiter where each request consumes a weight.
+
+    Exchanges such as Binance budget requests by weight per time window
+    rather than by request count. The bucket holds ``capacity`` units and
+    refills continuously at ``capacity / interval_seconds`` units per second.
+    Waiters are served in FIFO order.
+
+    Example:
+        >>> limiter = WeightRateLimiter(capacity=1200, interval_seconds=60)
+        >>> await limiter.acquire(weight=5)
+    """
+
+    def __init__(self, capacity: int, interval_seconds: float) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            capacity: Total weight allowed per interval
+            interval_seconds: Length of the rate limit window in seconds
+        """
+        if capacity <= 0 or interval_seconds <= 0:
+            raise ValueError("capacity and interval_seconds must be positive")
+        self.capacity = capacity
+        self.interval_seconds = interval_seconds
+        self._refill_rate = capacity / interval_seconds
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> float:
+        """Get the currently available weight."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last update."""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self._refill_rate)
+
+    async def acquire(self, weight: int = 1) -> None:
+        """Wait until ``weight`` units are available and consume them.
+
+        Args:
+            weight: Request weight
+
+        Raises:
+            ValueError: If the weight exceeds the bucket capacity
+        """
+        if weight > self.capacity:
+            raise ValueError(f"Weight {weight} exceeds capacity {self.capacity}")
+
+        async with self._lock:
+            self._refill()
+            while self._tokens < weight:
+                await asyncio.sleep((weight - self._tokens) / self._refill_rate)
+                self._refill()
+            self._tokens -= weight
+
+    def sync_used_weight(self, used_weight: int) -> None:
+        """Align the bucket with the weight the exchange reports as used.
+
+        Only ever lowers the available weight, so another client sharing the
+        same API key is accounted for.
+
+        Args:
+            used_weight: Weight used in the current window per the exchange
+        """
+        self._refill()
+        self._tokens = min(self._tokens, float(self.capacity - used_weight))
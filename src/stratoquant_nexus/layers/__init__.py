@@ -5,6 +5,7 @@ from stratoquant_nexus.layers.l0_data import DataLayer
 from stratoquant_nexus.layers.l1_signals import SignalLayer
 from stratoquant_nexus.layers.l2_risk import RiskLayer
 from stratoquant_nexus.layers.l3_execution import ExecutionLayer
+from stratoquant_nexus.layers.registry import LayerRegistry
 
 __all__ = [
     "BaseLayer",
@@ -13,4 +14,5 @@ __all__ = [
     "SignalLayer",
     "RiskLayer",
     "ExecutionLayer",
+    "LayerRegistry",
 ]
@@ -2,10 +2,15 @@
 
 from abc import ABC, abstractmethod
 from enum import IntEnum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
+from stratoquant_nexus.monitoring.latency import LatencyRecorder
+
+if TYPE_CHECKING:
+    from stratoquant_nexus.checkpoint import Checkpoint, CheckpointWriter
+
 
 class LayerLevel(IntEnum):
     """Layer hierarchy levels (L0-L100 architecture)."""
@@ -14,7 +19,7 @@ class LayerLevel(IntEnum):
     SIGNALS = 1  # L1: Signal generation & indicators
     RISK = 2  # L2: Risk management & position sizing
     EXECUTION = 3  # L3: Order execution & management
-    # Additional layers can be added up to L100 for advanced strategies
+    # Additional layers can use any level up to L100 for advanced strategies
 
 
 class LayerConfig(BaseModel):
@@ -22,7 +27,22 @@ class LayerConfig(BaseModel):
 
     enabled: bool = Field(default=True, description="Whether the layer is enabled")
     name: str = Field(..., description="Layer name")
-    level: LayerLevel = Field(..., description="Layer hierarchy level")
+    level: int = Field(..., ge=0, le=100, description="Layer hierarchy level")
+    order: int = Field(
+        default=0,
+        ge=0,
+        description="Position within the level; layers sharing level and order "
+        "form one stage",
+    )
+    independent: bool = Field(
+        default=False,
+        description="Only read the stage input without feeding the next stage, "
+        "so the layer runs concurrently with the rest of its stage",
+    )
+    depends_on: list[str] = Field(
+        default_factory=list,
+        description="Names of layers that must finish initializing first",
+    )
     log_level: str = Field(default="INFO", description="Logging level")
 
 
@@ -33,10 +53,15 @@ class BaseLayer(ABC):
     has a specific responsibility in the trading pipeline.
 
     Attributes:
+        result_key: Key of the layer's output in the engine cycle results
+            (the layer name if unset)
         config: Layer configuration
+        latency: Recorder for timings taken inside the layer
         _initialized: Whether the layer has been initialized
     """
 
+    result_key: str | None = None
+
     def __init__(self, config: LayerConfig) -> None:
         """Initialize the base layer.
 
@@ -44,6 +69,7 @@ class BaseLayer(ABC):
             config: Layer configuration
         """
         self.config = config
+        self.latency = LatencyRecorder(enabled=False)
         self._initialized = False
 
     @property
@@ -52,10 +78,18 @@ class BaseLayer(ABC):
         return self.config.name
 
     @property
-    def level(self) -> LayerLevel:
+    def level(self) -> int:
         """Get the layer level."""
         return self.config.level
 
+    def set_latency_recorder(self, recorder: LatencyRecorder) -> None:
+        """Share a latency recorder, e.g. the engine's.
+
+        Args:
+            recorder: Recorder for timings taken inside the layer
+        """
+        self.latency = recorder
+
     @property
     def is_enabled(self) -> bool:
         """Check if the layer is enabled."""
@@ -93,3 +127,34 @@ class BaseLayer(ABC):
             True if healthy, False otherwise
         """
         return self._initialized and self.is_enabled
+
+    def reconfigure(self, config: LayerConfig, changed: set[str]) -> None:
+        """Swap in a new configuration between cycles.
+
+        Layers that derive cached state from their configuration should
+        override this and drop only what depends on ``changed``.
+
+        Args:
+            config: Validated configuration of the layer's config class
+            changed: Names of the fields whose values changed
+        """
+        self.config = config
+
+    def save_checkpoint(self, writer: "CheckpointWriter") -> None:  # noqa: B027
+        """Add the layer's warm state to a checkpoint.
+
+        Section names should be prefixed with the layer name. Stateless
+        layers keep the default, which saves nothing.
+
+        Args:
+            writer: Checkpoint being built
+        """
+
+    def load_checkpoint(self, checkpoint: "Checkpoint") -> None:  # noqa: B027
+        """Restore state saved by ``save_checkpoint``.
+
+        Called after ``initialize`` when the engine starts from a checkpoint.
+
+        Args:
+            checkpoint: Mapped checkpoint
+        """
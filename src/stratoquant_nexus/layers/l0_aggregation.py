@@ -0,0 +1,269 @@
+"""Aggregation of raw trade prints into bars.
+
+``TradeAggregator`` turns batches of trades (numpy arrays of timestamps,
+prices and sizes for one symbol) into time, tick, volume or dollar bars.
+Bar boundaries and OHLCV values of a batch are found with numpy reductions,
+so the per-trade cost is a few vector operations; only completed bars are
+converted to ``OHLCV`` models. The bar still being filled is kept per
+symbol in a small mutable state and continued by the next batch.
+
+For tick, volume and dollar bars the trade that reaches the threshold
+closes the bar, and whatever it adds beyond the threshold counts towards
+the next one, so bar sizes average out to the threshold.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+
+from stratoquant_nexus.layers.l0_data import OHLCV, BarSpec, BarType, Timeframe
+from stratoquant_nexus.utils.binary import from_micros, to_micros
+
+# 1970-01-01 was a Thursday; weekly bars start on Monday 1970-01-05
+_WEEK_OFFSET_US = 4 * 86400 * 1_000_000
+
+
+class TradeBatch:
+    """Trades of one symbol in time order.
+
+    Attributes:
+        symbol: Trading symbol
+        timestamp: Trade times in microseconds since the epoch (int64)
+        price: Trade prices (float64)
+        size: Trade quantities (float64)
+    """
+
+    __slots__ = ("symbol", "timestamp", "price", "size")
+
+    def __init__(
+        self,
+        symbol: str,
+        timestamp: np.ndarray,
+        price: np.ndarray,
+        size: np.ndarray,
+    ) -> None:
+        """Initialize the batch.
+
+        Args:
+            symbol: Trading symbol
+            timestamp: Trade times in microseconds since the epoch
+            price: Trade prices
+            size: Trade quantities
+
+        Raises:
+            ValueError: If the arrays differ in length
+        """
+        self.symbol = symbol
+        self.timestamp = np.asarray(timestamp, dtype=np.int64)
+        self.price = np.asarray(price, dtype=np.float64)
+        self.size = np.asarray(size, dtype=np.float64)
+        if not len(self.timestamp) == len(self.price) == len(self.size):
+            raise ValueError("Trade batch arrays must have the same length")
+
+    def __len__(self) -> int:
+        """Get the number of trades."""
+        return len(self.timestamp)
+
+
+class _OpenBar:
+    """Bar being filled for one symbol."""
+
+    __slots__ = ("key", "start", "open", "high", "low", "close", "volume")
+
+    def __init__(self) -> None:
+        """Initialize an empty bar."""
+        self.key = -1  # Period or bar number; -1 when no bar is open
+        self.start = 0
+        self.open = self.high = self.low = self.close = self.volume = 0.0
+
+
+class TradeAggregator:
+    """Build bars from trade batches.
+
+    Example:
+        >>> aggregator = TradeAggregator(BarSpec(bar_type="dollar", threshold=1e6))
+        >>> bars = aggregator.add(TradeBatch("BTC/USD", ts, prices, sizes))
+    """
+
+    def __init__(self, spec: BarSpec | None = None) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            spec: Bar construction settings
+        """
+        self.spec = spec or BarSpec()
+        self._open: dict[str, _OpenBar] = {}
+        # Threshold progress carried into the next batch, per symbol
+        self._filled: dict[str, float] = {}
+        self._period_us = self.spec.timeframe.seconds * 1_000_000
+        self._offset_us = _WEEK_OFFSET_US if self.spec.timeframe == Timeframe.W1 else 0
+
+    def add(self, batch: TradeBatch) -> list[OHLCV]:
+        """Aggregate a batch of trades.
+
+        Args:
+            batch: Trades of one symbol, continuing earlier batches in time
+
+        Returns:
+            Bars completed by the batch, in time order
+        """
+        if not len(batch):
+            return []
+        keys, last_complete = self._bar_keys(batch)
+        state = self._open.get(batch.symbol)
+        if state is None:
+            state = self._open[batch.symbol] = _OpenBar()
+
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        ends = np.r_[starts[1:], len(keys)]
+        opens = batch.price[starts]
+        highs = np.maximum.reduceat(batch.price, starts)
+        lows = np.minimum.reduceat(batch.price, starts)
+        closes = batch.price[ends - 1]
+        volumes = np.add.reduceat(batch.size, starts)
+        first_times = batch.timestamp[starts]
+        segment_keys = keys[starts]
+
+        bars: list[OHLCV] = []
+        if state.key != -1:
+            if state.key == segment_keys[0]:
+                # The batch continues the open bar
+                opens[0] = state.open
+                highs[0] = max(highs[0], state.high)
+                lows[0] = min(lows[0], state.low)
+                volumes[0] += state.volume
+                first_times[0] = state.start
+            else:
+                bars.append(self._to_candle(batch.symbol, state))
+
+        complete = len(starts) if last_complete else len(starts) - 1
+        for i in range(complete):
+            bars.append(
+                self._candle(
+                    batch.symbol,
+                    int(segment_keys[i]),
+                    int(first_times[i]),
+                    float(opens[i]),
+                    float(highs[i]),
+                    float(lows[i]),
+                    float(closes[i]),
+                    float(volumes[i]),
+                )
+            )
+        if complete < len(starts):
+            # Threshold bar numbers restart at 0 in every batch
+            state.key = (
+                int(segment_keys[-1]) if self.spec.bar_type == BarType.TIME else 0
+            )
+            state.start = int(first_times[-1])
+            state.open = float(opens[-1])
+            state.high = float(highs[-1])
+            state.low = float(lows[-1])
+            state.close = float(closes[-1])
+            state.volume = float(volumes[-1])
+        else:
+            state.key = -1
+        return bars
+
+    def flush(self, until: datetime | None = None) -> list[OHLCV]:
+        """Close open bars.
+
+        Args:
+            until: Only close time bars whose period has ended by this time
+                (None to close every open bar, e.g. at the end of a stream)
+
+        Returns:
+            Closed bars
+        """
+        limit = None
+        if until is not None:
+            if self.spec.bar_type != BarType.TIME:
+                return []
+            limit = to_micros(until)
+        bars = []
+        for symbol, state in self._open.items():
+            if state.key == -1:
+                continue
+            period_end = (state.key + 1) * self._period_us + self._offset_us
+            if limit is not None and period_end > limit:
+                continue
+            bars.append(self._to_candle(symbol, state))
+            state.key = -1
+            self._filled[symbol] = 0.0
+        return bars
+
+    def partial(self, symbol: str) -> OHLCV | None:
+        """Get the bar still being filled for a symbol.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            The open bar so far, or None
+        """
+        state = self._open.get(symbol)
+        if state is None or state.key == -1:
+            return None
+        return self._to_candle(symbol, state)
+
+    def _bar_keys(self, batch: TradeBatch) -> tuple[np.ndarray, bool]:
+        """Number the bars of a batch's trades.
+
+        Returns:
+            Bar number per trade and whether the last trade completed its bar
+        """
+        spec = self.spec
+        if spec.bar_type == BarType.TIME:
+            return (batch.timestamp - self._offset_us) // self._period_us, False
+        if spec.bar_type == BarType.TICK:
+            measure = np.ones(len(batch))
+        elif spec.bar_type == BarType.VOLUME:
+            measure = batch.size
+        else:
+            measure = batch.price * batch.size
+        cumulative = self._filled.get(batch.symbol, 0.0) + np.cumsum(measure)
+        # A trade belongs to the bar that was being filled when it arrived
+        keys = ((cumulative - measure) // spec.threshold).astype(np.int64)
+        self._filled[batch.symbol] = float(cumulative[-1] % spec.threshold)
+        return keys, bool(cumulative[-1] >= (keys[-1] + 1) * spec.threshold)
+
+    def _to_candle(self, symbol: str, state: _OpenBar) -> OHLCV:
+        """Convert an open bar state to a candle."""
+        return self._candle(
+            symbol,
+            state.key,
+            state.start,
+            state.open,
+            state.high,
+            state.low,
+            state.close,
+            state.volume,
+        )
+
+    def _candle(
+        self,
+        symbol: str,
+        key: int,
+        first_trade: int,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> OHLCV:
+        """Build a candle; time bars are stamped with their period start."""
+        if self.spec.bar_type == BarType.TIME:
+            start = key * self._period_us + self._offset_us
+        else:
+            start = first_trade
+        return OHLCV.model_construct(
+            timestamp=from_micros(start),
+            open=Decimal(repr(open_)),
+            high=Decimal(repr(high)),
+            low=Decimal(repr(low)),
+            close=Decimal(repr(close)),
+            volume=Decimal(repr(volume)),
+            symbol=symbol,
+            timeframe=self.spec.timeframe,
+        )
@@ -0,0 +1,260 @@
+"""Memory-mapped on-disk candle archive.
+
+Candles are appended as fixed-width little-endian records, one file per
+symbol and timeframe::
+
+    <root>/<quoted symbol>/<timeframe>.ohlcv
+    file    = b"SQCA\\x01\\x00\\x00\\x00" | 40 zero bytes | records
+    record  = i8 timestamp (µs since the epoch, UTC) | f8 open | f8 high
+              | f8 low | f8 close | f8 volume
+
+Files are only ever appended in timestamp order, so a range query is two
+binary searches over the mapped timestamp column and returns a view of the
+mapped records: nothing is parsed or copied, and only the pages touched are
+read from disk. Prices are stored as float64; use the in-memory history
+when exact decimals matter.
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+import numpy as np
+import structlog
+
+from stratoquant_nexus.layers.l0_data import OHLCV, Timeframe
+from stratoquant_nexus.utils.binary import from_micros, to_micros
+
+logger = structlog.get_logger()
+
+MAGIC = b"SQCA\x01\x00\x00\x00"
+RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+    ]
+)
+HEADER_SIZE = RECORD_DTYPE.itemsize  # Keeps records aligned in the mapping
+SUFFIX = ".ohlcv"
+
+
+class CandleArchive:
+    """Append-only candle files read through ``numpy.memmap``.
+
+    Candles older than or equal to the last archived timestamp of their
+    file are skipped, which keeps every file sorted.
+
+    Example:
+        >>> archive = CandleArchive("data/archive")
+        >>> archive.append(candles)
+        >>> records = archive.read("BTC/USD", Timeframe.H1, start, end)
+        >>> records["close"].mean()
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """Initialize the archive.
+
+        Args:
+            root: Directory holding the archive files (created if missing)
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._last_timestamps: dict[Path, int] = {}
+        self._maps: dict[Path, tuple[int, np.ndarray]] = {}
+
+    def path(self, symbol: str, timeframe: Timeframe) -> Path:
+        """Get the file of a symbol and timeframe.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+
+        Returns:
+            Archive file path (may not exist yet)
+        """
+        directory = self.root / quote(symbol, safe="")
+        return directory / f"{Timeframe(timeframe).value}{SUFFIX}"
+
+    def append(self, candles: Iterable[OHLCV]) -> int:
+        """Append candles to their files.
+
+        Args:
+            candles: Candles in any order
+
+        Returns:
+            Number of records written
+        """
+        groups: dict[tuple[str, Timeframe], list[OHLCV]] = {}
+        for candle in candles:
+            groups.setdefault((candle.symbol, candle.timeframe), []).append(candle)
+
+        written = 0
+        for (symbol, timeframe), group in groups.items():
+            path = self.path(symbol, timeframe)
+            records = np.array(
+                [
+                    (
+                        to_micros(c.timestamp),
+                        float(c.open),
+                        float(c.high),
+                        float(c.low),
+                        float(c.close),
+                        float(c.volume),
+                    )
+                    for c in group
+                ],
+                dtype=RECORD_DTYPE,
+            )
+            records.sort(order="timestamp", kind="stable")
+            written += self.append_records(path, records)
+        return written
+
+    def append_records(self, path: Path, records: np.ndarray) -> int:
+        """Append records, already sorted by timestamp, to one file.
+
+        Args:
+            path: Archive file from ``path``
+            records: Array of ``RECORD_DTYPE``
+
+        Returns:
+            Number of records written
+        """
+        last = self._last_timestamp(path)
+        timestamps = records["timestamp"]
+        # Drop stale records and duplicates within the batch
+        keep = timestamps > last
+        keep[1:] &= timestamps[1:] > timestamps[:-1]
+        if not keep.all():
+            logger.debug(
+                "Skipped out-of-order candles",
+                path=str(path),
+                skipped=int((~keep).sum()),
+            )
+            records = records[keep]
+        if not len(records):
+            return 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("ab") as f:
+            size = f.tell()
+            if size == 0:
+                f.write(MAGIC.ljust(HEADER_SIZE, b"\x00"))
+            elif torn := (size - HEADER_SIZE) % RECORD_DTYPE.itemsize:
+                # Drop a record cut short by a crash mid-write
+                f.truncate(size - torn)
+            f.write(records.astype(RECORD_DTYPE, copy=False).tobytes())
+        self._last_timestamps[path] = int(records["timestamp"][-1])
+        return len(records)
+
+    def read(
+        self,
+        symbol: str,
+        timeframe: Timeframe,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> np.ndarray:
+        """Get archived records in a time range.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            start: First candle timestamp to include
+            end: Candle timestamp to stop before
+
+        Returns:
+            Read-only view of the mapped ``RECORD_DTYPE`` records (empty if
+            nothing is archived)
+        """
+        records = self._map(self.path(symbol, timeframe))
+        timestamps = records["timestamp"]
+        lo = 0 if start is None else np.searchsorted(timestamps, to_micros(start))
+        hi = (
+            len(records)
+            if end is None
+            else np.searchsorted(timestamps, to_micros(end), side="left")
+        )
+        return records[lo:hi]
+
+    def candles(
+        self,
+        symbol: str,
+        timeframe: Timeframe,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> list[OHLCV]:
+        """Get archived candles in a time range as models.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            start: First candle timestamp to include
+            end: Candle timestamp to stop before
+
+        Returns:
+            Candles in timestamp order
+        """
+        records = self.read(symbol, timeframe, start, end)
+        timeframe = Timeframe(timeframe)
+        return [
+            OHLCV.model_construct(
+                timestamp=from_micros(ts),
+                open=Decimal(repr(o)),
+                high=Decimal(repr(h)),
+                low=Decimal(repr(lo)),
+                close=Decimal(repr(c)),
+                volume=Decimal(repr(v)),
+                symbol=symbol,
+                timeframe=timeframe,
+            )
+            for ts, o, h, lo, c, v in records.tolist()
+        ]
+
+    def count(self, symbol: str, timeframe: Timeframe) -> int:
+        """Get the number of archived candles of a symbol and timeframe."""
+        return len(self._map(self.path(symbol, timeframe)))
+
+    def series(self) -> Iterator[tuple[str, Timeframe]]:
+        """Iterate over the archived symbol and timeframe pairs."""
+        for path in sorted(self.root.glob(f"*/*{SUFFIX}")):
+            yield unquote(path.parent.name), Timeframe(path.stem)
+
+    def close(self) -> None:
+        """Drop cached mappings (views already returned stay valid)."""
+        self._maps.clear()
+        self._last_timestamps.clear()
+
+    def _map(self, path: Path) -> np.ndarray:
+        """Map a file, reusing the mapping until the file grows."""
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        cached = self._maps.get(path)
+        if cached is not None and cached[0] == size:
+            return cached[1]
+        count = (size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+        if count <= 0:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        with path.open("rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a candle archive file: {path}")
+        records = np.memmap(
+            path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,)
+        )
+        self._maps[path] = (size, records)
+        return records
+
+    def _last_timestamp(self, path: Path) -> int:
+        """Get the last archived timestamp of a file."""
+        last = self._last_timestamps.get(path)
+        if last is None:
+            records = self._map(path)
+            last = int(records["timestamp"][-1]) if len(records) else -(2**63)
+            self._last_timestamps[path] = last
+        return last
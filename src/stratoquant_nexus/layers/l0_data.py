@@ -7,14 +7,27 @@ This layer handles:
 - Order book data processing
 """
 
+import asyncio
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from stratoquant_nexus.layers.base import BaseLayer, LayerConfig, LayerLevel
+from stratoquant_nexus.layers.l0_orderbook import BookUpdate, OrderBook
+from stratoquant_nexus.utils.binary import from_micros
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from stratoquant_nexus.checkpoint import Checkpoint, CheckpointWriter
+    from stratoquant_nexus.layers.l0_aggregation import TradeAggregator
+    from stratoquant_nexus.layers.l0_archive import CandleArchive
+    from stratoquant_nexus.layers.l0_resample import BarResampler
+    from stratoquant_nexus.layers.l0_validation import CandleValidator
 
 
 class Timeframe(str, Enum):
@@ -29,6 +42,12 @@ class Timeframe(str, Enum):
     D1 = "1d"
     W1 = "1w"
 
+    @property
+    def seconds(self) -> int:
+        """Get the length of one candle in seconds."""
+        value, unit = int(self.value[:-1]), self.value[-1]
+        return value * {"m": 60, "h": 3600, "d": 86400, "w": 604800}[unit]
+
 
 class OHLCV(BaseModel):
     """OHLCV candlestick data model."""
@@ -45,10 +64,86 @@ class OHLCV(BaseModel):
     timeframe: Timeframe = Field(..., description="Candle timeframe")
 
 
+class BarType(str, Enum):
+    """How trades are grouped into bars."""
+
+    TIME = "time"  # One bar per timeframe period
+    TICK = "tick"  # Fixed number of trades
+    VOLUME = "volume"  # Fixed traded quantity
+    DOLLAR = "dollar"  # Fixed traded notional (price * size)
+
+
+class BarSpec(BaseModel):
+    """Bar construction settings."""
+
+    bar_type: BarType = Field(default=BarType.TIME, description="Bar type")
+    timeframe: Timeframe = Field(
+        default=Timeframe.M1,
+        description="Period of time bars; the timeframe label of other bar types",
+    )
+    threshold: float = Field(
+        default=0.0,
+        ge=0,
+        description="Trades, quantity or notional per bar (non-time bars)",
+    )
+
+    @model_validator(mode="after")
+    def _check_threshold(self) -> "BarSpec":
+        """Require a threshold for threshold-based bars."""
+        if self.bar_type != BarType.TIME and self.threshold <= 0:
+            raise ValueError(f"{self.bar_type.value} bars need a positive threshold")
+        return self
+
+
+class ValidationAction(str, Enum):
+    """What happens to candles that fail validation."""
+
+    REJECT = "reject"  # Drop them
+    REPAIR = "repair"  # Fix what can be fixed, drop the rest
+    FLAG = "flag"  # Keep them and report them in MarketData.flagged
+
+
+class ValidationSpec(BaseModel):
+    """Incoming candle validation settings."""
+
+    action: ValidationAction = Field(
+        default=ValidationAction.REJECT, description="Handling of failed candles"
+    )
+    spike_zscore: float = Field(
+        default=8.0,
+        gt=0,
+        description="Robust z-score of a close-to-close return that marks a spike",
+    )
+    spike_window: int = Field(
+        default=200,
+        ge=2,
+        description="Recent returns per symbol/timeframe that scale the z-score",
+    )
+    spike_min_returns: int = Field(
+        default=20,
+        ge=2,
+        description="Returns needed before spikes are detected",
+    )
+
+
 class MarketData(BaseModel):
     """Market data container for multiple symbols."""
 
+    model_config = {"arbitrary_types_allowed": True}
+
     candles: list[OHLCV] = Field(default_factory=list)
+    closed_bars: list[OHLCV] = Field(
+        default_factory=list,
+        description="Higher-timeframe bars closed by resampling these candles",
+    )
+    flagged: list[OHLCV] = Field(
+        default_factory=list,
+        description="Candles kept despite failing validation (flag action)",
+    )
+    order_books: dict[str, OrderBook] = Field(
+        default_factory=dict,
+        description="Live order books by symbol (shared, not copies)",
+    )
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
     def get_latest(self, symbol: str, timeframe: Timeframe) -> OHLCV | None:
@@ -82,6 +177,27 @@ class DataLayerConfig(LayerConfig):
     max_candles: int = Field(
         default=1000, description="Maximum candles to store per symbol/timeframe"
     )
+    trade_bars: BarSpec | None = Field(
+        default=None,
+        description="How trade batches are aggregated into bars (None to only "
+        "accept candles)",
+    )
+    resample_from: Timeframe | None = Field(
+        default=None,
+        description="Build the higher configured timeframes from candles of this "
+        "timeframe (None to take every timeframe as supplied)",
+    )
+    order_book_levels: int | None = Field(
+        default=None, description="Levels kept per side of each order book"
+    )
+    validation: ValidationSpec | None = Field(
+        default=None,
+        description="Validation of incoming candles (None to accept them as is)",
+    )
+    archive_path: str | None = Field(
+        default=None,
+        description="Directory of the memory-mapped candle archive (None to disable)",
+    )
 
 
 class DataLayer(BaseLayer):
@@ -94,6 +210,8 @@ class DataLayer(BaseLayer):
     4. Managing historical data storage
     """
 
+    result_key = "market_data"
+
     def __init__(self, config: DataLayerConfig | None = None) -> None:
         """Initialize the data layer.
 
@@ -104,9 +222,29 @@ class DataLayer(BaseLayer):
             config = DataLayerConfig(name="DataLayer")
         super().__init__(config)
         self._market_data: dict[str, MarketData] = {}
+        self._archive: CandleArchive | None = None
+        # Keeps overlapping cycles' appends in order
+        self._archive_lock = asyncio.Lock()
+        self._resampler: BarResampler | None = None
+        self._aggregator: TradeAggregator | None = None
+        self._books: dict[str, OrderBook] = {}
+        self._validator: CandleValidator | None = None
+        self._configure_resampler()
+        self._configure_aggregator()
+        self._configure_validator()
+
+    @property
+    def archive(self) -> "CandleArchive | None":
+        """Get the on-disk candle archive, if configured."""
+        return self._archive
 
     async def initialize(self) -> None:
         """Initialize data layer resources."""
+        config: DataLayerConfig = self.config  # type: ignore
+        if config.archive_path and self._archive is None:
+            from stratoquant_nexus.layers.l0_archive import CandleArchive
+
+            self._archive = CandleArchive(config.archive_path)
         self._initialized = True
 
     async def process(self, data: Any) -> MarketData:
@@ -118,21 +256,213 @@ class DataLayer(BaseLayer):
         Returns:
             Normalized MarketData
         """
+        if self._aggregator is not None:
+            from stratoquant_nexus.layers.l0_aggregation import TradeBatch
+
+            if isinstance(data, TradeBatch):
+                data = [data]
+            if (
+                isinstance(data, list)
+                and data
+                and all(isinstance(d, TradeBatch) for d in data)
+            ):
+                # Completed bars continue as ordinary candles
+                bars = [bar for batch in data for bar in self._aggregator.add(batch)]
+                # Trade time closes the time bars of symbols gone quiet
+                latest = max((int(b.timestamp[-1]) for b in data if len(b)), default=0)
+                if latest:
+                    bars += self._aggregator.flush(until=from_micros(latest))
+                data = bars
+        if isinstance(data, BookUpdate):
+            data = [data]
+        if (
+            isinstance(data, list)
+            and data
+            and all(isinstance(d, BookUpdate) for d in data)
+        ):
+            for update in data:
+                self.apply_book_update(update)
+            return MarketData(order_books=self._books)
         if isinstance(data, list) and all(isinstance(d, OHLCV) for d in data):
-            market_data = MarketData(candles=data)
-            # Store by symbol
-            for candle in data:
-                if candle.symbol not in self._market_data:
-                    self._market_data[candle.symbol] = MarketData()
-                self._market_data[candle.symbol].candles.append(candle)
+            flagged: list[OHLCV] = []
+            if self._validator is not None and data:
+                data, flagged = self._validator.validate(data)
+            market_data = MarketData(
+                candles=data, flagged=flagged, order_books=self._books
+            )
+            self.store(data)
+            if self._resampler is not None:
+                base = self._resampler.base
+                market_data.closed_bars = self._resampler.update_many(
+                    c for c in data if c.timeframe == base
+                )
+                self.store(market_data.closed_bars)
+            if self._archive is not None:
+                if flagged:
+                    skipped = set(map(id, flagged))
+                    archived = [c for c in data if id(c) not in skipped]
+                else:
+                    archived = list(data)
+                archived.extend(market_data.closed_bars)
+                async with self._archive_lock:
+                    await asyncio.to_thread(self._archive.append, archived)
             return market_data
         return MarketData()
 
+    def reconfigure(self, config: LayerConfig, changed: set[str]) -> None:
+        """Swap in a new configuration, keeping partial resampled bars.
+
+        Args:
+            config: Validated data layer configuration
+            changed: Names of the fields whose values changed
+        """
+        super().reconfigure(config, changed)
+        if changed & {"resample_from", "timeframes"}:
+            self._configure_resampler()
+        if "trade_bars" in changed:
+            self._configure_aggregator()
+        if "validation" in changed:
+            self._configure_validator()
+
+    def _configure_resampler(self) -> None:
+        """Create or retarget the resampler from the configuration."""
+        config: DataLayerConfig = self.config  # type: ignore
+        base = config.resample_from
+        if base is None:
+            self._resampler = None
+            return
+        targets = [
+            t
+            for t in config.timeframes
+            if t.seconds > base.seconds and t.seconds % base.seconds == 0
+        ]
+        if self._resampler is not None and self._resampler.base == base:
+            self._resampler.set_targets(targets)
+            return
+        from stratoquant_nexus.layers.l0_resample import BarResampler
+
+        self._resampler = BarResampler(base, targets)
+
+    def apply_book_update(self, update: BookUpdate) -> bool:
+        """Apply an order book snapshot or diff.
+
+        Args:
+            update: Book update
+
+        Returns:
+            True if the update was applied; False for diffs that are stale,
+            skip a sequence number or arrive before a snapshot
+        """
+        book = self._books.get(update.symbol)
+        if book is None:
+            config: DataLayerConfig = self.config  # type: ignore
+            book = self._books[update.symbol] = OrderBook(
+                update.symbol, config.order_book_levels
+            )
+        return book.apply(update)
+
+    def get_order_book(self, symbol: str) -> OrderBook | None:
+        """Get the live order book of a symbol.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            The book (check ``in_sync`` before trading on it) or None
+        """
+        return self._books.get(symbol)
+
+    def _configure_aggregator(self) -> None:
+        """Create the trade aggregator from the configuration.
+
+        Bars still being filled are dropped.
+        """
+        config: DataLayerConfig = self.config  # type: ignore
+        if config.trade_bars is None:
+            self._aggregator = None
+            return
+        from stratoquant_nexus.layers.l0_aggregation import TradeAggregator
+
+        self._aggregator = TradeAggregator(config.trade_bars)
+
+    def _configure_validator(self) -> None:
+        """Create the candle validator from the configuration.
+
+        The per-series history used for ordering and spike checks is dropped.
+        """
+        config: DataLayerConfig = self.config  # type: ignore
+        if config.validation is None:
+            self._validator = None
+            return
+        from stratoquant_nexus.layers.l0_validation import CandleValidator
+
+        self._validator = CandleValidator(config.validation)
+
+    @property
+    def validation_counters(self) -> dict[str, int]:
+        """Get the candle validation counters (empty without validation)."""
+        if self._validator is None:
+            return {}
+        return dict(self._validator.counters)
+
+    def store(self, candles: Iterable[OHLCV]) -> None:
+        """Add candles to the per-symbol history without processing them.
+
+        Args:
+            candles: Candles to store, in arrival order
+        """
+        for candle in candles:
+            if candle.symbol not in self._market_data:
+                self._market_data[candle.symbol] = MarketData()
+            self._market_data[candle.symbol].candles.append(candle)
+
     async def shutdown(self) -> None:
         """Clean up data layer resources."""
         self._market_data.clear()
+        self._books.clear()
+        self._resampler = None
+        self._configure_resampler()
+        self._configure_aggregator()
+        self._configure_validator()
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
         self._initialized = False
 
+    def save_checkpoint(self, writer: "CheckpointWriter") -> None:
+        """Save the most recent stored candles.
+
+        Only the last ``max_candles`` of each symbol and timeframe are
+        written, in their stored order.
+
+        Args:
+            writer: Checkpoint being built
+        """
+        config: DataLayerConfig = self.config  # type: ignore
+        kept: list[OHLCV] = []
+        for data in self._market_data.values():
+            counts: dict[Timeframe, int] = {}
+            recent = []
+            for candle in reversed(data.candles):
+                count = counts.get(candle.timeframe, 0)
+                if count < config.max_candles:
+                    counts[candle.timeframe] = count + 1
+                    recent.append(candle)
+            kept.extend(reversed(recent))
+        writer.add_candles(f"{self.name}.candles", kept)
+
+    def load_checkpoint(self, checkpoint: "Checkpoint") -> None:
+        """Restore the stored candle history.
+
+        Args:
+            checkpoint: Mapped checkpoint
+        """
+        name = f"{self.name}.candles"
+        if name not in checkpoint:
+            return
+        self._market_data.clear()
+        self.store(checkpoint.candles(name))
+
     def get_market_data(self, symbol: str) -> MarketData | None:
         """Get stored market data for a symbol.
 
@@ -143,3 +473,86 @@ class DataLayer(BaseLayer):
             MarketData for the symbol or None
         """
         return self._market_data.get(symbol)
+
+    def get_history(
+        self,
+        symbol: str,
+        timeframe: Timeframe,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> "np.ndarray | None":
+        """Get archived candles in a time range without loading them.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            start: First candle timestamp to include
+            end: Candle timestamp to stop before
+
+        Returns:
+            Zero-copy view of the archived records, or None without an archive
+        """
+        if self._archive is None:
+            return None
+        return self._archive.read(symbol, timeframe, start, end)
+
+    def load_parquet(
+        self,
+        path: str,
+        symbols: list[str] | None = None,
+        timeframes: list[Timeframe] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> int:
+        """Load history from a Parquet dataset into the candle archive.
+
+        Only the requested partitions and row groups are read (see
+        ``ParquetCandleLoader``); records go straight into the archive
+        without building candle models, through the validator if one is
+        configured.
+
+        Args:
+            path: Parquet file or dataset directory
+            symbols: Symbols to load (None for all)
+            timeframes: Timeframes to load (None for all)
+            start: First candle timestamp to include
+            end: Candle timestamp to stop before
+
+        Returns:
+            Number of candles archived
+
+        Raises:
+            RuntimeError: If no archive is configured
+            ImportError: If pyarrow is not installed
+        """
+        if self._archive is None:
+            raise RuntimeError("Loading Parquet history requires archive_path")
+        from stratoquant_nexus.layers.l0_parquet import ParquetCandleLoader
+
+        return ParquetCandleLoader(path).load_into(
+            self._archive, symbols, timeframes, start, end, self._validator
+        )
+
+    def get_volume_profile(self, symbol: str, buckets: int = 24) -> list[float]:
+        """Get the average volume per intraday time bucket for a symbol.
+
+        Args:
+            symbol: Trading symbol
+            buckets: Number of equal buckets the day is divided into
+
+        Returns:
+            Average candle volume per bucket (empty if no data)
+        """
+        market_data = self._market_data.get(symbol)
+        if market_data is None or not market_data.candles:
+            return []
+
+        totals = [0.0] * buckets
+        counts = [0] * buckets
+        for candle in market_data.candles:
+            ts = candle.timestamp
+            seconds_of_day = ts.hour * 3600 + ts.minute * 60 + ts.second
+            bucket = seconds_of_day * buckets // 86400
+            totals[bucket] += float(candle.volume)
+            counts[bucket] += 1
+        return [t / c if c else 0.0 for t, c in zip(totals, counts, strict=True)]
@@ -0,0 +1,339 @@
+"""Incremental L2 order books.
+
+Each side keeps its price levels in a pair of sorted lists, ordered so the
+best level is last: a level update is a binary search plus a list insert or
+delete, and the best bid and ask are read in constant time. Books are built
+from a snapshot and then kept current by sequenced diffs; a missing
+sequence number marks the book out of sync until the next snapshot.
+
+Derived features (spread, microprice, depth within a band around the mid
+and bid/ask imbalance) read the live levels without copying the book.
+"""
+
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+import structlog
+
+logger = structlog.get_logger()
+
+PriceLevel = tuple[float, float]  # (price, size)
+
+
+class BookSide:
+    """Price levels of one side of a book, best level last."""
+
+    __slots__ = ("_keys", "_sizes", "_sign", "_floor")
+
+    def __init__(self, is_bid: bool) -> None:
+        """Initialize an empty side.
+
+        Args:
+            is_bid: True for bids (best is highest), False for asks
+        """
+        # Keys ascend towards the best price: bid prices, negated ask prices
+        self._sign = 1.0 if is_bid else -1.0
+        self._keys: list[float] = []
+        self._sizes: list[float] = []
+        # Keys below this were truncated away and are no longer tracked
+        self._floor = float("-inf")
+
+    def __len__(self) -> int:
+        """Get the number of price levels."""
+        return len(self._keys)
+
+    def set(self, price: float, size: float) -> None:
+        """Set the size at a price level.
+
+        Levels worse than the worst level kept by ``truncate`` are ignored,
+        since the levels between them are unknown.
+
+        Args:
+            price: Level price
+            size: Total size at the level (0 removes it)
+        """
+        key = price * self._sign
+        if key < self._floor:
+            return
+        keys = self._keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            if size > 0:
+                self._sizes[i] = size
+            else:
+                del keys[i]
+                del self._sizes[i]
+        elif size > 0:
+            keys.insert(i, key)
+            self._sizes.insert(i, size)
+
+    def clear(self) -> None:
+        """Remove every level."""
+        self._keys.clear()
+        self._sizes.clear()
+        self._floor = float("-inf")
+
+    def best(self) -> PriceLevel | None:
+        """Get the best level, or None if the side is empty."""
+        if not self._keys:
+            return None
+        return self._keys[-1] * self._sign, self._sizes[-1]
+
+    def levels(self, count: int) -> list[PriceLevel]:
+        """Get the best levels.
+
+        Args:
+            count: Maximum number of levels
+
+        Returns:
+            Levels from the best price outwards
+        """
+        sign = self._sign
+        keys = self._keys[-count:] if count > 0 else []
+        sizes = self._sizes[-count:] if count > 0 else []
+        return [
+            (k * sign, s) for k, s in zip(reversed(keys), reversed(sizes), strict=True)
+        ]
+
+    def size_within(self, price: float) -> float:
+        """Get the total size at prices as good as or better than a limit.
+
+        Args:
+            price: Worst price to include
+
+        Returns:
+            Summed size of the matching levels
+        """
+        return sum(self._sizes[bisect_left(self._keys, price * self._sign) :])
+
+    def size_top(self, count: int) -> float:
+        """Get the total size of the best levels.
+
+        Args:
+            count: Number of levels
+
+        Returns:
+            Summed size
+        """
+        return sum(self._sizes[-count:]) if count > 0 else 0.0
+
+    def truncate(self, count: int) -> None:
+        """Keep only the best levels.
+
+        Args:
+            count: Number of levels to keep
+        """
+        excess = len(self._keys) - count
+        if excess > 0:
+            del self._keys[:excess]
+            del self._sizes[:excess]
+            self._floor = self._keys[0] if self._keys else float("inf")
+
+
+class BookUpdate:
+    """Snapshot or diff of one symbol's book.
+
+    Attributes:
+        symbol: Trading symbol
+        sequence: Exchange sequence number of the update
+        bids: Bid levels as (price, size); size 0 deletes a level
+        asks: Ask levels as (price, size); size 0 deletes a level
+        snapshot: True to replace the book, False to apply a diff
+    """
+
+    __slots__ = ("symbol", "sequence", "bids", "asks", "snapshot")
+
+    def __init__(
+        self,
+        symbol: str,
+        sequence: int,
+        bids: Iterable[PriceLevel] = (),
+        asks: Iterable[PriceLevel] = (),
+        snapshot: bool = False,
+    ) -> None:
+        """Initialize the update."""
+        self.symbol = symbol
+        self.sequence = sequence
+        self.bids = bids
+        self.asks = asks
+        self.snapshot = snapshot
+
+
+class OrderBook:
+    """Limit order book of one symbol.
+
+    Example:
+        >>> book = OrderBook("BTC/USD")
+        >>> book.apply_snapshot([(99.5, 2.0)], [(100.5, 1.0)], sequence=10)
+        >>> book.apply_diff([(99.5, 0.0), (99.8, 1.5)], [], sequence=11)
+        >>> book.spread, book.microprice
+    """
+
+    def __init__(self, symbol: str, max_levels: int | None = None) -> None:
+        """Initialize an empty, out-of-sync book.
+
+        Args:
+            symbol: Trading symbol
+            max_levels: Levels kept per side (None for all)
+        """
+        self.symbol = symbol
+        self.max_levels = max_levels
+        self.bids = BookSide(is_bid=True)
+        self.asks = BookSide(is_bid=False)
+        self.sequence = -1
+        self.in_sync = False
+        self.gaps = 0
+        self.updated_at: datetime | None = None
+
+    def apply(self, update: BookUpdate) -> bool:
+        """Apply a snapshot or diff.
+
+        Args:
+            update: Update for this book's symbol
+
+        Returns:
+            True if the update was applied
+        """
+        if update.snapshot:
+            self.apply_snapshot(update.bids, update.asks, update.sequence)
+            return True
+        return self.apply_diff(update.bids, update.asks, update.sequence)
+
+    def apply_snapshot(
+        self, bids: Iterable[PriceLevel], asks: Iterable[PriceLevel], sequence: int
+    ) -> None:
+        """Replace the book.
+
+        Args:
+            bids: Bid levels as (price, size)
+            asks: Ask levels as (price, size)
+            sequence: Sequence number the snapshot is current at
+        """
+        for side, levels in ((self.bids, bids), (self.asks, asks)):
+            side.clear()
+            for price, size in levels:
+                side.set(float(price), float(size))
+            if self.max_levels is not None:
+                side.truncate(self.max_levels)
+        self.sequence = sequence
+        self.in_sync = True
+        self.updated_at = datetime.now(UTC)
+
+    def apply_diff(
+        self, bids: Iterable[PriceLevel], asks: Iterable[PriceLevel], sequence: int
+    ) -> bool:
+        """Apply changed levels.
+
+        Diffs already covered by the book are ignored. A diff that skips a
+        sequence number marks the book out of sync, and later diffs are
+        ignored until a new snapshot arrives. With ``max_levels``, each side
+        is truncated again after the diff.
+
+        Args:
+            bids: Changed bid levels as (price, size); size 0 deletes a level
+            asks: Changed ask levels as (price, size); size 0 deletes a level
+            sequence: Sequence number of the diff
+
+        Returns:
+            True if the diff was applied
+        """
+        if not self.in_sync or sequence <= self.sequence:
+            return False
+        if sequence != self.sequence + 1:
+            self.in_sync = False
+            self.gaps += 1
+            logger.warning(
+                "Order book sequence gap",
+                symbol=self.symbol,
+                expected=self.sequence + 1,
+                received=sequence,
+            )
+            return False
+        for price, size in bids:
+            self.bids.set(float(price), float(size))
+        for price, size in asks:
+            self.asks.set(float(price), float(size))
+        if self.max_levels is not None:
+            self.bids.truncate(self.max_levels)
+            self.asks.truncate(self.max_levels)
+        self.sequence = sequence
+        self.updated_at = datetime.now(UTC)
+        return True
+
+    @property
+    def best_bid(self) -> PriceLevel | None:
+        """Get the best bid level."""
+        return self.bids.best()
+
+    @property
+    def best_ask(self) -> PriceLevel | None:
+        """Get the best ask level."""
+        return self.asks.best()
+
+    @property
+    def mid(self) -> float | None:
+        """Get the mid price, or None if a side is empty."""
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    @property
+    def spread(self) -> float | None:
+        """Get the best ask minus the best bid."""
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    @property
+    def spread_bps(self) -> float | None:
+        """Get the spread in basis points of the mid price."""
+        spread, mid = self.spread, self.mid
+        if spread is None or not mid:
+            return None
+        return spread / mid * 10_000
+
+    @property
+    def microprice(self) -> float | None:
+        """Get the mid weighted towards the side with less size at the top."""
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        total = bid[1] + ask[1]
+        return (bid[0] * ask[1] + ask[0] * bid[1]) / total
+
+    def depth(self, bps: float) -> tuple[float, float]:
+        """Get the size resting within a band around the mid.
+
+        Args:
+            bps: Band half-width in basis points of the mid price
+
+        Returns:
+            Bid and ask size within the band (zeros if a side is empty)
+        """
+        mid = self.mid
+        if mid is None:
+            return 0.0, 0.0
+        band = mid * bps / 10_000
+        return self.bids.size_within(mid - band), self.asks.size_within(mid + band)
+
+    def imbalance(self, levels: int | None = 1, bps: float | None = None) -> float:
+        """Get the bid/ask size imbalance.
+
+        Args:
+            levels: Number of best levels per side to count
+            bps: Count levels within this band around the mid instead
+
+        Returns:
+            (bid size - ask size) / (bid size + ask size), in [-1, 1]; 0 for
+            an empty book
+        """
+        if bps is not None:
+            bid_size, ask_size = self.depth(bps)
+        else:
+            count = levels or 1
+            bid_size, ask_size = self.bids.size_top(count), self.asks.size_top(count)
+        total = bid_size + ask_size
+        return (bid_size - ask_size) / total if total else 0.0
@@ -0,0 +1,249 @@
+"""Historical candle loader for partitioned Parquet datasets.
+
+Requires the optional ``pyarrow`` dependency (``pip install
+stratoquant-nexus[parquet]``). Symbol, timeframe and time range filters are
+handed to ``pyarrow.dataset``, which skips non-matching partitions
+(e.g. ``symbol=BTC%2FUSD/timeframe=1h/...`` directories) and row groups whose
+statistics fall outside the range. Matching record batches are converted
+column-wise into ``RECORD_DTYPE`` arrays, the same layout the candle archive
+maps, without building a model per row.
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import structlog
+
+from stratoquant_nexus.layers.l0_archive import RECORD_DTYPE, CandleArchive
+from stratoquant_nexus.layers.l0_data import Timeframe
+from stratoquant_nexus.utils.binary import to_micros
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from stratoquant_nexus.layers.l0_validation import CandleValidator
+
+logger = structlog.get_logger()
+
+_PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def _import_pyarrow() -> Any:
+    """Import pyarrow and its dataset module.
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow
+        import pyarrow.dataset
+    except ImportError as e:
+        raise ImportError(
+            "Loading Parquet data requires pyarrow: "
+            "pip install 'stratoquant-nexus[parquet]'"
+        ) from e
+    return pyarrow
+
+
+class ParquetCandleLoader:
+    """Read candles from a Parquet file or partitioned dataset.
+
+    Example:
+        >>> loader = ParquetCandleLoader("data/history")
+        >>> series = loader.read(["BTC/USD"], [Timeframe.H1], start=start)
+        >>> series["BTC/USD", Timeframe.H1]["close"]
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        partitioning: str | None = "hive",
+        columns: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize the loader.
+
+        Args:
+            path: Parquet file or dataset directory
+            partitioning: pyarrow partitioning flavor of the directory layout
+            columns: Dataset column name per candle field, for fields whose
+                name differs (e.g. ``{"timestamp": "ts"}``)
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        self._pa = _import_pyarrow()
+        self.path = Path(path)
+        self.columns = {
+            field: field
+            for field in ("timestamp", "symbol", "timeframe", *_PRICE_FIELDS)
+        } | (columns or {})
+        self.dataset = self._pa.dataset.dataset(
+            str(self.path), format="parquet", partitioning=partitioning
+        )
+
+    def batches(
+        self,
+        symbols: Iterable[str] | None = None,
+        timeframes: Iterable[Timeframe] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        batch_size: int = 131_072,
+    ) -> Iterator[tuple[str, Timeframe, np.ndarray]]:
+        """Stream matching candles.
+
+        Args:
+            symbols: Symbols to read (None for all)
+            timeframes: Timeframes to read (None for all)
+            start: First candle timestamp to include
+            end: Candle timestamp to stop before
+            batch_size: Maximum rows per record batch
+
+        Yields:
+            Symbol, timeframe and the batch's ``RECORD_DTYPE`` records of
+            that series, sorted by timestamp
+        """
+        pa = self._pa
+        names = self.columns
+        scanner = self.dataset.scanner(
+            columns=list(names.values()),
+            filter=self._filter(symbols, timeframes, start, end),
+            batch_size=batch_size,
+        )
+        for batch in scanner.to_batches():
+            if not batch.num_rows:
+                continue
+            records = np.empty(batch.num_rows, dtype=RECORD_DTYPE)
+            timestamps = batch.column(names["timestamp"])
+            if pa.types.is_timestamp(timestamps.type):
+                timestamps = timestamps.cast(pa.timestamp("us", tz=timestamps.type.tz))
+            records["timestamp"] = timestamps.cast(pa.int64()).to_numpy()
+            for field in _PRICE_FIELDS:
+                column = batch.column(names[field]).cast(pa.float64())
+                records[field] = column.to_numpy(zero_copy_only=False)
+
+            # Group rows by series without touching them one by one
+            symbol_codes = batch.column(names["symbol"]).dictionary_encode()
+            timeframe_codes = batch.column(names["timeframe"]).dictionary_encode()
+            keys = (
+                symbol_codes.indices.to_numpy().astype(np.int64)
+                * len(timeframe_codes.dictionary)
+                + timeframe_codes.indices.to_numpy()
+            )
+            order = np.lexsort((records["timestamp"], keys))
+            keys = keys[order]
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            stops = np.r_[starts[1:], len(keys)]
+            width = len(timeframe_codes.dictionary)
+            symbol_names = symbol_codes.dictionary.to_pylist()
+            timeframe_names = timeframe_codes.dictionary.to_pylist()
+            for lo, hi in zip(starts.tolist(), stops.tolist(), strict=True):
+                key = int(keys[lo])
+                yield (
+                    symbol_names[key // width],
+                    Timeframe(timeframe_names[key % width]),
+                    records[order[lo:hi]],
+                )
+
+    def read(
+        self,
+        symbols: Iterable[str] | None = None,
+        timeframes: Iterable[Timeframe] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> dict[tuple[str, Timeframe], np.ndarray]:
+        """Read matching candles into one array per series.
+
+        Args:
+            symbols: Symbols to read (None for all)
+            timeframes: Timeframes to read (None for all)
+            start: First candle timestamp to include
+            end: Candle timestamp to stop before
+
+        Returns:
+            ``RECORD_DTYPE`` records sorted by timestamp, per symbol and
+            timeframe
+        """
+        chunks: dict[tuple[str, Timeframe], list[np.ndarray]] = {}
+        for symbol, timeframe, records in self.batches(symbols, timeframes, start, end):
+            chunks.setdefault((symbol, timeframe), []).append(records)
+        series = {}
+        for key, parts in chunks.items():
+            records = np.concatenate(parts)
+            series[key] = records[np.argsort(records["timestamp"], kind="stable")]
+        return series
+
+    def load_into(
+        self,
+        archive: CandleArchive,
+        symbols: Iterable[str] | None = None,
+        timeframes: Iterable[Timeframe] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        validator: "CandleValidator | None" = None,
+    ) -> int:
+        """Stream matching candles into a candle archive.
+
+        Batches are appended as they are read, so memory stays bounded by
+        the batch size. Candles older than what a series already holds are
+        skipped, so datasets should be sorted by time within each series.
+        With a validator, each batch is checked on its columns before it is
+        written.
+
+        Args:
+            archive: Archive to append to
+            symbols: Symbols to read (None for all)
+            timeframes: Timeframes to read (None for all)
+            start: First candle timestamp to include
+            end: Candle timestamp to stop before
+            validator: Validator the records pass through (optional)
+
+        Returns:
+            Number of records written
+        """
+        written = 0
+        for symbol, timeframe, records in self.batches(symbols, timeframes, start, end):
+            if validator is not None:
+                records, _ = validator.validate_records(symbol, timeframe, records)
+            written += archive.append_records(archive.path(symbol, timeframe), records)
+        logger.info("Parquet history loaded", path=str(self.path), candles=written)
+        return written
+
+    def _filter(
+        self,
+        symbols: Iterable[str] | None,
+        timeframes: Iterable[Timeframe] | None,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> "pa.compute.Expression | None":
+        """Build the pushdown filter expression."""
+        pa = self._pa
+        field = pa.dataset.field
+        names = self.columns
+        conditions = []
+        if symbols is not None:
+            conditions.append(field(names["symbol"]).isin(list(symbols)))
+        if timeframes is not None:
+            values = [Timeframe(t).value for t in timeframes]
+            conditions.append(field(names["timeframe"]).isin(values))
+        ts_type = self.dataset.schema.field(names["timestamp"]).type
+        for bound, ts in (("start", start), ("end", end)):
+            if ts is None:
+                continue
+            micros = to_micros(ts)
+            if pa.types.is_timestamp(ts_type):
+                value = pa.scalar(micros, pa.timestamp("us", tz=ts_type.tz)).cast(
+                    ts_type
+                )
+            else:
+                value = pa.scalar(micros, ts_type)
+            column = field(names["timestamp"])
+            conditions.append(column >= value if bound == "start" else column < value)
+        if not conditions:
+            return None
+        expression = conditions[0]
+        for condition in conditions[1:]:
+            expression = expression & condition
+        return expression
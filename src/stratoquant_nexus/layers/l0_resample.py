@@ -0,0 +1,209 @@
+"""Streaming resampling of base-timeframe candles into higher timeframes.
+
+``BarResampler`` keeps one partial bar per symbol and target timeframe and
+folds each base candle into it in constant time. A higher-timeframe bar is
+closed as soon as the base candle ending its period arrives, or when a
+later period starts after a gap in the feed. Periods are aligned to UTC:
+days start at midnight and weeks on Monday.
+"""
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import structlog
+
+from stratoquant_nexus.layers.l0_data import OHLCV, Timeframe
+
+logger = structlog.get_logger()
+
+# 1970-01-01 was a Thursday; weeks start on Monday 1970-01-05
+_PERIOD_OFFSETS = {Timeframe.W1: 4 * 86400}
+
+
+class _PartialBar:
+    """Mutable bar being built for one symbol and timeframe."""
+
+    __slots__ = ("start", "end", "open", "high", "low", "close", "volume")
+
+    def __init__(self, start: int, end: int, candle: OHLCV) -> None:
+        """Start a bar from its first base candle."""
+        self.start = start
+        self.end = end
+        self.open = candle.open
+        self.high = candle.high
+        self.low = candle.low
+        self.close = candle.close
+        self.volume: Decimal = candle.volume
+
+    def add(self, candle: OHLCV) -> None:
+        """Fold in a later base candle of the same period."""
+        if candle.high > self.high:
+            self.high = candle.high
+        if candle.low < self.low:
+            self.low = candle.low
+        self.close = candle.close
+        self.volume += candle.volume
+
+    def to_candle(self, symbol: str, timeframe: Timeframe) -> OHLCV:
+        """Get the bar as a candle stamped with its period start."""
+        return OHLCV.model_construct(
+            timestamp=datetime.fromtimestamp(self.start, UTC),
+            open=self.open,
+            high=self.high,
+            low=self.low,
+            close=self.close,
+            volume=self.volume,
+            symbol=symbol,
+            timeframe=timeframe,
+        )
+
+
+def period_start(seconds: int, timeframe: Timeframe) -> int:
+    """Get the start of the period containing a time.
+
+    Args:
+        seconds: Seconds since the epoch
+        timeframe: Period length
+
+    Returns:
+        Period start in seconds since the epoch
+    """
+    offset = _PERIOD_OFFSETS.get(timeframe, 0)
+    length = timeframe.seconds
+    return (seconds - offset) // length * length + offset
+
+
+class BarResampler:
+    """Build higher-timeframe bars from a single base-timeframe feed.
+
+    Base candles must arrive in time order per symbol; a candle from a
+    period that has already closed is dropped.
+
+    Example:
+        >>> resampler = BarResampler(Timeframe.M1, [Timeframe.M5, Timeframe.H1])
+        >>> closed = resampler.update_many(minute_candles)
+    """
+
+    def __init__(self, base: Timeframe, targets: Iterable[Timeframe]) -> None:
+        """Initialize the resampler.
+
+        Args:
+            base: Timeframe of the input candles
+            targets: Higher timeframes to build
+
+        Raises:
+            ValueError: If a target is not a multiple of the base timeframe
+        """
+        self.base = Timeframe(base)
+        self._targets: tuple[Timeframe, ...] = ()
+        self._bars: dict[tuple[str, Timeframe], _PartialBar] = {}
+        self._closed_until: dict[tuple[str, Timeframe], int] = {}
+        self.set_targets(targets)
+
+    @property
+    def targets(self) -> tuple[Timeframe, ...]:
+        """Get the timeframes being built."""
+        return self._targets
+
+    def set_targets(self, targets: Iterable[Timeframe]) -> None:
+        """Change the timeframes being built.
+
+        Partial bars of timeframes that remain are kept.
+
+        Args:
+            targets: Higher timeframes to build
+
+        Raises:
+            ValueError: If a target is not a multiple of the base timeframe
+        """
+        base_seconds = self.base.seconds
+        resolved = tuple(dict.fromkeys(Timeframe(t) for t in targets))
+        for timeframe in resolved:
+            if timeframe.seconds <= base_seconds or timeframe.seconds % base_seconds:
+                raise ValueError(
+                    f"Cannot build {timeframe.value} bars from {self.base.value} bars"
+                )
+        self._targets = resolved
+        self._bars = {key: bar for key, bar in self._bars.items() if key[1] in resolved}
+        self._closed_until = {
+            key: end for key, end in self._closed_until.items() if key[1] in resolved
+        }
+
+    def update(self, candle: OHLCV) -> list[OHLCV]:
+        """Fold in one base candle.
+
+        Args:
+            candle: Candle of the base timeframe
+
+        Returns:
+            Higher-timeframe bars closed by this candle
+        """
+        ts = candle.timestamp
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=UTC)
+        seconds = int(ts.timestamp())
+        candle_end = seconds + self.base.seconds
+        closed: list[OHLCV] = []
+        late = False
+        for timeframe in self._targets:
+            key = (candle.symbol, timeframe)
+            bar = self._bars.get(key)
+            if bar is not None and seconds >= bar.end:
+                # The feed skipped the candle that would have closed it
+                closed.append(self._close(key, bar))
+                bar = None
+            if bar is None:
+                if seconds < self._closed_until.get(key, seconds):
+                    late = True
+                    continue
+                start = period_start(seconds, timeframe)
+                bar = _PartialBar(start, start + timeframe.seconds, candle)
+                self._bars[key] = bar
+            elif seconds < bar.start:
+                late = True
+                continue
+            else:
+                bar.add(candle)
+            if candle_end >= bar.end:
+                closed.append(self._close(key, bar))
+        if late:
+            logger.debug(
+                "Dropped late candle",
+                symbol=candle.symbol,
+                timestamp=ts.isoformat(),
+            )
+        return closed
+
+    def update_many(self, candles: Iterable[OHLCV]) -> list[OHLCV]:
+        """Fold in base candles in order.
+
+        Args:
+            candles: Candles of the base timeframe
+
+        Returns:
+            Higher-timeframe bars closed by these candles, in closing order
+        """
+        closed: list[OHLCV] = []
+        for candle in candles:
+            closed.extend(self.update(candle))
+        return closed
+
+    def partial(self, symbol: str, timeframe: Timeframe) -> OHLCV | None:
+        """Get the bar still being built for a symbol and timeframe.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Target timeframe
+
+        Returns:
+            The partial bar so far, or None if no period is open
+        """
+        bar = self._bars.get((symbol, Timeframe(timeframe)))
+        return bar.to_candle(symbol, Timeframe(timeframe)) if bar else None
+
+    def _close(self, key: tuple[str, Timeframe], bar: _PartialBar) -> OHLCV:
+        """Close a partial bar and get it as a candle."""
+        del self._bars[key]
+        self._closed_until[key] = bar.end
+        return bar.to_candle(*key)
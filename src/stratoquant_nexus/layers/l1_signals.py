@@ -6,15 +6,19 @@ This layer handles:
 - Signal aggregation and scoring
 """
 
+from collections import deque
 from datetime import UTC, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
 from stratoquant_nexus.layers.base import BaseLayer, LayerConfig, LayerLevel
-from stratoquant_nexus.layers.l0_data import OHLCV, MarketData
+from stratoquant_nexus.layers.l0_data import OHLCV, MarketData, Timeframe
+
+if TYPE_CHECKING:
+    from stratoquant_nexus.checkpoint import Checkpoint, CheckpointWriter
 
 
 class SignalType(str, Enum):
@@ -81,6 +85,8 @@ class SignalLayer(BaseLayer):
     4. Providing signal confidence scores
     """
 
+    result_key = "signals"
+
     def __init__(self, config: SignalLayerConfig | None = None) -> None:
         """Initialize the signal layer.
 
@@ -90,7 +96,10 @@ class SignalLayer(BaseLayer):
         if config is None:
             config = SignalLayerConfig(name="SignalLayer")
         super().__init__(config)
-        self._signals: list[TradingSignal] = []
+        # Latest signal per symbol; older ones are superseded
+        self._signals: dict[str, TradingSignal] = {}
+        # Recent resampled bars per symbol and higher timeframe
+        self._closed_bars: dict[tuple[str, Timeframe], deque[OHLCV]] = {}
 
     async def initialize(self) -> None:
         """Initialize signal layer resources."""
@@ -116,10 +125,38 @@ class SignalLayer(BaseLayer):
                     signal = await self._generate_signal(symbol, candles)
                     if signal:
                         signals.append(signal)
-                        self._signals.append(signal)
+                        self._signals[symbol] = signal
+
+        if isinstance(data, MarketData):
+            for bar in data.closed_bars:
+                signal = await self._on_bar_close(bar)
+                if signal:
+                    signals.append(signal)
+                    self._signals[signal.symbol] = signal
 
         return signals
 
+    async def _on_bar_close(self, bar: OHLCV) -> TradingSignal | None:
+        """Generate a signal when a resampled higher-timeframe bar closes.
+
+        Args:
+            bar: Closed bar
+
+        Returns:
+            Signal from the timeframe's recent bars, or None while fewer
+            than two have closed
+        """
+        key = (bar.symbol, bar.timeframe)
+        history = self._closed_bars.get(key)
+        if history is None:
+            config: SignalLayerConfig = self.config  # type: ignore
+            history = self._closed_bars[key] = deque(maxlen=config.sma_long_period)
+        history.append(bar)
+        signal = await self._generate_signal(bar.symbol, list(history))
+        if signal:
+            signal.indicators["timeframe"] = bar.timeframe.value
+        return signal
+
     async def _generate_signal(
         self, symbol: str, candles: list[OHLCV]
     ) -> TradingSignal | None:
@@ -207,11 +244,73 @@ class SignalLayer(BaseLayer):
 
         return round(rsi, 2)
 
+    def reconfigure(self, config: LayerConfig, changed: set[str]) -> None:
+        """Swap in a new configuration, resizing the closed-bar windows.
+
+        Args:
+            config: Validated signal layer configuration
+            changed: Names of the fields whose values changed
+        """
+        super().reconfigure(config, changed)
+        if "sma_long_period" in changed:
+            period = config.sma_long_period  # type: ignore[attr-defined]
+            self._closed_bars = {
+                key: deque(history, maxlen=period)
+                for key, history in self._closed_bars.items()
+            }
+
     async def shutdown(self) -> None:
         """Clean up signal layer resources."""
         self._signals.clear()
+        self._closed_bars.clear()
         self._initialized = False
 
+    def save_checkpoint(self, writer: "CheckpointWriter") -> None:
+        """Save the latest signal per symbol and recent resampled bars.
+
+        Indicators are recomputed from the data layer's candles each cycle;
+        higher-timeframe bars are only seen as they close, so their windows
+        are kept here.
+
+        Args:
+            writer: Checkpoint being built
+        """
+        writer.add_json(
+            f"{self.name}.signals",
+            [signal.model_dump(mode="json") for signal in self._signals.values()],
+        )
+        writer.add_candles(
+            f"{self.name}.closed_bars",
+            [bar for history in self._closed_bars.values() for bar in history],
+        )
+
+    def load_checkpoint(self, checkpoint: "Checkpoint") -> None:
+        """Restore the latest signals and recent resampled bars.
+
+        Args:
+            checkpoint: Mapped checkpoint
+        """
+        name = f"{self.name}.signals"
+        if name in checkpoint:
+            self._signals = {}
+            for data in checkpoint.json(name):
+                signal = TradingSignal.model_validate(data)
+                latest = self._signals.get(signal.symbol)
+                if latest is None or signal.timestamp >= latest.timestamp:
+                    self._signals[signal.symbol] = signal
+        name = f"{self.name}.closed_bars"
+        if f"{name}.symbols" in checkpoint:
+            config: SignalLayerConfig = self.config  # type: ignore
+            self._closed_bars = {}
+            for bar in checkpoint.candles(name):
+                key = (bar.symbol, bar.timeframe)
+                history = self._closed_bars.get(key)
+                if history is None:
+                    history = self._closed_bars[key] = deque(
+                        maxlen=config.sma_long_period
+                    )
+                history.append(bar)
+
     def get_latest_signal(self, symbol: str) -> TradingSignal | None:
         """Get the latest signal for a symbol.
 
@@ -221,5 +320,4 @@ class SignalLayer(BaseLayer):
         Returns:
             Latest signal or None
         """
-        matching = [s for s in self._signals if s.symbol == symbol]
-        return max(matching, key=lambda x: x.timestamp) if matching else None
+        return self._signals.get(symbol)
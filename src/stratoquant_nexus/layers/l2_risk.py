@@ -7,14 +7,19 @@ This layer handles:
 - Stop-loss and take-profit levels
 """
 
+from collections.abc import Iterable
 from decimal import Decimal
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
 from stratoquant_nexus.layers.base import BaseLayer, LayerConfig, LayerLevel
 from stratoquant_nexus.layers.l1_signals import SignalType, TradingSignal
+from stratoquant_nexus.layers.l3_models import ExecutionReport, OrderSide
+
+if TYPE_CHECKING:
+    from stratoquant_nexus.checkpoint import Checkpoint, CheckpointWriter
 
 
 class RiskLevel(str, Enum):
@@ -37,6 +42,77 @@ class PositionSize(BaseModel):
     risk_reward_ratio: float = Field(..., description="Risk/reward ratio")
 
 
+class NetPosition(BaseModel):
+    """Net position accumulated from signed fills."""
+
+    symbol: str = Field(..., description="Trading symbol")
+    quantity: Decimal = Field(
+        default=Decimal("0"), description="Signed quantity (negative for short)"
+    )
+    average_price: Decimal = Field(default=Decimal("0"), description="Entry price")
+    stop_loss: Decimal | None = Field(default=None, description="Stop loss price")
+    take_profit: Decimal | None = Field(default=None, description="Take profit price")
+
+    @classmethod
+    def from_position_size(cls, position: PositionSize) -> "NetPosition":
+        """Build a net position from the risk layer's position model.
+
+        Args:
+            position: Position size with signed units
+
+        Returns:
+            Net position at the position's entry price
+        """
+        if not position.units:
+            return cls(symbol=position.symbol)
+        return cls(
+            symbol=position.symbol,
+            quantity=position.units,
+            average_price=position.notional_value / abs(position.units),
+            stop_loss=position.stop_loss_price,
+            take_profit=position.take_profit_price,
+        )
+
+    def apply_fill(self, quantity: Decimal, price: Decimal) -> None:
+        """Apply a signed fill to the position.
+
+        Args:
+            quantity: Signed filled quantity (negative for sells)
+            price: Fill price
+        """
+        new_quantity = self.quantity + quantity
+        if self.quantity == 0 or (self.quantity > 0) == (quantity > 0):
+            self.average_price = (
+                self.quantity * self.average_price + quantity * price
+            ) / new_quantity
+        elif new_quantity != 0 and (new_quantity > 0) != (self.quantity > 0):
+            # Position flipped; the remainder was opened at the fill price
+            self.average_price = price
+        self.quantity = new_quantity
+
+    def to_position_size(self) -> PositionSize:
+        """Convert to the position model.
+
+        Returns:
+            Position size with signed units
+        """
+        units = self.quantity
+        entry = self.average_price
+        stop_loss = self.stop_loss if self.stop_loss is not None else entry
+        take_profit = self.take_profit if self.take_profit is not None else entry
+        risk = abs(entry - stop_loss)
+        reward = abs(take_profit - entry)
+        return PositionSize(
+            symbol=self.symbol,
+            units=units,
+            notional_value=(abs(units) * entry).quantize(Decimal("0.01")),
+            risk_amount=(abs(units) * risk).quantize(Decimal("0.01")),
+            stop_loss_price=stop_loss,
+            take_profit_price=take_profit,
+            risk_reward_ratio=round(float(reward / risk), 2) if risk else 0.0,
+        )
+
+
 class RiskAssessment(BaseModel):
     """Risk assessment for a trading signal."""
 
@@ -48,6 +124,9 @@ class RiskAssessment(BaseModel):
     rejection_reason: str | None = Field(
         default=None, description="Reason for rejection if not approved"
     )
+    rejection_code: str | None = Field(
+        default=None, description="Short identifier of the rule that rejected"
+    )
     portfolio_exposure_pct: float = Field(
         default=0.0, description="Portfolio exposure percentage"
     )
@@ -87,6 +166,8 @@ class RiskLayer(BaseLayer):
     4. Approving or rejecting trades based on risk criteria
     """
 
+    result_key = "risk_assessments"
+
     def __init__(self, config: RiskLayerConfig | None = None) -> None:
         """Initialize the risk layer.
 
@@ -112,6 +193,68 @@ class RiskLayer(BaseLayer):
         """
         self._portfolio_value = value
 
+    @property
+    def active_positions(self) -> dict[str, PositionSize]:
+        """Get the active positions by symbol."""
+        return self._active_positions
+
+    @property
+    def current_exposure(self) -> Decimal:
+        """Get the notional value of the active positions."""
+        return self._current_exposure
+
+    def restore_positions(self, positions: dict[str, PositionSize]) -> None:
+        """Restore position state, e.g. after recovering from a journal.
+
+        Args:
+            positions: Positions by symbol (negative units for shorts)
+        """
+        self._active_positions = dict(positions)
+        self._update_exposure()
+
+    def apply_fills(self, reports: Iterable[ExecutionReport]) -> None:
+        """Update positions and exposure from executed orders.
+
+        Args:
+            reports: Execution reports of a cycle
+        """
+        filled = False
+        for report in reports:
+            order = report.order
+            if (
+                not report.success
+                or order.filled_quantity <= 0
+                or order.average_price is None
+            ):
+                continue
+            current = self._active_positions.get(order.symbol)
+            if current is None:
+                position = NetPosition(symbol=order.symbol)
+            else:
+                position = NetPosition.from_position_size(current)
+            quantity = order.filled_quantity
+            position.apply_fill(
+                quantity if order.side == OrderSide.BUY else -quantity,
+                order.average_price,
+            )
+            if order.stop_loss is not None:
+                position.stop_loss = order.stop_loss
+            if order.take_profit is not None:
+                position.take_profit = order.take_profit
+            if position.quantity:
+                self._active_positions[order.symbol] = position.to_position_size()
+            else:
+                self._active_positions.pop(order.symbol, None)
+            filled = True
+        if filled:
+            self._update_exposure()
+
+    def _update_exposure(self) -> None:
+        """Recompute the portfolio exposure from the active positions."""
+        self._current_exposure = sum(
+            (p.notional_value for p in self._active_positions.values()), Decimal("0")
+        )
+
     async def process(self, data: Any) -> list[RiskAssessment]:
         """Process trading signals and assess risk.
 
@@ -141,6 +284,7 @@ class RiskLayer(BaseLayer):
             Risk assessment
         """
         config: RiskLayerConfig = self.config  # type: ignore
+        latency = self.latency
 
         # Skip HOLD signals
         if signal.signal_type == SignalType.HOLD:
@@ -148,23 +292,33 @@ class RiskLayer(BaseLayer):
                 signal=signal,
                 approved=False,
                 rejection_reason="HOLD signals do not require execution",
+                rejection_code="hold_signal",
             )
 
         # Check portfolio exposure
+        start = latency.start()
         current_exposure_pct = float(self._current_exposure / self._portfolio_value)
-        if current_exposure_pct >= config.max_portfolio_exposure_pct:
+        exposure_exceeded = current_exposure_pct >= config.max_portfolio_exposure_pct
+        latency.record("risk.rule.exposure", start)
+        if exposure_exceeded:
             return RiskAssessment(
                 signal=signal,
                 approved=False,
                 rejection_reason="Maximum portfolio exposure reached",
+                rejection_code="max_exposure",
                 portfolio_exposure_pct=current_exposure_pct * 100,
             )
 
         # Calculate position size
+        start = latency.start()
         position_size = await self._calculate_position_size(signal, config)
+        latency.record("risk.rule.position_size", start)
 
         # Validate risk/reward ratio
-        if position_size.risk_reward_ratio < config.min_risk_reward_ratio:
+        start = latency.start()
+        below_min_ratio = position_size.risk_reward_ratio < config.min_risk_reward_ratio
+        latency.record("risk.rule.risk_reward", start)
+        if below_min_ratio:
             return RiskAssessment(
                 signal=signal,
                 approved=False,
@@ -173,6 +327,7 @@ class RiskLayer(BaseLayer):
                     f"Risk/reward ratio {position_size.risk_reward_ratio:.2f} "
                     f"below minimum {config.min_risk_reward_ratio}"
                 ),
+                rejection_code="min_risk_reward",
                 portfolio_exposure_pct=current_exposure_pct * 100,
             )
 
@@ -232,3 +387,38 @@ class RiskLayer(BaseLayer):
         self._active_positions.clear()
         self._current_exposure = Decimal("0")
         self._initialized = False
+
+    def save_checkpoint(self, writer: "CheckpointWriter") -> None:
+        """Save the portfolio value and active positions.
+
+        Args:
+            writer: Checkpoint being built
+        """
+        writer.add_json(
+            f"{self.name}.state",
+            {
+                "portfolio_value": str(self._portfolio_value),
+                "positions": {
+                    symbol: position.model_dump(mode="json")
+                    for symbol, position in self._active_positions.items()
+                },
+            },
+        )
+
+    def load_checkpoint(self, checkpoint: "Checkpoint") -> None:
+        """Restore the portfolio value and active positions.
+
+        Args:
+            checkpoint: Mapped checkpoint
+        """
+        name = f"{self.name}.state"
+        if name not in checkpoint:
+            return
+        state = checkpoint.json(name)
+        self.set_portfolio_value(Decimal(state["portfolio_value"]))
+        self.restore_positions(
+            {
+                symbol: PositionSize.model_validate(position)
+                for symbol, position in state["positions"].items()
+            }
+        )
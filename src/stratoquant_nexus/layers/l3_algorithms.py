@@ -0,0 +1,371 @@
+"""L3 execution algorithms - TWAP, VWAP and iceberg parent/child orders.
+
+A parent order is split into child slices up front. A single
+:class:`ChildOrderScheduler` task keeps every working parent in a heap keyed
+by the due time of its next child, so thousands of parents cost one timer
+and one task rather than one task per child. Children that fall due together
+are submitted as one batch, and each child fill is rolled into the parent's
+``filled_quantity`` and ``average_price`` incrementally.
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+from collections import deque
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import structlog
+
+from stratoquant_nexus.layers.l3_batching import pro_rata
+from stratoquant_nexus.layers.l3_models import (
+    ExecutionAlgorithm,
+    ExecutionReport,
+    Order,
+    OrderStatus,
+)
+
+logger = structlog.get_logger()
+
+
+def twap_slices(quantity: Decimal, slices: int) -> list[Decimal]:
+    """Split a quantity into equal time slices.
+
+    Args:
+        quantity: Parent quantity
+        slices: Number of slices
+
+    Returns:
+        Child quantities
+    """
+    return pro_rata(quantity, [Decimal("1")] * max(slices, 1))
+
+
+def vwap_slices(
+    quantity: Decimal,
+    slices: int,
+    duration_seconds: float,
+    volume_profile: list[float],
+    start: datetime | None = None,
+) -> list[Decimal]:
+    """Split a quantity in proportion to expected volume.
+
+    ``volume_profile`` holds average volume per intraday bucket (as returned
+    by ``DataLayer.get_volume_profile``); each slice is weighted by the
+    bucket its scheduled time falls in. Falls back to TWAP when no volume
+    information is available.
+
+    Args:
+        quantity: Parent quantity
+        slices: Number of slices
+        duration_seconds: Time over which the slices are spread
+        volume_profile: Average volume per intraday bucket
+        start: Schedule start time (defaults to now)
+
+    Returns:
+        Child quantities
+    """
+    slices = max(slices, 1)
+    if not volume_profile or not any(volume_profile):
+        return twap_slices(quantity, slices)
+
+    start = start or datetime.now(UTC)
+    bucket_seconds = 86400 / len(volume_profile)
+    step = duration_seconds / slices
+    weights = []
+    for i in range(slices):
+        at = start + timedelta(seconds=i * step)
+        seconds_of_day = at.hour * 3600 + at.minute * 60 + at.second
+        weights.append(
+            Decimal(str(volume_profile[int(seconds_of_day // bucket_seconds)]))
+        )
+    if not any(weights):
+        return twap_slices(quantity, slices)
+    return pro_rata(quantity, weights)
+
+
+def iceberg_slices(quantity: Decimal, display_quantity: Decimal) -> list[Decimal]:
+    """Split a quantity into visible clips of at most ``display_quantity``.
+
+    Args:
+        quantity: Parent quantity
+        display_quantity: Maximum visible child size
+
+    Returns:
+        Child quantities
+    """
+    if display_quantity <= 0 or display_quantity >= quantity:
+        return [quantity]
+    full, remainder = divmod(quantity, display_quantity)
+    clips = [display_quantity] * int(full)
+    if remainder:
+        clips.append(remainder)
+    return clips
+
+
+class ParentOrder:
+    """A parent order worked through child orders by an algorithm.
+
+    Attributes:
+        order: The parent order whose fills are rolled up
+        algorithm: Algorithm working the order
+        interval_seconds: Delay between child orders
+        children: Child orders released so far
+    """
+
+    def __init__(
+        self,
+        order: Order,
+        algorithm: ExecutionAlgorithm,
+        slices: list[Decimal],
+        interval_seconds: float,
+    ) -> None:
+        """Initialize the parent order.
+
+        Args:
+            order: Parent order
+            algorithm: Algorithm working the order
+            slices: Planned child quantities
+            interval_seconds: Delay between child orders
+        """
+        self.order = order
+        self.algorithm = algorithm
+        self.interval_seconds = interval_seconds
+        self.children: list[Order] = []
+        self._slices = deque(s for s in slices if s > 0)
+        self._carry = Decimal("0")
+        self._filled_notional = order.filled_quantity * (
+            order.average_price or Decimal("0")
+        )
+
+    @property
+    def order_id(self) -> str:
+        """Get the parent order ID."""
+        return self.order.order_id
+
+    @property
+    def remaining_slices(self) -> int:
+        """Get the number of child orders still to release."""
+        return len(self._slices)
+
+    @property
+    def done(self) -> bool:
+        """Check if the parent needs no further child orders."""
+        return not self._slices or self.order.status in (
+            OrderStatus.FILLED,
+            OrderStatus.CANCELLED,
+        )
+
+    def next_child(self) -> Order | None:
+        """Release the next child order.
+
+        Quantity the previous child failed to fill is carried into this one;
+        whatever the last child leaves unfilled is cancelled with the parent.
+
+        Returns:
+            Child order, or None if the schedule is exhausted
+        """
+        if not self._slices:
+            return None
+        quantity = self._slices.popleft() + self._carry
+        self._carry = Decimal("0")
+        child = Order(
+            symbol=self.order.symbol,
+            side=self.order.side,
+            order_type=self.order.order_type,
+            quantity=quantity,
+            price=self.order.price,
+        )
+        self.children.append(child)
+        return child
+
+    def apply_fill(self, child: Order) -> None:
+        """Roll a child's fill into the parent.
+
+        Args:
+            child: Child order after execution
+        """
+        filled = child.filled_quantity
+        if self._slices:
+            self._carry += child.quantity - filled
+
+        order = self.order
+        if filled > 0 and child.average_price is not None:
+            self._filled_notional += filled * child.average_price
+            order.filled_quantity += filled
+            order.average_price = self._filled_notional / order.filled_quantity
+        order.status = (
+            OrderStatus.FILLED
+            if order.filled_quantity >= order.quantity
+            else OrderStatus.PARTIAL if order.filled_quantity > 0 else order.status
+        )
+        order.updated_at = datetime.now(UTC)
+
+    def cancel(self) -> None:
+        """Stop releasing child orders."""
+        self._slices.clear()
+        self._carry = Decimal("0")
+        if self.order.status != OrderStatus.FILLED:
+            self.order.status = OrderStatus.CANCELLED
+            self.order.updated_at = datetime.now(UTC)
+
+
+ChildSubmitter = Callable[[list[Order]], Awaitable[list[ExecutionReport]]]
+
+
+class ChildOrderScheduler:
+    """Single-task timer scheduler releasing child orders for many parents.
+
+    Parents sit in a heap keyed by the loop time their next child is due.
+    The scheduler task sleeps until the earliest due time, releases every
+    child that is due, submits them as one batch, rolls the fills up and
+    re-queues parents that still have slices.
+
+    Example:
+        >>> scheduler = ChildOrderScheduler(submit=layer_submit)
+        >>> scheduler.schedule(ParentOrder(order, ExecutionAlgorithm.TWAP, ...))
+    """
+
+    def __init__(
+        self,
+        submit: ChildSubmitter,
+        on_update: Callable[[ParentOrder], None] | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            submit: Coroutine executing a batch of child orders
+            on_update: Callback invoked after a parent's fills change
+        """
+        self._submit = submit
+        self._on_update = on_update
+        self._heap: list[tuple[float, int, ParentOrder]] = []
+        self._parents: dict[str, ParentOrder] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def active_parents(self) -> int:
+        """Get the number of parents still being worked."""
+        return len(self._parents)
+
+    def get_parent(self, order_id: str) -> ParentOrder | None:
+        """Get a working parent by order ID.
+
+        Args:
+            order_id: Parent order ID
+
+        Returns:
+            Parent order or None
+        """
+        return self._parents.get(order_id)
+
+    def schedule(self, parent: ParentOrder, delay_seconds: float = 0.0) -> None:
+        """Start working a parent order.
+
+        Args:
+            parent: Parent order to work
+            delay_seconds: Delay before the first child is released
+        """
+        loop = asyncio.get_running_loop()
+        self._parents[parent.order_id] = parent
+        self._push(loop.time() + delay_seconds, parent)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def cancel(self, order_id: str) -> bool:
+        """Cancel a working parent; its heap entry is dropped lazily.
+
+        Args:
+            order_id: Parent order ID
+
+        Returns:
+            True if the parent was working
+        """
+        parent = self._parents.pop(order_id, None)
+        if parent is None:
+            return False
+        parent.cancel()
+        if self._on_update is not None:
+            self._on_update(parent)
+        return True
+
+    def _push(self, due: float, parent: ParentOrder) -> None:
+        """Queue a parent and wake the task if it is now the earliest."""
+        heapq.heappush(self._heap, (due, next(self._counter), parent))
+        if self._heap[0][2] is parent:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Release child orders as they fall due."""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            due = self._heap[0][0]
+            if due > loop.time():
+                handle = loop.call_at(due, self._wakeup.set)
+                try:
+                    await self._wakeup.wait()
+                finally:
+                    handle.cancel()
+                continue
+
+            now = loop.time()
+            batch: list[tuple[ParentOrder, Order]] = []
+            while self._heap and self._heap[0][0] <= now:
+                _, _, parent = heapq.heappop(self._heap)
+                if self._parents.get(parent.order_id) is not parent:
+                    continue  # Cancelled
+                child = parent.next_child()
+                if child is not None:
+                    batch.append((parent, child))
+
+            if batch:
+                await self._dispatch(batch, loop.time())
+
+    async def _dispatch(
+        self, batch: list[tuple[ParentOrder, Order]], now: float
+    ) -> None:
+        """Submit due children and roll their fills up.
+
+        Args:
+            batch: Parents with their released child orders
+            now: Loop time used to schedule the next slices
+        """
+        try:
+            await self._submit([child for _, child in batch])
+        except Exception as e:  # Keep working the other parents
+            logger.error("Child order submission failed", error=str(e))
+
+        for parent, child in batch:
+            parent.apply_fill(child)
+            if self._on_update is not None:
+                self._on_update(parent)
+            if parent.done:
+                self._parents.pop(parent.order_id, None)
+                if parent.order.status not in (
+                    OrderStatus.FILLED,
+                    OrderStatus.CANCELLED,
+                ):
+                    parent.cancel()
+                    if self._on_update is not None:
+                        self._on_update(parent)
+            else:
+                self._push(now + parent.interval_seconds, parent)
+
+    async def stop(self) -> None:
+        """Stop the scheduler task, leaving parents in their current state."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._heap.clear()
+        self._parents.clear()
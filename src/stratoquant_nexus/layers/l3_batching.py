@@ -0,0 +1,249 @@
+"""L3 order coalescing - per-symbol netting and batch fan-out.
+
+Orders generated for the same symbol within one cycle are netted before they
+reach the venue: opposing quantity is crossed internally at a reference price
+and only the residual is sent as a single net order. Net orders are then
+grouped into venue batch requests and each batch result is fanned back out
+into one :class:`ExecutionReport` per original order.
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import TypeVar
+
+from pydantic import BaseModel, Field
+
+from stratoquant_nexus.layers.l3_models import (
+    ExecutionReport,
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+)
+
+_QUANTITY_STEP = Decimal("0.00000001")
+
+T = TypeVar("T")
+
+
+class OrderAllocation(BaseModel):
+    """Share of a net order allocated to one original order."""
+
+    order: Order = Field(..., description="Original order")
+    crossed_quantity: Decimal = Field(
+        default=Decimal("0"), description="Quantity crossed internally"
+    )
+    exchange_quantity: Decimal = Field(
+        default=Decimal("0"), description="Quantity routed through the net order"
+    )
+
+
+class NettedOrder(BaseModel):
+    """Result of netting all orders for one symbol."""
+
+    symbol: str = Field(..., description="Trading symbol")
+    net_order: Order | None = Field(
+        default=None, description="Residual order to submit, None if fully offset"
+    )
+    cross_price: Decimal = Field(..., description="Internal crossing price")
+    allocations: list[OrderAllocation] = Field(default_factory=list)
+
+
+def chunk(items: Sequence[T], size: int) -> list[list[T]]:
+    """Split items into consecutive chunks of at most ``size``.
+
+    Args:
+        items: Items to split
+        size: Maximum chunk size
+
+    Returns:
+        List of chunks
+    """
+    return [list(items[i : i + size]) for i in range(0, len(items), size)]
+
+
+def pro_rata(total: Decimal, weights: list[Decimal]) -> list[Decimal]:
+    """Split a quantity proportionally, giving the rounding residue to the last.
+
+    Args:
+        total: Quantity to split
+        weights: Relative weights
+
+    Returns:
+        Allocated quantities summing exactly to ``total``
+    """
+    weight_sum = sum(weights, Decimal("0"))
+    shares = [(total * w / weight_sum).quantize(_QUANTITY_STEP) for w in weights[:-1]]
+    shares.append(total - sum(shares, Decimal("0")))
+    return shares
+
+
+def net_orders(
+    orders: Sequence[tuple[Order, Decimal]],
+    order_type: OrderType = OrderType.MARKET,
+    netting: bool = True,
+) -> list[NettedOrder]:
+    """Net opposing orders per symbol.
+
+    With ``netting`` disabled every order is passed through as its own net
+    order, so callers still benefit from batch submission.
+
+    Args:
+        orders: Orders with the reference price used for internal crossing
+        order_type: Order type of generated net orders
+        netting: Whether to offset opposing orders
+
+    Returns:
+        One NettedOrder per symbol (or per order without netting)
+    """
+    if not netting:
+        return [
+            NettedOrder(
+                symbol=order.symbol,
+                net_order=order,
+                cross_price=price,
+                allocations=[
+                    OrderAllocation(order=order, exchange_quantity=order.quantity)
+                ],
+            )
+            for order, price in orders
+        ]
+
+    by_symbol: dict[str, list[tuple[Order, Decimal]]] = {}
+    for order, price in orders:
+        by_symbol.setdefault(order.symbol, []).append((order, price))
+
+    netted = []
+    for symbol, group in by_symbol.items():
+        # Cross at the most recent reference price seen for the symbol
+        cross_price = group[-1][1]
+        buys = [o for o, _ in group if o.side == OrderSide.BUY]
+        sells = [o for o, _ in group if o.side == OrderSide.SELL]
+        buy_total = sum((o.quantity for o in buys), Decimal("0"))
+        sell_total = sum((o.quantity for o in sells), Decimal("0"))
+        net = buy_total - sell_total
+
+        if net > 0:
+            dominant, minority, side = buys, sells, OrderSide.BUY
+        else:
+            dominant, minority, side = sells, buys, OrderSide.SELL
+
+        allocations = [
+            OrderAllocation(order=o, crossed_quantity=o.quantity) for o in minority
+        ]
+        exchange_shares = (
+            pro_rata(abs(net), [o.quantity for o in dominant])
+            if net
+            else [Decimal("0")] * len(dominant)
+        )
+        allocations.extend(
+            OrderAllocation(
+                order=o,
+                crossed_quantity=o.quantity - share,
+                exchange_quantity=share,
+            )
+            for o, share in zip(dominant, exchange_shares, strict=True)
+        )
+
+        net_order = None
+        if net:
+            if len(group) == 1:
+                net_order = group[0][0]
+            else:
+                net_order = Order(
+                    symbol=symbol,
+                    side=side,
+                    order_type=order_type,
+                    quantity=abs(net),
+                    price=cross_price if order_type == OrderType.LIMIT else None,
+                    child_order_ids=[o.order_id for o, _ in group],
+                )
+
+        netted.append(
+            NettedOrder(
+                symbol=symbol,
+                net_order=net_order,
+                cross_price=cross_price,
+                allocations=allocations,
+            )
+        )
+
+    return netted
+
+
+def fan_out(
+    netted: NettedOrder, net_report: ExecutionReport | None
+) -> list[ExecutionReport]:
+    """Distribute a net order's execution back onto the original orders.
+
+    Args:
+        netted: Netting result for one symbol
+        net_report: Execution report of the net order, None if fully offset
+
+    Returns:
+        One execution report per original order
+    """
+    net_order = netted.net_order
+    if net_order is not None and net_report is not None and net_order.quantity:
+        fill_ratio = net_order.filled_quantity / net_order.quantity
+        venue_price = net_order.average_price or Decimal("0")
+        venue_status = net_order.status
+        venue_fees = net_report.fees
+        elapsed_ms = net_report.execution_time_ms
+    else:
+        fill_ratio = Decimal("0")
+        venue_price = Decimal("0")
+        venue_status = OrderStatus.FILLED
+        venue_fees = Decimal("0")
+        elapsed_ms = 0.0
+
+    reports = []
+    for allocation in netted.allocations:
+        order = allocation.order
+        if order is net_order and net_report is not None:
+            # Passed through unchanged; the venue report already describes it
+            reports.append(net_report)
+            continue
+
+        venue_filled = (allocation.exchange_quantity * fill_ratio).quantize(
+            _QUANTITY_STEP
+        )
+        filled = allocation.crossed_quantity + venue_filled
+
+        order.filled_quantity = filled
+        order.updated_at = datetime.now(UTC)
+        if filled:
+            order.average_price = (
+                allocation.crossed_quantity * netted.cross_price
+                + venue_filled * venue_price
+            ) / filled
+        if filled >= order.quantity:
+            order.status = OrderStatus.FILLED
+        elif filled > 0:
+            order.status = OrderStatus.PARTIAL
+        else:
+            order.status = venue_status
+
+        fees = Decimal("0")
+        if net_order is not None and net_order.quantity:
+            fees = venue_fees * allocation.exchange_quantity / net_order.quantity
+
+        message = f"{allocation.crossed_quantity} crossed internally at " + str(
+            netted.cross_price
+        )
+        if allocation.exchange_quantity and net_order is not None:
+            message += f", {venue_filled} via net order {net_order.order_id}"
+
+        reports.append(
+            ExecutionReport(
+                order=order,
+                success=order.status
+                not in (OrderStatus.REJECTED, OrderStatus.CANCELLED),
+                message=message,
+                execution_time_ms=elapsed_ms,
+                fees=fees.quantize(Decimal("0.01")),
+            )
+        )
+
+    return reports
@@ -8,79 +8,48 @@ This layer handles:
 """
 
 import time
+from collections.abc import Callable
 from datetime import UTC, datetime
 from decimal import Decimal
-from enum import Enum
-from typing import Any
-from uuid import uuid4
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
 from stratoquant_nexus.layers.base import BaseLayer, LayerConfig, LayerLevel
 from stratoquant_nexus.layers.l1_signals import SignalType
-from stratoquant_nexus.layers.l2_risk import RiskAssessment
-
-
-class OrderType(str, Enum):
-    """Order types."""
-
-    MARKET = "market"
-    LIMIT = "limit"
-    STOP_MARKET = "stop_market"
-    STOP_LIMIT = "stop_limit"
-
-
-class OrderSide(str, Enum):
-    """Order side."""
-
-    BUY = "buy"
-    SELL = "sell"
-
-
-class OrderStatus(str, Enum):
-    """Order status."""
-
-    PENDING = "pending"
-    SUBMITTED = "submitted"
-    PARTIAL = "partial"
-    FILLED = "filled"
-    CANCELLED = "cancelled"
-    REJECTED = "rejected"
-
-
-class Order(BaseModel):
-    """Trading order model."""
-
-    order_id: str = Field(
-        default_factory=lambda: str(uuid4()), description="Unique order ID"
-    )
-    symbol: str = Field(..., description="Trading symbol")
-    side: OrderSide = Field(..., description="Order side")
-    order_type: OrderType = Field(default=OrderType.MARKET, description="Order type")
-    quantity: Decimal = Field(..., description="Order quantity")
-    price: Decimal | None = Field(default=None, description="Limit price")
-    stop_price: Decimal | None = Field(default=None, description="Stop price")
-    stop_loss: Decimal | None = Field(default=None, description="Stop loss price")
-    take_profit: Decimal | None = Field(default=None, description="Take profit price")
-    status: OrderStatus = Field(default=OrderStatus.PENDING, description="Order status")
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    filled_quantity: Decimal = Field(
-        default=Decimal("0"), description="Filled quantity"
-    )
-    average_price: Decimal | None = Field(
-        default=None, description="Average fill price"
-    )
-
-
-class ExecutionReport(BaseModel):
-    """Execution report for processed orders."""
-
-    order: Order = Field(..., description="The order")
-    success: bool = Field(..., description="Whether execution was successful")
-    message: str = Field(..., description="Execution message")
-    execution_time_ms: float = Field(default=0.0, description="Execution time in ms")
-    fees: Decimal = Field(default=Decimal("0"), description="Execution fees")
+from stratoquant_nexus.layers.l2_risk import PositionSize, RiskAssessment
+from stratoquant_nexus.layers.l3_algorithms import (
+    ChildOrderScheduler,
+    ExecutionAlgorithm,
+    ParentOrder,
+    iceberg_slices,
+    twap_slices,
+    vwap_slices,
+)
+from stratoquant_nexus.layers.l3_batching import chunk, fan_out, net_orders
+from stratoquant_nexus.layers.l3_journal import OrderJournal
+from stratoquant_nexus.layers.l3_models import (
+    ExecutionReport,
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+)
+from stratoquant_nexus.monitoring.latency import elapsed_ms
+
+if TYPE_CHECKING:
+    from stratoquant_nexus.checkpoint import Checkpoint, CheckpointWriter
+    from stratoquant_nexus.exchange.base import ExchangeAdapter, ExchangeOrderResult
+
+__all__ = [
+    "ExecutionLayer",
+    "ExecutionLayerConfig",
+    "ExecutionReport",
+    "Order",
+    "OrderSide",
+    "OrderStatus",
+    "OrderType",
+]
 
 
 class ExecutionLayerConfig(LayerConfig):
@@ -97,6 +66,47 @@ class ExecutionLayerConfig(LayerConfig):
         default=0.001, description="Default slippage percentage"
     )
     fee_rate: float = Field(default=0.001, description="Trading fee rate")
+    enable_batching: bool = Field(
+        default=False,
+        description="Coalesce each cycle's orders into per-symbol batch submissions",
+    )
+    net_opposing_orders: bool = Field(
+        default=True,
+        description="Cross opposing orders for the same symbol before submission",
+    )
+    max_batch_size: int = Field(
+        default=20, ge=1, description="Maximum orders per venue batch request"
+    )
+    journal_dir: str | None = Field(
+        default=None,
+        description="Directory for the order write-ahead journal (disabled if unset)",
+    )
+    journal_commit_interval_ms: float = Field(
+        default=2.0, gt=0, description="Journal group-commit window in milliseconds"
+    )
+    journal_snapshot_interval: int = Field(
+        default=10_000, ge=1, description="Journal records between snapshots"
+    )
+    algo_notional_threshold: float | None = Field(
+        default=None,
+        description="Orders at or above this notional are worked by an algorithm",
+    )
+    execution_algorithm: ExecutionAlgorithm = Field(
+        default=ExecutionAlgorithm.TWAP, description="Algorithm for large orders"
+    )
+    algo_duration_seconds: float = Field(
+        default=300.0, gt=0, description="Time over which parent orders are worked"
+    )
+    algo_slices: int = Field(
+        default=10, ge=1, description="Number of TWAP/VWAP child orders"
+    )
+    iceberg_display_pct: float = Field(
+        default=0.1, gt=0, le=1, description="Visible iceberg clip as % of parent"
+    )
+    resume_algo_orders: bool = Field(
+        default=True,
+        description="Resume parent orders recovered from the journal (else cancel)",
+    )
 
 
 class ExecutionLayer(BaseLayer):
@@ -109,20 +119,114 @@ class ExecutionLayer(BaseLayer):
     4. Tracking fills and execution quality
     """
 
-    def __init__(self, config: ExecutionLayerConfig | None = None) -> None:
+    result_key = "execution_reports"
+
+    def __init__(
+        self,
+        config: ExecutionLayerConfig | None = None,
+        exchange: "ExchangeAdapter | None" = None,
+    ) -> None:
         """Initialize the execution layer.
 
         Args:
             config: Execution layer configuration
+            exchange: Exchange adapter used when execution is not simulated
         """
         if config is None:
             config = ExecutionLayerConfig(name="ExecutionLayer")
         super().__init__(config)
         self._orders: dict[str, Order] = {}
         self._execution_reports: list[ExecutionReport] = []
+        self._exchange = exchange
+        self._recovered_positions: dict[str, PositionSize] = {}
+        self._reference_prices: dict[str, Decimal] = {}
+        self._volume_profile_source: Callable[[str], list[float]] | None = None
+        self._on_fill: Callable[[list[ExecutionReport]], None] | None = None
+        self._scheduler = ChildOrderScheduler(
+            submit=self._execute_children, on_update=self._on_parent_update
+        )
+        self._journal = (
+            OrderJournal(
+                config.journal_dir,
+                commit_interval_ms=config.journal_commit_interval_ms,
+                snapshot_interval=config.journal_snapshot_interval,
+            )
+            if config.journal_dir
+            else None
+        )
+
+    @property
+    def exchange(self) -> "ExchangeAdapter | None":
+        """Get the exchange adapter."""
+        return self._exchange
+
+    def set_exchange(self, exchange: "ExchangeAdapter | None") -> None:
+        """Set the exchange adapter used for live execution.
+
+        Args:
+            exchange: Exchange adapter
+        """
+        self._exchange = exchange
+
+    @property
+    def scheduler(self) -> ChildOrderScheduler:
+        """Get the child order scheduler."""
+        return self._scheduler
+
+    def set_volume_profile_source(
+        self, source: Callable[[str], list[float]] | None
+    ) -> None:
+        """Set the source of intraday volume profiles used by VWAP.
+
+        Args:
+            source: Callable returning average volume per bucket for a symbol
+        """
+        self._volume_profile_source = source
+
+    def set_fill_listener(
+        self, listener: Callable[[list[ExecutionReport]], None] | None
+    ) -> None:
+        """Set the callback receiving child order reports of worked parents.
+
+        Children are executed by the scheduler outside of any cycle, so
+        their fills never appear in a cycle's results.
+
+        Args:
+            listener: Callable receiving each batch of child reports
+        """
+        self._on_fill = listener
+
+    @property
+    def journal(self) -> OrderJournal | None:
+        """Get the order journal."""
+        return self._journal
+
+    @property
+    def recovered_positions(self) -> dict[str, PositionSize]:
+        """Get positions rebuilt from the journal on initialization."""
+        return self._recovered_positions
 
     async def initialize(self) -> None:
-        """Initialize execution layer resources."""
+        """Initialize execution layer resources.
+
+        If a journal is configured, open orders and positions are recovered
+        from it before any new orders are accepted. Parent orders that were
+        still being worked are resumed on the scheduler, or cancelled if
+        ``resume_algo_orders`` is disabled.
+        """
+        config: ExecutionLayerConfig = self.config  # type: ignore
+        if self._journal is not None:
+            state = await self._journal.open()
+            for order_id, order in list(state.open_orders.items()):
+                order = self._orders[order_id] = order.model_copy()
+                if order.algorithm is not None:
+                    self._recover_parent(order, config)
+            self._recovered_positions = {
+                symbol: position.to_position_size()
+                for symbol, position in state.positions.items()
+            }
+        if self._exchange is not None and not config.simulate_execution:
+            await self._exchange.connect()
         self._initialized = True
 
     async def process(self, data: Any) -> list[ExecutionReport]:
@@ -134,14 +238,25 @@ class ExecutionLayer(BaseLayer):
         Returns:
             List of execution reports
         """
+        config: ExecutionLayerConfig = self.config  # type: ignore
         reports = []
 
         if isinstance(data, list):
-            for item in data:
-                if isinstance(item, RiskAssessment) and item.approved:
-                    report = await self._execute_order(item)
-                    reports.append(report)
-                    self._execution_reports.append(report)
+            approved = [
+                item
+                for item in data
+                if isinstance(item, RiskAssessment) and item.approved
+            ]
+            if config.enable_batching:
+                reports = await self._execute_batched(approved, config)
+            else:
+                for assessment in approved:
+                    reports.append(await self._execute_order(assessment))
+            self._execution_reports.extend(reports)
+            if self._journal is not None:
+                for report in reports:
+                    if report.order.order_id in self._orders:
+                        self._journal.record(report.order)
 
         return reports
 
@@ -155,6 +270,296 @@ class ExecutionLayer(BaseLayer):
             Execution report
         """
         config: ExecutionLayerConfig = self.config  # type: ignore
+        start = self.latency.start()
+        order = self._create_order(assessment, config)
+        if isinstance(order, ExecutionReport):
+            return order
+        if self._uses_algorithm(order, assessment.signal.price, config):
+            return self._start_algorithm(order, config.execution_algorithm, config)
+
+        # Simulate or execute
+        if config.simulate_execution:
+            report = await self._simulate_execution(order, config)
+        else:
+            report = await self._submit_to_exchange(order)
+        self.latency.record("order.create_to_report", start)
+        return report
+
+    async def _execute_batched(
+        self, assessments: list[RiskAssessment], config: ExecutionLayerConfig
+    ) -> list[ExecutionReport]:
+        """Execute a cycle's assessments as netted, batched submissions.
+
+        Opposing orders per symbol are crossed internally, the residual net
+        orders are sent in batches of ``max_batch_size`` and the results are
+        fanned back out so each assessment still gets its own report. Net
+        orders combining several orders are stored and journaled with the
+        IDs of those orders; their fills are booked on the originals.
+
+        Args:
+            assessments: Approved risk assessments
+            config: Execution configuration
+
+        Returns:
+            Execution reports in the same order as ``assessments``
+        """
+        reports: dict[int, ExecutionReport] = {}
+        pending = []
+        for index, assessment in enumerate(assessments):
+            order = self._create_order(assessment, config)
+            if isinstance(order, ExecutionReport):
+                reports[index] = order
+            elif self._uses_algorithm(order, assessment.signal.price, config):
+                reports[index] = self._start_algorithm(
+                    order, config.execution_algorithm, config
+                )
+            else:
+                pending.append((index, order, assessment.signal.price))
+
+        netted = net_orders(
+            [(order, price) for _, order, price in pending],
+            order_type=config.default_order_type,
+            netting=config.net_opposing_orders,
+        )
+        submissions = [n.net_order for n in netted if n.net_order is not None]
+        # Combined net orders are tracked like submitted ones; a lone order
+        # is its own net order and is already registered
+        combined = [order for order in submissions if order.child_order_ids]
+        for order in combined:
+            self._register_order(order)
+
+        net_reports: dict[str, ExecutionReport] = {}
+        if config.simulate_execution:
+            for order in submissions:
+                report = await self._simulate_execution(order, config)
+                net_reports[order.order_id] = report
+        else:
+            for batch in chunk(submissions, config.max_batch_size):
+                for report in await self._submit_batch_to_exchange(batch):
+                    net_reports[report.order.order_id] = report
+        if self._journal is not None:
+            for order in combined:
+                self._journal.record(order)
+
+        by_order_id: dict[str, ExecutionReport] = {}
+        for item in netted:
+            net_report = (
+                net_reports.get(item.net_order.order_id)
+                if item.net_order is not None
+                else None
+            )
+            for report in fan_out(item, net_report):
+                by_order_id[report.order.order_id] = report
+
+        for index, order, _ in pending:
+            reports[index] = by_order_id[order.order_id]
+        return [reports[i] for i in range(len(assessments))]
+
+    @staticmethod
+    def _uses_algorithm(
+        order: Order, price: Decimal, config: ExecutionLayerConfig
+    ) -> bool:
+        """Check if an order is large enough to be worked by an algorithm.
+
+        Args:
+            order: Order to check
+            price: Reference price
+            config: Execution configuration
+
+        Returns:
+            True if the order should be sliced
+        """
+        threshold = config.algo_notional_threshold
+        return threshold is not None and order.quantity * price >= Decimal(
+            str(threshold)
+        )
+
+    def submit_algo_order(
+        self,
+        order: Order,
+        algorithm: ExecutionAlgorithm,
+        duration_seconds: float | None = None,
+        slices: int | None = None,
+    ) -> ParentOrder:
+        """Work an order through an execution algorithm.
+
+        The order becomes a parent: child orders are released on the
+        scheduler and their fills roll up into ``order``.
+
+        Args:
+            order: Parent order
+            algorithm: Execution algorithm
+            duration_seconds: Time to work the order over (config default)
+            slices: Number of TWAP/VWAP child orders (config default)
+
+        Returns:
+            The working parent order
+        """
+        config: ExecutionLayerConfig = self.config  # type: ignore
+        order.algorithm = algorithm
+        parent = self._plan_parent(
+            order,
+            order.quantity,
+            duration_seconds or config.algo_duration_seconds,
+            slices or config.algo_slices,
+        )
+        self._orders[order.order_id] = order
+        order.status = OrderStatus.SUBMITTED
+        order.updated_at = datetime.now(UTC)
+        self._on_parent_update(parent)
+        self._scheduler.schedule(parent)
+        return parent
+
+    def _plan_parent(
+        self, order: Order, quantity: Decimal, duration: float, count: int
+    ) -> ParentOrder:
+        """Split a quantity of a parent order into child slices.
+
+        Args:
+            order: Parent order with its algorithm set
+            quantity: Quantity still to be worked
+            duration: Time to work the quantity over
+            count: Number of TWAP/VWAP child orders
+
+        Returns:
+            Parent order ready to be scheduled
+        """
+        config: ExecutionLayerConfig = self.config  # type: ignore
+        algorithm = order.algorithm or ExecutionAlgorithm.TWAP
+        if algorithm == ExecutionAlgorithm.ICEBERG:
+            display = (
+                order.quantity * Decimal(str(config.iceberg_display_pct))
+            ).quantize(Decimal("0.00000001"))
+            planned = iceberg_slices(quantity, display)
+        elif algorithm == ExecutionAlgorithm.VWAP:
+            profile = (
+                self._volume_profile_source(order.symbol)
+                if self._volume_profile_source is not None
+                else []
+            )
+            planned = vwap_slices(quantity, count, duration, profile)
+        else:
+            planned = twap_slices(quantity, count)
+
+        return ParentOrder(
+            order,
+            algorithm,
+            planned,
+            interval_seconds=duration / max(len(planned), 1),
+        )
+
+    def _recover_parent(self, order: Order, config: ExecutionLayerConfig) -> None:
+        """Resume or cancel a parent order that was working before a restart.
+
+        The unfilled remainder is re-planned over the configured duration;
+        fills journaled before the restart are kept on the parent.
+
+        Args:
+            order: Recovered parent order
+            config: Execution configuration
+        """
+        remaining = order.quantity - order.filled_quantity
+        if config.resume_algo_orders and remaining > 0:
+            parent = self._plan_parent(
+                order, remaining, config.algo_duration_seconds, config.algo_slices
+            )
+            self._scheduler.schedule(parent)
+            return
+        order.status = OrderStatus.CANCELLED
+        order.updated_at = datetime.now(UTC)
+        if self._journal is not None:
+            self._journal.record(order)
+
+    def _start_algorithm(
+        self,
+        order: Order,
+        algorithm: ExecutionAlgorithm,
+        config: ExecutionLayerConfig,
+    ) -> ExecutionReport:
+        """Hand an order to an algorithm and report it as working.
+
+        Args:
+            order: Order to work
+            algorithm: Execution algorithm
+            config: Execution configuration
+
+        Returns:
+            Execution report for the accepted parent
+        """
+        parent = self.submit_algo_order(order, algorithm)
+        return ExecutionReport(
+            order=order,
+            success=True,
+            message=(
+                f"Working {algorithm.value.upper()} over "
+                f"{parent.remaining_slices} child orders "
+                f"in {config.algo_duration_seconds:g}s"
+            ),
+        )
+
+    async def _execute_children(self, children: list[Order]) -> list[ExecutionReport]:
+        """Execute child orders released by the scheduler.
+
+        Args:
+            children: Child orders due now
+
+        Returns:
+            Execution reports for the children
+        """
+        config: ExecutionLayerConfig = self.config  # type: ignore
+        if config.simulate_execution:
+            reports = [await self._simulate_execution(c, config) for c in children]
+        else:
+            reports = []
+            for batch in chunk(children, config.max_batch_size):
+                reports.extend(await self._submit_batch_to_exchange(batch))
+        if self._on_fill is not None:
+            self._on_fill(reports)
+        return reports
+
+    def _on_parent_update(self, parent: ParentOrder) -> None:
+        """Journal a parent order's new state.
+
+        Args:
+            parent: Updated parent order
+        """
+        if self._journal is not None and self._journal.is_open:
+            self._journal.record(parent.order)
+
+    def get_parent_order(self, order_id: str) -> ParentOrder | None:
+        """Get a parent order that is still being worked.
+
+        Args:
+            order_id: Parent order ID
+
+        Returns:
+            Parent order or None
+        """
+        return self._scheduler.get_parent(order_id)
+
+    def cancel_algo_order(self, order_id: str) -> bool:
+        """Stop working a parent order.
+
+        Args:
+            order_id: Parent order ID
+
+        Returns:
+            True if the parent was being worked
+        """
+        return self._scheduler.cancel(order_id)
+
+    def _create_order(
+        self, assessment: RiskAssessment, config: ExecutionLayerConfig
+    ) -> Order | ExecutionReport:
+        """Create and store an order from a risk assessment.
+
+        Args:
+            assessment: Approved risk assessment
+            config: Execution configuration
+
+        Returns:
+            The new order, or a rejection report if no order can be created
+        """
         signal = assessment.signal
         position_size = assessment.position_size
 
@@ -170,6 +575,8 @@ class ExecutionLayer(BaseLayer):
                 message="No position size calculated",
             )
 
+        self._reference_prices[signal.symbol] = signal.price
+
         # Determine order side
         side = OrderSide.BUY if signal.signal_type == SignalType.BUY else OrderSide.SELL
 
@@ -186,15 +593,132 @@ class ExecutionLayer(BaseLayer):
             take_profit=position_size.take_profit_price,
         )
 
-        # Store order
+        self._register_order(order)
+        return order
+
+    def _register_order(self, order: Order) -> None:
+        """Store a new order and journal its initial state.
+
+        Args:
+            order: Order about to be submitted
+        """
         self._orders[order.order_id] = order
+        if self._journal is not None:
+            self._journal.record(order)
 
-        # Simulate or execute
-        if config.simulate_execution:
-            return await self._simulate_execution(order, config)
-        else:
-            # In production, this would connect to an exchange
-            return await self._simulate_execution(order, config)
+    async def _submit_to_exchange(self, order: Order) -> ExecutionReport:
+        """Submit an order to the configured exchange.
+
+        Args:
+            order: Order to execute
+
+        Returns:
+            Execution report
+        """
+        # Deferred to avoid a circular import: the exchange package imports
+        # the order models from this package.
+        from stratoquant_nexus.exchange.base import ExchangeError
+
+        start_time = time.perf_counter_ns()
+
+        if self._exchange is None:
+            order.status = OrderStatus.REJECTED
+            order.updated_at = datetime.now(UTC)
+            return ExecutionReport(
+                order=order,
+                success=False,
+                message="No exchange adapter configured for live execution",
+            )
+
+        try:
+            result = await self._exchange.submit_order(order)
+        except ExchangeError as e:
+            self.latency.record(f"venue.{self._exchange.name}.submit_order", start_time)
+            order.status = OrderStatus.REJECTED
+            order.updated_at = datetime.now(UTC)
+            return ExecutionReport(
+                order=order,
+                success=False,
+                message=f"Exchange error: {e}",
+                execution_time_ms=elapsed_ms(start_time),
+            )
+
+        self.latency.record(f"venue.{self._exchange.name}.submit_order", start_time)
+        return self._apply_exchange_result(order, result, start_time)
+
+    async def _submit_batch_to_exchange(
+        self, orders: list[Order]
+    ) -> list[ExecutionReport]:
+        """Submit orders to the configured exchange in one batch request.
+
+        Args:
+            orders: Orders to execute
+
+        Returns:
+            Execution reports in the same order as ``orders``
+        """
+        from stratoquant_nexus.exchange.base import ExchangeError
+
+        if self._exchange is None or len(orders) == 1:
+            return [await self._submit_to_exchange(order) for order in orders]
+
+        start_time = time.perf_counter_ns()
+        try:
+            results = await self._exchange.submit_orders(orders)
+        except ExchangeError as e:
+            self.latency.record(
+                f"venue.{self._exchange.name}.submit_orders", start_time
+            )
+            reports = []
+            for order in orders:
+                order.status = OrderStatus.REJECTED
+                order.updated_at = datetime.now(UTC)
+                reports.append(
+                    ExecutionReport(
+                        order=order,
+                        success=False,
+                        message=f"Exchange error: {e}",
+                        execution_time_ms=elapsed_ms(start_time),
+                    )
+                )
+            return reports
+
+        self.latency.record(f"venue.{self._exchange.name}.submit_orders", start_time)
+        return [
+            self._apply_exchange_result(order, result, start_time)
+            for order, result in zip(orders, results, strict=True)
+        ]
+
+    def _apply_exchange_result(
+        self, order: Order, result: "ExchangeOrderResult", start_time: int
+    ) -> ExecutionReport:
+        """Update an order from an exchange acknowledgement.
+
+        Args:
+            order: Submitted order
+            result: Exchange acknowledgement
+            start_time: Submission start time from ``time.perf_counter_ns()``
+
+        Returns:
+            Execution report
+        """
+        order.status = result.status
+        order.filled_quantity = result.filled_quantity
+        order.average_price = result.average_price
+        order.updated_at = datetime.now(UTC)
+
+        success = result.status not in (OrderStatus.REJECTED, OrderStatus.CANCELLED)
+        exchange_name = self._exchange.name if self._exchange else "exchange"
+        return ExecutionReport(
+            order=order,
+            success=success,
+            message=(
+                f"Order {result.status.value} on {exchange_name}"
+                + (f": {result.message}" if result.message else "")
+            ),
+            execution_time_ms=elapsed_ms(start_time),
+            fees=result.fees,
+        )
 
     async def _simulate_execution(
         self, order: Order, config: ExecutionLayerConfig
@@ -208,15 +732,17 @@ class ExecutionLayer(BaseLayer):
         Returns:
             Execution report
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
-        # Simulate slippage
-        if order.price:
-            slippage = order.price * Decimal(str(config.default_slippage_pct))
+        # Simulate slippage around the limit price, or the latest signal
+        # price for market orders
+        reference = order.price or self._reference_prices.get(order.symbol)
+        if reference:
+            slippage = reference * Decimal(str(config.default_slippage_pct))
             fill_price = (
-                order.price + slippage
+                reference + slippage
                 if order.side == OrderSide.BUY
-                else order.price - slippage
+                else reference - slippage
             )
         else:
             fill_price = order.stop_price or Decimal("0")
@@ -231,22 +757,52 @@ class ExecutionLayer(BaseLayer):
         order.average_price = fill_price
         order.updated_at = datetime.now(UTC)
 
-        execution_time = (time.time() - start_time) * 1000
-
         return ExecutionReport(
             order=order,
             success=True,
             message=f"Order filled at {fill_price} (simulated)",
-            execution_time_ms=round(execution_time, 2),
+            execution_time_ms=elapsed_ms(start_time),
             fees=fees.quantize(Decimal("0.01")),
         )
 
     async def shutdown(self) -> None:
         """Clean up execution layer resources."""
+        await self._scheduler.stop()
+        if self._exchange is not None:
+            await self._exchange.close()
+        if self._journal is not None:
+            await self._journal.close()
         self._orders.clear()
         self._execution_reports.clear()
         self._initialized = False
 
+    def save_checkpoint(self, writer: "CheckpointWriter") -> None:
+        """Save the open orders.
+
+        Args:
+            writer: Checkpoint being built
+        """
+        writer.add_json(
+            f"{self.name}.open_orders",
+            [order.model_dump(mode="json") for order in self.get_open_orders()],
+        )
+
+    def load_checkpoint(self, checkpoint: "Checkpoint") -> None:
+        """Restore open orders not already known.
+
+        A configured journal is authoritative: orders it recovered on
+        initialization are kept as they are.
+
+        Args:
+            checkpoint: Mapped checkpoint
+        """
+        name = f"{self.name}.open_orders"
+        if self._journal is not None or name not in checkpoint:
+            return
+        for data in checkpoint.json(name):
+            order = Order.model_validate(data)
+            self._orders.setdefault(order.order_id, order)
+
     def get_order(self, order_id: str) -> Order | None:
         """Get an order by ID.
 
@@ -258,6 +814,22 @@ class ExecutionLayer(BaseLayer):
         """
         return self._orders.get(order_id)
 
+    def count_open_orders(self) -> int:
+        """Count open orders.
+
+        The order map is copied in one step first, so this is safe to call
+        from a metrics scrape thread while the event loop adds orders.
+
+        Returns:
+            Number of pending, submitted or partially filled orders
+        """
+        open_statuses = {
+            OrderStatus.PENDING,
+            OrderStatus.SUBMITTED,
+            OrderStatus.PARTIAL,
+        }
+        return sum(1 for o in list(self._orders.values()) if o.status in open_statuses)
+
     def get_open_orders(self, symbol: str | None = None) -> list[Order]:
         """Get all open orders.
 
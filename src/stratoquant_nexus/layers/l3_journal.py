@@ -0,0 +1,537 @@
+"""L3 order journal - append-only write-ahead log with fast crash recovery.
+
+Every order state transition is appended to ``orders.wal`` as a compact,
+checksummed binary record. Records are buffered in memory and written by a
+background group-commit task that issues one ``fsync`` per commit window
+instead of one per order. Periodically (and on clean shutdown) the reduced
+state - open orders and net positions - is written to ``orders.snapshot``
+and the log is truncated, so recovery loads the snapshot and replays only
+the log tail.
+
+Record layout (little-endian)::
+
+    u32 payload_length | u32 crc32(payload) | payload
+    payload = u64 sequence | i64 created_ns | i64 updated_ns
+              | u8 side | u8 type | u8 status
+              | str order_id | str symbol | 7 x str decimal | str algorithm
+              | u16 n_children | n_children x str child_order_id
+
+Strings are ``u16 length + utf-8``; an empty decimal or algorithm string
+means ``None``. Records written before the algorithm or child fields were
+added end early and decode with no algorithm and no children.
+
+Fills of a net order (one with child order IDs) are not applied to
+positions: the child orders it fans out to carry the same fills.
+"""
+
+import asyncio
+import os
+import struct
+import zlib
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import structlog
+
+from stratoquant_nexus.layers.l2_risk import NetPosition
+from stratoquant_nexus.layers.l3_models import (
+    ExecutionAlgorithm,
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+)
+from stratoquant_nexus.utils.binary import from_micros, pack_str, to_micros, unpack_str
+
+logger = structlog.get_logger()
+
+_HEADER = struct.Struct("<II")
+_FIXED = struct.Struct("<QqqBBB")
+_COUNT = struct.Struct("<H")
+_SNAPSHOT_MAGIC = b"SQJS\x01"
+_SNAPSHOT_HEADER = struct.Struct("<QII")
+
+_SIDES = list(OrderSide)
+_TYPES = list(OrderType)
+_STATUSES = list(OrderStatus)
+_SIDE_CODES = {v: i for i, v in enumerate(_SIDES)}
+_TYPE_CODES = {v: i for i, v in enumerate(_TYPES)}
+_STATUS_CODES = {v: i for i, v in enumerate(_STATUSES)}
+
+OPEN_STATUSES = frozenset(
+    {OrderStatus.PENDING, OrderStatus.SUBMITTED, OrderStatus.PARTIAL}
+)
+
+
+def _pack_decimal(value: Decimal | None) -> bytes:
+    """Encode an optional decimal as a length-prefixed string."""
+    return pack_str("" if value is None else str(value))
+
+
+def _unpack_decimal(buf: memoryview, offset: int) -> tuple[Decimal | None, int]:
+    """Decode an optional decimal."""
+    text, offset = unpack_str(buf, offset)
+    return (Decimal(text) if text else None), offset
+
+
+def _to_ns(value: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch."""
+    return to_micros(value) * 1000
+
+
+def _from_ns(value: int) -> datetime:
+    """Convert integer nanoseconds since the epoch to a UTC datetime."""
+    return from_micros(value // 1000)
+
+
+def encode_order(sequence: int, order: Order) -> bytes:
+    """Encode an order state as a journal payload.
+
+    Args:
+        sequence: Journal sequence number
+        order: Order to encode
+
+    Returns:
+        Encoded payload (without record header)
+    """
+    return b"".join(
+        (
+            _FIXED.pack(
+                sequence,
+                _to_ns(order.created_at),
+                _to_ns(order.updated_at),
+                _SIDE_CODES[order.side],
+                _TYPE_CODES[order.order_type],
+                _STATUS_CODES[order.status],
+            ),
+            pack_str(order.order_id),
+            pack_str(order.symbol),
+            _pack_decimal(order.quantity),
+            _pack_decimal(order.price),
+            _pack_decimal(order.stop_price),
+            _pack_decimal(order.stop_loss),
+            _pack_decimal(order.take_profit),
+            _pack_decimal(order.filled_quantity),
+            _pack_decimal(order.average_price),
+            pack_str(order.algorithm.value if order.algorithm else ""),
+            _COUNT.pack(len(order.child_order_ids)),
+            *map(pack_str, order.child_order_ids),
+        )
+    )
+
+
+def decode_order(payload: memoryview) -> tuple[int, Order]:
+    """Decode a journal payload.
+
+    Args:
+        payload: Encoded payload
+
+    Returns:
+        Sequence number and order state
+    """
+    sequence, created, updated, side, order_type, status = _FIXED.unpack_from(
+        payload, 0
+    )
+    offset = _FIXED.size
+    order_id, offset = unpack_str(payload, offset)
+    symbol, offset = unpack_str(payload, offset)
+    decimals = []
+    for _ in range(7):
+        value, offset = _unpack_decimal(payload, offset)
+        decimals.append(value)
+    quantity, price, stop_price, stop_loss, take_profit, filled, average = decimals
+    algorithm = ""
+    if offset < len(payload):
+        algorithm, offset = unpack_str(payload, offset)
+    children = []
+    if offset < len(payload):
+        (n_children,) = _COUNT.unpack_from(payload, offset)
+        offset += _COUNT.size
+        for _ in range(n_children):
+            child, offset = unpack_str(payload, offset)
+            children.append(child)
+
+    order = Order(
+        order_id=order_id,
+        symbol=symbol,
+        side=_SIDES[side],
+        order_type=_TYPES[order_type],
+        quantity=quantity or Decimal("0"),
+        price=price,
+        stop_price=stop_price,
+        stop_loss=stop_loss,
+        take_profit=take_profit,
+        status=_STATUSES[status],
+        created_at=_from_ns(created),
+        updated_at=_from_ns(updated),
+        filled_quantity=filled or Decimal("0"),
+        average_price=average,
+        algorithm=ExecutionAlgorithm(algorithm) if algorithm else None,
+        child_order_ids=children,
+    )
+    return sequence, order
+
+
+class JournalState:
+    """Reduced journal state: open orders and net positions.
+
+    The same reducer is applied to live records and during replay, so a
+    snapshot of the live state is exactly what recovery would rebuild.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty state."""
+        self.last_sequence = 0
+        self.open_orders: dict[str, Order] = {}
+        self.positions: dict[str, NetPosition] = {}
+        self._fills: dict[str, tuple[Decimal, Decimal]] = {}
+
+    def apply(self, sequence: int, order: Order) -> None:
+        """Apply one order state transition.
+
+        Args:
+            sequence: Journal sequence number
+            order: New order state
+        """
+        self.last_sequence = sequence
+        prev_filled, prev_cost = self._fills.get(order.order_id, (Decimal(0),) * 2)
+        filled = order.filled_quantity
+        cost = filled * (order.average_price or Decimal("0"))
+
+        delta = filled - prev_filled
+        if delta and not order.child_order_ids:
+            position = self.positions.get(order.symbol)
+            if position is None:
+                position = NetPosition(symbol=order.symbol)
+                self.positions[order.symbol] = position
+            signed = delta if order.side == OrderSide.BUY else -delta
+            position.apply_fill(signed, (cost - prev_cost) / delta)
+            if order.stop_loss is not None:
+                position.stop_loss = order.stop_loss
+            if order.take_profit is not None:
+                position.take_profit = order.take_profit
+            if position.quantity == 0:
+                del self.positions[order.symbol]
+
+        if order.status in OPEN_STATUSES:
+            self.open_orders[order.order_id] = order
+            self._fills[order.order_id] = (filled, cost)
+        else:
+            self.open_orders.pop(order.order_id, None)
+            self._fills.pop(order.order_id, None)
+
+    def encode(self) -> bytes:
+        """Serialize the state for a snapshot file.
+
+        Returns:
+            Snapshot body
+        """
+        parts = [
+            _SNAPSHOT_HEADER.pack(
+                self.last_sequence, len(self.open_orders), len(self.positions)
+            )
+        ]
+        for order in self.open_orders.values():
+            payload = encode_order(self.last_sequence, order)
+            parts.append(_HEADER.pack(len(payload), 0) + payload)
+        for position in self.positions.values():
+            parts.append(
+                pack_str(position.symbol)
+                + _pack_decimal(position.quantity)
+                + _pack_decimal(position.average_price)
+                + _pack_decimal(position.stop_loss)
+                + _pack_decimal(position.take_profit)
+            )
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, body: bytes) -> "JournalState":
+        """Deserialize a snapshot body.
+
+        Args:
+            body: Snapshot body
+
+        Returns:
+            Restored state
+        """
+        state = cls()
+        buf = memoryview(body)
+        state.last_sequence, n_orders, n_positions = _SNAPSHOT_HEADER.unpack_from(
+            buf, 0
+        )
+        offset = _SNAPSHOT_HEADER.size
+        for _ in range(n_orders):
+            length, _ = _HEADER.unpack_from(buf, offset)
+            offset += _HEADER.size
+            _, order = decode_order(buf[offset : offset + length])
+            offset += length
+            state.open_orders[order.order_id] = order
+            state._fills[order.order_id] = (
+                order.filled_quantity,
+                order.filled_quantity * (order.average_price or Decimal("0")),
+            )
+        for _ in range(n_positions):
+            symbol, offset = unpack_str(buf, offset)
+            quantity, offset = _unpack_decimal(buf, offset)
+            average_price, offset = _unpack_decimal(buf, offset)
+            stop_loss, offset = _unpack_decimal(buf, offset)
+            take_profit, offset = _unpack_decimal(buf, offset)
+            state.positions[symbol] = NetPosition(
+                symbol=symbol,
+                quantity=quantity or Decimal("0"),
+                average_price=average_price or Decimal("0"),
+                stop_loss=stop_loss,
+                take_profit=take_profit,
+            )
+        return state
+
+
+class OrderJournal:
+    """Append-only order journal with group commit and snapshotting.
+
+    ``record`` never blocks: it encodes the order into an in-memory buffer
+    and wakes the commit task, which writes and fsyncs everything buffered
+    in one go from a worker thread. ``sync`` waits until all records so far
+    are durable.
+
+    Example:
+        >>> journal = OrderJournal("var/journal")
+        >>> state = await journal.open()
+        >>> journal.record(order)
+        >>> await journal.close()
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        commit_interval_ms: float = 2.0,
+        snapshot_interval: int = 10_000,
+    ) -> None:
+        """Initialize the order journal.
+
+        Args:
+            directory: Directory holding the log and snapshot files
+            commit_interval_ms: Group-commit window in milliseconds
+            snapshot_interval: Log records between automatic snapshots
+        """
+        self.directory = Path(directory)
+        self.wal_path = self.directory / "orders.wal"
+        self.snapshot_path = self.directory / "orders.snapshot"
+        self.commit_interval = commit_interval_ms / 1000
+        self.snapshot_interval = snapshot_interval
+        self.state = JournalState()
+        self.fsync_count = 0
+        self._sequence = 0
+        self._durable_sequence = 0
+        self._tail_records = 0
+        self._buffer = bytearray()
+        self._file: int | None = None
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._waiters: list[tuple[int, asyncio.Future[None]]] = []
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+
+    @property
+    def sequence(self) -> int:
+        """Get the sequence number of the last recorded transition."""
+        return self._sequence
+
+    @property
+    def pending(self) -> int:
+        """Get the number of recorded transitions not yet made durable."""
+        return self._sequence - self._durable_sequence
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the journal is open."""
+        return self._file is not None
+
+    async def open(self) -> JournalState:
+        """Recover state from disk and start the commit task.
+
+        Returns:
+            State rebuilt from the latest snapshot and the log tail
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.state, valid_length, self._tail_records = await asyncio.to_thread(
+            self._recover
+        )
+        self._sequence = self._durable_sequence = self.state.last_sequence
+        self._file = os.open(self.wal_path, os.O_WRONLY | os.O_CREAT, 0o644)
+        # Drop any torn record left by a crash mid-write
+        os.ftruncate(self._file, valid_length)
+        os.lseek(self._file, valid_length, os.SEEK_SET)
+        self._closing = False
+        self._task = asyncio.create_task(self._commit_loop())
+        logger.info(
+            "Order journal opened",
+            path=str(self.directory),
+            open_orders=len(self.state.open_orders),
+            positions=len(self.state.positions),
+            replayed_records=self._tail_records,
+        )
+        return self.state
+
+    def _recover(self) -> tuple[JournalState, int, int]:
+        """Load the snapshot and replay the log tail.
+
+        Returns:
+            Recovered state, length of the valid log prefix, records replayed
+        """
+        state = JournalState()
+        if self.snapshot_path.exists():
+            data = self.snapshot_path.read_bytes()
+            magic_len = len(_SNAPSHOT_MAGIC)
+            valid = len(data) >= magic_len + 4 and data[:magic_len] == _SNAPSHOT_MAGIC
+            if valid:
+                (crc,) = struct.unpack_from("<I", data, magic_len)
+                body = data[magic_len + 4 :]
+                valid = zlib.crc32(body) == crc
+            if valid:
+                state = JournalState.decode(body)
+            else:
+                logger.warning("Ignoring corrupt journal snapshot")
+
+        if not self.wal_path.exists():
+            return state, 0, 0
+
+        buf = memoryview(self.wal_path.read_bytes())
+        offset = 0
+        replayed = 0
+        while offset + _HEADER.size <= len(buf):
+            length, crc = _HEADER.unpack_from(buf, offset)
+            start = offset + _HEADER.size
+            payload = buf[start : start + length]
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break
+            sequence, order = decode_order(payload)
+            if sequence > state.last_sequence:
+                state.apply(sequence, order)
+                replayed += 1
+            offset = start + length
+        return state, offset, replayed
+
+    def record(self, order: Order) -> int:
+        """Append an order state transition.
+
+        Args:
+            order: Order in its new state
+
+        Returns:
+            Sequence number of the record
+        """
+        self._sequence += 1
+        payload = encode_order(self._sequence, order)
+        self._buffer += _HEADER.pack(len(payload), zlib.crc32(payload))
+        self._buffer += payload
+        self.state.apply(self._sequence, order.model_copy())
+        self._tail_records += 1
+        self._wakeup.set()
+        return self._sequence
+
+    async def sync(self) -> None:
+        """Wait until every recorded transition is durable."""
+        target = self._sequence
+        if target <= self._durable_sequence:
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append((target, future))
+        self._wakeup.set()
+        await future
+
+    async def _commit_loop(self) -> None:
+        """Write and fsync buffered records once per commit window.
+
+        Returns once ``close`` asks it to, after finishing any commit in
+        progress; it is never cancelled while a worker thread is writing.
+        """
+        while not self._closing:
+            await self._wakeup.wait()
+            if self._closing:
+                return
+            await asyncio.sleep(self.commit_interval)
+            self._wakeup.clear()
+            await self._commit()
+            if self._tail_records >= self.snapshot_interval and not self._closing:
+                await self.snapshot()
+
+    async def _commit(self) -> None:
+        """Flush the buffer to disk with a single fsync."""
+        async with self._lock:
+            if not self._buffer or self._file is None:
+                self._resolve_waiters()
+                return
+            data = bytes(self._buffer)
+            sequence = self._sequence
+            self._buffer.clear()
+            await asyncio.to_thread(self._write_and_sync, self._file, data)
+            self._durable_sequence = sequence
+            self._resolve_waiters()
+
+    def _write_and_sync(self, fd: int, data: bytes) -> None:
+        """Write data and fsync (runs in a worker thread)."""
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+        self.fsync_count += 1
+
+    def _resolve_waiters(self) -> None:
+        """Wake ``sync`` callers whose records are now durable."""
+        pending = []
+        for target, future in self._waiters:
+            if target <= self._durable_sequence:
+                if not future.done():
+                    future.set_result(None)
+            else:
+                pending.append((target, future))
+        self._waiters = pending
+
+    async def snapshot(self) -> None:
+        """Write a snapshot of the current state and truncate the log."""
+        await self._commit()
+        async with self._lock:
+            if self._file is None:
+                return
+            body = self.state.encode()
+            await asyncio.to_thread(self._write_snapshot, self._file, body)
+            self._tail_records = 0
+        logger.info("Order journal snapshot written", sequence=self._sequence)
+
+    def _write_snapshot(self, fd: int, body: bytes) -> None:
+        """Atomically replace the snapshot file, then truncate the log."""
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_SNAPSHOT_MAGIC + struct.pack("<I", zlib.crc32(body)) + body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        os.ftruncate(fd, 0)
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.fsync(fd)
+
+    async def close(self, snapshot: bool = True) -> None:
+        """Flush outstanding records and close the journal.
+
+        Args:
+            snapshot: Whether to write a snapshot so the next start replays
+                no log records
+        """
+        if self._file is None:
+            return
+        if self._task is not None:
+            # Let an in-flight commit finish instead of cancelling it mid-write
+            self._closing = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        if snapshot:
+            await self.snapshot()
+        else:
+            await self._commit()
+        os.close(self._file)
+        self._file = None
+        logger.info("Order journal closed", sequence=self._sequence)
@@ -0,0 +1,85 @@
+"""L3 order models shared by the execution layer and exchange adapters."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from enum import Enum
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+
+class OrderType(str, Enum):
+    """Order types."""
+
+    MARKET = "market"
+    LIMIT = "limit"
+    STOP_MARKET = "stop_market"
+    STOP_LIMIT = "stop_limit"
+
+
+class OrderSide(str, Enum):
+    """Order side."""
+
+    BUY = "buy"
+    SELL = "sell"
+
+
+class OrderStatus(str, Enum):
+    """Order status."""
+
+    PENDING = "pending"
+    SUBMITTED = "submitted"
+    PARTIAL = "partial"
+    FILLED = "filled"
+    CANCELLED = "cancelled"
+    REJECTED = "rejected"
+
+
+class ExecutionAlgorithm(str, Enum):
+    """Parent order execution algorithms."""
+
+    TWAP = "twap"
+    VWAP = "vwap"
+    ICEBERG = "iceberg"
+
+
+class Order(BaseModel):
+    """Trading order model."""
+
+    order_id: str = Field(
+        default_factory=lambda: str(uuid4()), description="Unique order ID"
+    )
+    symbol: str = Field(..., description="Trading symbol")
+    side: OrderSide = Field(..., description="Order side")
+    order_type: OrderType = Field(default=OrderType.MARKET, description="Order type")
+    quantity: Decimal = Field(..., description="Order quantity")
+    price: Decimal | None = Field(default=None, description="Limit price")
+    stop_price: Decimal | None = Field(default=None, description="Stop price")
+    stop_loss: Decimal | None = Field(default=None, description="Stop loss price")
+    take_profit: Decimal | None = Field(default=None, description="Take profit price")
+    status: OrderStatus = Field(default=OrderStatus.PENDING, description="Order status")
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    filled_quantity: Decimal = Field(
+        default=Decimal("0"), description="Filled quantity"
+    )
+    average_price: Decimal | None = Field(
+        default=None, description="Average fill price"
+    )
+    algorithm: ExecutionAlgorithm | None = Field(
+        default=None, description="Algorithm working this order as a parent"
+    )
+    child_order_ids: list[str] = Field(
+        default_factory=list,
+        description="Orders a net order was netted from and fans out to",
+    )
+
+
+class ExecutionReport(BaseModel):
+    """Execution report for processed orders."""
+
+    order: Order = Field(..., description="The order")
+    success: bool = Field(..., description="Whether execution was successful")
+    message: str = Field(..., description="Execution message")
+    execution_time_ms: float = Field(default=0.0, description="Execution time in ms")
+    fees: Decimal = Field(default=Decimal("0"), description="Execution fees")
@@ -0,0 +1,270 @@
+"""Layer registry building the engine's ordered processing chain."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from stratoquant_nexus.layers.base import BaseLayer
+from stratoquant_nexus.monitoring.latency import LatencyRecorder
+
+
+class LayerStage:
+    """Layers sharing a ``(level, order)`` slot in the chain.
+
+    Attributes:
+        key: ``(level, order)`` of the stage
+        layer: Layer whose output feeds the next stage, if any
+        taps: Independent layers run concurrently on the stage input
+    """
+
+    __slots__ = ("key", "layer", "taps")
+
+    def __init__(
+        self, key: tuple[int, int], layer: BaseLayer | None, taps: tuple[BaseLayer, ...]
+    ) -> None:
+        """Initialize the stage."""
+        self.key = key
+        self.layer = layer
+        self.taps = taps
+
+
+class LayerRegistry:
+    """Ordered registry of engine layers (L0-L100).
+
+    Layers run in ``(level, order)`` order, each stage receiving the previous
+    stage's output. The chain stops as soon as a stage produces nothing, so
+    downstream layers are not called with empty input. Layers configured as
+    ``independent`` only read the stage input and do not feed the chain;
+    they run concurrently with the other layers of their stage.
+
+    Example:
+        >>> registry = LayerRegistry()
+        >>> registry.register(DataLayer(DataLayerConfig(name="DataLayer")))
+        >>> registry.register(SignalLayer(SignalLayerConfig(name="SignalLayer")))
+        >>> await registry.run(candles, results, latency)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._layers: dict[str, BaseLayer] = {}
+        self._stages: tuple[LayerStage, ...] | None = None
+
+    def __iter__(self) -> Iterator[BaseLayer]:
+        """Iterate the layers in chain order."""
+        return iter(self.layers)
+
+    def __len__(self) -> int:
+        """Get the number of registered layers."""
+        return len(self._layers)
+
+    def __contains__(self, name: object) -> bool:
+        """Check if a layer is registered under a name."""
+        return name in self._layers
+
+    @property
+    def layers(self) -> list[BaseLayer]:
+        """Get the registered layers in chain order."""
+        return sorted(
+            self._layers.values(), key=lambda layer: (layer.level, layer.config.order)
+        )
+
+    @property
+    def stages(self) -> tuple[LayerStage, ...]:
+        """Get the processing chain of enabled layers (cached)."""
+        if self._stages is None:
+            self._stages = self._build_stages()
+        return self._stages
+
+    def get(self, name: str) -> BaseLayer | None:
+        """Get a layer by name.
+
+        Args:
+            name: Layer name
+
+        Returns:
+            The layer or None if not registered
+        """
+        return self._layers.get(name)
+
+    def register(self, layer: BaseLayer) -> None:
+        """Add a layer to the chain.
+
+        Args:
+            layer: Layer to add
+
+        Raises:
+            ValueError: If the name is taken or its stage already has a
+                chained (non-independent) layer
+        """
+        if layer.name in self._layers:
+            raise ValueError(f"Layer already registered: {layer.name}")
+        if not layer.config.independent:
+            key = (layer.level, layer.config.order)
+            for other in self._layers.values():
+                if (
+                    not other.config.independent
+                    and (other.level, other.config.order) == key
+                ):
+                    raise ValueError(
+                        f"Layers {other.name} and {layer.name} both feed stage "
+                        f"L{key[0]}.{key[1]}; mark one as independent or change "
+                        "its order"
+                    )
+        self._layers[layer.name] = layer
+        self._stages = None
+
+    def unregister(self, name: str) -> BaseLayer:
+        """Remove a layer from the chain.
+
+        Args:
+            name: Layer name
+
+        Returns:
+            The removed layer
+
+        Raises:
+            KeyError: If no layer has that name
+        """
+        layer = self._layers.pop(name)
+        self._stages = None
+        return layer
+
+    def invalidate(self) -> None:
+        """Rebuild the cached chain on next use, e.g. after a layer is toggled."""
+        self._stages = None
+
+    def initialization_waves(self) -> list[list[BaseLayer]]:
+        """Group layers so each wave only depends on earlier waves.
+
+        Returns:
+            Waves of layers whose ``depends_on`` are all in earlier waves
+
+        Raises:
+            ValueError: If a dependency is unknown or dependencies form a cycle
+        """
+        remaining = {layer.name: layer for layer in self.layers}
+        for layer in remaining.values():
+            for name in layer.config.depends_on:
+                if name not in remaining:
+                    raise ValueError(
+                        f"Layer {layer.name} depends on unknown layer {name}"
+                    )
+        done: set[str] = set()
+        waves = []
+        while remaining:
+            wave = [
+                layer
+                for layer in remaining.values()
+                if all(name in done for name in layer.config.depends_on)
+            ]
+            if not wave:
+                raise ValueError(
+                    f"Circular layer dependencies among {sorted(remaining)}"
+                )
+            waves.append(wave)
+            for layer in wave:
+                done.add(layer.name)
+                del remaining[layer.name]
+        return waves
+
+    async def initialize(self) -> None:
+        """Initialize all layers, concurrently within each dependency wave.
+
+        Raises:
+            ValueError: If the dependencies cannot be resolved
+        """
+        for wave in self.initialization_waves():
+            await asyncio.gather(*(layer.initialize() for layer in wave))
+
+    def _build_stages(self) -> tuple[LayerStage, ...]:
+        """Group enabled layers into ordered stages."""
+        grouped: dict[tuple[int, int], list[BaseLayer]] = {}
+        for layer in self.layers:
+            if layer.is_enabled:
+                key = (layer.level, layer.config.order)
+                grouped.setdefault(key, []).append(layer)
+        stages = []
+        for key, members in grouped.items():
+            chained = [m for m in members if not m.config.independent]
+            taps = tuple(m for m in members if m.config.independent)
+            stages.append(LayerStage(key, chained[0] if chained else None, taps))
+        return tuple(stages)
+
+    async def run(
+        self,
+        data: Any,
+        results: dict[str, list[Any]],
+        latency: LatencyRecorder,
+        min_level: int = 0,
+    ) -> None:
+        """Push data through the chain and collect every layer's output.
+
+        Each output is stored under the layer's ``result_key`` (the layer
+        name if unset); other outputs are wrapped in a list and None
+        counts as no output.
+
+        Args:
+            data: Input for the first stage
+            results: Cycle results, updated in place
+            latency: Recorder for ``layer.<name>`` timings
+            min_level: Skip stages below this level
+        """
+        async for layer, output in self.iter_run(data, latency, min_level):
+            results[layer.result_key or layer.name] = as_list(output)
+
+    async def iter_run(
+        self, data: Any, latency: LatencyRecorder, min_level: int = 0
+    ) -> AsyncIterator[tuple[BaseLayer, Any]]:
+        """Push data through the chain, yielding each layer's output.
+
+        The next stage only runs once the consumer asks for more, so outputs
+        can be acted on before downstream layers start.
+
+        Args:
+            data: Input for the first stage
+            latency: Recorder for ``layer.<name>`` timings
+            min_level: Skip stages below this level
+
+        Yields:
+            ``(layer, output)`` pairs in chain order
+        """
+        for stage in self.stages:
+            if stage.key[0] < min_level:
+                continue
+            if stage.taps:
+                layers = (stage.layer, *stage.taps) if stage.layer else stage.taps
+                outputs = await asyncio.gather(
+                    *(self._run_layer(layer, data, latency) for layer in layers)
+                )
+                for layer, output in zip(layers, outputs, strict=True):
+                    yield layer, output
+                if stage.layer is None:
+                    continue
+                data = outputs[0]
+            else:
+                data = await self._run_layer(stage.layer, data, latency)
+                yield stage.layer, data
+            if not data:
+                return
+
+    @staticmethod
+    async def _run_layer(layer: Any, data: Any, latency: LatencyRecorder) -> Any:
+        """Run one layer and time it."""
+        start = latency.start()
+        output = await layer.process(data)
+        latency.record(f"layer.{layer.name}", start)
+        return output
+
+
+def as_list(output: Any) -> list[Any]:
+    """Normalize a layer output to a list of items.
+
+    Args:
+        output: Layer output
+
+    Returns:
+        The output if it is a list, ``[]`` for None, else ``[output]``
+    """
+    if isinstance(output, list):
+        return output
+    return [] if output is None else [output]
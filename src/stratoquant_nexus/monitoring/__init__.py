@@ -0,0 +1,31 @@
+"""Runtime instrumentation for the trading engine."""
+
+from stratoquant_nexus.monitoring.engine_metrics import EngineMetrics
+from stratoquant_nexus.monitoring.latency import (
+    LatencyHistogram,
+    LatencyRecorder,
+    LatencySnapshot,
+    elapsed_ms,
+)
+from stratoquant_nexus.monitoring.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    LatencySummary,
+    MetricsRegistry,
+)
+from stratoquant_nexus.monitoring.server import MetricsServer
+
+__all__ = [
+    "Counter",
+    "EngineMetrics",
+    "Gauge",
+    "Histogram",
+    "LatencyHistogram",
+    "LatencyRecorder",
+    "LatencySnapshot",
+    "LatencySummary",
+    "MetricsRegistry",
+    "MetricsServer",
+    "elapsed_ms",
+]
@@ -0,0 +1,135 @@
+"""Standard metric set for a :class:`~stratoquant_nexus.engine.TradingEngine`."""
+
+from typing import TYPE_CHECKING
+
+from stratoquant_nexus.monitoring.latency import LatencyRecorder
+from stratoquant_nexus.monitoring.metrics import LatencySummary, MetricsRegistry
+
+if TYPE_CHECKING:
+    from stratoquant_nexus.layers.l1_signals import TradingSignal
+    from stratoquant_nexus.layers.l2_risk import RiskAssessment
+    from stratoquant_nexus.layers.l3_execution import ExecutionLayer, ExecutionReport
+
+CYCLE_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+class EngineMetrics:
+    """Cycle throughput, queue depth, latency, rejection and fill metrics.
+
+    Counters are updated once per cycle from the cycle's results; queue
+    depths are read from the execution layer only when scraped.
+    """
+
+    def __init__(self, registry: MetricsRegistry, latency: LatencyRecorder) -> None:
+        """Register the engine metrics.
+
+        Args:
+            registry: Registry to register the metrics with
+            latency: Recorder whose layer, rule and venue histograms to export
+        """
+        self.registry = registry
+        self.cycles = registry.counter("cycles_total", "Processing cycles completed")
+        self.cycle_duration = registry.histogram(
+            "cycle_duration_seconds",
+            "Wall time of a full processing cycle",
+            buckets=CYCLE_BUCKETS,
+        )
+        self.signals = registry.counter(
+            "signals_total", "Signals generated", ("signal_type",)
+        )
+        self.assessments = registry.counter(
+            "risk_assessments_total", "Risk assessments by outcome", ("outcome",)
+        )
+        self.rejections = registry.counter(
+            "risk_rejections_total", "Risk rejections by rule", ("reason",)
+        )
+        self.orders = registry.counter(
+            "orders_total", "Orders by reported status", ("status",)
+        )
+        self.filled_orders = registry.counter(
+            "orders_filled_total", "Orders completely filled"
+        )
+        self.fill_rate = registry.gauge(
+            "order_fill_rate", "Share of executed orders that were completely filled"
+        )
+        self.fill_rate.set_function(self._fill_rate)
+        self.queue_depth = registry.gauge(
+            "queue_depth", "Items waiting in engine queues", ("queue",)
+        )
+        for name, prefix, label in (
+            ("layer_latency_seconds", "layer.", "layer"),
+            ("risk_rule_latency_seconds", "risk.rule.", "rule"),
+            ("venue_latency_seconds", "venue.", "call"),
+        ):
+            registry.register(
+                LatencySummary(
+                    registry.full_name(name),
+                    f"Latency by {label}",
+                    latency,
+                    prefix,
+                    label,
+                )
+            )
+
+    def _fill_rate(self) -> float:
+        """Compute the fill rate from the order counters."""
+        executed = self.orders.total()
+        return self.filled_orders.value() / executed if executed else 0.0
+
+    def attach_execution_layer(self, layer: "ExecutionLayer") -> None:
+        """Expose the execution layer's queue depths.
+
+        Args:
+            layer: Execution layer to observe
+        """
+        self.queue_depth.set_function(layer.count_open_orders, queue="open_orders")
+        self.queue_depth.set_function(
+            lambda: layer.scheduler.active_parents, queue="working_parent_orders"
+        )
+        self.queue_depth.set_function(
+            lambda: layer.journal.pending if layer.journal else 0,
+            queue="journal_pending",
+        )
+
+    def observe_cycle(
+        self,
+        duration_seconds: float,
+        signals: "list[TradingSignal]",
+        assessments: "list[RiskAssessment]",
+        reports: "list[ExecutionReport]",
+    ) -> None:
+        """Record one processing cycle.
+
+        Args:
+            duration_seconds: Cycle wall time
+            signals: Signals generated
+            assessments: Risk assessments produced
+            reports: Execution reports produced
+        """
+        self.cycles.inc()
+        self.cycle_duration.observe(duration_seconds)
+        for signal in signals:
+            self.signals.inc(signal_type=signal.signal_type.value)
+        for assessment in assessments:
+            if assessment.approved:
+                self.assessments.inc(outcome="approved")
+            else:
+                self.assessments.inc(outcome="rejected")
+                self.rejections.inc(reason=assessment.rejection_code or "other")
+        for report in reports:
+            order = report.order
+            self.orders.inc(status=order.status.value)
+            if order.quantity > 0 and order.filled_quantity >= order.quantity:
+                self.filled_orders.inc()
@@ -0,0 +1,272 @@
+"""Low-overhead latency instrumentation.
+
+Durations are taken with :func:`time.perf_counter_ns` and recorded into
+HDR-style histograms: buckets are log-linear (a fixed number of linear
+sub-buckets per power of two), so relative error is bounded by the bucket
+resolution at every magnitude and recording is a few integer operations on a
+preallocated list. A disabled :class:`LatencyRecorder` returns ``0`` from
+:meth:`LatencyRecorder.start` and ignores ``record`` calls that carry it, so
+instrumented code pays only a method call when tracking is off.
+"""
+
+import math
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from pydantic import BaseModel, Field
+
+
+def elapsed_ms(start_ns: int) -> float:
+    """Get the milliseconds elapsed since a ``perf_counter_ns`` reading.
+
+    Args:
+        start_ns: Start time from ``time.perf_counter_ns()``
+
+    Returns:
+        Elapsed time in milliseconds
+    """
+    return (time.perf_counter_ns() - start_ns) / 1_000_000
+
+
+class LatencySnapshot(BaseModel):
+    """Point-in-time summary of a latency histogram (nanoseconds)."""
+
+    count: int = Field(default=0, description="Number of recorded samples")
+    min_ns: int = Field(default=0, description="Smallest recorded value")
+    max_ns: int = Field(default=0, description="Largest recorded value")
+    mean_ns: float = Field(default=0.0, description="Mean recorded value")
+    p50_ns: int = Field(default=0, description="50th percentile")
+    p99_ns: int = Field(default=0, description="99th percentile")
+    p999_ns: int = Field(default=0, description="99.9th percentile")
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram with preallocated buckets.
+
+    Values below ``2 ** significant_bits`` are counted exactly; above that
+    each power of two is split into ``2 ** (significant_bits - 1)`` linear
+    buckets, giving a worst-case relative error of
+    ``2 ** -(significant_bits - 1)`` (under 1.6% with the default of 7).
+    Values above ``max_value_ns`` are clamped into the last bucket.
+    """
+
+    __slots__ = (
+        "_counts",
+        "_sub_bits",
+        "_sub_count",
+        "_half_count",
+        "_max_value",
+        "count",
+        "total",
+        "min",
+        "max",
+    )
+
+    def __init__(
+        self, max_value_ns: int = 60_000_000_000, significant_bits: int = 7
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            max_value_ns: Largest value tracked without clamping
+            significant_bits: Bits of precision per power of two
+        """
+        self._sub_bits = significant_bits
+        self._sub_count = 1 << significant_bits
+        self._half_count = self._sub_count >> 1
+        self._max_value = max_value_ns
+        self._counts = [0] * (self._index(max_value_ns) + 1)
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        """Map a value to its bucket index."""
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self._sub_bits
+        return (
+            self._sub_count
+            + (shift - 1) * self._half_count
+            + ((value >> shift) - self._half_count)
+        )
+
+    def _highest_equivalent(self, index: int) -> int:
+        """Get the largest value that maps to a bucket index."""
+        if index < self._sub_count:
+            return index
+        offset = index - self._sub_count
+        shift = offset // self._half_count + 1
+        mantissa = offset % self._half_count + self._half_count
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value_ns: int) -> None:
+        """Record a duration.
+
+        Args:
+            value_ns: Duration in nanoseconds
+        """
+        if value_ns < 0:
+            value_ns = 0
+        index = (
+            self._index(value_ns)
+            if value_ns <= self._max_value
+            else len(self._counts) - 1
+        )
+        self._counts[index] += 1
+        if self.count == 0 or value_ns < self.min:
+            self.min = value_ns
+        if value_ns > self.max:
+            self.max = value_ns
+        self.count += 1
+        self.total += value_ns
+
+    def value_at_percentile(self, percentile: float) -> int:
+        """Get the value at a percentile.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Highest value equivalent to the percentile's bucket, capped at
+            the largest recorded value
+        """
+        if self.count == 0:
+            return 0
+        target = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+        for index, bucket in enumerate(self._counts):
+            seen += bucket
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    def snapshot(self) -> LatencySnapshot:
+        """Summarize the histogram.
+
+        Returns:
+            Count, extremes, mean and p50/p99/p999
+        """
+        if self.count == 0:
+            return LatencySnapshot()
+        return LatencySnapshot(
+            count=self.count,
+            min_ns=self.min,
+            max_ns=self.max,
+            mean_ns=self.total / self.count,
+            p50_ns=self.value_at_percentile(50),
+            p99_ns=self.value_at_percentile(99),
+            p999_ns=self.value_at_percentile(99.9),
+        )
+
+    def reset(self) -> None:
+        """Clear all recorded values, keeping the bucket storage."""
+        for index in range(len(self._counts)):
+            self._counts[index] = 0
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+
+class LatencyRecorder:
+    """Named latency histograms for layers, rules and venue calls.
+
+    Names are dotted paths such as ``"layer.RiskLayer"``,
+    ``"risk.rule.exposure"`` or ``"venue.http.submit_order"``; a histogram
+    is created the first time a name is recorded.
+
+    Example:
+        >>> recorder = LatencyRecorder()
+        >>> start = recorder.start()
+        >>> ...
+        >>> recorder.record("engine.cycle", start)
+        >>> recorder.snapshot()["engine.cycle"].p99_ns
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        """Initialize the recorder.
+
+        Args:
+            enabled: Whether samples are recorded
+        """
+        self.enabled = enabled
+        self._histograms: dict[str, LatencyHistogram] = {}
+
+    def start(self) -> int:
+        """Take a start timestamp.
+
+        Returns:
+            ``perf_counter_ns()``, or 0 when recording is disabled
+        """
+        return time.perf_counter_ns() if self.enabled else 0
+
+    def record(self, name: str, start_ns: int) -> None:
+        """Record the time elapsed since ``start_ns``.
+
+        Args:
+            name: Histogram name
+            start_ns: Value returned by :meth:`start`; 0 is ignored
+        """
+        if start_ns:
+            self.record_value(name, time.perf_counter_ns() - start_ns)
+
+    def record_value(self, name: str, value_ns: int) -> None:
+        """Record a duration measured elsewhere.
+
+        Args:
+            name: Histogram name
+            value_ns: Duration in nanoseconds
+        """
+        if not self.enabled:
+            return
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = LatencyHistogram()
+        histogram.record(value_ns)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time a block of code.
+
+        Args:
+            name: Histogram name
+        """
+        start = self.start()
+        try:
+            yield
+        finally:
+            self.record(name, start)
+
+    def histogram(self, name: str) -> LatencyHistogram | None:
+        """Get a histogram by name.
+
+        Args:
+            name: Histogram name
+
+        Returns:
+            Histogram, or None if nothing was recorded under the name
+        """
+        return self._histograms.get(name)
+
+    def snapshot(self, prefix: str = "") -> dict[str, LatencySnapshot]:
+        """Summarize every histogram.
+
+        Args:
+            prefix: Only include names starting with this prefix
+
+        Returns:
+            Snapshots keyed by histogram name
+        """
+        return {
+            name: histogram.snapshot()
+            for name, histogram in sorted(self._histograms.items())
+            if name.startswith(prefix)
+        }
+
+    def reset(self) -> None:
+        """Clear all histograms."""
+        for histogram in self._histograms.values():
+            histogram.reset()
@@ -0,0 +1,496 @@
+"""Metrics registry rendered in the Prometheus text exposition format.
+
+Counters, gauges and histograms are updated only from the trading event
+loop, so a plain ``dict`` update under the GIL is all an increment costs: no
+locks are taken on the hot path. Rendering copies each metric's values with a
+single ``dict.copy()`` before formatting, which lets a scrape run on another
+thread (see :class:`~stratoquant_nexus.monitoring.server.MetricsServer`)
+without blocking or racing the loop.
+"""
+
+import bisect
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+
+from stratoquant_nexus.monitoring.latency import LatencyRecorder
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    """Format a label set, e.g. ``{layer="RiskLayer"}``."""
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values, strict=True)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric(ABC):
+    """Base class for a named metric family.
+
+    Attributes:
+        name: Metric name
+        documentation: Help text
+        labelnames: Label names, in order
+    """
+
+    type_name = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> None:
+        """Initialize the metric.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names, in order
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        """Build the label-value key for a sample."""
+        if not self.labelnames:
+            return ()
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> list[str]:
+        """Render the metric's sample lines.
+
+        Returns:
+            Exposition lines without the HELP/TYPE header
+        """
+
+    def render(self) -> str:
+        """Render the metric family.
+
+        Returns:
+            Exposition text including HELP and TYPE lines
+        """
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """Monotonically increasing counter."""
+
+    type_name = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> None:
+        """Initialize the counter.
+
+        Args:
+            name: Metric name (conventionally ending in ``_total``)
+            documentation: Help text
+            labelnames: Label names, in order
+        """
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increment the counter.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Label values
+        """
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Get the current value for a label set.
+
+        Args:
+            **labels: Label values
+
+        Returns:
+            Counter value
+        """
+        return self._values.get(self._key(labels), 0.0)
+
+    def total(self) -> float:
+        """Get the sum over all label sets.
+
+        Returns:
+            Total count
+        """
+        return sum(self._values.copy().values())
+
+    def samples(self) -> list[str]:
+        """Render the counter's samples."""
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}"
+            for key, v in self._values.copy().items()
+        ]
+
+
+class Gauge(Metric):
+    """Value that can go up and down, optionally computed at scrape time."""
+
+    type_name = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> None:
+        """Initialize the gauge.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names, in order
+        """
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+        self._functions: dict[LabelValues, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge.
+
+        Args:
+            value: New value
+            **labels: Label values
+        """
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the gauge.
+
+        Args:
+            amount: Increment
+            **labels: Label values
+        """
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        """Decrease the gauge.
+
+        Args:
+            amount: Decrement
+            **labels: Label values
+        """
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float], **labels: str) -> None:
+        """Compute the gauge when scraped instead of on every change.
+
+        Use this for values that are cheap to read but change constantly,
+        such as queue depths.
+
+        Args:
+            function: Callable returning the current value
+            **labels: Label values
+        """
+        self._functions[self._key(labels)] = function
+
+    def value(self, **labels: str) -> float:
+        """Get the current value for a label set.
+
+        Args:
+            **labels: Label values
+
+        Returns:
+            Gauge value
+        """
+        key = self._key(labels)
+        function = self._functions.get(key)
+        return float(function()) if function else self._values.get(key, 0.0)
+
+    def samples(self) -> list[str]:
+        """Render the gauge's samples."""
+        values = self._values.copy()
+        for key, function in self._functions.copy().items():
+            values[key] = float(function())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}"
+            for key, v in values.items()
+        ]
+
+
+class Histogram(Metric):
+    """Cumulative bucket histogram."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Label names, in order
+            buckets: Sorted upper bounds (``+Inf`` is implicit)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [bucket counts..., +Inf count, sum]
+        self._values: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation.
+
+        Args:
+            value: Observed value
+            **labels: Label values
+        """
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+        state[bisect.bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def count(self, **labels: str) -> int:
+        """Get the number of observations for a label set.
+
+        Args:
+            **labels: Label values
+
+        Returns:
+            Observation count
+        """
+        state = self._values.get(self._key(labels))
+        return int(sum(state[:-1])) if state else 0
+
+    def samples(self) -> list[str]:
+        """Render the histogram's samples."""
+        lines = []
+        bounds = [*map(_format_value, self.buckets), "+Inf"]
+        names = (*self.labelnames, "le")
+        for key, state in self._values.copy().items():
+            state = list(state)
+            cumulative = 0.0
+            for bound, bucket in zip(bounds, state[:-1], strict=True):
+                cumulative += bucket
+                labels = _format_labels(names, (*key, bound))
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(cumulative)}")
+        return lines
+
+
+class LatencySummary(Metric):
+    """Exports a :class:`LatencyRecorder` as a Prometheus summary.
+
+    Each recorder histogram becomes one label set with p50/p99/p999
+    quantiles, in seconds.
+    """
+
+    type_name = "summary"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        recorder: LatencyRecorder,
+        prefix: str,
+        label: str,
+    ) -> None:
+        """Initialize the summary.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            recorder: Recorder to export
+            prefix: Histogram name prefix to select, e.g. ``"layer."``
+            label: Label carrying the rest of the histogram name
+        """
+        super().__init__(name, documentation, (label,))
+        self._recorder = recorder
+        self._prefix = prefix
+
+    def samples(self) -> list[str]:
+        """Render the summary's samples."""
+        lines = []
+        label = self.labelnames[0]
+        for name, snapshot in self._recorder.snapshot(self._prefix).items():
+            value = name[len(self._prefix) :]
+            for quantile, ns in (
+                ("0.5", snapshot.p50_ns),
+                ("0.99", snapshot.p99_ns),
+                ("0.999", snapshot.p999_ns),
+            ):
+                labels = _format_labels((label, "quantile"), (value, quantile))
+                lines.append(f"{self.name}{labels} {_format_value(ns / 1e9)}")
+            labels = _format_labels((label,), (value,))
+            total = snapshot.mean_ns * snapshot.count / 1e9
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {snapshot.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together.
+
+    Example:
+        >>> registry = MetricsRegistry(namespace="stratoquant")
+        >>> cycles = registry.counter("cycles_total", "Processing cycles")
+        >>> cycles.inc()
+        >>> registry.render()
+    """
+
+    def __init__(self, namespace: str = "") -> None:
+        """Initialize the registry.
+
+        Args:
+            namespace: Prefix joined to every metric name with ``_``
+        """
+        self.namespace = namespace
+        self._metrics: dict[str, Metric] = {}
+
+    def full_name(self, name: str) -> str:
+        """Apply the namespace to a metric name.
+
+        Args:
+            name: Metric name without namespace
+
+        Returns:
+            Namespaced metric name
+        """
+        return f"{self.namespace}_{name}" if self.namespace else name
+
+    def register(self, metric: Metric) -> Metric:
+        """Register a metric family.
+
+        Args:
+            metric: Metric to register
+
+        Returns:
+            The registered metric
+
+        Raises:
+            ValueError: If a metric with the same name is already registered
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def _get_or_create(self, cls: type[Metric], name: str, *args: object) -> Metric:
+        """Return an existing metric of ``cls`` or register a new one."""
+        full_name = self.full_name(name)
+        existing = self._metrics.get(full_name)
+        if existing is not None:
+            if not isinstance(existing, cls):
+                raise ValueError(f"Metric {full_name} registered as another type")
+            return existing
+        return self.register(cls(full_name, *args))
+
+    def counter(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        """Get or create a counter.
+
+        Args:
+            name: Metric name without namespace
+            documentation: Help text
+            labelnames: Label names
+
+        Returns:
+            Counter
+        """
+        return self._get_or_create(Counter, name, documentation, labelnames)  # type: ignore[return-value]
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Gauge:
+        """Get or create a gauge.
+
+        Args:
+            name: Metric name without namespace
+            documentation: Help text
+            labelnames: Label names
+
+        Returns:
+            Gauge
+        """
+        return self._get_or_create(Gauge, name, documentation, labelnames)  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram.
+
+        Args:
+            name: Metric name without namespace
+            documentation: Help text
+            labelnames: Label names
+            buckets: Bucket upper bounds
+
+        Returns:
+            Histogram
+        """
+        return self._get_or_create(  # type: ignore[return-value]
+            Histogram, name, documentation, labelnames, buckets
+        )
+
+    def get(self, name: str) -> Metric | None:
+        """Get a metric by its full name.
+
+        Args:
+            name: Metric name including namespace
+
+        Returns:
+            Metric or None
+        """
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render every metric family.
+
+        Returns:
+            Prometheus text exposition (format version 0.0.4)
+        """
+        families = [metric.render() for metric in list(self._metrics.values())]
+        return "\n".join(families) + "\n" if families else ""
@@ -0,0 +1,160 @@
+"""Prometheus scrape endpoint.
+
+The server runs its own asyncio event loop on a daemon thread, so accepting
+connections and rendering the registry never take time from the trading
+loop. Only ``GET /metrics`` (and ``GET /`` as an alias) is served.
+"""
+
+import asyncio
+import contextlib
+import threading
+
+import structlog
+
+from stratoquant_nexus.monitoring.metrics import MetricsRegistry
+
+logger = structlog.get_logger()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsServer:
+    """Lightweight HTTP endpoint serving a metrics registry.
+
+    Example:
+        >>> server = MetricsServer(engine.metrics, port=9100)
+        >>> server.start()
+        >>> ...
+        >>> server.stop()
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        host: str = "127.0.0.1",
+        port: int = 9100,
+        path: str = "/metrics",
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            registry: Registry to expose
+            host: Bind address
+            port: Bind port (0 picks a free port)
+            path: Scrape path
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.path = path
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.Server | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+
+    @property
+    def url(self) -> str:
+        """Get the scrape URL."""
+        return f"http://{self.host}:{self.port}{self.path}"
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the server thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start serving on a background thread.
+
+        Raises:
+            OSError: If the address cannot be bound
+        """
+        if self.is_running:
+            return
+        self._ready.clear()
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            self._thread.join()
+            self._thread = None
+            raise self._error
+        logger.info("Metrics server started", url=self.url)
+
+    def stop(self) -> None:
+        """Stop the server and join its thread."""
+        if self._thread is None or self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._shutdown)
+        self._thread.join()
+        self._thread = None
+        logger.info("Metrics server stopped")
+
+    def _run(self) -> None:
+        """Thread body running the server's event loop."""
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        try:
+            self._server = loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port)
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            loop.close()
+            return
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._server.close()
+            loop.run_until_complete(self._server.wait_closed())
+            loop.close()
+            self._loop = None
+
+    def _shutdown(self) -> None:
+        """Stop the loop; called on the server thread."""
+        assert self._loop is not None
+        self._loop.stop()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve a single scrape request."""
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode("latin-1").split()
+            method, target = (parts[0], parts[1]) if len(parts) >= 2 else ("", "")
+            path = target.split("?", 1)[0]
+
+            if method != "GET":
+                status, body = "405 Method Not Allowed", b"method not allowed\n"
+            elif path not in (self.path, "/"):
+                status, body = "404 Not Found", b"not found\n"
+            else:
+                status, body = "200 OK", self.registry.render().encode()
+
+            writer.write(
+                (
+                    f"HTTP/1.1 {status}\r\n"
+                    f"Content-Type: {CONTENT_TYPE}\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode()
+                + body
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:  # Never let a scrape take the server down
+            logger.error("Metrics scrape failed", error=str(e))
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
@@ -9,6 +9,7 @@ from stratoquant_nexus.layers.l1_signals import (
     SignalType,
     TradingSignal,
 )
+from stratoquant_nexus.monitoring.latency import elapsed_ms
 from stratoquant_nexus.pine_executor.models import (
     AlertType,
     ExecutionResult,
@@ -75,7 +76,7 @@ class PineExecutor:
         Returns:
             Execution result
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         # Validate strategy
         strategy = self._strategies.get(alert.strategy_name)
@@ -90,7 +91,7 @@ class PineExecutor:
         signal = self._alert_to_signal(alert)
 
         self._processed_alerts.append(alert)
-        execution_time = (time.time() - start_time) * 1000
+        execution_time = elapsed_ms(start_time)
 
         logger.info(
             "Alert processed",
@@ -103,7 +104,7 @@ class PineExecutor:
             alert=alert,
             executed=True,
             message=f"Alert converted to {signal.signal_type} signal",
-            execution_time_ms=round(execution_time, 2),
+            execution_time_ms=execution_time,
         )
 
     def _alert_to_signal(self, alert: PineAlert) -> TradingSignal:
@@ -0,0 +1,13 @@
+"""Record/replay capture of engine cycles for debugging and regression tests."""
+
+from stratoquant_nexus.replay.format import RecordedCycle
+from stratoquant_nexus.replay.recorder import CycleRecorder
+from stratoquant_nexus.replay.replayer import CycleReplayer, ReplayDiff, ReplayResult
+
+__all__ = [
+    "CycleRecorder",
+    "CycleReplayer",
+    "RecordedCycle",
+    "ReplayDiff",
+    "ReplayResult",
+]
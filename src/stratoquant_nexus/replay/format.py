@@ -0,0 +1,377 @@
+"""Columnar, compressed binary format for recorded engine cycles.
+
+A capture file is a magic header followed by independent blocks::
+
+    file  = b"SQRC\\x01" | block*
+    block = u32 compressed_length | u32 crc32(compressed) | zlib(body)
+    body  = u32 n_cycles | u16 n_columns | column*
+    column = str name | u8 kind | u32 byte_length | bytes
+
+Each block holds up to a few hundred cycles laid out column by column, e.g.
+every candle close price of the block in one column, so the repetitive
+values (symbols, timeframes, statuses) compress well. Integer and float
+columns are packed little-endian 64-bit arrays; string columns are UTF-8
+joined by NUL. Per-cycle row counts (``cycle.candles``, ``cycle.signals``,
+...) delimit each cycle's rows within the data columns.
+
+Only the raw candle inputs are stored in full. Layer outputs are stored as
+the deterministic fields that a replay compares (no generated IDs or
+wall-clock timestamps).
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Iterator
+from decimal import Decimal
+from typing import Any, BinaryIO
+
+from stratoquant_nexus.layers.l0_data import OHLCV, Timeframe
+from stratoquant_nexus.utils.binary import from_micros, pack_str, to_micros, unpack_str
+
+MAGIC = b"SQRC\x01"
+
+_BLOCK_HEADER = struct.Struct("<II")
+_BODY_HEADER = struct.Struct("<IH")
+_COLUMN_HEADER = struct.Struct("<BI")
+
+_INT = 0
+_FLOAT = 1
+_STR = 2
+
+SignalRow = tuple[str, str, str, str, float]
+AssessmentRow = tuple[str, int, str, str]
+ReportRow = tuple[str, str, str, str, str, str, int]
+
+SIGNAL_FIELDS = ("symbol", "type", "strength", "price", "confidence")
+ASSESSMENT_FIELDS = ("symbol", "approved", "code", "units")
+REPORT_FIELDS = (
+    "symbol",
+    "side",
+    "quantity",
+    "status",
+    "filled",
+    "average_price",
+    "success",
+)
+_CANDLE_FIELDS = (
+    "ts",
+    "aware",
+    "timeframe",
+    "symbol",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+)
+
+_COLUMN_KINDS = {
+    "cycle.candles": _INT,
+    "cycle.signals": _INT,
+    "cycle.assessments": _INT,
+    "cycle.reports": _INT,
+    "candle.ts": _INT,
+    "candle.aware": _INT,
+    "signal.confidence": _FLOAT,
+    "assessment.approved": _INT,
+    "report.success": _INT,
+}
+
+
+def signal_row(signal: Any) -> SignalRow:
+    """Get the recorded fields of a trading signal.
+
+    Args:
+        signal: Trading signal
+
+    Returns:
+        Signal row
+    """
+    return (
+        signal.symbol,
+        signal.signal_type.value,
+        signal.strength.value,
+        str(signal.price),
+        float(signal.confidence),
+    )
+
+
+def assessment_row(assessment: Any) -> AssessmentRow:
+    """Get the recorded fields of a risk assessment.
+
+    Args:
+        assessment: Risk assessment
+
+    Returns:
+        Assessment row
+    """
+    position = assessment.position_size
+    return (
+        assessment.signal.symbol,
+        int(assessment.approved),
+        assessment.rejection_code or "",
+        str(position.units) if position is not None else "",
+    )
+
+
+def report_row(report: Any) -> ReportRow:
+    """Get the recorded fields of an execution report.
+
+    Args:
+        report: Execution report
+
+    Returns:
+        Report row
+    """
+    order = report.order
+    return (
+        order.symbol,
+        order.side.value,
+        str(order.quantity),
+        order.status.value,
+        str(order.filled_quantity),
+        "" if order.average_price is None else str(order.average_price),
+        int(report.success),
+    )
+
+
+class RecordedCycle:
+    """One recorded cycle: its inputs and the layer outputs to compare.
+
+    Attributes:
+        index: Cycle number within the capture
+        candles: Raw candles fed to ``process_cycle``
+        signals: Signal rows
+        assessments: Risk assessment rows
+        reports: Execution report rows
+    """
+
+    __slots__ = ("index", "candles", "signals", "assessments", "reports")
+
+    def __init__(
+        self,
+        index: int,
+        candles: list[OHLCV],
+        signals: list[SignalRow],
+        assessments: list[AssessmentRow],
+        reports: list[ReportRow],
+    ) -> None:
+        """Initialize the recorded cycle."""
+        self.index = index
+        self.candles = candles
+        self.signals = signals
+        self.assessments = assessments
+        self.reports = reports
+
+
+def _encode_column(kind: int, values: list[Any]) -> bytes:
+    """Encode one column's values."""
+    if kind == _STR:
+        return "\x00".join(values).encode()
+    packed = array("q" if kind == _INT else "d", values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _decode_column(kind: int, data: bytes, count: int) -> list[Any]:
+    """Decode one column's values."""
+    if kind == _STR:
+        return data.decode().split("\x00") if count else []
+    packed = array("q" if kind == _INT else "d")
+    packed.frombytes(data)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tolist()
+
+
+def encode_block(
+    cycles: list[tuple[list[OHLCV], list[Any], list[Any], list[ReportRow]]],
+    compression_level: int = 6,
+) -> bytes:
+    """Encode captured cycles into a compressed columnar block.
+
+    Args:
+        cycles: ``(candles, signals, assessments, report_rows)`` per cycle
+        compression_level: zlib compression level
+
+    Returns:
+        Block bytes including the block header
+    """
+    columns: dict[str, list[Any]] = {
+        name: []
+        for name in (
+            "cycle.candles",
+            "cycle.signals",
+            "cycle.assessments",
+            "cycle.reports",
+            *(f"candle.{f}" for f in _CANDLE_FIELDS),
+            *(f"signal.{f}" for f in SIGNAL_FIELDS),
+            *(f"assessment.{f}" for f in ASSESSMENT_FIELDS),
+            *(f"report.{f}" for f in REPORT_FIELDS),
+        )
+    }
+
+    def extend(prefix: str, fields: tuple[str, ...], rows: list[tuple]) -> None:
+        for position, field in enumerate(fields):
+            columns[f"{prefix}.{field}"].extend(row[position] for row in rows)
+
+    for candles, signals, assessments, reports in cycles:
+        columns["cycle.candles"].append(len(candles))
+        columns["cycle.signals"].append(len(signals))
+        columns["cycle.assessments"].append(len(assessments))
+        columns["cycle.reports"].append(len(reports))
+        candle_rows = []
+        for candle in candles:
+            candle_rows.append(
+                (
+                    to_micros(candle.timestamp),
+                    int(candle.timestamp.tzinfo is not None),
+                    candle.timeframe.value,
+                    candle.symbol,
+                    str(candle.open),
+                    str(candle.high),
+                    str(candle.low),
+                    str(candle.close),
+                    str(candle.volume),
+                )
+            )
+        extend("candle", _CANDLE_FIELDS, candle_rows)
+        extend("signal", SIGNAL_FIELDS, [signal_row(s) for s in signals])
+        extend(
+            "assessment", ASSESSMENT_FIELDS, [assessment_row(a) for a in assessments]
+        )
+        extend("report", REPORT_FIELDS, reports)
+
+    parts = [_BODY_HEADER.pack(len(cycles), len(columns))]
+    for name, values in columns.items():
+        kind = _COLUMN_KINDS.get(name, _STR)
+        data = _encode_column(kind, values)
+        parts.append(pack_str(name))
+        parts.append(_COLUMN_HEADER.pack(kind, len(data)))
+        parts.append(data)
+    compressed = zlib.compress(b"".join(parts), compression_level)
+    return _BLOCK_HEADER.pack(len(compressed), zlib.crc32(compressed)) + compressed
+
+
+def _rows(
+    columns: dict[str, list[Any]],
+    prefix: str,
+    fields: tuple[str, ...],
+    start: int,
+    count: int,
+) -> list[tuple]:
+    """Slice ``count`` rows starting at ``start`` from a table's columns."""
+    data = [columns[f"{prefix}.{field}"][start : start + count] for field in fields]
+    return list(zip(*data, strict=True)) if count else []
+
+
+def decode_block(body: bytes, first_index: int) -> list[RecordedCycle]:
+    """Decode an uncompressed block body.
+
+    Args:
+        body: Decompressed block body
+        first_index: Capture index of the block's first cycle
+
+    Returns:
+        Recorded cycles
+    """
+    view = memoryview(body)
+    n_cycles, n_columns = _BODY_HEADER.unpack_from(view, 0)
+    offset = _BODY_HEADER.size
+    raw: dict[str, tuple[int, bytes]] = {}
+    for _ in range(n_columns):
+        name, offset = unpack_str(view, offset)
+        kind, size = _COLUMN_HEADER.unpack_from(view, offset)
+        offset += _COLUMN_HEADER.size
+        raw[name] = (kind, bytes(view[offset : offset + size]))
+        offset += size
+
+    counts = {
+        name: _decode_column(*raw[f"cycle.{name}"], n_cycles)
+        for name in ("candles", "signals", "assessments", "reports")
+    }
+    totals = {name: sum(values) for name, values in counts.items()}
+    table_of = {
+        "candle": "candles",
+        "signal": "signals",
+        "assessment": "assessments",
+        "report": "reports",
+    }
+    columns = {
+        name: _decode_column(kind, data, totals[table_of[name.split(".")[0]]])
+        for name, (kind, data) in raw.items()
+        if not name.startswith("cycle.")
+    }
+
+    cycles = []
+    cursor = dict.fromkeys(counts, 0)
+    for i in range(n_cycles):
+        n = {name: counts[name][i] for name in counts}
+        candles = [
+            OHLCV(
+                timestamp=from_micros(ts, bool(aware)),
+                open=Decimal(o),
+                high=Decimal(h),
+                low=Decimal(lo),
+                close=Decimal(c),
+                volume=Decimal(v),
+                symbol=symbol,
+                timeframe=Timeframe(timeframe),
+            )
+            for ts, aware, timeframe, symbol, o, h, lo, c, v in _rows(
+                columns, "candle", _CANDLE_FIELDS, cursor["candles"], n["candles"]
+            )
+        ]
+        cycles.append(
+            RecordedCycle(
+                index=first_index + i,
+                candles=candles,
+                signals=_rows(
+                    columns, "signal", SIGNAL_FIELDS, cursor["signals"], n["signals"]
+                ),
+                assessments=_rows(
+                    columns,
+                    "assessment",
+                    ASSESSMENT_FIELDS,
+                    cursor["assessments"],
+                    n["assessments"],
+                ),
+                reports=_rows(
+                    columns, "report", REPORT_FIELDS, cursor["reports"], n["reports"]
+                ),
+            )
+        )
+        for name in cursor:
+            cursor[name] += n[name]
+    return cycles
+
+
+def read_blocks(stream: BinaryIO) -> Iterator[bytes]:
+    """Iterate the decompressed block bodies of a capture file.
+
+    A truncated or corrupt trailing block (e.g. from a crash mid-write) ends
+    iteration instead of raising.
+
+    Args:
+        stream: Binary stream positioned at the start of the file
+
+    Yields:
+        Decompressed block bodies
+
+    Raises:
+        ValueError: If the stream is not a capture file
+    """
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a StratoQuant cycle capture")
+    while True:
+        header = stream.read(_BLOCK_HEADER.size)
+        if len(header) < _BLOCK_HEADER.size:
+            return
+        length, checksum = _BLOCK_HEADER.unpack(header)
+        compressed = stream.read(length)
+        if len(compressed) < length or zlib.crc32(compressed) != checksum:
+            return
+        yield zlib.decompress(compressed)
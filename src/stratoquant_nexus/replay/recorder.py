@@ -0,0 +1,158 @@
+"""Background recorder capturing engine cycles to a capture file."""
+
+import queue
+import threading
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from stratoquant_nexus.layers.l0_data import OHLCV
+from stratoquant_nexus.layers.l0_orderbook import BookUpdate
+from stratoquant_nexus.replay.format import MAGIC, encode_block, report_row
+
+logger = structlog.get_logger()
+
+_STOP = object()
+
+
+class CycleRecorder:
+    """Capture ``process_cycle`` inputs and outputs off the hot path.
+
+    ``record`` only copies list references (and the mutable order fields of
+    execution reports) onto a queue; a writer thread does the columnar
+    encoding, compression and file I/O in blocks of ``block_cycles``.
+
+    The candles recorded are the data layer's output, after validation and
+    trade aggregation, so replaying them reproduces what the signal layer
+    saw. Order book updates are not recorded; a capture of cycles that used
+    them is logged as one that may not replay exactly.
+
+    Example:
+        >>> recorder = CycleRecorder("cycles.sqrc")
+        >>> recorder.open()
+        >>> recorder.record(candles, results)
+        >>> recorder.close()
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        block_cycles: int = 256,
+        flush_interval_seconds: float = 1.0,
+        compression_level: int = 6,
+    ) -> None:
+        """Initialize the recorder.
+
+        Args:
+            path: Capture file to create (overwritten if it exists)
+            block_cycles: Cycles per compressed block
+            flush_interval_seconds: Maximum time a partial block is held
+            compression_level: zlib compression level
+        """
+        self.path = Path(path)
+        self.block_cycles = block_cycles
+        self.flush_interval_seconds = flush_interval_seconds
+        self.compression_level = compression_level
+        self.cycles_recorded = 0
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._failed = False
+        self._warned_books = False
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the writer thread is running."""
+        return self._thread is not None
+
+    def open(self) -> None:
+        """Create the capture file and start the writer thread."""
+        if self._thread is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        stream = open(self.path, "wb")  # noqa: SIM115 - owned by the writer thread
+        stream.write(MAGIC)
+        self._thread = threading.Thread(
+            target=self._write_loop, args=(stream,), name="cycle-recorder", daemon=True
+        )
+        self._thread.start()
+        logger.info("Cycle recording started", path=str(self.path))
+
+    def record(self, raw_data: Any, results: dict[str, list[Any]]) -> None:
+        """Queue one cycle for writing.
+
+        Args:
+            raw_data: Input passed to ``process_cycle``
+            results: Results returned by ``process_cycle``
+        """
+        if self._thread is None or self._failed:
+            return
+        market_data = results.get("market_data")
+        self._queue.put(
+            (
+                list(raw_data) if isinstance(raw_data, list) else [raw_data],
+                # L0 output when the data layer ran, else the raw candles
+                (
+                    [c for data in market_data for c in data.candles]
+                    if market_data
+                    else None
+                ),
+                list(results.get("signals", [])),
+                list(results.get("risk_assessments", [])),
+                # Orders keep changing after the cycle, so capture them now
+                [report_row(r) for r in results.get("execution_reports", [])],
+            )
+        )
+        self.cycles_recorded += 1
+
+    def close(self) -> None:
+        """Flush queued cycles and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        logger.info(
+            "Cycle recording stopped",
+            path=str(self.path),
+            cycles=self.cycles_recorded,
+        )
+
+    def _write_loop(self, stream: Any) -> None:
+        """Writer thread body: batch, encode and append blocks."""
+        pending: list[tuple] = []
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval_seconds)
+                except queue.Empty:
+                    item = None
+                if item is _STOP:
+                    break
+                if item is not None:
+                    raw, candles, signals, assessments, reports = item
+                    if candles is None:
+                        candles = [c for c in raw if isinstance(c, OHLCV)]
+                    if not self._warned_books and any(
+                        isinstance(d, BookUpdate) for d in raw
+                    ):
+                        self._warned_books = True
+                        logger.warning(
+                            "Order book updates are not recorded; "
+                            "replay may diverge",
+                            path=str(self.path),
+                        )
+                    pending.append((candles, signals, assessments, reports))
+                    if len(pending) < self.block_cycles:
+                        continue
+                if pending:
+                    stream.write(encode_block(pending, self.compression_level))
+                    stream.flush()
+                    pending = []
+            if pending:
+                stream.write(encode_block(pending, self.compression_level))
+        except Exception as e:  # Recording must never take the engine down
+            self._failed = True
+            logger.error("Cycle recording failed", error=str(e))
+        finally:
+            stream.close()
@@ -0,0 +1,142 @@
+"""Replay recorded cycles through an engine and diff the outputs."""
+
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, Field
+
+from stratoquant_nexus.replay.format import (
+    RecordedCycle,
+    assessment_row,
+    decode_block,
+    read_blocks,
+    report_row,
+    signal_row,
+)
+
+if TYPE_CHECKING:
+    from stratoquant_nexus.engine import TradingEngine
+
+
+class ReplayDiff(BaseModel):
+    """Mismatch between a recorded and a replayed layer output."""
+
+    cycle: int = Field(..., description="Cycle index within the capture")
+    layer: str = Field(..., description="Result key that differs")
+    expected: list[tuple[Any, ...]] = Field(..., description="Recorded rows")
+    actual: list[tuple[Any, ...]] = Field(..., description="Replayed rows")
+
+
+class ReplayResult(BaseModel):
+    """Outcome of replaying a capture."""
+
+    cycles: int = Field(default=0, description="Cycles replayed")
+    mismatched_cycles: int = Field(
+        default=0, description="Cycles with at least one differing layer"
+    )
+    diffs: list[ReplayDiff] = Field(
+        default_factory=list, description="Recorded differences (capped)"
+    )
+    elapsed_seconds: float = Field(
+        default=0.0, description="Time spent inside process_cycle"
+    )
+
+    @property
+    def matched(self) -> bool:
+        """Check if every replayed cycle reproduced its recorded outputs."""
+        return self.mismatched_cycles == 0
+
+    @property
+    def cycles_per_second(self) -> float:
+        """Get replay throughput."""
+        return self.cycles / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class CycleReplayer:
+    """Feed a capture back through a :class:`TradingEngine`.
+
+    Rows are compared as sorted lists per layer, because the signal layer
+    does not guarantee an order across symbols.
+
+    Example:
+        >>> replayer = CycleReplayer("cycles.sqrc")
+        >>> result = await replayer.replay(engine)
+        >>> assert result.matched, result.diffs[:3]
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the replayer.
+
+        Args:
+            path: Capture file written by ``CycleRecorder``
+        """
+        self.path = Path(path)
+
+    def cycles(self) -> Iterator[RecordedCycle]:
+        """Iterate the recorded cycles, one block in memory at a time.
+
+        Yields:
+            Recorded cycles in capture order
+        """
+        index = 0
+        with open(self.path, "rb") as stream:
+            for body in read_blocks(stream):
+                block = decode_block(body, index)
+                index += len(block)
+                yield from block
+
+    async def replay(
+        self, engine: "TradingEngine", compare: bool = True, max_diffs: int = 100
+    ) -> ReplayResult:
+        """Replay every recorded cycle as fast as the engine allows.
+
+        Args:
+            engine: Started engine to replay through
+            compare: Diff outputs against the recording
+            max_diffs: Maximum number of diffs to keep
+
+        Returns:
+            Replay summary with throughput and differences
+        """
+        result = ReplayResult()
+        elapsed_ns = 0
+        for cycle in self.cycles():
+            start = time.perf_counter_ns()
+            results = await engine.process_cycle(cycle.candles)
+            elapsed_ns += time.perf_counter_ns() - start
+            result.cycles += 1
+            if not compare:
+                continue
+
+            mismatched = False
+            for layer, expected, actual in (
+                ("signals", cycle.signals, map(signal_row, results["signals"])),
+                (
+                    "risk_assessments",
+                    cycle.assessments,
+                    map(assessment_row, results["risk_assessments"]),
+                ),
+                (
+                    "execution_reports",
+                    cycle.reports,
+                    map(report_row, results["execution_reports"]),
+                ),
+            ):
+                expected_rows = sorted(expected)
+                actual_rows = sorted(actual)
+                if expected_rows != actual_rows:
+                    mismatched = True
+                    if len(result.diffs) < max_diffs:
+                        result.diffs.append(
+                            ReplayDiff(
+                                cycle=cycle.index,
+                                layer=layer,
+                                expected=expected_rows,
+                                actual=actual_rows,
+                            )
+                        )
+            result.mismatched_cycles += mismatched
+        result.elapsed_seconds = elapsed_ns / 1e9
+        return result
@@ -0,0 +1,15 @@
+"""Symbol-sharded multi-process deployment of the trading engine."""
+
+from stratoquant_nexus.sharding.engine import (
+    ShardedEngineConfig,
+    ShardedTradingEngine,
+    ShardError,
+    shard_for,
+)
+
+__all__ = [
+    "ShardError",
+    "ShardedEngineConfig",
+    "ShardedTradingEngine",
+    "shard_for",
+]
@@ -0,0 +1,239 @@
+"""Binary framing for the shard IPC channel.
+
+Each message sent over a worker pipe is one frame: a ``u8`` frame type
+followed by a payload. ``multiprocessing.Connection.send_bytes`` supplies the
+outer length prefix, so frames are never split or merged.
+
+Candle batch payload (little-endian)::
+
+    u32 count | u16 n_symbols | n_symbols x str
+    count x (i64 timestamp_us | u8 tz_aware | u8 timeframe | u16 symbol_index
+             | 5 x str decimal)
+
+Signal batch payload::
+
+    u32 count
+    count x (i64 timestamp_us | u8 tz_aware | u8 type | u8 strength
+             | f64 confidence | str symbol | str price
+             | u8 n_indicators | n x (str name | u8 kind | f64 or str value))
+
+Strings are ``u16 length + utf-8``. Decimals are sent as their exact string
+form; symbols are sent once per batch in a table.
+"""
+
+import struct
+from collections.abc import Iterable
+from decimal import Decimal
+from enum import IntEnum
+
+from stratoquant_nexus.layers.l0_data import OHLCV, Timeframe
+from stratoquant_nexus.layers.l1_signals import (
+    SignalStrength,
+    SignalType,
+    TradingSignal,
+)
+from stratoquant_nexus.utils.binary import from_micros, pack_str, to_micros, unpack_str
+
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_F64 = struct.Struct("<d")
+_CANDLE = struct.Struct("<qBBH")
+_SIGNAL = struct.Struct("<qBBBd")
+
+_TIMEFRAMES = list(Timeframe)
+_SIGNAL_TYPES = list(SignalType)
+_STRENGTHS = list(SignalStrength)
+_TIMEFRAME_CODES = {v: i for i, v in enumerate(_TIMEFRAMES)}
+_SIGNAL_TYPE_CODES = {v: i for i, v in enumerate(_SIGNAL_TYPES)}
+_STRENGTH_CODES = {v: i for i, v in enumerate(_STRENGTHS)}
+
+_INDICATOR_FLOAT = 0
+_INDICATOR_STR = 1
+
+
+class FrameType(IntEnum):
+    """Shard IPC frame types."""
+
+    CANDLES = 1
+    SIGNALS = 2
+    STOP = 3
+    ERROR = 4
+
+
+def encode_frame(frame_type: FrameType, payload: bytes = b"") -> bytes:
+    """Prefix a payload with its frame type.
+
+    Args:
+        frame_type: Frame type
+        payload: Frame payload
+
+    Returns:
+        Encoded frame
+    """
+    return _U8.pack(frame_type) + payload
+
+
+def decode_frame(frame: bytes) -> tuple[FrameType, memoryview]:
+    """Split a frame into its type and payload.
+
+    Args:
+        frame: Encoded frame
+
+    Returns:
+        Frame type and payload view
+    """
+    view = memoryview(frame)
+    return FrameType(view[0]), view[1:]
+
+
+def encode_candles(candles: Iterable[OHLCV]) -> bytes:
+    """Encode a batch of candles.
+
+    Args:
+        candles: Candles to encode
+
+    Returns:
+        Candle batch payload
+    """
+    symbols: dict[str, int] = {}
+    body = []
+    count = 0
+    for candle in candles:
+        index = symbols.setdefault(candle.symbol, len(symbols))
+        timestamp = candle.timestamp
+        body.append(
+            _CANDLE.pack(
+                to_micros(timestamp),
+                timestamp.tzinfo is not None,
+                _TIMEFRAME_CODES[candle.timeframe],
+                index,
+            )
+        )
+        for value in (candle.open, candle.high, candle.low, candle.close):
+            body.append(pack_str(str(value)))
+        body.append(pack_str(str(candle.volume)))
+        count += 1
+    header = [_U32.pack(count), _U16.pack(len(symbols))]
+    header.extend(pack_str(symbol) for symbol in symbols)
+    return b"".join(header + body)
+
+
+def decode_candles(payload: memoryview) -> list[OHLCV]:
+    """Decode a candle batch.
+
+    Args:
+        payload: Candle batch payload
+
+    Returns:
+        Decoded candles
+    """
+    (count,) = _U32.unpack_from(payload, 0)
+    (n_symbols,) = _U16.unpack_from(payload, _U32.size)
+    offset = _U32.size + _U16.size
+    symbols = []
+    for _ in range(n_symbols):
+        symbol, offset = unpack_str(payload, offset)
+        symbols.append(symbol)
+
+    candles = []
+    for _ in range(count):
+        timestamp, aware, timeframe, index = _CANDLE.unpack_from(payload, offset)
+        offset += _CANDLE.size
+        values = []
+        for _ in range(5):
+            text, offset = unpack_str(payload, offset)
+            values.append(Decimal(text))
+        candles.append(
+            OHLCV(
+                timestamp=from_micros(timestamp, bool(aware)),
+                open=values[0],
+                high=values[1],
+                low=values[2],
+                close=values[3],
+                volume=values[4],
+                symbol=symbols[index],
+                timeframe=_TIMEFRAMES[timeframe],
+            )
+        )
+    return candles
+
+
+def encode_signals(signals: Iterable[TradingSignal]) -> bytes:
+    """Encode a batch of signals.
+
+    Args:
+        signals: Signals to encode
+
+    Returns:
+        Signal batch payload
+    """
+    body = []
+    count = 0
+    for signal in signals:
+        timestamp = signal.timestamp
+        body.append(
+            _SIGNAL.pack(
+                to_micros(timestamp),
+                timestamp.tzinfo is not None,
+                _SIGNAL_TYPE_CODES[signal.signal_type],
+                _STRENGTH_CODES[signal.strength],
+                signal.confidence,
+            )
+        )
+        body.append(pack_str(signal.symbol))
+        body.append(pack_str(str(signal.price)))
+        body.append(_U8.pack(len(signal.indicators)))
+        for name, value in signal.indicators.items():
+            body.append(pack_str(name))
+            if isinstance(value, str):
+                body.append(_U8.pack(_INDICATOR_STR) + pack_str(value))
+            else:
+                body.append(_U8.pack(_INDICATOR_FLOAT) + _F64.pack(value))
+        count += 1
+    return _U32.pack(count) + b"".join(body)
+
+
+def decode_signals(payload: memoryview) -> list[TradingSignal]:
+    """Decode a signal batch.
+
+    Args:
+        payload: Signal batch payload
+
+    Returns:
+        Decoded signals
+    """
+    (count,) = _U32.unpack_from(payload, 0)
+    offset = _U32.size
+    signals = []
+    for _ in range(count):
+        timestamp, aware, signal_type, strength, confidence = _SIGNAL.unpack_from(
+            payload, offset
+        )
+        offset += _SIGNAL.size
+        symbol, offset = unpack_str(payload, offset)
+        price, offset = unpack_str(payload, offset)
+        (n_indicators,) = _U8.unpack_from(payload, offset)
+        offset += _U8.size
+        indicators: dict[str, float | str] = {}
+        for _ in range(n_indicators):
+            name, offset = unpack_str(payload, offset)
+            (kind,) = _U8.unpack_from(payload, offset)
+            offset += _U8.size
+            if kind == _INDICATOR_STR:
+                indicators[name], offset = unpack_str(payload, offset)
+            else:
+                (indicators[name],) = _F64.unpack_from(payload, offset)
+                offset += _F64.size
+        signals.append(
+            TradingSignal(
+                symbol=symbol,
+                signal_type=_SIGNAL_TYPES[signal_type],
+                strength=_STRENGTHS[strength],
+                price=Decimal(price),
+                timestamp=from_micros(timestamp, bool(aware)),
+                indicators=indicators,
+                confidence=confidence,
+            )
+        )
+    return signals
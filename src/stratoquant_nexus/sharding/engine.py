@@ -0,0 +1,323 @@
+"""Symbol-sharded multi-process trading engine.
+
+Symbols are hash-partitioned across worker processes. Each worker runs its
+own L0 data and L1 signal layers, so indicator work for different symbols
+runs on different cores. The coordinator process owns a
+:class:`~stratoquant_nexus.engine.TradingEngine` with only L2 and L3
+enabled, so portfolio risk state and order management stay in one place.
+
+Candles go out to the workers and signals come back over one duplex pipe
+per worker. Each message is a single binary frame (see
+:mod:`~stratoquant_nexus.sharding.codec`).
+"""
+
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import zlib
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any
+
+import structlog
+from pydantic import BaseModel, Field
+
+from stratoquant_nexus.engine import EngineConfig, EngineStatus, TradingEngine
+from stratoquant_nexus.layers.l0_data import OHLCV, DataLayerConfig
+from stratoquant_nexus.layers.l1_signals import SignalLayerConfig, TradingSignal
+from stratoquant_nexus.layers.l2_risk import RiskLayerConfig
+from stratoquant_nexus.layers.l3_execution import ExecutionLayerConfig
+from stratoquant_nexus.sharding.codec import (
+    FrameType,
+    decode_frame,
+    decode_signals,
+    encode_candles,
+    encode_frame,
+)
+from stratoquant_nexus.sharding.worker import run_shard
+
+logger = structlog.get_logger()
+
+
+class ShardError(RuntimeError):
+    """Raised when a shard worker fails or exits unexpectedly."""
+
+
+def shard_for(symbol: str, num_shards: int) -> int:
+    """Get the shard that owns a symbol.
+
+    Uses CRC32 rather than ``hash()`` so the mapping is identical in every
+    process regardless of ``PYTHONHASHSEED``.
+
+    Args:
+        symbol: Trading symbol
+        num_shards: Number of shards
+
+    Returns:
+        Shard index
+    """
+    return zlib.crc32(symbol.encode()) % num_shards
+
+
+class ShardedEngineConfig(BaseModel):
+    """Configuration for the sharded trading engine."""
+
+    name: str = Field(default="StratoQuant Nexus", description="Engine name")
+    num_shards: int = Field(
+        default_factory=lambda: max((os.cpu_count() or 2) - 1, 1),
+        ge=1,
+        description="Number of L0/L1 worker processes",
+    )
+    start_method: str = Field(
+        default="spawn", description="multiprocessing start method for workers"
+    )
+    worker_timeout_seconds: float = Field(
+        default=30.0, gt=0, description="Maximum wait for a shard's signals"
+    )
+    enable_metrics: bool = Field(
+        default=False, description="Maintain Prometheus metrics in the coordinator"
+    )
+    data_config: DataLayerConfig | None = None
+    signal_config: SignalLayerConfig | None = None
+    risk_config: RiskLayerConfig | None = None
+    execution_config: ExecutionLayerConfig | None = None
+
+
+class _Shard:
+    """Coordinator-side handle for one worker process."""
+
+    def __init__(self, shard_id: int, process: BaseProcess, conn: Connection) -> None:
+        self.shard_id = shard_id
+        self.process = process
+        self.conn = conn
+
+
+class ShardedTradingEngine:
+    """Trading engine that spreads L0/L1 work over worker processes.
+
+    Example:
+        >>> engine = ShardedTradingEngine(ShardedEngineConfig(num_shards=4))
+        >>> await engine.start()
+        >>> results = await engine.process_cycle(candles)
+        >>> await engine.stop()
+    """
+
+    def __init__(self, config: ShardedEngineConfig | None = None) -> None:
+        """Initialize the sharded engine.
+
+        Args:
+            config: Sharded engine configuration
+        """
+        self.config = config or ShardedEngineConfig()
+        self._shards: list[_Shard] = []
+        self._coordinator = TradingEngine(
+            EngineConfig(
+                name=self.config.name,
+                enable_data_layer=False,
+                enable_signal_layer=False,
+                enable_metrics=self.config.enable_metrics,
+                risk_config=self.config.risk_config,
+                execution_config=self.config.execution_config,
+            )
+        )
+
+    @property
+    def coordinator(self) -> TradingEngine:
+        """Get the engine owning the global risk and execution layers."""
+        return self._coordinator
+
+    @property
+    def status(self) -> EngineStatus:
+        """Get the coordinator's status."""
+        return self._coordinator.status
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the engine is running."""
+        return self._coordinator.is_running
+
+    @property
+    def num_shards(self) -> int:
+        """Get the number of shards."""
+        return self.config.num_shards
+
+    def shard_for(self, symbol: str) -> int:
+        """Get the shard that owns a symbol.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Shard index
+        """
+        return shard_for(symbol, self.config.num_shards)
+
+    async def start(self) -> None:
+        """Start the worker processes and the coordinator layers."""
+        logger.info(
+            "Starting sharded trading engine",
+            name=self.config.name,
+            shards=self.config.num_shards,
+        )
+        context = multiprocessing.get_context(self.config.start_method)
+        data_config = (
+            self.config.data_config or DataLayerConfig(name="DataLayer")
+        ).model_dump_json()
+        signal_config = (
+            self.config.signal_config or SignalLayerConfig(name="SignalLayer")
+        ).model_dump_json()
+
+        for shard_id in range(self.config.num_shards):
+            parent_conn, child_conn = context.Pipe(duplex=True)
+            process = context.Process(
+                target=run_shard,
+                args=(child_conn, shard_id, data_config, signal_config),
+                name=f"stratoquant-shard-{shard_id}",
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._shards.append(_Shard(shard_id, process, parent_conn))
+
+        await self._coordinator.start()
+        logger.info("Sharded trading engine started")
+
+    async def stop(self) -> None:
+        """Stop the workers and the coordinator layers."""
+        logger.info("Stopping sharded trading engine")
+        for shard in self._shards:
+            with contextlib.suppress(OSError):  # Worker already gone
+                shard.conn.send_bytes(encode_frame(FrameType.STOP))
+        for shard in self._shards:
+            await asyncio.to_thread(shard.process.join, 5.0)
+            if shard.process.is_alive():
+                shard.process.terminate()
+                await asyncio.to_thread(shard.process.join)
+            shard.conn.close()
+        self._shards.clear()
+        await self._coordinator.stop()
+        logger.info("Sharded trading engine stopped")
+
+    def partition(self, candles: list[OHLCV]) -> dict[int, list[OHLCV]]:
+        """Group candles by owning shard, preserving their order.
+
+        Args:
+            candles: Candles to partition
+
+        Returns:
+            Candles keyed by shard index
+        """
+        num_shards = self.config.num_shards
+        owners: dict[str, int] = {}
+        batches: dict[int, list[OHLCV]] = {}
+        for candle in candles:
+            shard_id = owners.get(candle.symbol)
+            if shard_id is None:
+                shard_id = owners[candle.symbol] = shard_for(candle.symbol, num_shards)
+            batches.setdefault(shard_id, []).append(candle)
+        return batches
+
+    async def process_cycle(self, raw_data: Any) -> dict[str, list[Any]]:
+        """Run a cycle: L0/L1 on the shards, then L2/L3 in the coordinator.
+
+        Args:
+            raw_data: Candles to process
+
+        Returns:
+            Dictionary containing results from each layer. ``market_data``
+            is empty because normalized data stays in the workers.
+
+        Raises:
+            RuntimeError: If the engine is not running
+            ShardError: If a worker fails or does not answer in time
+        """
+        if not self.is_running:
+            raise RuntimeError("Engine is not running. Call start() first.")
+
+        candles = (
+            [c for c in raw_data if isinstance(c, OHLCV)]
+            if isinstance(raw_data, list)
+            else []
+        )
+        batches = self.partition(candles)
+        for shard_id, batch in batches.items():
+            self._shards[shard_id].conn.send_bytes(
+                encode_frame(FrameType.CANDLES, encode_candles(batch))
+            )
+
+        try:
+            # Every shard's reply is read, even after one fails, so no reply
+            # is left in a pipe to be mistaken for the next cycle's
+            responses = await asyncio.wait_for(
+                asyncio.gather(
+                    *(self._receive(self._shards[i]) for i in batches),
+                    return_exceptions=True,
+                ),
+                timeout=self.config.worker_timeout_seconds,
+            )
+        except TimeoutError as e:
+            # A late reply would be read as the next cycle's, so the shard
+            # pipes can no longer be trusted.
+            raise ShardError(
+                "Timed out waiting for shard signals; restart the engine"
+            ) from e
+        signals: list[TradingSignal] = []
+        for batch_signals in responses:
+            if isinstance(batch_signals, BaseException):
+                raise batch_signals
+            signals.extend(batch_signals)
+        return await self._coordinator.process_signals(signals)
+
+    async def _receive(self, shard: _Shard) -> list[TradingSignal]:
+        """Wait for a shard's response without blocking the event loop.
+
+        Args:
+            shard: Shard to read from
+
+        Returns:
+            Signals produced by the shard
+
+        Raises:
+            ShardError: If the worker reported an error or exited
+        """
+        conn = shard.conn
+        if not conn.poll():
+            loop = asyncio.get_running_loop()
+            readable = loop.create_future()
+            try:
+                loop.add_reader(
+                    conn.fileno(),
+                    lambda: readable.done() or readable.set_result(None),
+                )
+            except NotImplementedError:  # Proactor event loop (Windows)
+                await asyncio.to_thread(conn.poll, None)
+            else:
+                try:
+                    await readable
+                finally:
+                    loop.remove_reader(conn.fileno())
+        try:
+            frame = conn.recv_bytes()
+        except EOFError as e:
+            raise ShardError(f"shard {shard.shard_id} exited") from e
+
+        frame_type, payload = decode_frame(frame)
+        if frame_type == FrameType.ERROR:
+            raise ShardError(bytes(payload).decode())
+        return decode_signals(payload)
+
+    async def health_check(self) -> dict[str, bool]:
+        """Check worker liveness and coordinator layer health.
+
+        Returns:
+            Health by component (``shard_<n>`` for each worker)
+        """
+        health = {
+            f"shard_{shard.shard_id}": shard.process.is_alive()
+            for shard in self._shards
+        }
+        coordinator = await self._coordinator.health_check()
+        health["risk_layer"] = coordinator["risk_layer"]
+        health["execution_layer"] = coordinator["execution_layer"]
+        return health
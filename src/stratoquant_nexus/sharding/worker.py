@@ -0,0 +1,61 @@
+"""Shard worker process running L0 and L1 for a subset of symbols."""
+
+import asyncio
+from multiprocessing.connection import Connection
+
+from stratoquant_nexus.layers.l0_data import DataLayer, DataLayerConfig
+from stratoquant_nexus.layers.l1_signals import SignalLayer, SignalLayerConfig
+from stratoquant_nexus.sharding.codec import (
+    FrameType,
+    decode_candles,
+    decode_frame,
+    encode_frame,
+    encode_signals,
+)
+
+
+def run_shard(
+    conn: Connection, shard_id: int, data_config: str, signal_config: str
+) -> None:
+    """Serve candle batches until a STOP frame arrives.
+
+    Each CANDLES frame is run through the shard's own data and signal
+    layers and answered with exactly one SIGNALS (or ERROR) frame.
+
+    Args:
+        conn: Worker end of the shard pipe
+        shard_id: Shard index, used in error messages
+        data_config: JSON-encoded ``DataLayerConfig``
+        signal_config: JSON-encoded ``SignalLayerConfig``
+    """
+    data_layer = DataLayer(DataLayerConfig.model_validate_json(data_config))
+    signal_layer = SignalLayer(SignalLayerConfig.model_validate_json(signal_config))
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(data_layer.initialize())
+        loop.run_until_complete(signal_layer.initialize())
+        while True:
+            try:
+                frame = conn.recv_bytes()
+            except EOFError:
+                break
+            frame_type, payload = decode_frame(frame)
+            if frame_type == FrameType.STOP:
+                break
+            try:
+                candles = decode_candles(payload)
+                market_data = loop.run_until_complete(data_layer.process(candles))
+                signals = loop.run_until_complete(signal_layer.process(market_data))
+                conn.send_bytes(
+                    encode_frame(FrameType.SIGNALS, encode_signals(signals))
+                )
+            except Exception as e:  # Report to the coordinator and keep serving
+                message = f"shard {shard_id}: {type(e).__name__}: {e}"
+                conn.send_bytes(encode_frame(FrameType.ERROR, message.encode()))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(signal_layer.shutdown())
+        loop.run_until_complete(data_layer.shutdown())
+        loop.close()
+        conn.close()
@@ -0,0 +1,327 @@
+"""Synthetic market data for load and benchmark testing.
+
+Price paths, volumes, gaps and arrival order are generated with numpy for
+all symbols at once, so millions of bars take seconds. Bars stay columnar
+(``SyntheticBars``) until they are saved to a ``.npz`` file, stored in a
+``DataLayer`` or converted to ``OHLCV`` candles.
+
+Example:
+    >>> bars = SyntheticMarket(SyntheticConfig(symbols=1000, bars=1000)).generate()
+    >>> bars.save("bars.npz")
+    >>> alerts = crossover_alerts(bars)  # TradingView-style webhook payloads
+"""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from stratoquant_nexus.layers.l0_data import OHLCV, DataLayer, Timeframe
+from stratoquant_nexus.utils.binary import from_micros, to_micros
+
+_COLUMNS = ("symbol", "timestamp", "open", "high", "low", "close", "volume")
+
+
+class PriceModel(str, Enum):
+    """Price path models."""
+
+    GBM = "gbm"  # Geometric Brownian motion
+    REGIME = "regime"  # Markov-switching drift and volatility
+
+
+class SyntheticConfig(BaseModel):
+    """Configuration for synthetic market data."""
+
+    symbols: int = Field(default=10, ge=1, description="Number of symbols")
+    bars: int = Field(default=1000, ge=1, description="Bars per symbol")
+    timeframe: Timeframe = Field(default=Timeframe.H1, description="Bar timeframe")
+    start: datetime = Field(
+        default=datetime(2024, 1, 1, tzinfo=UTC), description="First bar's open time"
+    )
+    model: PriceModel = Field(default=PriceModel.GBM, description="Price model")
+    initial_price: float = Field(default=100.0, gt=0, description="Starting price")
+    drift: float = Field(default=0.0, description="Mean log return per bar (GBM)")
+    volatility: float = Field(
+        default=0.01, gt=0, description="Log return standard deviation per bar (GBM)"
+    )
+    regimes: list[tuple[float, float]] = Field(
+        default_factory=lambda: [(0.0005, 0.005), (-0.001, 0.03)],
+        min_length=1,
+        description="(drift, volatility) per bar of each regime",
+    )
+    regime_switch_probability: float = Field(
+        default=0.01, ge=0, le=1, description="Chance per bar of changing regime"
+    )
+    base_volume: float = Field(default=1000.0, gt=0, description="Mean bar volume")
+    gap_probability: float = Field(
+        default=0.0, ge=0, lt=1, description="Chance each bar is missing"
+    )
+    out_of_order_probability: float = Field(
+        default=0.0, ge=0, le=1, description="Chance a bar arrives after its successor"
+    )
+    price_decimals: int = Field(default=2, ge=0, description="Price precision")
+    seed: int | None = Field(default=None, description="Random seed")
+
+
+class SyntheticBars:
+    """Columnar bars in arrival order.
+
+    Attributes:
+        symbols: Symbol names, indexed by the ``symbol`` column
+        timeframe: Bar timeframe
+        symbol: Symbol index per bar (int32)
+        timestamp: Open time in microseconds since the epoch (int64)
+        open: Open prices (float64)
+        high: High prices (float64)
+        low: Low prices (float64)
+        close: Close prices (float64)
+        volume: Volumes (float64)
+    """
+
+    __slots__ = ("symbols", "timeframe", *_COLUMNS)
+
+    def __init__(
+        self, symbols: list[str], timeframe: Timeframe, **columns: np.ndarray
+    ) -> None:
+        """Initialize the bars.
+
+        Args:
+            symbols: Symbol names
+            timeframe: Bar timeframe
+            **columns: One array per column, all the same length
+        """
+        self.symbols = symbols
+        self.timeframe = timeframe
+        for name in _COLUMNS:
+            setattr(self, name, columns[name])
+
+    def __len__(self) -> int:
+        """Get the number of bars."""
+        return len(self.timestamp)
+
+    def to_candles(self, price_decimals: int = 2) -> list[OHLCV]:
+        """Convert to candles.
+
+        Args:
+            price_decimals: Decimal places of the prices
+
+        Returns:
+            Candles in arrival order
+        """
+        price = f"{{:.{price_decimals}f}}"
+
+        def decimals(values: np.ndarray, fmt: str) -> list[Decimal]:
+            return [Decimal(fmt.format(v)) for v in values.tolist()]
+
+        opens = decimals(self.open, price)
+        highs = decimals(self.high, price)
+        lows = decimals(self.low, price)
+        closes = decimals(self.close, price)
+        volumes = decimals(self.volume, "{:.4f}")
+        symbols = [self.symbols[i] for i in self.symbol.tolist()]
+        # Values are generated consistent (low <= open/close <= high)
+        return [
+            OHLCV.model_construct(
+                timestamp=from_micros(ts),
+                open=opens[i],
+                high=highs[i],
+                low=lows[i],
+                close=closes[i],
+                volume=volumes[i],
+                symbol=symbols[i],
+                timeframe=self.timeframe,
+            )
+            for i, ts in enumerate(self.timestamp.tolist())
+        ]
+
+    def store_into(self, layer: DataLayer, price_decimals: int = 2) -> int:
+        """Add the bars to a data layer's candle history.
+
+        Args:
+            layer: Data layer to fill
+            price_decimals: Decimal places of the prices
+
+        Returns:
+            Number of candles stored
+        """
+        candles = self.to_candles(price_decimals)
+        layer.store(candles)
+        return len(candles)
+
+    def save(self, path: str | Path) -> None:
+        """Write the columns to an uncompressed ``.npz`` file.
+
+        Args:
+            path: Output file
+        """
+        np.savez(
+            path,
+            symbols=np.array(self.symbols),
+            timeframe=np.array(self.timeframe.value),
+            **{name: getattr(self, name) for name in _COLUMNS},
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SyntheticBars":
+        """Read bars written by ``save``.
+
+        Args:
+            path: Input file
+
+        Returns:
+            Loaded bars
+        """
+        with np.load(path) as data:
+            return cls(
+                data["symbols"].tolist(),
+                Timeframe(str(data["timeframe"])),
+                **{name: data[name] for name in _COLUMNS},
+            )
+
+
+class SyntheticMarket:
+    """Vectorized generator of synthetic bars.
+
+    Example:
+        >>> market = SyntheticMarket(SyntheticConfig(model="regime", seed=7))
+        >>> bars = market.generate()
+    """
+
+    def __init__(self, config: SyntheticConfig | None = None) -> None:
+        """Initialize the generator.
+
+        Args:
+            config: Generator configuration
+        """
+        self.config = config or SyntheticConfig()
+        self._rng = np.random.default_rng(self.config.seed)
+
+    def _return_params(self, shape: tuple[int, int]) -> tuple[np.ndarray, np.ndarray]:
+        """Get per-bar drift and volatility for the configured model."""
+        config = self.config
+        if config.model == PriceModel.GBM:
+            return np.full(shape, config.drift), np.full(shape, config.volatility)
+        regimes = np.asarray(config.regimes, dtype=np.float64)
+        switches = self._rng.random(shape) < config.regime_switch_probability
+        state = np.cumsum(switches, axis=1) % len(regimes)
+        return regimes[state, 0], regimes[state, 1]
+
+    def generate(self) -> SyntheticBars:
+        """Generate bars for every symbol.
+
+        Returns:
+            Bars in arrival order: by open time across symbols, with
+            configured gaps removed and late bars moved back
+        """
+        config = self.config
+        rng = self._rng
+        shape = (config.symbols, config.bars)
+
+        drift, sigma = self._return_params(shape)
+        shocks = rng.standard_normal(shape)
+        returns = drift - sigma**2 / 2 + sigma * shocks
+        close = config.initial_price * np.exp(np.cumsum(returns, axis=1))
+        open_ = np.empty_like(close)
+        open_[:, 0] = config.initial_price
+        open_[:, 1:] = close[:, :-1]
+        wicks = np.abs(rng.standard_normal((2, *shape))) * sigma / 2
+        high = np.maximum(open_, close) * (1 + wicks[0])
+        low = np.minimum(open_, close) * (1 - wicks[1])
+
+        step = config.timeframe.seconds * 1_000_000
+        start = to_micros(config.start)
+        timestamps = start + np.arange(config.bars, dtype=np.int64) * step
+        # Intraday U-shape around the UTC day boundary, more volume on big moves
+        day_fraction = (timestamps // 1_000_000 % 86400) / 86400
+        profile = 1 + 0.6 * np.cos(2 * np.pi * day_fraction)
+        volume = (
+            config.base_volume
+            * profile
+            * (1 + np.abs(shocks))
+            * rng.lognormal(-0.03, 0.25, shape)
+        )
+
+        # Arrival order: bar b of a late pair arrives just after bar b + 1
+        rank = np.broadcast_to(np.arange(config.bars, dtype=np.float64), shape).copy()
+        late = rng.random(shape) < config.out_of_order_probability
+        late[:, -1] = False
+        rank[late] += 1.5
+        symbol = np.broadcast_to(
+            np.arange(config.symbols, dtype=np.int32)[:, None], shape
+        )
+        order = np.lexsort((symbol.ravel(), rank.ravel()))
+        keep = rng.random(order.size) >= config.gap_probability
+        order = order[keep[order]]
+
+        decimals = config.price_decimals
+        return SyntheticBars(
+            [f"SYN{i:04d}/USD" for i in range(config.symbols)],
+            config.timeframe,
+            symbol=symbol.ravel()[order],
+            timestamp=np.broadcast_to(timestamps, shape).ravel()[order],
+            open=np.round(open_.ravel()[order], decimals),
+            high=np.round(high.ravel()[order], decimals),
+            low=np.round(low.ravel()[order], decimals),
+            close=np.round(close.ravel()[order], decimals),
+            volume=np.round(volume.ravel()[order], 4),
+        )
+
+
+def crossover_alerts(
+    bars: SyntheticBars,
+    fast: int = 10,
+    slow: int = 30,
+    strategy: str = "synthetic_sma_cross",
+    exchange: str = "SYNTH",
+) -> list[dict[str, Any]]:
+    """Build a TradingView alert stream from moving-average crossovers.
+
+    Each payload has the fields ``WebhookServer.parse_alert`` reads.
+
+    Args:
+        bars: Bars to scan
+        fast: Fast moving-average length
+        slow: Slow moving-average length
+        strategy: Strategy name in the payloads
+        exchange: Exchange name in the payloads
+
+    Returns:
+        Webhook payloads in time order
+    """
+    order = np.lexsort((bars.timestamp, bars.symbol))
+    symbol = bars.symbol[order]
+    close = bars.close[order]
+    timestamp = bars.timestamp[order]
+    bounds = np.flatnonzero(np.diff(symbol)) + 1
+    events: list[tuple[int, int, str, float]] = []
+    for segment in np.split(np.arange(len(order)), bounds):
+        if len(segment) <= slow:
+            continue
+        sums = np.concatenate(([0.0], np.cumsum(close[segment])))
+        fast_ma = (sums[fast:] - sums[:-fast]) / fast
+        slow_ma = (sums[slow:] - sums[:-slow]) / slow
+        above = fast_ma[slow - fast :] > slow_ma
+        for i in np.flatnonzero(above[1:] != above[:-1]) + 1:
+            row = segment[i + slow - 1]
+            action = "buy" if above[i] else "sell"
+            events.append(
+                (int(timestamp[row]), int(symbol[row]), action, float(close[row]))
+            )
+    events.sort()
+    return [
+        {
+            "alert_id": f"{strategy}-{symbol_index}-{ts}",
+            "action": action,
+            "ticker": bars.symbols[symbol_index],
+            "exchange": exchange,
+            "close": f"{price:.8g}",
+            "interval": bars.timeframe.value,
+            "strategy": strategy,
+            "time": from_micros(ts).isoformat(),
+        }
+        for ts, symbol_index, action, price in events
+    ]
@@ -1,10 +1,27 @@
 """Utility modules for StratoQuant Nexus."""
 
-from stratoquant_nexus.utils.config import Settings, get_settings
-from stratoquant_nexus.utils.logging import setup_logging
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from stratoquant_nexus.utils.config import Settings, get_settings
+    from stratoquant_nexus.utils.logging import setup_logging
 
 __all__ = [
     "Settings",
     "get_settings",
     "setup_logging",
 ]
+
+_LAZY = {
+    "Settings": "stratoquant_nexus.utils.config",
+    "get_settings": "stratoquant_nexus.utils.config",
+    "setup_logging": "stratoquant_nexus.utils.logging",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules on first use so light tooling starts fast."""
+    if name in _LAZY:
+        return getattr(importlib.import_module(_LAZY[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
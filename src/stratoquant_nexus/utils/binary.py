@@ -0,0 +1,70 @@
+"""Binary encoding primitives shared by the on-disk and IPC formats.
+
+The order journal, checkpoints, replay logs and shard frames all store
+strings as ``u16 length + utf-8`` and timestamps as integer microseconds
+since the Unix epoch, with naive datetimes taken to be UTC. Keeping those
+conversions here means every format round-trips timestamps the same way.
+"""
+
+import struct
+from datetime import UTC, datetime, timedelta
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+MICROSECOND = timedelta(microseconds=1)
+STR_LEN = struct.Struct("<H")
+
+
+def pack_str(value: str) -> bytes:
+    """Encode a length-prefixed UTF-8 string.
+
+    Args:
+        value: String to encode (at most 65535 bytes of UTF-8)
+
+    Returns:
+        Encoded bytes
+    """
+    data = value.encode()
+    return STR_LEN.pack(len(data)) + data
+
+
+def unpack_str(buf: memoryview, offset: int) -> tuple[str, int]:
+    """Decode a length-prefixed UTF-8 string.
+
+    Args:
+        buf: Buffer holding the string
+        offset: Offset of the length prefix
+
+    Returns:
+        Decoded string and the offset just past it
+    """
+    (length,) = STR_LEN.unpack_from(buf, offset)
+    offset += STR_LEN.size
+    return bytes(buf[offset : offset + length]).decode(), offset + length
+
+
+def to_micros(ts: datetime) -> int:
+    """Convert a timestamp to microseconds since the epoch (naive is UTC).
+
+    Args:
+        ts: Timestamp
+
+    Returns:
+        Integer microseconds since 1970-01-01T00:00:00Z
+    """
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=UTC)
+    return (ts - EPOCH) // MICROSECOND
+
+
+def from_micros(value: int, aware: bool = True) -> datetime:
+    """Convert microseconds since the epoch back to a timestamp.
+
+    Args:
+        value: Integer microseconds since 1970-01-01T00:00:00Z
+        aware: Return a UTC-aware timestamp, or a naive one in UTC
+
+    Returns:
+        Timestamp
+    """
+    result = EPOCH + timedelta(microseconds=value)
+    return result if aware else result.replace(tzinfo=None)
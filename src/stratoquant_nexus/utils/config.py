@@ -1,6 +1,8 @@
-"""Configuration management using pydantic-settings."""
+"""Configuration management using pydantic-settings and layered YAML files."""
 
 from functools import lru_cache
+from pathlib import Path
+from typing import Any
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -19,6 +21,10 @@ class Settings(BaseSettings):
     app_name: str = "StratoQuant Nexus"
     debug: bool = False
     log_level: str = "INFO"
+    log_json: bool = False
+    log_queued: bool = False
+    log_queue_size: int = 10000
+    log_sample_hot_paths: bool = True
 
     # Trading
     default_exchange: str = "binance"
@@ -36,6 +42,16 @@ class Settings(BaseSettings):
     webhook_port: int = 8080
     webhook_secret: str = ""
 
+    # Layered YAML configuration (config/default.yaml + config/<environment>.yaml)
+    config_dir: str = "config"
+    environment: str = ""
+    config_reload_interval_seconds: float = 2.0
+
+    # Metrics endpoint
+    metrics_enabled: bool = False
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int = 9100
+
     # API Keys (should be set via environment variables)
     exchange_api_key: str = ""
     exchange_api_secret: str = ""
@@ -49,3 +65,74 @@ def get_settings() -> Settings:
         Application settings instance
     """
     return Settings()
+
+
+def config_files(config_dir: str | Path, environment: str | None = None) -> list[Path]:
+    """Get the YAML files making up a configuration, lowest precedence first.
+
+    Args:
+        config_dir: Directory holding ``default.yaml`` and environment files
+        environment: Environment overlay, e.g. ``production`` (optional)
+
+    Returns:
+        ``default.yaml`` followed by ``<environment>.yaml`` if given
+    """
+    files = [Path(config_dir) / "default.yaml"]
+    if environment:
+        files.append(Path(config_dir) / f"{environment}.yaml")
+    return files
+
+
+def deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    """Merge nested dictionaries, with ``override`` winning.
+
+    Args:
+        base: Lower-precedence values
+        override: Higher-precedence values
+
+    Returns:
+        New merged dictionary (inputs are not modified)
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_yaml_config(
+    config_dir: str | Path = "config", environment: str | None = None
+) -> dict[str, Any]:
+    """Load ``default.yaml`` overlaid with an environment file.
+
+    Missing files are skipped, so an absent environment overlay falls back
+    to the defaults.
+
+    Args:
+        config_dir: Directory holding the YAML files
+        environment: Environment overlay, e.g. ``production`` (optional)
+
+    Returns:
+        Merged configuration
+
+    Raises:
+        ValueError: If a file is not valid YAML or not a mapping
+    """
+    import yaml
+
+    config: dict[str, Any] = {}
+    for path in config_files(config_dir, environment):
+        if not path.exists():
+            continue
+        try:
+            data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in {path}: {e}") from e
+        if data is None:
+            continue
+        if not isinstance(data, dict):
+            raise ValueError(f"{path} must contain a mapping")
+        config = deep_merge(config, data)
+    return config
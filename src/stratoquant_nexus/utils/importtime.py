@@ -0,0 +1,104 @@
+"""Import-time profiling via ``python -X importtime``.
+
+Kept free of third-party imports so the ``stratoquant imports`` command
+starts instantly itself.
+"""
+
+import re
+import subprocess  # noqa: S404 - runs the current interpreter only
+import sys
+
+_MODULE_NAME = re.compile(r"[A-Za-z_]\w*(\.[A-Za-z_]\w*)*")
+
+
+class ImportTiming:
+    """Import time of one module.
+
+    Attributes:
+        module: Dotted module name
+        self_us: Time spent in the module itself (microseconds)
+        cumulative_us: Time including the module's own imports
+        depth: Nesting level in the import tree (0 for top-level imports)
+    """
+
+    __slots__ = ("module", "self_us", "cumulative_us", "depth")
+
+    def __init__(
+        self, module: str, self_us: int, cumulative_us: int, depth: int
+    ) -> None:
+        """Initialize the timing."""
+        self.module = module
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.depth = depth
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse ``-X importtime`` stderr output.
+
+    Args:
+        output: Captured stderr
+
+    Returns:
+        Timings in the order the imports finished
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(
+            ImportTiming(
+                module=stripped,
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return timings
+
+
+def measure_imports(module: str) -> list[ImportTiming]:
+    """Import a module in a fresh interpreter and time every import.
+
+    Args:
+        module: Dotted module name to import
+
+    Returns:
+        Timings for every module imported
+
+    Raises:
+        ValueError: If ``module`` is not a dotted module name
+        RuntimeError: If the import fails
+    """
+    if not _MODULE_NAME.fullmatch(module):
+        raise ValueError(f"Invalid module name: {module!r}")
+    result = subprocess.run(  # noqa: S603 - fixed interpreter and arguments
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip()}")
+    return parse_importtime(result.stderr)
+
+
+def package_totals(timings: list[ImportTiming]) -> dict[str, int]:
+    """Sum self time per top-level package.
+
+    Args:
+        timings: Parsed import timings
+
+    Returns:
+        Microseconds per top-level package, largest first
+    """
+    totals: dict[str, int] = {}
+    for timing in timings:
+        package = timing.module.split(".")[0]
+        totals[package] = totals.get(package, 0) + timing.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
@@ -0,0 +1,168 @@
+"""Sampling and rate limiting of high-frequency log events.
+
+``LogSampler`` is a structlog processor. Events named in its rules are
+kept one in N and/or up to a rate per second; the rest are dropped before
+any rendering or I/O. Each kept record carries the number of occurrences
+suppressed since the previous one, and a summary line with per-event
+counts is logged periodically, so totals stay visible.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+import structlog
+from pydantic import BaseModel, Field
+
+SUMMARY_EVENT = "Log sampling summary"
+
+
+class SamplingRule(BaseModel):
+    """How often to keep one event."""
+
+    every: int | None = Field(
+        default=None, ge=1, description="Keep one in this many occurrences"
+    )
+    max_per_second: float | None = Field(
+        default=None, gt=0, description="Keep at most this many per second"
+    )
+
+
+# Hot-path events logged once per alert or webhook
+HOT_PATH_SAMPLING: dict[str, SamplingRule] = {
+    "Alert processed": SamplingRule(max_per_second=10),
+    "Webhook received": SamplingRule(max_per_second=10),
+}
+
+
+class _EventState:
+    """Counters and token bucket for one sampled event."""
+
+    __slots__ = ("rule", "seen", "logged", "suppressed", "tokens", "refilled_at")
+
+    def __init__(self, rule: SamplingRule, now: float) -> None:
+        """Initialize the state."""
+        self.rule = rule
+        self.seen = 0
+        self.logged = 0
+        self.suppressed = 0  # Since the last kept record
+        self.tokens = rule.max_per_second or 0.0
+        self.refilled_at = now
+
+    def admit(self, now: float) -> bool:
+        """Count an occurrence and decide whether to keep it."""
+        rule = self.rule
+        self.seen += 1
+        if rule.every is not None and (self.seen - 1) % rule.every:
+            return False
+        if rule.max_per_second is not None:
+            self.tokens = min(
+                rule.max_per_second,
+                self.tokens + (now - self.refilled_at) * rule.max_per_second,
+            )
+            self.refilled_at = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+        return True
+
+
+class LogSampler:
+    """structlog processor sampling events by name.
+
+    Example:
+        >>> sampler = LogSampler({"Alert processed": SamplingRule(every=100)})
+        >>> structlog.configure(processors=[sampler, ...])
+    """
+
+    def __init__(
+        self,
+        rules: Mapping[str, SamplingRule],
+        summary_interval_seconds: float | None = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            rules: Sampling rule per event name
+            summary_interval_seconds: Seconds between summary lines (None to
+                only summarize on ``flush_summary``)
+            clock: Monotonic time source
+
+        Raises:
+            ValueError: If a rule sets neither ``every`` nor ``max_per_second``
+        """
+        for event, rule in rules.items():
+            if rule.every is None and rule.max_per_second is None:
+                raise ValueError(f"Sampling rule for {event!r} keeps everything")
+        self._clock = clock
+        now = clock()
+        self._events = {event: _EventState(rule, now) for event, rule in rules.items()}
+        self._summary_interval = summary_interval_seconds
+        self._summarized_at = now
+        self._lock = threading.Lock()
+
+    def __call__(
+        self, logger: Any, method_name: str, event_dict: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Keep or drop a record.
+
+        Raises:
+            structlog.DropEvent: If the record is sampled out
+        """
+        state = self._events.get(event_dict.get("event"))  # type: ignore[arg-type]
+        summary_due = False
+        with self._lock:
+            now = self._clock()
+            if (
+                self._summary_interval is not None
+                and now - self._summarized_at >= self._summary_interval
+            ):
+                self._summarized_at = now
+                summary_due = True
+            if state is not None:
+                keep = state.admit(now)
+                if keep:
+                    state.logged += 1
+                    if state.suppressed:
+                        event_dict["suppressed"] = state.suppressed
+                    state.suppressed = 0
+                else:
+                    state.suppressed += 1
+        if summary_due:
+            self.flush_summary()
+        if state is not None and not keep:
+            raise structlog.DropEvent
+        return event_dict
+
+    def summary(self, reset: bool = True) -> dict[str, dict[str, int]]:
+        """Get per-event counts.
+
+        Args:
+            reset: Start new counts afterwards
+
+        Returns:
+            Seen, logged and suppressed counts of events seen since the
+            last reset
+        """
+        with self._lock:
+            counts = {
+                event: {
+                    "seen": state.seen,
+                    "logged": state.logged,
+                    "suppressed": state.seen - state.logged,
+                }
+                for event, state in self._events.items()
+                if state.seen
+            }
+            if reset:
+                for state in self._events.values():
+                    state.seen = state.logged = 0
+        return counts
+
+    def flush_summary(self) -> None:
+        """Log a summary line for events seen since the last one, if any."""
+        counts = self.summary()
+        if counts:
+            structlog.get_logger().info(SUMMARY_EVENT, events=counts)
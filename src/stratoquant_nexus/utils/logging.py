@@ -1,27 +1,287 @@
 """Logging configuration using structlog."""
 
+import contextlib
+import io
+import json
 import logging
+import queue
 import sys
+import threading
+from collections.abc import Mapping
+from typing import Any, Literal, TextIO
 
 import structlog
+from pydantic import BaseModel, Field
 
+from stratoquant_nexus.utils.log_sampling import LogSampler, SamplingRule
 
-def setup_logging(log_level: str = "INFO", json_output: bool = False) -> None:
+DropPolicy = Literal["newest", "oldest"]
+
+_STOP = object()
+_MAX_BATCH = 512
+
+_log_writer: "QueuedLogWriter | None" = None
+_log_sampler: LogSampler | None = None
+
+
+class LogQueueStats(BaseModel):
+    """Counters of the queued log writer."""
+
+    written: int = Field(default=0, description="Records written")
+    dropped: int = Field(default=0, description="Records dropped on a full queue")
+    dropped_by_level: dict[str, int] = Field(
+        default_factory=dict, description="Dropped records per log level"
+    )
+    pending: int = Field(default=0, description="Records waiting to be written")
+
+
+class JSONLineRenderer:
+    """Render event dicts as JSON lines, reusing one encoder and buffer."""
+
+    def __init__(self) -> None:
+        """Initialize the renderer."""
+        self._encoder = json.JSONEncoder(
+            default=str, ensure_ascii=False, separators=(",", ":")
+        )
+        self._buffer = io.StringIO()
+
+    def render(self, events: list[dict[str, Any]]) -> str:
+        """Render a batch of events.
+
+        Args:
+            events: Event dicts
+
+        Returns:
+            One JSON object per line
+        """
+        buffer = self._buffer
+        buffer.seek(0)
+        buffer.truncate()
+        for event in events:
+            buffer.write(self._encoder.encode(event))
+            buffer.write("\n")
+        return buffer.getvalue()
+
+
+class QueuedLogWriter:
+    """Final structlog processor handing records to a background writer.
+
+    The calling thread only runs the cheap processors and a non-blocking
+    queue put; rendering and the (possibly blocking) stream write happen on
+    a daemon thread, so a slow terminal or pipe never stalls the event loop.
+    When the bounded queue is full, records are dropped and counted instead
+    of waiting.
+
+    Values are rendered after the call returns, so mutable objects logged
+    as values should not be modified afterwards.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        json_output: bool = False,
+        maxsize: int = 10000,
+        drop_policy: DropPolicy = "newest",
+    ) -> None:
+        """Initialize and start the writer thread.
+
+        Args:
+            stream: Output stream (defaults to stdout)
+            json_output: Render JSON lines instead of console output
+            maxsize: Maximum queued records
+            drop_policy: Drop the incoming record ("newest") or the oldest
+                queued one ("oldest") when the queue is full
+        """
+        self._stream = stream or sys.stdout
+        self._json = JSONLineRenderer() if json_output else None
+        self._console = structlog.dev.ConsoleRenderer(
+            colors=self._stream.isatty(),
+            exception_formatter=structlog.dev.rich_traceback,
+        )
+        self._format_exc_info = structlog.processors.ExceptionRenderer()
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize)
+        self._drop_policy = drop_policy
+        self._drop_lock = threading.Lock()
+        self._dropped_by_level: dict[str, int] = {}
+        self._written = 0
+        # The _STOP sentinel only wakes the writer; "oldest" may drop it
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __call__(
+        self, logger: Any, method_name: str, event_dict: dict[str, Any]
+    ) -> Any:
+        """Queue a record for the writer thread.
+
+        Raises:
+            structlog.DropEvent: Always, as the record is written elsewhere
+        """
+        try:
+            self._queue.put_nowait(event_dict)
+        except queue.Full:
+            if self._drop_policy == "oldest":
+                try:
+                    dropped = self._queue.get_nowait()
+                    if dropped is not _STOP:
+                        self._count_drop(dropped)
+                    self._queue.put_nowait(event_dict)
+                except (queue.Empty, queue.Full):
+                    self._count_drop(event_dict)
+            else:
+                self._count_drop(event_dict)
+        raise structlog.DropEvent
+
+    def _count_drop(self, event_dict: dict[str, Any]) -> None:
+        """Count a dropped record by level."""
+        level = event_dict.get("level", "unknown")
+        with self._drop_lock:
+            self._dropped_by_level[level] = self._dropped_by_level.get(level, 0) + 1
+
+    def _render(self, events: list[dict[str, Any]]) -> str:
+        """Render a batch of records."""
+        if self._json is not None:
+            return self._json.render(
+                [self._format_exc_info(None, "", event) for event in events]
+            )
+        return "".join(self._console(None, "", event) + "\n" for event in events)
+
+    def _run(self) -> None:
+        """Write queued records in batches until stopped."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < _MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            events = [event for event in batch if event is not _STOP]
+            if events:
+                try:
+                    self._stream.write(self._render(events))
+                    self._stream.flush()
+                except Exception as e:  # Never let the writer thread die
+                    sys.stderr.write(f"Log writer error: {e}\n")
+                self._written += len(events)
+            if self._stopping.is_set() and self._queue.empty():
+                return
+
+    def stats(self) -> LogQueueStats:
+        """Get writer counters.
+
+        Returns:
+            Current counters
+        """
+        with self._drop_lock:
+            dropped_by_level = dict(self._dropped_by_level)
+        return LogQueueStats(
+            written=self._written,
+            dropped=sum(dropped_by_level.values()),
+            dropped_by_level=dropped_by_level,
+            pending=self._queue.qsize(),
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write the queued records and stop the thread.
+
+        Args:
+            timeout: Seconds to wait for the queue to drain
+        """
+        if not self._thread.is_alive():
+            return
+        self._stopping.set()
+        with contextlib.suppress(queue.Full):  # A busy writer sees the flag
+            self._queue.put_nowait(_STOP)
+        self._thread.join(timeout)
+
+
+def _capture_exc_info(
+    logger: Any, method_name: str, event_dict: dict[str, Any]
+) -> dict[str, Any]:
+    """Resolve ``exc_info`` on the calling thread, where it is still set."""
+    exc_info = event_dict.get("exc_info")
+    if exc_info is True or (method_name == "exception" and exc_info is None):
+        event_dict["exc_info"] = sys.exc_info()
+    elif isinstance(exc_info, BaseException):
+        event_dict["exc_info"] = (type(exc_info), exc_info, exc_info.__traceback__)
+    return event_dict
+
+
+def get_log_queue_stats() -> LogQueueStats | None:
+    """Get the queued log writer's counters.
+
+    Returns:
+        Counters, or None unless logging was set up with ``queued=True``
+    """
+    return _log_writer.stats() if _log_writer is not None else None
+
+
+def shutdown_logging(timeout: float = 5.0) -> None:
+    """Log the final sampling summary and stop the queued log writer, if any.
+
+    Args:
+        timeout: Seconds to wait for queued records to be written
+    """
+    global _log_writer, _log_sampler
+    if _log_sampler is not None:
+        _log_sampler.flush_summary()
+        _log_sampler = None
+    if _log_writer is not None:
+        _log_writer.stop(timeout)
+        _log_writer = None
+
+
+def setup_logging(
+    log_level: str = "INFO",
+    json_output: bool = False,
+    queued: bool = False,
+    queue_size: int = 10000,
+    drop_policy: DropPolicy = "newest",
+    stream: TextIO | None = None,
+    sampling: Mapping[str, SamplingRule] | None = None,
+    sampling_summary_seconds: float | None = 60.0,
+) -> None:
     """Configure structured logging.
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_output: Whether to output JSON format (for production)
+        queued: Render and write records on a background thread through a
+            bounded queue, so logging never blocks the caller
+        queue_size: Maximum queued records in queued mode
+        drop_policy: Which record to drop when the queue is full
+        stream: Output stream (defaults to stdout)
+        sampling: Sampling rules for high-frequency events, by event name
+        sampling_summary_seconds: Seconds between sampling summary lines
     """
+    global _log_sampler
+    level = getattr(logging, log_level.upper())
+
     # Configure standard logging
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        stream=stream or sys.stdout,
+        level=level,
     )
 
+    shutdown_logging()
+    # Sampling runs first so dropped events cost as little as possible
+    sampling_processors: list[structlog.typing.Processor] = []
+    if sampling:
+        _log_sampler = LogSampler(sampling, sampling_summary_seconds)
+        sampling_processors.append(_log_sampler)
+
+    if queued:
+        _setup_queued_logging(
+            level, json_output, queue_size, drop_policy, stream, sampling_processors
+        )
+        return
+
     # Configure structlog processors
     shared_processors: list[structlog.typing.Processor] = [
+        *sampling_processors,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
@@ -48,3 +308,36 @@ def setup_logging(log_level: str = "INFO", json_output: bool = False) -> None:
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
+
+
+def _setup_queued_logging(
+    level: int,
+    json_output: bool,
+    queue_size: int,
+    drop_policy: DropPolicy,
+    stream: TextIO | None,
+    sampling_processors: list[structlog.typing.Processor],
+) -> None:
+    """Configure structlog to write through a ``QueuedLogWriter``.
+
+    Level filtering happens in the bound logger itself, and the stdlib
+    logging machinery (and its locks) is bypassed entirely.
+    """
+    global _log_writer
+    _log_writer = QueuedLogWriter(stream, json_output, queue_size, drop_policy)
+    structlog.configure(
+        processors=[
+            *sampling_processors,
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            _capture_exc_info,
+            _log_writer,
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        context_class=dict,
+        logger_factory=structlog.PrintLoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
@@ -0,0 +1,112 @@
+"""Fixtures for the benchmark suite.
+
+The suite needs pytest-benchmark (``pip install -e ".[dev]"``) and is not
+part of the default test run::
+
+    pytest tests/benchmarks --benchmark-json=.benchmarks/current.json
+    python tools/bench_compare.py .benchmarks/current.json
+
+``bench_compare.py`` compares the run against the stored baseline in
+``tests/benchmarks/baseline.json`` and fails on regressions; pass
+``--update`` to store the run as the new baseline.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from stratoquant_nexus import TradingEngine
+from stratoquant_nexus.layers.l0_data import OHLCV, Timeframe
+from stratoquant_nexus.layers.l1_signals import (
+    SignalStrength,
+    SignalType,
+    TradingSignal,
+)
+
+
+def _make_candles(symbols: int, bars: int) -> list[OHLCV]:
+    """Create a series rising 2% per bar for each symbol, yielding buy signals.
+
+    Args:
+        symbols: Number of symbols
+        bars: Candles per symbol
+
+    Returns:
+        Candles ordered by symbol, then time
+    """
+    start = datetime(2024, 1, 1)
+    closes = [Decimal(f"{1000 * 1.02**i:.2f}") for i in range(bars)]
+    return [
+        OHLCV(
+            timestamp=start + timedelta(hours=i),
+            open=close,
+            high=close * Decimal("1.005"),
+            low=close * Decimal("0.995"),
+            close=close,
+            volume=Decimal("12.5"),
+            symbol=f"SYM{s}/USD",
+            timeframe=Timeframe.H1,
+        )
+        for s in range(symbols)
+        for i, close in enumerate(closes)
+    ]
+
+
+def _make_signals(count: int) -> list[TradingSignal]:
+    """Create buy signals for distinct symbols.
+
+    Args:
+        count: Number of signals
+
+    Returns:
+        Trading signals
+    """
+    return [
+        TradingSignal(
+            symbol=f"SYM{i}/USD",
+            signal_type=SignalType.BUY,
+            strength=SignalStrength.STRONG,
+            price=Decimal("42000"),
+            confidence=0.8,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def make_candles() -> Callable[[int, int], list[OHLCV]]:
+    """Get the candle series factory."""
+    return _make_candles
+
+
+@pytest.fixture
+def make_signals() -> Callable[[int], list[TradingSignal]]:
+    """Get the buy signal factory."""
+    return _make_signals
+
+
+@pytest.fixture
+def run() -> Iterator[Callable[[Callable[[], Awaitable[Any]]], Any]]:
+    """Run coroutines on a dedicated event loop from synchronous benchmarks."""
+    loop = asyncio.new_event_loop()
+
+    def _run(factory: Callable[[], Awaitable[Any]]) -> Any:
+        return loop.run_until_complete(factory())
+
+    yield _run
+    loop.close()
+
+
+@pytest.fixture
+def engines(
+    run: Callable[[Callable[[], Awaitable[Any]]], Any],
+) -> Iterator[list[TradingEngine]]:
+    """Collect engines started by a benchmark and stop them afterwards."""
+    started: list[TradingEngine] = []
+    yield started
+    for engine in started:
+        run(engine.stop)
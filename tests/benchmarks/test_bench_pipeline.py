@@ -0,0 +1,231 @@
+"""Benchmarks for each layer, the Pine executor and the full engine cycle."""
+
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from stratoquant_nexus import TradingEngine  # noqa: E402
+from stratoquant_nexus.layers import (  # noqa: E402
+    DataLayer,
+    ExecutionLayer,
+    RiskLayer,
+    SignalLayer,
+)
+from stratoquant_nexus.layers.l0_aggregation import (  # noqa: E402
+    TradeAggregator,
+    TradeBatch,
+)
+from stratoquant_nexus.layers.l0_archive import RECORD_DTYPE  # noqa: E402
+from stratoquant_nexus.layers.l0_data import (  # noqa: E402
+    OHLCV,
+    BarSpec,
+    BarType,
+    MarketData,
+    ValidationAction,
+    ValidationSpec,
+)
+from stratoquant_nexus.layers.l0_validation import CandleValidator  # noqa: E402
+from stratoquant_nexus.layers.l1_signals import TradingSignal  # noqa: E402
+from stratoquant_nexus.pine_executor import (  # noqa: E402
+    PineAlert,
+    PineExecutor,
+    PineStrategy,
+)
+from stratoquant_nexus.pine_executor.models import AlertType  # noqa: E402
+from stratoquant_nexus.utils.binary import to_micros  # noqa: E402
+
+# (symbols, bars per symbol) fed to the data and signal layers and the engine
+CANDLE_SCALES = [(1, 50), (10, 100), (50, 200)]
+# Signals per cycle fed to the risk and execution layers
+SIGNAL_SCALES = [1, 10, 100]
+
+Runner = Callable[[Callable[[], Any]], Any]
+CandleFactory = Callable[[int, int], list[OHLCV]]
+SignalFactory = Callable[[int], list[TradingSignal]]
+
+
+def _scale_id(scale: tuple[int, int]) -> str:
+    """Name a (symbols, bars) scale."""
+    return f"{scale[0]}x{scale[1]}"
+
+
+@pytest.mark.parametrize("scale", CANDLE_SCALES, ids=_scale_id)
+def test_data_layer(
+    benchmark: Any, run: Runner, make_candles: CandleFactory, scale: tuple[int, int]
+) -> None:
+    """Benchmark DataLayer.process."""
+    candles = make_candles(*scale)
+
+    def setup() -> tuple[tuple[DataLayer], dict[str, Any]]:
+        layer = DataLayer()
+        run(layer.initialize)
+        return (layer,), {}
+
+    result = benchmark.pedantic(
+        lambda layer: run(lambda: layer.process(candles)), setup=setup, rounds=20
+    )
+    assert len(result.candles) == len(candles)
+
+
+@pytest.mark.parametrize("scale", CANDLE_SCALES, ids=_scale_id)
+def test_signal_layer(
+    benchmark: Any, run: Runner, make_candles: CandleFactory, scale: tuple[int, int]
+) -> None:
+    """Benchmark SignalLayer.process."""
+    market_data = MarketData(candles=make_candles(*scale))
+
+    def setup() -> tuple[tuple[SignalLayer], dict[str, Any]]:
+        layer = SignalLayer()
+        run(layer.initialize)
+        return (layer,), {}
+
+    signals = benchmark.pedantic(
+        lambda layer: run(lambda: layer.process(market_data)), setup=setup, rounds=50
+    )
+    assert len(signals) == scale[0]
+
+
+@pytest.mark.parametrize("count", SIGNAL_SCALES)
+def test_risk_layer(
+    benchmark: Any, run: Runner, make_signals: SignalFactory, count: int
+) -> None:
+    """Benchmark RiskLayer.process."""
+    signals = make_signals(count)
+
+    def setup() -> tuple[tuple[RiskLayer], dict[str, Any]]:
+        layer = RiskLayer()
+        run(layer.initialize)
+        return (layer,), {}
+
+    assessments = benchmark.pedantic(
+        lambda layer: run(lambda: layer.process(signals)), setup=setup, rounds=50
+    )
+    assert sum(a.approved for a in assessments) == count
+
+
+@pytest.mark.parametrize("count", SIGNAL_SCALES)
+def test_execution_layer(
+    benchmark: Any, run: Runner, make_signals: SignalFactory, count: int
+) -> None:
+    """Benchmark ExecutionLayer.process with simulated fills."""
+    risk = RiskLayer()
+    run(risk.initialize)
+    assessments = run(lambda: risk.process(make_signals(count)))
+
+    def setup() -> tuple[tuple[ExecutionLayer], dict[str, Any]]:
+        layer = ExecutionLayer()
+        run(layer.initialize)
+        return (layer,), {}
+
+    reports = benchmark.pedantic(
+        lambda layer: run(lambda: layer.process(assessments)), setup=setup, rounds=20
+    )
+    assert len(reports) == count
+
+
+@pytest.mark.parametrize("bar_type", list(BarType), ids=lambda t: t.value)
+def test_trade_aggregator(benchmark: Any, bar_type: BarType) -> None:
+    """Benchmark TradeAggregator.add over 1M trades in 10k-trade batches."""
+    rng = np.random.default_rng(0)
+    count = 1_000_000
+    timestamp = np.sort(rng.integers(0, 86_400_000_000, count))
+    price = 100 + np.cumsum(rng.normal(0, 0.01, count))
+    size = rng.random(count)
+    batches = [
+        TradeBatch(
+            "BTC/USD",
+            timestamp[i : i + 10_000],
+            price[i : i + 10_000],
+            size[i : i + 10_000],
+        )
+        for i in range(0, count, 10_000)
+    ]
+    threshold = {BarType.TICK: 1000, BarType.VOLUME: 500, BarType.DOLLAR: 5e4}
+    spec = BarSpec(bar_type=bar_type, threshold=threshold.get(bar_type, 0))
+
+    def aggregate() -> int:
+        aggregator = TradeAggregator(spec)
+        return sum(len(aggregator.add(batch)) for batch in batches)
+
+    bars = benchmark.pedantic(aggregate, rounds=5)
+    assert bars > 0
+
+
+@pytest.mark.parametrize("action", list(ValidationAction), ids=lambda a: a.value)
+def test_candle_validator(
+    benchmark: Any, make_candles: CandleFactory, action: ValidationAction
+) -> None:
+    """Benchmark CandleValidator.validate on the largest candle scale."""
+    candles = make_candles(*CANDLE_SCALES[-1])
+    spec = ValidationSpec(action=action)
+
+    accepted, _ = benchmark.pedantic(
+        lambda: CandleValidator(spec).validate(candles), rounds=20
+    )
+    assert len(accepted) == len(candles)
+
+
+def test_candle_validator_records(benchmark: Any, make_candles: CandleFactory) -> None:
+    """Benchmark CandleValidator.validate_records on the same candles as records."""
+    candles = make_candles(*CANDLE_SCALES[-1])
+    series: dict[tuple[str, Any], list[tuple[Any, ...]]] = {}
+    for c in candles:
+        series.setdefault((c.symbol, c.timeframe), []).append(
+            (to_micros(c.timestamp), c.open, c.high, c.low, c.close, c.volume)
+        )
+    records = {key: np.array(rows, dtype=RECORD_DTYPE) for key, rows in series.items()}
+
+    def validate() -> int:
+        validator = CandleValidator(ValidationSpec())
+        return sum(
+            len(validator.validate_records(symbol, timeframe, batch)[0])
+            for (symbol, timeframe), batch in records.items()
+        )
+
+    assert benchmark.pedantic(validate, rounds=20) == len(candles)
+
+
+def test_pine_executor(benchmark: Any, run: Runner) -> None:
+    """Benchmark PineExecutor.process_alert."""
+    executor = PineExecutor()
+    executor.register_strategy(PineStrategy(name="bench"))
+    alert = PineAlert(
+        alert_id="bench-1",
+        alert_type=AlertType.LONG_ENTRY,
+        symbol="BTC/USD",
+        price=Decimal("42000"),
+        strategy_name="bench",
+    )
+
+    result = benchmark(run, lambda: executor.process_alert(alert))
+    assert result.executed
+
+
+@pytest.mark.parametrize("scale", CANDLE_SCALES, ids=_scale_id)
+def test_engine_cycle(
+    benchmark: Any,
+    run: Runner,
+    engines: list[TradingEngine],
+    make_candles: CandleFactory,
+    scale: tuple[int, int],
+) -> None:
+    """Benchmark TradingEngine.process_cycle end to end."""
+    candles = make_candles(*scale)
+
+    def setup() -> tuple[tuple[TradingEngine], dict[str, Any]]:
+        engine = TradingEngine()
+        run(engine.start)
+        engines.append(engine)
+        return (engine,), {}
+
+    results = benchmark.pedantic(
+        lambda engine: run(lambda: engine.process_cycle(candles)),
+        setup=setup,
+        rounds=10,
+    )
+    assert len(results["execution_reports"]) == scale[0]
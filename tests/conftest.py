@@ -1,9 +1,11 @@
 """Test configuration and fixtures for pytest."""
 
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from decimal import Decimal
 
 import pytest
+import structlog
 
 from stratoquant_nexus.layers.l0_data import OHLCV, MarketData, Timeframe
 from stratoquant_nexus.layers.l1_signals import (
@@ -11,6 +13,7 @@ from stratoquant_nexus.layers.l1_signals import (
     SignalType,
     TradingSignal,
 )
+from stratoquant_nexus.utils.logging import shutdown_logging
 
 
 @pytest.fixture
@@ -31,6 +34,52 @@ def sample_candles() -> list[OHLCV]:
     ]
 
 
+@pytest.fixture
+def trending_candles(sample_candles: list[OHLCV]) -> list[OHLCV]:
+    """Create candles that trigger an approved, filled buy."""
+    return [
+        c.model_copy(
+            update={
+                "open": Decimal(1000 + i * 30),
+                "high": Decimal(1010 + i * 30),
+                "low": Decimal(990 + i * 30),
+                "close": Decimal(1000 + i * 30),
+            }
+        )
+        for i, c in enumerate(sample_candles)
+    ]
+
+
+@pytest.fixture
+def candle_series() -> Callable[..., list[OHLCV]]:
+    """Create a factory for rising or falling hourly candle series."""
+
+    def make(symbol: str, step: int, offset: int = 0) -> list[OHLCV]:
+        return [
+            OHLCV(
+                timestamp=datetime(2024, 1, 1, i, 0, 0),
+                open=Decimal(1000 + offset + i * step),
+                high=Decimal(1010 + offset + i * step),
+                low=Decimal(990 + offset + i * step),
+                close=Decimal(1000 + offset + i * step),
+                volume=Decimal("12.5"),
+                symbol=symbol,
+                timeframe=Timeframe.H1,
+            )
+            for i in range(20)
+        ]
+
+    return make
+
+
+@pytest.fixture
+def reset_logging() -> Iterator[None]:
+    """Restore the default structlog configuration after the test."""
+    yield
+    shutdown_logging()
+    structlog.reset_defaults()
+
+
 @pytest.fixture
 def sample_market_data(sample_candles: list[OHLCV]) -> MarketData:
     """Create sample market data for testing."""
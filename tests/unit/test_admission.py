@@ -0,0 +1,127 @@
+"""Unit tests for admission control and load shedding."""
+
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from stratoquant_nexus import TradingEngine
+from stratoquant_nexus.admission import AdmissionConfig, AdmissionController
+from stratoquant_nexus.engine import EngineConfig
+from stratoquant_nexus.layers.l0_data import OHLCV, Timeframe
+
+
+def _bar(symbol: str, hour: int) -> OHLCV:
+    """Create a single candle."""
+    return OHLCV(
+        timestamp=datetime(2024, 1, 1) + timedelta(hours=hour),
+        open=Decimal("100"),
+        high=Decimal("101"),
+        low=Decimal("99"),
+        close=Decimal("100"),
+        volume=Decimal("1"),
+        symbol=symbol,
+        timeframe=Timeframe.H1,
+    )
+
+
+class GatedEngine:
+    """Stand-in for the engine's process_cycle that blocks until released."""
+
+    def __init__(self, engine: TradingEngine) -> None:
+        """Patch the engine's process_cycle."""
+        self.cycles: list[list[OHLCV]] = []
+        self.gate = asyncio.Event()
+        self.entered = asyncio.Event()
+        engine.process_cycle = self.process_cycle  # type: ignore[method-assign]
+
+    async def process_cycle(self, raw_data: Any) -> dict[str, list[Any]]:
+        """Record the cycle input and wait for the gate."""
+        self.cycles.append(raw_data)
+        self.entered.set()
+        await self.gate.wait()
+        return {}
+
+
+class TestAdmissionController:
+    """Tests for the AdmissionController class."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_to_newest_bar_per_symbol(self) -> None:
+        """Test a busy engine only sees the newest pending bar per symbol."""
+        engine = TradingEngine()
+        gated = GatedEngine(engine)
+        admission = AdmissionController(engine)
+        await admission.start()
+
+        admission.submit([_bar("BTC/USD", 0)])
+        await gated.entered.wait()
+        for hour in (1, 2, 3):
+            admission.submit([_bar("BTC/USD", hour), _bar("ETH/USD", hour)])
+        admission.submit([_bar("ETH/USD", 1)])  # Late, out-of-order bar
+        gated.gate.set()
+        await admission.wait_idle()
+        await admission.stop()
+
+        stats = admission.stats
+        assert [
+            [(c.symbol, c.timestamp.hour) for c in cycle] for cycle in gated.cycles
+        ] == [
+            [("BTC/USD", 0)],
+            [("BTC/USD", 3), ("ETH/USD", 3)],
+        ]
+        assert stats.submitted == 8
+        assert stats.processed == 3
+        assert stats.coalesced == 5
+        assert stats.cycles == 2
+        assert stats.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_drops_stale_updates(self) -> None:
+        """Test updates older than the staleness budget are shed."""
+        engine = TradingEngine(EngineConfig(enable_metrics=True))
+        gated = GatedEngine(engine)
+        admission = AdmissionController(
+            engine, AdmissionConfig(max_staleness_seconds=0.01)
+        )
+        await admission.start()
+
+        admission.submit([_bar("BTC/USD", 0)])
+        await gated.entered.wait()
+        admission.submit([_bar("ETH/USD", 0)])
+        assert admission.stats.pending == 1
+        await asyncio.sleep(0.05)
+        gated.gate.set()
+        await admission.wait_idle()
+        await admission.stop()
+
+        stats = admission.stats
+        assert len(gated.cycles) == 1
+        assert stats.dropped_stale == 1
+        assert stats.shed == 1
+        assert 'stratoquant_admission_shed_total{reason="stale"} 1' in (
+            engine.metrics.render()
+        )
+
+    @pytest.mark.asyncio
+    async def test_runs_real_cycles_and_survives_errors(
+        self, sample_candles: list[OHLCV]
+    ) -> None:
+        """Test admitted data reaches the engine and failures are counted."""
+        engine = TradingEngine()
+        await engine.start()
+        admission = AdmissionController(engine)
+        await admission.start()
+
+        admission.submit(sample_candles)
+        await admission.wait_idle()
+        await engine.stop()
+        admission.submit(sample_candles)
+        await admission.stop()
+
+        assert engine.status.last_cycle_at is not None
+        assert admission.stats.cycles == 2
+        assert admission.stats.failed_cycles == 1
+        assert not admission.is_running
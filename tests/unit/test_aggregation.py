@@ -0,0 +1,180 @@
+"""Unit tests for trade-to-bar aggregation."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from stratoquant_nexus.layers.l0_aggregation import TradeAggregator, TradeBatch
+from stratoquant_nexus.layers.l0_data import (
+    BarSpec,
+    BarType,
+    DataLayer,
+    DataLayerConfig,
+    Timeframe,
+)
+
+
+def _batch(
+    times_s: list[float], prices: list[float], sizes: list[float] | None = None
+) -> TradeBatch:
+    """Create a BTC/USD trade batch from times in seconds."""
+    return TradeBatch(
+        "BTC/USD",
+        np.array([int(t * 1_000_000) for t in times_s]),
+        np.array(prices),
+        np.array(sizes if sizes is not None else [1.0] * len(prices)),
+    )
+
+
+class TestTimeBars:
+    """Tests for time bars."""
+
+    def test_bars_close_when_next_period_starts(self) -> None:
+        """Test a bar is emitted once a later period's trade arrives."""
+        aggregator = TradeAggregator(BarSpec(timeframe=Timeframe.M1))
+
+        bars = aggregator.add(
+            _batch([1, 20, 59, 61, 90], [100, 105, 98, 101, 102], [1, 2, 3, 1, 1])
+        )
+
+        assert len(bars) == 1
+        bar = bars[0]
+        assert bar.timestamp == datetime(1970, 1, 1, tzinfo=UTC)
+        assert (bar.open, bar.high, bar.low, bar.close, bar.volume) == (
+            Decimal("100.0"),
+            Decimal("105.0"),
+            Decimal("98.0"),
+            Decimal("98.0"),
+            Decimal("6.0"),
+        )
+        partial = aggregator.partial("BTC/USD")
+        assert partial is not None
+        assert partial.close == Decimal("102.0")
+
+    def test_open_bar_continues_across_batches(self) -> None:
+        """Test a later batch extends the open bar."""
+        aggregator = TradeAggregator()
+        aggregator.add(_batch([1, 2], [100, 101]))
+
+        bars = aggregator.add(_batch([30, 70], [110, 90]))
+
+        assert len(bars) == 1
+        assert bars[0].open == Decimal("100.0")
+        assert bars[0].high == Decimal("110.0")
+        assert bars[0].volume == Decimal("3.0")
+
+    def test_flush_until(self) -> None:
+        """Test flushing closes only periods that have ended."""
+        aggregator = TradeAggregator()
+        aggregator.add(_batch([10], [100]))
+
+        assert aggregator.flush(datetime(1970, 1, 1, 0, 0, 30, tzinfo=UTC)) == []
+        bars = aggregator.flush(datetime(1970, 1, 1, 0, 1, tzinfo=UTC))
+
+        assert len(bars) == 1
+        assert aggregator.partial("BTC/USD") is None
+
+
+class TestThresholdBars:
+    """Tests for tick, volume and dollar bars."""
+
+    def test_tick_bars(self) -> None:
+        """Test every N trades make a bar, across batches."""
+        aggregator = TradeAggregator(BarSpec(bar_type=BarType.TICK, threshold=3))
+
+        first = aggregator.add(_batch(list(range(7)), [float(p) for p in range(7)]))
+        second = aggregator.add(_batch([7, 8], [7.0, 8.0]))
+
+        assert [(b.open, b.close) for b in first + second] == [
+            (Decimal("0.0"), Decimal("2.0")),
+            (Decimal("3.0"), Decimal("5.0")),
+            (Decimal("6.0"), Decimal("8.0")),
+        ]
+        assert first[0].timestamp == datetime(1970, 1, 1, tzinfo=UTC)
+        assert aggregator.partial("BTC/USD") is None
+
+    def test_volume_bars_carry_the_excess(self) -> None:
+        """Test the trade crossing the threshold closes the bar."""
+        aggregator = TradeAggregator(BarSpec(bar_type=BarType.VOLUME, threshold=10))
+
+        bars = aggregator.add(_batch([0, 1, 2, 3], [1, 2, 3, 4], [4, 8, 5, 2]))
+
+        assert [b.volume for b in bars] == [Decimal("12.0")]
+        partial = aggregator.partial("BTC/USD")
+        assert partial is not None
+        assert partial.volume == Decimal("7.0")
+        # 2 of the first bar's 12 count towards the second bar's 10
+        assert aggregator.add(_batch([4], [5], [1])) != []
+
+    def test_dollar_bars(self) -> None:
+        """Test bars close on traded notional."""
+        aggregator = TradeAggregator(BarSpec(bar_type=BarType.DOLLAR, threshold=1000))
+
+        bars = aggregator.add(_batch([0, 1, 2], [100, 100, 250], [6, 4, 4]))
+
+        assert [b.close for b in bars] == [Decimal("100.0"), Decimal("250.0")]
+
+    def test_threshold_required(self) -> None:
+        """Test threshold-based bars need a positive threshold."""
+        with pytest.raises(ValidationError, match="positive threshold"):
+            BarSpec(bar_type=BarType.TICK)
+
+
+class TestDataLayerTrades:
+    """Tests for feeding trades through the data layer."""
+
+    @pytest.mark.asyncio
+    async def test_process_trade_batches(self) -> None:
+        """Test completed bars are processed as candles."""
+        layer = DataLayer(
+            DataLayerConfig(name="DataLayer", trade_bars=BarSpec(timeframe="1m"))
+        )
+        times = np.arange(0, 300, 0.5)
+
+        market_data = await layer.process(
+            TradeBatch(
+                "BTC/USD",
+                (times * 1_000_000).astype(np.int64),
+                100 + times / 100,
+                np.ones(len(times)),
+            )
+        )
+
+        assert len(market_data.candles) == 4
+        assert market_data.candles[-1].timestamp.minute == 3
+        assert market_data.candles[0].volume == Decimal("120.0")
+        stored = layer.get_market_data("BTC/USD")
+        assert stored is not None
+        assert len(stored.candles) == 4
+
+    @pytest.mark.asyncio
+    async def test_quiet_symbol_bars_close_on_trade_time(self) -> None:
+        """Test another symbol's trades close the bar of a symbol gone quiet."""
+        layer = DataLayer(
+            DataLayerConfig(name="DataLayer", trade_bars=BarSpec(timeframe="1m"))
+        )
+        eth = TradeBatch(
+            "ETH/USD", np.array([10_000_000]), np.array([2000.0]), np.ones(1)
+        )
+
+        first = await layer.process([_batch([5, 30], [100, 101]), eth])
+        second = await layer.process(_batch([65, 130], [102, 103]))
+
+        assert first.candles == []
+        assert [(c.symbol, c.timestamp.minute) for c in second.candles] == [
+            ("BTC/USD", 0),
+            ("BTC/USD", 1),
+            ("ETH/USD", 0),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_trades_ignored_without_config(self) -> None:
+        """Test trade batches are not accepted unless configured."""
+        layer = DataLayer()
+
+        market_data = await layer.process(_batch([0], [100]))
+
+        assert market_data.candles == []
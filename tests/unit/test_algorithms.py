@@ -0,0 +1,279 @@
+"""Unit tests for L3 execution algorithms and the child order scheduler."""
+
+import asyncio
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+
+from stratoquant_nexus.layers.l1_signals import (
+    SignalStrength,
+    SignalType,
+    TradingSignal,
+)
+from stratoquant_nexus.layers.l2_risk import PositionSize, RiskAssessment, RiskLayer
+from stratoquant_nexus.layers.l3_algorithms import (
+    ChildOrderScheduler,
+    ExecutionAlgorithm,
+    ParentOrder,
+    iceberg_slices,
+    twap_slices,
+    vwap_slices,
+)
+from stratoquant_nexus.layers.l3_execution import (
+    ExecutionLayer,
+    ExecutionLayerConfig,
+    ExecutionReport,
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+)
+
+
+def _order(quantity: str = "10") -> Order:
+    """Create a limit buy order."""
+    return Order(
+        symbol="BTC/USD",
+        side=OrderSide.BUY,
+        order_type=OrderType.LIMIT,
+        quantity=Decimal(quantity),
+        price=Decimal("100"),
+    )
+
+
+async def _fill_all(children: list[Order]) -> list[ExecutionReport]:
+    """Fill every child at a price that rises by one per child."""
+    reports = []
+    for child in children:
+        _fill_all.price += 1  # type: ignore[attr-defined]
+        child.filled_quantity = child.quantity
+        child.average_price = Decimal(_fill_all.price)  # type: ignore[attr-defined]
+        child.status = OrderStatus.FILLED
+        reports.append(ExecutionReport(order=child, success=True, message="filled"))
+    return reports
+
+
+class TestSlicing:
+    """Tests for the slice planners."""
+
+    def test_twap_equal_slices(self) -> None:
+        """Test TWAP splits the quantity evenly."""
+        slices = twap_slices(Decimal("10"), 4)
+
+        assert slices == [Decimal("2.5")] * 4
+
+    def test_twap_rounding_residue(self) -> None:
+        """Test TWAP slices always sum to the parent quantity."""
+        slices = twap_slices(Decimal("1"), 3)
+
+        assert sum(slices) == Decimal("1")
+
+    def test_vwap_follows_volume_profile(self) -> None:
+        """Test VWAP weights slices by the bucket volume."""
+        profile = [0.0] * 24
+        profile[10] = 100.0
+        profile[11] = 300.0
+        start = datetime(2024, 1, 1, 10, 0, tzinfo=UTC)
+
+        slices = vwap_slices(Decimal("8"), 2, 7200, profile, start=start)
+
+        assert slices == [Decimal("2"), Decimal("6")]
+
+    def test_vwap_without_profile_falls_back_to_twap(self) -> None:
+        """Test VWAP degrades to TWAP without volume data."""
+        assert vwap_slices(Decimal("4"), 2, 60, []) == [Decimal("2")] * 2
+
+    def test_iceberg_clips(self) -> None:
+        """Test iceberg clips never exceed the display quantity."""
+        slices = iceberg_slices(Decimal("10"), Decimal("3"))
+
+        assert slices == [Decimal("3"), Decimal("3"), Decimal("3"), Decimal("1")]
+
+
+class TestParentOrder:
+    """Tests for parent fill roll-up."""
+
+    def test_incremental_average_price(self) -> None:
+        """Test child fills roll into the parent's VWAP."""
+        parent = ParentOrder(
+            _order("4"), ExecutionAlgorithm.TWAP, twap_slices(Decimal("4"), 2), 0.0
+        )
+
+        for price in ("100", "110"):
+            child = parent.next_child()
+            assert child is not None
+            child.filled_quantity = child.quantity
+            child.average_price = Decimal(price)
+            parent.apply_fill(child)
+
+        assert parent.order.filled_quantity == Decimal("4")
+        assert parent.order.average_price == Decimal("105")
+        assert parent.order.status == OrderStatus.FILLED
+        assert parent.done
+
+    def test_unfilled_quantity_carried_forward(self) -> None:
+        """Test quantity a child misses is added to the next child."""
+        parent = ParentOrder(
+            _order("4"), ExecutionAlgorithm.TWAP, twap_slices(Decimal("4"), 2), 0.0
+        )
+
+        child = parent.next_child()
+        assert child is not None
+        parent.apply_fill(child)
+        next_child = parent.next_child()
+
+        assert next_child is not None
+        assert next_child.quantity == Decimal("4")
+
+
+class TestChildOrderScheduler:
+    """Tests for the ChildOrderScheduler class."""
+
+    @pytest.mark.asyncio
+    async def test_works_many_parents_with_one_task(self) -> None:
+        """Test thousands of parents are driven by a single task."""
+        _fill_all.price = 0  # type: ignore[attr-defined]
+        scheduler = ChildOrderScheduler(submit=_fill_all)
+        parents = [
+            ParentOrder(
+                _order("3"),
+                ExecutionAlgorithm.TWAP,
+                twap_slices(Decimal("3"), 3),
+                interval_seconds=0.01,
+            )
+            for _ in range(2000)
+        ]
+        tasks_before = len(asyncio.all_tasks())
+
+        for parent in parents:
+            scheduler.schedule(parent)
+        assert len(asyncio.all_tasks()) == tasks_before + 1
+
+        while scheduler.active_parents:
+            await asyncio.sleep(0.01)
+
+        assert all(p.order.status == OrderStatus.FILLED for p in parents)
+        assert all(len(p.children) == 3 for p in parents)
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel(self) -> None:
+        """Test cancelling a parent stops further child orders."""
+        scheduler = ChildOrderScheduler(submit=_fill_all)
+        parent = ParentOrder(
+            _order(), ExecutionAlgorithm.TWAP, twap_slices(Decimal("10"), 5), 10.0
+        )
+        scheduler.schedule(parent, delay_seconds=10.0)
+
+        assert scheduler.cancel(parent.order_id)
+
+        assert parent.order.status == OrderStatus.CANCELLED
+        assert scheduler.active_parents == 0
+        await scheduler.stop()
+
+
+class TestAlgorithmicExecution:
+    """Tests for algorithm selection in the execution layer."""
+
+    @pytest.fixture
+    def large_assessment(self) -> RiskAssessment:
+        """Create an approved assessment with a large notional."""
+        signal = TradingSignal(
+            symbol="BTC/USD",
+            signal_type=SignalType.BUY,
+            strength=SignalStrength.STRONG,
+            price=Decimal("100"),
+        )
+        position = PositionSize(
+            symbol="BTC/USD",
+            units=Decimal("50"),
+            notional_value=Decimal("5000"),
+            risk_amount=Decimal("100"),
+            stop_loss_price=Decimal("98"),
+            take_profit_price=Decimal("104"),
+            risk_reward_ratio=2.0,
+        )
+        return RiskAssessment(signal=signal, approved=True, position_size=position)
+
+    @pytest.mark.asyncio
+    async def test_large_order_worked_by_iceberg(
+        self, large_assessment: RiskAssessment
+    ) -> None:
+        """Test orders above the threshold are sliced and rolled up."""
+        layer = ExecutionLayer(
+            ExecutionLayerConfig(
+                name="ExecutionLayer",
+                algo_notional_threshold=1000,
+                execution_algorithm=ExecutionAlgorithm.ICEBERG,
+                algo_duration_seconds=0.05,
+                iceberg_display_pct=0.2,
+            )
+        )
+        await layer.initialize()
+
+        reports = await layer.process([large_assessment])
+        parent_order = reports[0].order
+        parent = layer.get_parent_order(parent_order.order_id)
+
+        assert reports[0].success
+        assert parent_order.status == OrderStatus.SUBMITTED
+        assert parent is not None
+
+        while layer.scheduler.active_parents:
+            await asyncio.sleep(0.01)
+
+        assert parent_order.status == OrderStatus.FILLED
+        assert parent_order.filled_quantity == Decimal("50")
+        assert len(parent.children) == 5
+        assert all(c.quantity == Decimal("10") for c in parent.children)
+        assert parent_order.average_price == Decimal("100.1")
+
+        await layer.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_child_fills_reach_risk_exposure(
+        self, large_assessment: RiskAssessment
+    ) -> None:
+        """Test fills of worked parents move the risk layer's exposure."""
+        risk_layer = RiskLayer()
+        layer = ExecutionLayer(
+            ExecutionLayerConfig(
+                name="ExecutionLayer",
+                algo_notional_threshold=1000,
+                algo_duration_seconds=0.05,
+                algo_slices=5,
+            )
+        )
+        layer.set_fill_listener(risk_layer.apply_fills)
+        await layer.initialize()
+
+        reports = await layer.process([large_assessment])
+        # The cycle's own report carries no fill yet
+        risk_layer.apply_fills(reports)
+        assert risk_layer.current_exposure == 0
+        while layer.scheduler.active_parents:
+            await asyncio.sleep(0.01)
+        await layer.shutdown()
+
+        parent_order = reports[0].order
+        position = risk_layer.active_positions["BTC/USD"]
+        assert position.units == parent_order.filled_quantity == Decimal("50")
+        assert risk_layer.current_exposure == position.notional_value > 0
+
+    @pytest.mark.asyncio
+    async def test_small_order_executes_directly(
+        self, large_assessment: RiskAssessment
+    ) -> None:
+        """Test orders below the threshold are not sliced."""
+        layer = ExecutionLayer(
+            ExecutionLayerConfig(name="ExecutionLayer", algo_notional_threshold=1e9)
+        )
+        await layer.initialize()
+
+        reports = await layer.process([large_assessment])
+
+        assert reports[0].order.status == OrderStatus.FILLED
+        assert layer.scheduler.active_parents == 0
+
+        await layer.shutdown()
@@ -0,0 +1,164 @@
+"""Unit tests for the memory-mapped candle archive."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from stratoquant_nexus.layers.l0_archive import MAGIC, CandleArchive
+from stratoquant_nexus.layers.l0_data import (
+    OHLCV,
+    DataLayer,
+    DataLayerConfig,
+    Timeframe,
+    ValidationSpec,
+)
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _candles(count: int, symbol: str = "BTC/USD", offset: int = 0) -> list[OHLCV]:
+    """Create hourly candles."""
+    return [
+        OHLCV(
+            timestamp=START + timedelta(hours=offset + i),
+            open=Decimal(str(100 + i)),
+            high=Decimal(str(101 + i)),
+            low=Decimal(str(99 + i)),
+            close=Decimal(str(100.5 + i)),
+            volume=Decimal("10"),
+            symbol=symbol,
+            timeframe=Timeframe.H1,
+        )
+        for i in range(count)
+    ]
+
+
+class TestCandleArchive:
+    """Tests for CandleArchive."""
+
+    def test_append_and_range_read(self, tmp_path: Path) -> None:
+        """Test range queries return the matching records."""
+        archive = CandleArchive(tmp_path)
+
+        assert archive.append(_candles(100)) == 100
+        records = archive.read(
+            "BTC/USD",
+            Timeframe.H1,
+            START + timedelta(hours=10),
+            START + timedelta(hours=20),
+        )
+
+        assert len(records) == 10
+        assert records["open"][0] == 110.0
+        assert records["close"][-1] == 119.5
+        assert isinstance(records, np.memmap)
+        assert not records.flags.writeable
+        assert archive.path("BTC/USD", Timeframe.H1).read_bytes().startswith(MAGIC)
+
+    def test_appends_are_visible_and_ordered(self, tmp_path: Path) -> None:
+        """Test later appends extend the file and stale candles are skipped."""
+        archive = CandleArchive(tmp_path)
+        archive.append(_candles(10))
+        assert archive.count("BTC/USD", Timeframe.H1) == 10
+
+        written = archive.append(list(reversed(_candles(10, offset=5))))
+
+        assert written == 5
+        timestamps = archive.read("BTC/USD", Timeframe.H1)["timestamp"]
+        assert len(timestamps) == 15
+        assert np.all(np.diff(timestamps) > 0)
+
+    def test_reopen_and_series(self, tmp_path: Path) -> None:
+        """Test a new archive instance reads existing files."""
+        CandleArchive(tmp_path).append(_candles(5) + _candles(3, symbol="ETH/USD"))
+
+        archive = CandleArchive(tmp_path)
+        candles = archive.candles("ETH/USD", Timeframe.H1)
+
+        assert sorted(archive.series()) == [
+            ("BTC/USD", Timeframe.H1),
+            ("ETH/USD", Timeframe.H1),
+        ]
+        assert archive.append(_candles(5)) == 0
+        assert [c.close for c in candles] == [
+            Decimal("100.5"),
+            Decimal("101.5"),
+            Decimal("102.5"),
+        ]
+        assert candles[0].timestamp == START
+        assert archive.read("SOL/USD", Timeframe.H1).size == 0
+
+    def test_torn_record_is_dropped(self, tmp_path: Path) -> None:
+        """Test a partially written record does not misalign later appends."""
+        archive = CandleArchive(tmp_path)
+        archive.append(_candles(3))
+        path = archive.path("BTC/USD", Timeframe.H1)
+        with path.open("ab") as f:
+            f.write(b"\x01\x02\x03")
+
+        archive = CandleArchive(tmp_path)
+        archive.append(_candles(2, offset=3))
+
+        assert archive.read("BTC/USD", Timeframe.H1)["open"].tolist() == [
+            100.0,
+            101.0,
+            102.0,
+            100.0,
+            101.0,
+        ]
+
+
+class TestDataLayerArchive:
+    """Tests for archiving through the data layer."""
+
+    @pytest.mark.asyncio
+    async def test_process_appends_to_archive(self, tmp_path: Path) -> None:
+        """Test processed candles are archived and readable as history."""
+        layer = DataLayer(DataLayerConfig(name="DataLayer", archive_path=str(tmp_path)))
+        await layer.initialize()
+
+        await layer.process(_candles(24))
+        history = layer.get_history(
+            "BTC/USD", Timeframe.H1, START + timedelta(hours=12)
+        )
+        await layer.shutdown()
+
+        assert history is not None
+        assert len(history) == 12
+        assert layer.archive is None
+
+    @pytest.mark.asyncio
+    async def test_flagged_candles_not_archived(self, tmp_path: Path) -> None:
+        """Test candles kept under the flag action stay out of the archive."""
+        layer = DataLayer(
+            DataLayerConfig(
+                name="DataLayer",
+                archive_path=str(tmp_path),
+                validation=ValidationSpec(action="flag"),
+            )
+        )
+        await layer.initialize()
+        candles = _candles(3)
+        candles[1] = candles[1].model_copy(update={"high": Decimal("50")})
+
+        market_data = await layer.process(candles)
+        history = layer.get_history("BTC/USD", Timeframe.H1)
+
+        assert market_data.flagged == [candles[1]]
+        assert history is not None
+        assert history["timestamp"].tolist() == [
+            int(c.timestamp.timestamp()) * 1_000_000 for c in (candles[0], candles[2])
+        ]
+
+    @pytest.mark.asyncio
+    async def test_no_archive_by_default(self) -> None:
+        """Test the archive is disabled without a path."""
+        layer = DataLayer()
+        await layer.initialize()
+
+        await layer.process(_candles(2))
+
+        assert layer.get_history("BTC/USD", Timeframe.H1) is None
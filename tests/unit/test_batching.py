@@ -0,0 +1,223 @@
+"""Unit tests for L3 order netting and batch submission."""
+
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from stratoquant_nexus.exchange import (
+    HttpExchangeAdapter,
+    HttpExchangeConfig,
+    MockExchangeServer,
+)
+from stratoquant_nexus.layers.l1_signals import (
+    SignalStrength,
+    SignalType,
+    TradingSignal,
+)
+from stratoquant_nexus.layers.l2_risk import PositionSize, RiskAssessment
+from stratoquant_nexus.layers.l3_batching import chunk, fan_out, net_orders
+from stratoquant_nexus.layers.l3_execution import (
+    ExecutionLayer,
+    ExecutionLayerConfig,
+    Order,
+    OrderSide,
+    OrderStatus,
+)
+from stratoquant_nexus.layers.l3_journal import OrderJournal
+
+
+def _assessment(symbol: str, signal_type: SignalType, units: str) -> RiskAssessment:
+    """Create an approved assessment."""
+    signal = TradingSignal(
+        symbol=symbol,
+        signal_type=signal_type,
+        strength=SignalStrength.STRONG,
+        price=Decimal("100"),
+    )
+    position = PositionSize(
+        symbol=symbol,
+        units=Decimal(units),
+        notional_value=Decimal(units) * 100,
+        risk_amount=Decimal("2"),
+        stop_loss_price=Decimal("98"),
+        take_profit_price=Decimal("104"),
+        risk_reward_ratio=2.0,
+    )
+    return RiskAssessment(signal=signal, approved=True, position_size=position)
+
+
+def _order(side: OrderSide, quantity: str, symbol: str = "BTC/USD") -> Order:
+    """Create a market order."""
+    return Order(symbol=symbol, side=side, quantity=Decimal(quantity))
+
+
+class TestNetOrders:
+    """Tests for per-symbol netting."""
+
+    def test_opposing_orders_netted(self) -> None:
+        """Test opposing orders produce a single residual net order."""
+        buy = _order(OrderSide.BUY, "3")
+        sell = _order(OrderSide.SELL, "1")
+
+        netted = net_orders([(buy, Decimal("100")), (sell, Decimal("101"))])
+
+        assert len(netted) == 1
+        net = netted[0]
+        assert net.net_order is not None
+        assert net.net_order.side == OrderSide.BUY
+        assert net.net_order.quantity == Decimal("2")
+        assert net.cross_price == Decimal("101")
+        assert net.net_order.child_order_ids == [buy.order_id, sell.order_id]
+        allocations = {a.order.order_id: a for a in net.allocations}
+        assert allocations[sell.order_id].crossed_quantity == Decimal("1")
+        assert allocations[buy.order_id].exchange_quantity == Decimal("2")
+
+    def test_fully_offset_orders(self) -> None:
+        """Test equal opposing orders need no venue submission."""
+        netted = net_orders(
+            [
+                (_order(OrderSide.BUY, "1"), Decimal("100")),
+                (_order(OrderSide.SELL, "1"), Decimal("100")),
+            ]
+        )
+
+        assert netted[0].net_order is None
+
+    def test_pro_rata_allocation_sums_exactly(self) -> None:
+        """Test residual allocation adds up to the net quantity."""
+        buys = [_order(OrderSide.BUY, "1") for _ in range(3)]
+        sell = _order(OrderSide.SELL, "1")
+
+        netted = net_orders([(o, Decimal("100")) for o in [*buys, sell]])
+
+        total = sum(a.exchange_quantity for a in netted[0].allocations)
+        assert total == Decimal("2")
+
+    def test_single_order_passed_through(self) -> None:
+        """Test a lone order is submitted as-is."""
+        order = _order(OrderSide.SELL, "1", symbol="ETH/USD")
+
+        netted = net_orders([(order, Decimal("100"))])
+
+        assert netted[0].net_order is order
+
+    def test_netting_disabled(self) -> None:
+        """Test every order is kept when netting is disabled."""
+        orders = [_order(OrderSide.BUY, "1"), _order(OrderSide.SELL, "1")]
+
+        netted = net_orders([(o, Decimal("100")) for o in orders], netting=False)
+
+        assert [n.net_order for n in netted] == orders
+
+    def test_fan_out_fully_offset(self) -> None:
+        """Test fully offset orders are filled at the crossing price."""
+        netted = net_orders(
+            [
+                (_order(OrderSide.BUY, "2"), Decimal("100")),
+                (_order(OrderSide.SELL, "2"), Decimal("100")),
+            ]
+        )
+
+        reports = fan_out(netted[0], None)
+
+        assert len(reports) == 2
+        for report in reports:
+            assert report.success
+            assert report.order.status == OrderStatus.FILLED
+            assert report.order.average_price == Decimal("100")
+
+    def test_chunk(self) -> None:
+        """Test chunking respects the maximum size."""
+        assert chunk([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+
+class TestBatchedExecution:
+    """Tests for ExecutionLayer batch execution."""
+
+    @pytest.mark.asyncio
+    async def test_reports_aligned_with_assessments(self) -> None:
+        """Test every approved assessment gets its own report, in order."""
+        layer = ExecutionLayer(
+            ExecutionLayerConfig(name="ExecutionLayer", enable_batching=True)
+        )
+        await layer.initialize()
+        assessments = [
+            _assessment("BTC/USD", SignalType.BUY, "2"),
+            _assessment("ETH/USD", SignalType.SELL, "5"),
+            _assessment("BTC/USD", SignalType.SELL, "1"),
+        ]
+
+        reports = await layer.process(assessments)
+
+        assert [r.order.symbol for r in reports] == ["BTC/USD", "ETH/USD", "BTC/USD"]
+        assert [r.order.side for r in reports] == [
+            OrderSide.BUY,
+            OrderSide.SELL,
+            OrderSide.SELL,
+        ]
+        assert all(r.order.filled_quantity == r.order.quantity for r in reports)
+
+        await layer.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_net_orders_registered_and_journaled(self, tmp_path: Path) -> None:
+        """Test combined net orders are tracked without double-booking fills."""
+        layer = ExecutionLayer(
+            ExecutionLayerConfig(
+                name="ExecutionLayer", enable_batching=True, journal_dir=str(tmp_path)
+            )
+        )
+        await layer.initialize()
+        assessments = [
+            _assessment("BTC/USD", SignalType.BUY, "2"),
+            _assessment("BTC/USD", SignalType.BUY, "1"),
+            _assessment("BTC/USD", SignalType.SELL, "1"),
+        ]
+
+        reports = await layer.process(assessments)
+
+        net = [o for o in layer._orders.values() if o.child_order_ids]
+        assert len(net) == 1
+        assert layer.get_order(net[0].order_id) is net[0]
+        assert net[0].child_order_ids == [r.order.order_id for r in reports]
+        assert net[0].filled_quantity == Decimal("2")
+        await layer.shutdown()
+
+        journal = OrderJournal(tmp_path)
+        state = await journal.open()
+        await journal.close(snapshot=False)
+        assert state.open_orders == {}
+        # Only the original orders' fills count towards the position
+        assert state.positions["BTC/USD"].quantity == Decimal("2")
+
+    @pytest.mark.asyncio
+    async def test_live_batches_reduce_round_trips(self) -> None:
+        """Test net orders are sent in batch requests of max_batch_size."""
+        async with MockExchangeServer() as server:
+            symbols = [f"SYM{i}/USD" for i in range(5)]
+            for symbol in symbols:
+                server.set_price(symbol, Decimal("100"))
+            adapter = HttpExchangeAdapter(HttpExchangeConfig(base_url=server.url))
+            layer = ExecutionLayer(
+                ExecutionLayerConfig(
+                    name="ExecutionLayer",
+                    simulate_execution=False,
+                    enable_batching=True,
+                    max_batch_size=2,
+                ),
+                exchange=adapter,
+            )
+            await layer.initialize()
+            assessments = [_assessment(s, SignalType.BUY, "1") for s in symbols]
+            assessments.append(_assessment(symbols[0], SignalType.SELL, "0.5"))
+
+            reports = await layer.process(assessments)
+
+            assert len(reports) == 6
+            assert all(r.success for r in reports)
+            assert server.request_count == 3
+            assert reports[0].order.filled_quantity == Decimal("1")
+            assert reports[-1].order.status == OrderStatus.FILLED
+
+            await layer.shutdown()
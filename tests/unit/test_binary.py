@@ -0,0 +1,38 @@
+"""Unit tests for the shared binary encoding helpers."""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+from stratoquant_nexus.utils.binary import from_micros, pack_str, to_micros, unpack_str
+
+
+class TestStrings:
+    """Tests for length-prefixed strings."""
+
+    def test_round_trip(self) -> None:
+        """Test consecutive strings decode with the right offsets."""
+        buf = memoryview(pack_str("BTC/USD") + pack_str("") + pack_str("€"))
+
+        first, offset = unpack_str(buf, 0)
+        second, offset = unpack_str(buf, offset)
+        third, offset = unpack_str(buf, offset)
+
+        assert (first, second, third) == ("BTC/USD", "", "€")
+        assert offset == len(buf)
+
+
+class TestMicros:
+    """Tests for epoch microsecond conversion."""
+
+    def test_naive_is_utc(self) -> None:
+        """Test naive timestamps convert as if they were UTC."""
+        aware = datetime(2024, 3, 1, 12, 30, 0, 250, tzinfo=UTC)
+
+        assert to_micros(aware.replace(tzinfo=None)) == to_micros(aware)
+        assert from_micros(to_micros(aware)) == aware
+        assert from_micros(to_micros(aware), aware=False) == aware.replace(tzinfo=None)
+
+    def test_offset_timezone(self) -> None:
+        """Test aware timestamps in other zones convert to the same instant."""
+        local = datetime(2024, 3, 1, 14, 30, tzinfo=timezone(timedelta(hours=2)))
+
+        assert from_micros(to_micros(local)) == local
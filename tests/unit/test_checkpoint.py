@@ -0,0 +1,174 @@
+"""Unit tests for engine state checkpoints."""
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from stratoquant_nexus.checkpoint import Checkpoint, CheckpointWriter
+from stratoquant_nexus.engine import EngineConfig, TradingEngine
+from stratoquant_nexus.layers.l0_data import OHLCV, Timeframe
+from stratoquant_nexus.layers.l2_risk import PositionSize
+
+
+class TestCheckpointFormat:
+    """Tests for CheckpointWriter and Checkpoint."""
+
+    def test_round_trip(self, tmp_path: Path, sample_candles: list[OHLCV]) -> None:
+        """Test candles, arrays and JSON survive a write and mapped read."""
+        candles = [
+            *sample_candles,
+            OHLCV(
+                timestamp=datetime(2024, 3, 1, 12, 30, 15, 250, tzinfo=UTC),
+                open=Decimal("0.00012345"),
+                high=Decimal("0.0002"),
+                low=Decimal("0.0001"),
+                close=Decimal("0.00015"),
+                volume=Decimal("1E+6"),
+                symbol="DOGE/€",
+                timeframe=Timeframe.M5,
+            ),
+        ]
+        writer = CheckpointWriter()
+        writer.add_candles("data.candles", candles)
+        writer.add_array("data.prices", np.arange(5, dtype=np.float64))
+        writer.add_json("risk.state", {"portfolio_value": "100000"})
+        writer.write(tmp_path / "engine.ckpt")
+
+        with Checkpoint.open(tmp_path / "engine.ckpt") as checkpoint:
+            restored = checkpoint.candles("data.candles")
+            prices = checkpoint.array("data.prices").tolist()
+            state = checkpoint.json("risk.state")
+            assert "data.candles" in checkpoint
+            assert "missing" not in checkpoint
+
+        assert restored == candles
+        assert restored[0].timestamp.tzinfo is None
+        assert restored[-1].timestamp.tzinfo is not None
+        assert prices == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert state == {"portfolio_value": "100000"}
+
+    def test_rejects_duplicates_and_bad_files(self, tmp_path: Path) -> None:
+        """Test duplicate sections and non-checkpoint files are rejected."""
+        writer = CheckpointWriter()
+        writer.add_json("a", 1)
+        with pytest.raises(ValueError, match="Duplicate"):
+            writer.add_json("a", 2)
+
+        path = tmp_path / "bad.ckpt"
+        path.write_bytes(b"not a checkpoint")
+        with pytest.raises(ValueError, match="Not a StratoQuant checkpoint"):
+            Checkpoint.open(path)
+
+
+class TestEngineCheckpoint:
+    """Tests for TradingEngine warm restarts."""
+
+    @pytest.mark.asyncio
+    async def test_warm_restart(
+        self, tmp_path: Path, trending_candles: list[OHLCV]
+    ) -> None:
+        """Test state saved on stop is restored by the next start."""
+        config = EngineConfig(
+            checkpoint_path=str(tmp_path / "engine.ckpt"),
+            checkpoint_interval_seconds=0,
+        )
+        engine = TradingEngine(config)
+        await engine.start()
+        await engine.process_cycle(trending_candles)
+        positions = {
+            "BTC/USD": PositionSize(
+                symbol="BTC/USD",
+                units=Decimal("0.5"),
+                notional_value=Decimal("25000"),
+                risk_amount=Decimal("500"),
+                stop_loss_price=Decimal("49000"),
+                take_profit_price=Decimal("52000"),
+                risk_reward_ratio=2.0,
+            )
+        }
+        engine._risk_layer.restore_positions(positions)
+        engine._risk_layer.set_portfolio_value(Decimal("250000"))
+        await engine.stop()
+
+        restarted = TradingEngine(config)
+        await restarted.start()
+        market_data = restarted._data_layer.get_market_data("BTC/USD")
+        signal = restarted._signal_layer.get_latest_signal("BTC/USD")
+        restored_positions = dict(restarted._risk_layer.active_positions)
+        portfolio_value = restarted._risk_layer._portfolio_value
+        await restarted.stop()
+
+        assert restored_positions == positions
+        assert portfolio_value == Decimal("250000")
+        assert market_data is not None
+        assert market_data.candles == trending_candles
+        assert signal is not None
+        assert restarted.status.orders_executed == engine.status.orders_executed
+
+    @pytest.mark.asyncio
+    async def test_cold_start_on_missing_or_corrupt_file(self, tmp_path: Path) -> None:
+        """Test a missing or corrupt checkpoint does not block starting."""
+        path = tmp_path / "engine.ckpt"
+        engine = TradingEngine(
+            EngineConfig(checkpoint_path=str(path), checkpoint_interval_seconds=0)
+        )
+        assert engine.restore_checkpoint() is False
+
+        path.write_bytes(b"SQCK\x01\x00\x00\x00garbage")
+        await engine.start()
+        await engine.stop()
+
+        assert engine.restore_checkpoint() is True
+
+    @pytest.mark.asyncio
+    async def test_save_waits_for_cycle_boundary(
+        self, tmp_path: Path, trending_candles: list[OHLCV]
+    ) -> None:
+        """Test a checkpoint requested mid-cycle is taken once it finishes."""
+        import asyncio
+
+        engine = TradingEngine(
+            EngineConfig(
+                checkpoint_path=str(tmp_path / "engine.ckpt"),
+                checkpoint_interval_seconds=0,
+            )
+        )
+        await engine.start()
+        stream = engine.stream(trending_candles)
+        await anext(stream)
+
+        save = asyncio.create_task(engine.save_checkpoint())
+        await asyncio.sleep(0.01)
+        waiting = not save.done()
+        async for _ in stream:
+            pass
+        path = await save
+        status = engine.status.model_copy()
+        await engine.stop()
+
+        assert waiting
+        assert status.orders_executed > 0
+        with Checkpoint.open(path) as checkpoint:
+            state = checkpoint.json("engine.state")
+        assert state["cycle"] == 1
+        assert state["orders_executed"] == status.orders_executed
+
+    @pytest.mark.asyncio
+    async def test_candle_history_trimmed_to_max_candles(
+        self, sample_candles: list[OHLCV]
+    ) -> None:
+        """Test only the most recent candles of each series are saved."""
+        engine = TradingEngine()
+        engine._data_layer.config.max_candles = 3
+        daily = [
+            c.model_copy(update={"timeframe": Timeframe.D1}) for c in sample_candles
+        ]
+        engine._data_layer.store(sample_candles + daily[:2])
+
+        checkpoint = Checkpoint(engine.build_checkpoint())
+        candles = checkpoint.candles("DataLayer.candles")
+
+        assert candles == sample_candles[-3:] + daily[:2]
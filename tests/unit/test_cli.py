@@ -0,0 +1,78 @@
+"""Unit tests for the CLI and lazy package imports."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import stratoquant_nexus
+from stratoquant_nexus.cli import main
+from stratoquant_nexus.utils.importtime import package_totals, parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     pydantic.version
+import time:       900 |       1020 |   pydantic
+import time:        40 |       1060 | stratoquant_nexus.engine
+"""
+
+
+class TestLazyImports:
+    """Tests for lazy package attributes."""
+
+    def test_package_import_skips_engine(self) -> None:
+        """Test importing the package does not load the engine."""
+        code = (
+            "import sys, stratoquant_nexus, stratoquant_nexus.cli;"
+            "print('stratoquant_nexus.engine' in sys.modules, 'pydantic' in sys.modules)"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parents[2] / "src",
+        )
+
+        assert result.stdout.split() == ["False", "False"]
+
+    def test_lazy_attributes_resolve(self) -> None:
+        """Test lazily exported names still resolve."""
+        from stratoquant_nexus.engine import TradingEngine
+        from stratoquant_nexus.utils import get_settings
+
+        assert stratoquant_nexus.TradingEngine is TradingEngine
+        assert callable(get_settings)
+        with pytest.raises(AttributeError):
+            stratoquant_nexus.Missing  # noqa: B018
+
+
+class TestImportsCommand:
+    """Tests for the ``stratoquant imports`` command."""
+
+    def test_parse_importtime(self) -> None:
+        """Test -X importtime output is parsed with nesting depth."""
+        timings = parse_importtime(SAMPLE)
+
+        assert [(t.module, t.depth) for t in timings] == [
+            ("pydantic.version", 2),
+            ("pydantic", 1),
+            ("stratoquant_nexus.engine", 0),
+        ]
+        assert package_totals(timings) == {"pydantic": 1020, "stratoquant_nexus": 40}
+
+    def test_reports_breakdown(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test the command prints totals for a module."""
+        assert main(["imports", "json", "--top", "500"]) == 0
+
+        out = capsys.readouterr().out
+        assert out.startswith("import json:")
+        assert "By package" in out
+        assert "json.decoder" in out
+
+    def test_rejects_bad_module(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test invalid and missing modules fail cleanly."""
+        assert main(["imports", "os; print(1)"]) == 1
+        assert main(["imports", "no_such_module_xyz"]) == 1
+        assert "Invalid module name" in capsys.readouterr().err
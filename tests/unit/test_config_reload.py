@@ -0,0 +1,158 @@
+"""Unit tests for layered YAML configuration and hot reload."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from stratoquant_nexus.config_reload import ConfigReloader
+from stratoquant_nexus.engine import TradingEngine
+from stratoquant_nexus.layers.l0_data import OHLCV, Timeframe
+from stratoquant_nexus.utils.config import deep_merge, load_yaml_config
+
+CONFIG_DIR = Path(__file__).parents[2] / "config"
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path) -> Path:
+    """Copy the shipped configuration to a writable directory."""
+    for name in ("default.yaml", "development.yaml", "production.yaml"):
+        shutil.copy(CONFIG_DIR / name, tmp_path / name)
+    return tmp_path
+
+
+def _touch(path: Path, text: str) -> None:
+    """Rewrite a file with a modification time the poller will notice."""
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestLoadYamlConfig:
+    """Tests for the layered YAML loader."""
+
+    def test_environment_overlays_defaults(self) -> None:
+        """Test the environment file overrides only the keys it sets."""
+        config = load_yaml_config(CONFIG_DIR, "production")
+
+        assert config["risk"]["max_position_size_pct"] == 0.05
+        assert config["risk"]["min_risk_reward_ratio"] == 1.5
+        assert config["layers"]["execution"]["simulate"] is False
+        assert config["layers"]["signal"]["rsi_period"] == 14
+
+    def test_missing_overlay_and_invalid_yaml(self, config_dir: Path) -> None:
+        """Test a missing overlay is skipped and invalid YAML is rejected."""
+        assert load_yaml_config(config_dir, "staging") == load_yaml_config(config_dir)
+
+        (config_dir / "default.yaml").write_text("risk: [unclosed")
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            load_yaml_config(config_dir)
+
+    def test_deep_merge(self) -> None:
+        """Test nested mappings merge and other values are replaced."""
+        base = {"a": {"b": 1, "c": [1]}, "d": 1}
+
+        assert deep_merge(base, {"a": {"c": [2]}}) == {"a": {"b": 1, "c": [2]}, "d": 1}
+        assert base == {"a": {"b": 1, "c": [1]}, "d": 1}
+
+
+class TestConfigReloader:
+    """Tests for applying YAML changes to a running engine."""
+
+    @pytest.mark.asyncio
+    async def test_reload_updates_running_layers(self, config_dir: Path) -> None:
+        """Test edited thresholds reach the layers without a restart."""
+        engine = TradingEngine()
+        reloader = ConfigReloader(engine, config_dir, "production")
+
+        initial = reloader.reload()
+        await engine.start()
+        path = config_dir / "production.yaml"
+        _touch(path, path.read_text().replace("0.05", "0.07"))
+        changed = reloader.check()
+        unchanged = reloader.check()
+        await engine.stop()
+
+        assert initial["DataLayer"] == {"timeframes"}
+        assert "max_position_size_pct" in initial["RiskLayer"]
+        assert initial["ExecutionLayer"] == {"simulate_execution"}
+        assert changed == {"RiskLayer": {"max_position_size_pct"}}
+        assert unchanged is None
+        assert engine._risk_layer.config.max_position_size_pct == 0.07
+        assert Timeframe.H4 in engine._data_layer.config.timeframes
+
+    @pytest.mark.asyncio
+    async def test_invalid_change_keeps_running_config(self, config_dir: Path) -> None:
+        """Test a change failing validation is rejected as a whole."""
+        engine = TradingEngine()
+        await engine.start()
+        reloader = ConfigReloader(engine, config_dir)
+        reloader.reload()
+        before = engine._risk_layer.config
+
+        path = config_dir / "default.yaml"
+        text = path.read_text()
+        _touch(
+            path,
+            text.replace("max_position_size_pct: 0.10", "max_position_size_pct: 0.2")
+            .replace("rsi_period: 14", "rsi_period: 21")
+            .replace('level: "moderate"', 'level: "reckless"'),
+        )
+        with pytest.raises(ValueError, match="risk_level"):
+            reloader.check()
+        await engine.stop()
+
+        assert engine._risk_layer.config is before
+        assert engine._signal_layer.config.rsi_period == 14
+
+    @pytest.mark.asyncio
+    async def test_structural_and_unknown_fields_rejected(self) -> None:
+        """Test fields that place a layer in the chain cannot be reloaded."""
+        engine = TradingEngine()
+
+        with pytest.raises(ValueError, match="without a restart"):
+            engine.update_layer_configs({"RiskLayer": {"level": 7}})
+        with pytest.raises(ValueError, match="Unknown RiskLayer settings"):
+            engine.update_layer_configs({"RiskLayer": {"max_leverage": 3}})
+        with pytest.raises(KeyError):
+            engine.update_layer_configs({"Nope": {}})
+
+    @pytest.mark.asyncio
+    async def test_startup_fields_fixed_while_running(self) -> None:
+        """Test simulate_execution can only be set before the engine starts."""
+        engine = TradingEngine()
+        engine.update_layer_configs({"ExecutionLayer": {"simulate_execution": False}})
+        engine.update_layer_configs({"ExecutionLayer": {"simulate_execution": True}})
+        await engine.start()
+
+        with pytest.raises(ValueError, match="without a restart"):
+            engine.update_layer_configs(
+                {"ExecutionLayer": {"simulate_execution": False}}
+            )
+        await engine.stop()
+
+        assert engine._execution_layer.config.simulate_execution is True
+
+    @pytest.mark.asyncio
+    async def test_swap_waits_for_in_flight_cycle(
+        self, sample_candles: list[OHLCV]
+    ) -> None:
+        """Test a change made mid-cycle applies once the cycle finishes."""
+        engine = TradingEngine()
+        await engine.start()
+
+        stream = engine.stream(sample_candles)
+        await anext(stream)
+        changed = engine.update_layer_configs({"SignalLayer": {"enabled": False}})
+        staged_enabled = engine._signal_layer.config.enabled
+        events = [event async for event in stream]
+        results = await engine.process_cycle(sample_candles)
+        await engine.stop()
+
+        assert changed == {"SignalLayer": {"enabled"}}
+        assert staged_enabled is True
+        assert events
+        assert engine._signal_layer.config.enabled is False
+        assert "signals" not in [stage.key for stage in engine.layers.stages]
+        assert results["signals"] == []
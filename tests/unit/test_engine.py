@@ -1,5 +1,8 @@
 """Unit tests for the trading engine."""
 
+import asyncio
+import time
+
 import pytest
 
 from stratoquant_nexus import TradingEngine
@@ -61,6 +64,36 @@ class TestTradingEngine:
 
         await engine.stop()
 
+    @pytest.mark.asyncio
+    async def test_health_report_times_out_slow_layers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test health checks run concurrently within the timeout budget."""
+        engine = TradingEngine(EngineConfig(health_check_timeout_seconds=0.05))
+        await engine.start()
+
+        async def hang() -> bool:
+            await asyncio.sleep(1)
+            return True
+
+        async def fail() -> bool:
+            raise ConnectionError("venue unreachable")
+
+        monkeypatch.setattr(engine.data_layer, "health_check", hang)
+        monkeypatch.setattr(engine.signal_layer, "health_check", hang)
+        monkeypatch.setattr(engine.execution_layer, "health_check", fail)
+        start = time.perf_counter()
+        report = await engine.health_report()
+        elapsed = time.perf_counter() - start
+        await engine.stop()
+
+        assert elapsed < 0.5
+        assert report["data_layer"].timed_out
+        assert not report["signal_layer"].healthy
+        assert report["risk_layer"].healthy
+        assert report["risk_layer"].latency_ms >= 0
+        assert report["execution_layer"].error == "venue unreachable"
+
     @pytest.mark.asyncio
     async def test_process_cycle_not_running(self, engine: TradingEngine) -> None:
         """Test process cycle raises error when not running."""
@@ -106,6 +139,12 @@ class TestTradingEngine:
         assert engine.risk_layer is not None
         assert engine.execution_layer is not None
 
+    def test_algo_fills_reach_risk_layer(self, engine: TradingEngine) -> None:
+        """Test child order fills are wired to the risk layer."""
+        listener = engine.execution_layer._on_fill
+        assert listener is not None
+        assert listener.__self__ is engine.risk_layer  # type: ignore[attr-defined]
+
     def test_custom_config(self, custom_engine: TradingEngine) -> None:
         """Test engine with custom configuration."""
         assert custom_engine.config.name == "Test Engine"
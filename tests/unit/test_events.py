@@ -0,0 +1,128 @@
+"""Unit tests for engine event streaming and subscriptions."""
+
+from typing import Any
+
+import pytest
+
+from stratoquant_nexus import TradingEngine
+from stratoquant_nexus.events import (
+    CycleCompleteEvent,
+    EngineEvent,
+    EventSubscription,
+    ExecutionReportEvent,
+    FillEvent,
+    MarketDataEvent,
+    RiskAssessmentEvent,
+    SignalEvent,
+)
+from stratoquant_nexus.layers.l0_data import OHLCV
+
+
+class TestStream:
+    """Tests for TradingEngine.stream."""
+
+    @pytest.mark.asyncio
+    async def test_stream_matches_process_cycle(
+        self, trending_candles: list[OHLCV]
+    ) -> None:
+        """Test streamed events carry the same items as the results dict."""
+        engine = TradingEngine()
+        await engine.start()
+        expected = await engine.process_cycle(trending_candles)
+
+        events = [event async for event in engine.stream(trending_candles)]
+        await engine.stop()
+
+        by_type: dict[type, list[EngineEvent]] = {}
+        for event in events:
+            by_type.setdefault(type(event), []).append(event)
+        reports = by_type.get(ExecutionReportEvent, []) + by_type.get(FillEvent, [])
+        assert len(by_type[MarketDataEvent]) == 1
+        assert len(by_type[SignalEvent]) == len(expected["signals"])
+        assert len(by_type[RiskAssessmentEvent]) == len(expected["risk_assessments"])
+        assert len(reports) == len(expected["execution_reports"])
+        assert isinstance(events[-1], CycleCompleteEvent)
+        assert {e.cycle for e in events} == {2}
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_before_downstream_layers(
+        self, trending_candles: list[OHLCV], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test signals arrive before the risk layer runs, filtered by type."""
+        engine = TradingEngine()
+        risk_calls: list[Any] = []
+        process = engine.risk_layer.process
+
+        async def counting_process(data: Any) -> Any:
+            risk_calls.append(data)
+            return await process(data)
+
+        monkeypatch.setattr(engine.risk_layer, "process", counting_process)
+        await engine.start()
+
+        seen: list[tuple[type, int]] = []
+        async for event in engine.stream(trending_candles, SignalEvent):
+            seen.append((type(event), len(risk_calls)))
+        await engine.stop()
+
+        assert seen == [(SignalEvent, 0)]
+        assert len(risk_calls) == 1
+
+
+class TestSubscriptions:
+    """Tests for TradingEngine.subscribe."""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_only_their_types(
+        self, trending_candles: list[OHLCV]
+    ) -> None:
+        """Test per-type subscriptions across cycles, ending at stop()."""
+        engine = TradingEngine()
+        fills = engine.subscribe(FillEvent)
+        reports = engine.subscribe(ExecutionReportEvent)
+        cycles = engine.subscribe(CycleCompleteEvent)
+        await engine.start()
+
+        results = await engine.process_cycle(trending_candles)
+        await engine.process_cycle(trending_candles)
+        await engine.stop()
+
+        fill_events = [event async for event in fills]
+        report_events = [event async for event in reports]
+        cycle_events = [event async for event in cycles]
+        filled = [
+            r for r in results["execution_reports"] if r.order.filled_quantity > 0
+        ]
+        assert filled
+        assert len(report_events) == 2 * len(results["execution_reports"])
+        assert len(fill_events) == 2 * len(filled)
+        assert all(isinstance(e, FillEvent) for e in fill_events)
+        assert [e.cycle for e in cycle_events] == [1, 2]
+        assert cycle_events[0].signals == len(results["signals"])
+        assert fills.closed
+
+    @pytest.mark.asyncio
+    async def test_closed_subscription_stops_receiving(
+        self, sample_candles: list[OHLCV]
+    ) -> None:
+        """Test closing a subscription detaches it from the engine."""
+        engine = TradingEngine()
+        await engine.start()
+
+        async with engine.subscribe(MarketDataEvent) as subscription:
+            await engine.process_cycle(sample_candles)
+        await engine.process_cycle(sample_candles)
+        await engine.stop()
+
+        assert [type(e) async for e in subscription] == [MarketDataEvent]
+
+    @pytest.mark.asyncio
+    async def test_bounded_subscription_drops_oldest(self) -> None:
+        """Test a slow consumer loses the oldest events, not the newest."""
+        subscription = EventSubscription((), maxsize=2)
+        for cycle in range(1, 5):
+            subscription.put(CycleCompleteEvent(cycle, 0, 0))
+        subscription.close()
+
+        assert [e.cycle async for e in subscription] == [4]
+        assert subscription.dropped == 3
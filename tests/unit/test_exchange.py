@@ -0,0 +1,317 @@
+"""Unit tests for the exchange adapters."""
+
+import time
+from collections.abc import AsyncIterator
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from stratoquant_nexus.exchange import (
+    ExchangeError,
+    HttpExchangeAdapter,
+    HttpExchangeConfig,
+    MockExchangeServer,
+    WeightRateLimiter,
+)
+from stratoquant_nexus.layers.l1_signals import (
+    SignalStrength,
+    SignalType,
+    TradingSignal,
+)
+from stratoquant_nexus.layers.l2_risk import PositionSize, RiskAssessment
+from stratoquant_nexus.layers.l3_execution import (
+    ExecutionLayer,
+    ExecutionLayerConfig,
+    Order,
+    OrderSide,
+    OrderStatus,
+)
+
+
+@pytest.fixture
+async def mock_exchange() -> AsyncIterator[MockExchangeServer]:
+    """Start a mock exchange server."""
+    async with MockExchangeServer() as server:
+        server.set_price("BTC/USD", Decimal("42000"))
+        yield server
+
+
+@pytest.fixture
+async def adapter(
+    mock_exchange: MockExchangeServer,
+) -> AsyncIterator[HttpExchangeAdapter]:
+    """Create a connected HTTP adapter pointed at the mock exchange."""
+    adapter = HttpExchangeAdapter(
+        HttpExchangeConfig(base_url=mock_exchange.url, retry_delay_seconds=0.0)
+    )
+    await adapter.connect()
+    yield adapter
+    await adapter.close()
+
+
+def _order(quantity: str = "0.5") -> Order:
+    """Create a market buy order."""
+    return Order(symbol="BTC/USD", side=OrderSide.BUY, quantity=Decimal(quantity))
+
+
+class TestWeightRateLimiter:
+    """Tests for the WeightRateLimiter class."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_capacity(self) -> None:
+        """Test acquiring weight below capacity does not wait."""
+        limiter = WeightRateLimiter(capacity=10, interval_seconds=60)
+
+        start = time.monotonic()
+        await limiter.acquire(4)
+        await limiter.acquire(4)
+
+        assert time.monotonic() - start < 0.05
+        assert limiter.available == pytest.approx(2, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self) -> None:
+        """Test acquiring beyond available weight waits for refill."""
+        limiter = WeightRateLimiter(capacity=10, interval_seconds=0.1)
+        await limiter.acquire(10)
+
+        start = time.monotonic()
+        await limiter.acquire(5)
+
+        assert time.monotonic() - start >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_weight_above_capacity_rejected(self) -> None:
+        """Test a weight larger than the bucket is rejected."""
+        limiter = WeightRateLimiter(capacity=10, interval_seconds=1)
+
+        with pytest.raises(ValueError):
+            await limiter.acquire(11)
+
+    def test_sync_used_weight(self) -> None:
+        """Test syncing with exchange-reported usage lowers availability."""
+        limiter = WeightRateLimiter(capacity=100, interval_seconds=60)
+
+        limiter.sync_used_weight(90)
+
+        assert limiter.available == pytest.approx(10, abs=0.1)
+
+
+class TestHttpExchangeAdapter:
+    """Tests for the HttpExchangeAdapter class."""
+
+    @pytest.mark.asyncio
+    async def test_submit_order_filled(
+        self, adapter: HttpExchangeAdapter, mock_exchange: MockExchangeServer
+    ) -> None:
+        """Test submitting a market order fills at the reference price."""
+        order = _order()
+
+        result = await adapter.submit_order(order)
+
+        assert result.client_order_id == order.order_id
+        assert result.status == OrderStatus.FILLED
+        assert result.filled_quantity == Decimal("0.5")
+        assert result.average_price == Decimal("42000")
+        assert result.fees == Decimal("21.00")
+
+    @pytest.mark.asyncio
+    async def test_connection_reused(
+        self, adapter: HttpExchangeAdapter, mock_exchange: MockExchangeServer
+    ) -> None:
+        """Test sequential requests share one pooled connection."""
+        for _ in range(5):
+            await adapter.submit_order(_order())
+
+        assert mock_exchange.request_count == 5
+        assert mock_exchange.connections_opened == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(
+        self, adapter: HttpExchangeAdapter, mock_exchange: MockExchangeServer
+    ) -> None:
+        """Test 5xx responses are retried up to retry_attempts."""
+        mock_exchange.fail_next(2, status_code=503)
+
+        result = await adapter.submit_order(_order())
+
+        assert result.status == OrderStatus.FILLED
+        assert mock_exchange.request_count == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_retry_attempts(
+        self, adapter: HttpExchangeAdapter, mock_exchange: MockExchangeServer
+    ) -> None:
+        """Test the last transient error is raised once attempts run out."""
+        mock_exchange.fail_next(3, status_code=429)
+
+        with pytest.raises(ExchangeError) as exc_info:
+            await adapter.submit_order(_order())
+
+        assert exc_info.value.status_code == 429
+        assert mock_exchange.request_count == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(
+        self, adapter: HttpExchangeAdapter, mock_exchange: MockExchangeServer
+    ) -> None:
+        """Test 4xx responses fail without retrying."""
+        mock_exchange.fail_next(1, status_code=400)
+
+        with pytest.raises(ExchangeError) as exc_info:
+            await adapter.submit_order(_order())
+
+        assert not exc_info.value.retryable
+        assert mock_exchange.request_count == 1
+
+    @pytest.mark.asyncio
+    async def test_non_json_body(self) -> None:
+        """Test a non-JSON success response raises a non-retryable error."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, text="<html>maintenance</html>")
+        )
+        adapter = HttpExchangeAdapter(
+            HttpExchangeConfig(base_url="http://venue"), transport=transport
+        )
+        await adapter.connect()
+
+        with pytest.raises(ExchangeError, match="non-JSON") as exc_info:
+            await adapter.submit_order(_order())
+
+        assert not exc_info.value.retryable
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_malformed_order_response(self) -> None:
+        """Test a body missing required fields raises a non-retryable error."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"status": "bogus"})
+        )
+        adapter = HttpExchangeAdapter(
+            HttpExchangeConfig(base_url="http://venue"), transport=transport
+        )
+        await adapter.connect()
+
+        with pytest.raises(ExchangeError, match="Malformed") as exc_info:
+            await adapter.submit_order(_order())
+
+        assert not exc_info.value.retryable
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_not_connected(self) -> None:
+        """Test requests fail before connect is called."""
+        adapter = HttpExchangeAdapter(HttpExchangeConfig(base_url="http://x"))
+
+        with pytest.raises(ExchangeError, match="not connected"):
+            await adapter.submit_order(_order())
+
+    @pytest.mark.asyncio
+    async def test_health_check(self, adapter: HttpExchangeAdapter) -> None:
+        """Test health check pings the exchange."""
+        assert await adapter.health_check()
+
+    def test_config_from_execution_section(self) -> None:
+        """Test retry settings are read from the execution config section."""
+        execution = {
+            "retry_attempts": 5,
+            "retry_delay_seconds": 2,
+            "fee_rate": 0.001,
+        }
+
+        config = HttpExchangeConfig.from_execution_section(
+            execution, base_url="http://localhost"
+        )
+
+        assert config.retry_attempts == 5
+        assert config.retry_delay_seconds == 2.0
+
+
+class TestLiveExecution:
+    """Tests for ExecutionLayer live execution through an adapter."""
+
+    @pytest.fixture
+    def approved_assessment(self) -> RiskAssessment:
+        """Create an approved risk assessment."""
+        signal = TradingSignal(
+            symbol="BTC/USD",
+            signal_type=SignalType.BUY,
+            strength=SignalStrength.STRONG,
+            price=Decimal("42000"),
+        )
+        position = PositionSize(
+            symbol="BTC/USD",
+            units=Decimal("0.5"),
+            notional_value=Decimal("21000"),
+            risk_amount=Decimal("420"),
+            stop_loss_price=Decimal("41000"),
+            take_profit_price=Decimal("43000"),
+            risk_reward_ratio=2.0,
+        )
+        return RiskAssessment(signal=signal, approved=True, position_size=position)
+
+    @pytest.mark.asyncio
+    async def test_live_execution_uses_adapter(
+        self,
+        mock_exchange: MockExchangeServer,
+        approved_assessment: RiskAssessment,
+    ) -> None:
+        """Test orders are sent to the exchange when not simulating."""
+        adapter = HttpExchangeAdapter(HttpExchangeConfig(base_url=mock_exchange.url))
+        layer = ExecutionLayer(
+            ExecutionLayerConfig(name="ExecutionLayer", simulate_execution=False),
+            exchange=adapter,
+        )
+        await layer.initialize()
+
+        reports = await layer.process([approved_assessment])
+
+        assert reports[0].success
+        assert reports[0].order.status == OrderStatus.FILLED
+        assert reports[0].order.average_price == Decimal("42000")
+        assert reports[0].order.order_id in mock_exchange.orders
+
+        await layer.shutdown()
+        assert not adapter.is_connected
+
+    @pytest.mark.asyncio
+    async def test_live_execution_bad_response_rejects(
+        self, approved_assessment: RiskAssessment
+    ) -> None:
+        """Test an undecodable venue response rejects the order."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, text="<html></html>")
+        )
+        adapter = HttpExchangeAdapter(
+            HttpExchangeConfig(base_url="http://venue"), transport=transport
+        )
+        layer = ExecutionLayer(
+            ExecutionLayerConfig(name="ExecutionLayer", simulate_execution=False),
+            exchange=adapter,
+        )
+        await layer.initialize()
+
+        reports = await layer.process([approved_assessment])
+
+        assert not reports[0].success
+        assert reports[0].order.status == OrderStatus.REJECTED
+
+        await layer.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_live_execution_without_adapter(
+        self, approved_assessment: RiskAssessment
+    ) -> None:
+        """Test live execution without an adapter rejects the order."""
+        layer = ExecutionLayer(
+            ExecutionLayerConfig(name="ExecutionLayer", simulate_execution=False)
+        )
+        await layer.initialize()
+
+        reports = await layer.process([approved_assessment])
+
+        assert not reports[0].success
+        assert reports[0].order.status == OrderStatus.REJECTED
+
+        await layer.shutdown()
@@ -0,0 +1,333 @@
+"""Unit tests for the L3 order journal."""
+
+import asyncio
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from stratoquant_nexus import TradingEngine
+from stratoquant_nexus.engine import EngineConfig
+from stratoquant_nexus.layers.l1_signals import (
+    SignalStrength,
+    SignalType,
+    TradingSignal,
+)
+from stratoquant_nexus.layers.l2_risk import PositionSize, RiskAssessment
+from stratoquant_nexus.layers.l3_algorithms import ExecutionAlgorithm
+from stratoquant_nexus.layers.l3_execution import (
+    ExecutionLayer,
+    ExecutionLayerConfig,
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+)
+from stratoquant_nexus.layers.l3_journal import OrderJournal, decode_order, encode_order
+
+
+def _order(side: OrderSide = OrderSide.BUY, quantity: str = "2") -> Order:
+    """Create a limit order."""
+    return Order(
+        symbol="BTC/USD",
+        side=side,
+        order_type=OrderType.LIMIT,
+        quantity=Decimal(quantity),
+        price=Decimal("100"),
+        stop_loss=Decimal("95"),
+        take_profit=Decimal("110"),
+    )
+
+
+def _fill(order: Order, quantity: str, price: str) -> None:
+    """Mark an order as (partially) filled."""
+    order.filled_quantity = Decimal(quantity)
+    order.average_price = Decimal(price)
+    order.status = (
+        OrderStatus.FILLED
+        if order.filled_quantity == order.quantity
+        else OrderStatus.PARTIAL
+    )
+
+
+class TestRecordEncoding:
+    """Tests for the binary record encoding."""
+
+    def test_round_trip(self) -> None:
+        """Test an order survives encode/decode unchanged."""
+        order = _order()
+        _fill(order, "1", "100.5")
+
+        sequence, decoded = decode_order(memoryview(encode_order(7, order)))
+
+        assert sequence == 7
+        assert decoded == order
+
+    def test_records_without_trailing_fields(self) -> None:
+        """Test records written before the algorithm/child fields still decode."""
+        order = _order()
+        order.algorithm = ExecutionAlgorithm.TWAP
+        payload = encode_order(1, order)
+        assert decode_order(memoryview(payload))[1].algorithm == "twap"
+
+        # No algorithm and no children encode as two two-byte prefixes
+        _, legacy = decode_order(memoryview(encode_order(1, _order())[:-4]))
+        assert legacy.algorithm is None
+        assert legacy.child_order_ids == []
+
+    def test_child_order_ids_round_trip(self) -> None:
+        """Test a net order keeps the IDs of the orders it fans out to."""
+        order = _order()
+        order.child_order_ids = ["a", "b"]
+
+        _, decoded = decode_order(memoryview(encode_order(1, order)))
+
+        assert decoded.child_order_ids == ["a", "b"]
+
+
+class TestOrderJournal:
+    """Tests for the OrderJournal class."""
+
+    @pytest.mark.asyncio
+    async def test_recover_open_orders_and_positions(self, tmp_path: Path) -> None:
+        """Test open orders and positions are rebuilt from the log."""
+        journal = OrderJournal(tmp_path)
+        await journal.open()
+        open_order = _order()
+        journal.record(open_order)
+        _fill(open_order, "1", "100")
+        journal.record(open_order)
+        closed = _order(OrderSide.SELL, "0.5")
+        journal.record(closed)
+        _fill(closed, "0.5", "104")
+        journal.record(closed)
+        await journal.close(snapshot=False)
+
+        reopened = OrderJournal(tmp_path)
+        recovered = await reopened.open()
+        await reopened.close()
+
+        assert list(recovered.open_orders) == [open_order.order_id]
+        assert recovered.open_orders[open_order.order_id].status == OrderStatus.PARTIAL
+        position = recovered.positions["BTC/USD"]
+        assert position.quantity == Decimal("0.5")
+        assert position.average_price == Decimal("100")
+
+    @pytest.mark.asyncio
+    async def test_snapshot_plus_tail(self, tmp_path: Path) -> None:
+        """Test recovery combines the snapshot with records written after it."""
+        journal = OrderJournal(tmp_path)
+        await journal.open()
+        first = _order()
+        _fill(first, "2", "100")
+        journal.record(first)
+        await journal.snapshot()
+        second = _order()
+        journal.record(second)
+        await journal.close(snapshot=False)
+
+        reopened = OrderJournal(tmp_path)
+        state = await reopened.open()
+
+        assert state.positions["BTC/USD"].quantity == Decimal("2")
+        assert second.order_id in state.open_orders
+        assert state.last_sequence == 2
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_torn_tail_is_discarded(self, tmp_path: Path) -> None:
+        """Test a partially written final record is ignored and truncated."""
+        journal = OrderJournal(tmp_path)
+        await journal.open()
+        order = _order()
+        journal.record(order)
+        await journal.close(snapshot=False)
+        with open(journal.wal_path, "ab") as f:
+            f.write(b"\x40\x00\x00\x00garbage")
+
+        reopened = OrderJournal(tmp_path)
+        state = await reopened.open()
+        reopened.record(_order())
+        await reopened.close(snapshot=False)
+
+        final = OrderJournal(tmp_path)
+        final_state = await final.open()
+        await final.close()
+
+        assert order.order_id in state.open_orders
+        assert len(final_state.open_orders) == 2
+
+    @pytest.mark.asyncio
+    async def test_truncated_snapshot_is_ignored(self, tmp_path: Path) -> None:
+        """Test a snapshot cut short by a crash does not prevent opening."""
+        journal = OrderJournal(tmp_path)
+        await journal.open()
+        order = _order()
+        journal.record(order)
+        await journal.sync()
+        await journal.close(snapshot=False)
+        journal.snapshot_path.write_bytes(b"SQJS\x01\x00")
+
+        reopened = OrderJournal(tmp_path)
+        state = await reopened.open()
+
+        assert order.order_id in state.open_orders
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_in_flight_commit(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test closing during a commit lets the write finish."""
+        journal = OrderJournal(tmp_path, commit_interval_ms=1)
+        write_and_sync = journal._write_and_sync
+
+        def slow_write(fd: int, data: bytes) -> None:
+            time.sleep(0.05)
+            write_and_sync(fd, data)
+
+        monkeypatch.setattr(journal, "_write_and_sync", slow_write)
+        await journal.open()
+        order = _order()
+        journal.record(order)
+        sync = asyncio.create_task(journal.sync())
+        await asyncio.sleep(0.02)  # The commit is now writing
+
+        await journal.close(snapshot=False)
+        await asyncio.wait_for(sync, timeout=1)
+
+        assert journal.pending == 0
+        reopened = OrderJournal(tmp_path)
+        state = await reopened.open()
+        assert order.order_id in state.open_orders
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_group_commit(self, tmp_path: Path) -> None:
+        """Test many records are made durable with few fsyncs."""
+        journal = OrderJournal(tmp_path, commit_interval_ms=5)
+        await journal.open()
+
+        for _ in range(200):
+            journal.record(_order())
+        await journal.sync()
+
+        assert journal.fsync_count < 10
+        await journal.close(snapshot=False)
+
+
+class TestJournaledExecution:
+    """Tests for journal integration with the execution layer and engine."""
+
+    @pytest.fixture
+    def assessment(self) -> RiskAssessment:
+        """Create an approved buy assessment."""
+        signal = TradingSignal(
+            symbol="BTC/USD",
+            signal_type=SignalType.BUY,
+            strength=SignalStrength.STRONG,
+            price=Decimal("100"),
+        )
+        position = PositionSize(
+            symbol="BTC/USD",
+            units=Decimal("3"),
+            notional_value=Decimal("300"),
+            risk_amount=Decimal("6"),
+            stop_loss_price=Decimal("98"),
+            take_profit_price=Decimal("104"),
+            risk_reward_ratio=2.0,
+        )
+        return RiskAssessment(signal=signal, approved=True, position_size=position)
+
+    @pytest.mark.asyncio
+    async def test_restart_restores_risk_positions(
+        self, tmp_path: Path, assessment: RiskAssessment
+    ) -> None:
+        """Test an engine restart rebuilds risk positions from the journal."""
+        execution_config = ExecutionLayerConfig(
+            name="ExecutionLayer",
+            default_order_type=OrderType.LIMIT,
+            journal_dir=str(tmp_path),
+        )
+        layer = ExecutionLayer(execution_config)
+        await layer.initialize()
+        await layer.process([assessment])
+        await layer.shutdown()
+
+        engine = TradingEngine(EngineConfig(execution_config=execution_config))
+        await engine.start()
+
+        position = engine.risk_layer.active_positions["BTC/USD"]
+        assert position.units == Decimal("3")
+        assert position.stop_loss_price == Decimal("98")
+
+        await engine.stop()
+
+    async def _interrupt_parent(self, tmp_path: Path) -> Order:
+        """Journal a TWAP parent that stops after its first child fills."""
+        layer = ExecutionLayer(
+            ExecutionLayerConfig(name="ExecutionLayer", journal_dir=str(tmp_path))
+        )
+        await layer.initialize()
+        order = _order(quantity="4")
+        layer.submit_algo_order(
+            order, ExecutionAlgorithm.TWAP, duration_seconds=60, slices=2
+        )
+        while not order.filled_quantity:
+            await asyncio.sleep(0.01)
+        await layer.shutdown()
+        assert order.status == OrderStatus.PARTIAL
+        return order
+
+    @pytest.mark.asyncio
+    async def test_recovered_parent_is_resumed(self, tmp_path: Path) -> None:
+        """Test a parent working at shutdown is worked to completion on restart."""
+        interrupted = await self._interrupt_parent(tmp_path)
+
+        layer = ExecutionLayer(
+            ExecutionLayerConfig(
+                name="ExecutionLayer",
+                journal_dir=str(tmp_path),
+                algo_duration_seconds=0.05,
+            )
+        )
+        await layer.initialize()
+        parent = layer.get_parent_order(interrupted.order_id)
+        assert parent is not None
+        assert parent.order.filled_quantity == Decimal("2")
+
+        assert layer.get_order(interrupted.order_id) is parent.order
+        while layer.scheduler.active_parents:
+            await asyncio.sleep(0.01)
+        await layer.shutdown()
+
+        order = parent.order
+        assert order.status == OrderStatus.FILLED
+        assert order.filled_quantity == Decimal("4")
+        assert sum(c.quantity for c in parent.children) == Decimal("2")
+
+    @pytest.mark.asyncio
+    async def test_recovered_parent_is_cancelled(self, tmp_path: Path) -> None:
+        """Test recovered parents are cancelled and journaled when not resumed."""
+        interrupted = await self._interrupt_parent(tmp_path)
+        config = ExecutionLayerConfig(
+            name="ExecutionLayer",
+            journal_dir=str(tmp_path),
+            resume_algo_orders=False,
+        )
+
+        layer = ExecutionLayer(config)
+        await layer.initialize()
+        order = layer.get_order(interrupted.order_id)
+        assert order is not None
+        assert order.status == OrderStatus.CANCELLED
+        assert layer.scheduler.active_parents == 0
+        assert layer.count_open_orders() == 0
+        await layer.shutdown()
+
+        journal = OrderJournal(tmp_path)
+        state = await journal.open()
+        await journal.close(snapshot=False)
+        assert interrupted.order_id not in state.open_orders
+        assert state.positions["BTC/USD"].quantity == Decimal("2")
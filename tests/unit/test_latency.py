@@ -0,0 +1,123 @@
+"""Unit tests for latency instrumentation."""
+
+import pytest
+
+from stratoquant_nexus import TradingEngine
+from stratoquant_nexus.engine import EngineConfig
+from stratoquant_nexus.layers.l0_data import OHLCV
+from stratoquant_nexus.monitoring import LatencyHistogram, LatencyRecorder
+
+
+class TestLatencyHistogram:
+    """Tests for the LatencyHistogram class."""
+
+    def test_small_values_exact(self) -> None:
+        """Test values below the sub-bucket count are tracked exactly."""
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.record(value)
+
+        assert histogram.value_at_percentile(50) == 50
+        assert histogram.value_at_percentile(99) == 99
+        assert histogram.value_at_percentile(100) == 100
+
+    def test_relative_error_bounded(self) -> None:
+        """Test large values stay within the bucket resolution."""
+        histogram = LatencyHistogram(significant_bits=7)
+        for value in range(1_000, 10_000_000, 997):
+            histogram.record(value)
+
+        p50 = histogram.value_at_percentile(50)
+
+        assert abs(p50 - 5_000_000) / 5_000_000 < 0.02
+
+    def test_snapshot_tail(self) -> None:
+        """Test p99 and p999 reflect outliers."""
+        histogram = LatencyHistogram()
+        for _ in range(990):
+            histogram.record(1_000)
+        for _ in range(10):
+            histogram.record(1_000_000)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot.count == 1000
+        assert snapshot.p50_ns <= 1_010
+        assert snapshot.p999_ns >= 990_000
+        assert snapshot.max_ns == 1_000_000
+
+    def test_values_above_range_clamped(self) -> None:
+        """Test out-of-range values do not raise."""
+        histogram = LatencyHistogram(max_value_ns=1_000_000)
+
+        histogram.record(10**12)
+
+        assert histogram.snapshot().max_ns == 10**12
+
+    def test_reset(self) -> None:
+        """Test reset clears counts."""
+        histogram = LatencyHistogram()
+        histogram.record(5)
+
+        histogram.reset()
+
+        assert histogram.snapshot().count == 0
+
+
+class TestLatencyRecorder:
+    """Tests for the LatencyRecorder class."""
+
+    def test_measure(self) -> None:
+        """Test timed blocks are recorded under their name."""
+        recorder = LatencyRecorder()
+
+        with recorder.measure("block"):
+            sum(range(1000))
+
+        snapshot = recorder.snapshot()["block"]
+        assert snapshot.count == 1
+        assert snapshot.max_ns > 0
+
+    def test_disabled_records_nothing(self) -> None:
+        """Test a disabled recorder ignores samples."""
+        recorder = LatencyRecorder(enabled=False)
+
+        start = recorder.start()
+        recorder.record("noop", start)
+        recorder.record_value("noop", 10)
+
+        assert start == 0
+        assert recorder.snapshot() == {}
+
+
+class TestEngineLatency:
+    """Tests for engine latency tracking."""
+
+    @pytest.mark.asyncio
+    async def test_cycle_records_layer_latencies(
+        self, sample_candles: list[OHLCV]
+    ) -> None:
+        """Test a cycle records per-layer and per-rule histograms."""
+        engine = TradingEngine(EngineConfig(enable_latency_tracking=True))
+        await engine.start()
+
+        await engine.process_cycle(sample_candles)
+        snapshot = engine.latency_snapshot()
+
+        assert snapshot["engine.cycle"].count == 1
+        for layer in ("DataLayer", "SignalLayer", "RiskLayer", "ExecutionLayer"):
+            assert snapshot[f"layer.{layer}"].count == 1
+        assert engine.risk_layer.latency is engine.latency
+
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, sample_candles: list[OHLCV]) -> None:
+        """Test no histograms are kept unless tracking is enabled."""
+        engine = TradingEngine()
+        await engine.start()
+
+        await engine.process_cycle(sample_candles)
+
+        assert engine.latency_snapshot() == {}
+        await engine.stop()
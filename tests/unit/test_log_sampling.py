@@ -0,0 +1,107 @@
+"""Unit tests for log sampling and rate limiting."""
+
+import contextlib
+import io
+import json
+from typing import Any
+
+import pytest
+import structlog
+
+from stratoquant_nexus.utils.log_sampling import (
+    SUMMARY_EVENT,
+    LogSampler,
+    SamplingRule,
+)
+from stratoquant_nexus.utils.logging import setup_logging, shutdown_logging
+
+pytestmark = pytest.mark.usefixtures("reset_logging")
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+
+def _emit(sampler: LogSampler, event: str, count: int) -> list[dict[str, Any]]:
+    """Pass events through the sampler and return the kept ones."""
+    kept = []
+    for i in range(count):
+        with contextlib.suppress(structlog.DropEvent):
+            kept.append(sampler(None, "info", {"event": event, "i": i}))
+    return kept
+
+
+class TestLogSampler:
+    """Tests for the LogSampler processor."""
+
+    def test_one_in_n(self) -> None:
+        """Test every Nth occurrence is kept with the suppressed count."""
+        sampler = LogSampler({"tick": SamplingRule(every=10)}, None)
+
+        kept = _emit(sampler, "tick", 25)
+        other = _emit(sampler, "order filled", 3)
+
+        assert [e["i"] for e in kept] == [0, 10, 20]
+        assert "suppressed" not in kept[0]
+        assert kept[1]["suppressed"] == 9
+        assert len(other) == 3
+        assert sampler.summary() == {
+            "tick": {"seen": 25, "logged": 3, "suppressed": 22}
+        }
+        assert sampler.summary() == {}
+
+    def test_max_per_second(self) -> None:
+        """Test the rate limit refills over time."""
+        clock = FakeClock()
+        sampler = LogSampler({"tick": SamplingRule(max_per_second=5)}, None, clock)
+
+        burst = _emit(sampler, "tick", 100)
+        clock.now = 0.4
+        refill = _emit(sampler, "tick", 100)
+
+        assert len(burst) == 5
+        assert len(refill) == 2
+        assert refill[0]["suppressed"] == 95
+
+    def test_rejects_rule_keeping_everything(self) -> None:
+        """Test a rule without limits is rejected."""
+        with pytest.raises(ValueError, match="keeps everything"):
+            LogSampler({"tick": SamplingRule()})
+
+
+class TestSamplingSetup:
+    """Tests for sampling through setup_logging."""
+
+    def test_summary_lines(self) -> None:
+        """Test sampled events are summarized on shutdown."""
+        stream = io.StringIO()
+        setup_logging(
+            "INFO",
+            json_output=True,
+            queued=True,
+            stream=stream,
+            sampling={"Alert processed": SamplingRule(every=100)},
+        )
+        logger = structlog.get_logger()
+
+        for i in range(250):
+            logger.info("Alert processed", alert_id=i)
+        logger.warning("Order rejected")
+        shutdown_logging()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        events = [line["event"] for line in lines]
+        assert events.count("Alert processed") == 3
+        assert "Order rejected" in events
+        assert lines[-1]["event"] == SUMMARY_EVENT
+        assert lines[-1]["events"] == {
+            "Alert processed": {"seen": 250, "logged": 3, "suppressed": 247}
+        }
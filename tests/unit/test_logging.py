@@ -0,0 +1,132 @@
+"""Unit tests for logging setup."""
+
+import io
+import json
+import threading
+import time
+
+import pytest
+import structlog
+
+from stratoquant_nexus.utils.logging import (
+    QueuedLogWriter,
+    get_log_queue_stats,
+    setup_logging,
+    shutdown_logging,
+)
+
+pytestmark = pytest.mark.usefixtures("reset_logging")
+
+
+class BlockingStream(io.StringIO):
+    """Stream whose writes wait until released, like a stalled pipe."""
+
+    def __init__(self) -> None:
+        """Initialize the stream."""
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, s: str) -> int:
+        """Block until released, then write."""
+        self.release.wait(timeout=5)
+        return super().write(s)
+
+
+class TestQueuedLogging:
+    """Tests for the queued logging mode."""
+
+    def test_writes_json_lines(self) -> None:
+        """Test records are rendered as JSON on the writer thread."""
+        stream = io.StringIO()
+        setup_logging("INFO", json_output=True, queued=True, stream=stream)
+        logger = structlog.get_logger()
+
+        logger.debug("hidden")
+        logger.info("alert processed", symbol="BTC/USD", qty=1.5)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("alert failed")
+        stats = get_log_queue_stats()
+        shutdown_logging()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [line["event"] for line in lines] == ["alert processed", "alert failed"]
+        assert lines[0]["symbol"] == "BTC/USD"
+        assert lines[0]["level"] == "info"
+        assert "ValueError: boom" in lines[1]["exception"]
+        assert stats is not None
+        assert stats.dropped == 0
+
+    def test_full_queue_drops_instead_of_blocking(self) -> None:
+        """Test a stalled stream never blocks the caller."""
+        stream = BlockingStream()
+        writer = QueuedLogWriter(stream, json_output=True, maxsize=2)
+
+        for i in range(10):
+            with pytest.raises(structlog.DropEvent):
+                writer(None, "info", {"event": f"e{i}", "level": "info"})
+        stats = writer.stats()
+        stream.release.set()
+        writer.stop()
+
+        # The blocked writer thread may already hold a few records
+        assert stats.dropped >= 6
+        assert stats.dropped_by_level == {"info": stats.dropped}
+        assert writer.stats().written == 10 - stats.dropped
+        assert '"e0"' in stream.getvalue()
+
+    def test_drop_oldest_keeps_newest(self) -> None:
+        """Test the oldest policy evicts queued records for new ones."""
+        stream = BlockingStream()
+        writer = QueuedLogWriter(
+            stream, json_output=True, maxsize=2, drop_policy="oldest"
+        )
+
+        for i in range(10):
+            with pytest.raises(structlog.DropEvent):
+                writer(None, "warning", {"event": f"e{i}", "level": "warning"})
+        stream.release.set()
+        writer.stop()
+
+        assert '"e9"' in stream.getvalue()
+        assert writer.stats().dropped_by_level["warning"] >= 7
+
+    def test_drop_oldest_never_loses_stop(self) -> None:
+        """Test evicting the stop sentinel still ends the writer."""
+        stream = BlockingStream()
+        writer = QueuedLogWriter(
+            stream, json_output=True, maxsize=2, drop_policy="oldest"
+        )
+        with pytest.raises(structlog.DropEvent):
+            writer(None, "info", {"event": "e0", "level": "info"})
+        while writer.stats().pending:  # The writer holds e0, blocked
+            time.sleep(0.001)
+        with pytest.raises(structlog.DropEvent):
+            writer(None, "info", {"event": "e1", "level": "info"})
+        stopper = threading.Thread(target=writer.stop)
+        stopper.start()
+        while writer.stats().pending < 2:
+            time.sleep(0.001)
+
+        for event in ("e2", "e3"):  # Evicts e1, then the sentinel
+            with pytest.raises(structlog.DropEvent):
+                writer(None, "info", {"event": event, "level": "info"})
+        stream.release.set()
+        stopper.join(timeout=5)
+
+        assert not stopper.is_alive()
+        assert writer.stats().dropped_by_level == {"info": 1}
+        assert '"e3"' in stream.getvalue()
+
+    def test_console_output(self) -> None:
+        """Test the console renderer is used without JSON output."""
+        stream = io.StringIO()
+        setup_logging("INFO", queued=True, stream=stream)
+
+        structlog.get_logger().warning("slow venue", venue="binance")
+        shutdown_logging()
+
+        output = stream.getvalue()
+        assert "slow venue" in output
+        assert "venue=binance" in output
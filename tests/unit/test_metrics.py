@@ -0,0 +1,108 @@
+"""Unit tests for the metrics registry and Prometheus endpoint."""
+
+import httpx
+import pytest
+
+from stratoquant_nexus import TradingEngine
+from stratoquant_nexus.engine import EngineConfig
+from stratoquant_nexus.layers.l0_data import OHLCV
+from stratoquant_nexus.monitoring import MetricsRegistry, MetricsServer
+
+
+class TestMetricsRegistry:
+    """Tests for the MetricsRegistry class."""
+
+    def test_counter_render(self) -> None:
+        """Test counters render with labels and help text."""
+        registry = MetricsRegistry(namespace="test")
+        counter = registry.counter("events_total", "Events", ("kind",))
+        counter.inc(kind="a")
+        counter.inc(2, kind='b"q')
+
+        text = registry.render()
+
+        assert "# TYPE test_events_total counter" in text
+        assert 'test_events_total{kind="a"} 1' in text
+        assert 'test_events_total{kind="b\\"q"} 2' in text
+
+    def test_gauge_function(self) -> None:
+        """Test function gauges are evaluated at render time."""
+        registry = MetricsRegistry()
+        depth = [3]
+        registry.gauge("depth", "Depth").set_function(lambda: depth[0])
+        depth[0] = 7
+
+        assert "depth 7" in registry.render()
+
+    def test_histogram_cumulative_buckets(self) -> None:
+        """Test histogram buckets are cumulative with sum and count."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        text = registry.render()
+
+        assert 'latency_bucket{le="0.1"} 2' in text
+        assert 'latency_bucket{le="1"} 3' in text
+        assert 'latency_bucket{le="+Inf"} 4' in text
+        assert "latency_count 4" in text
+        assert "latency_sum 2.65" in text
+
+    def test_get_or_create(self) -> None:
+        """Test repeated lookups return the same metric."""
+        registry = MetricsRegistry()
+
+        assert registry.counter("c", "C") is registry.counter("c", "C")
+        with pytest.raises(ValueError):
+            registry.gauge("c", "C")
+
+
+class TestMetricsServer:
+    """Tests for the MetricsServer class."""
+
+    def test_scrape(self) -> None:
+        """Test the endpoint serves the rendered registry."""
+        registry = MetricsRegistry()
+        registry.counter("scrapes_total", "Scrapes").inc()
+        server = MetricsServer(registry, port=0)
+        server.start()
+        try:
+            response = httpx.get(server.url)
+            missing = httpx.get(server.url.replace("/metrics", "/nope"))
+        finally:
+            server.stop()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "scrapes_total 1" in response.text
+        assert missing.status_code == 404
+        assert not server.is_running
+
+
+class TestEngineMetrics:
+    """Tests for engine metric collection."""
+
+    @pytest.mark.asyncio
+    async def test_cycle_metrics(self, sample_candles: list[OHLCV]) -> None:
+        """Test a cycle updates throughput, latency and queue metrics."""
+        engine = TradingEngine(EngineConfig(enable_metrics=True))
+        await engine.start()
+
+        await engine.process_cycle(sample_candles)
+        text = engine.metrics.render()
+
+        assert "stratoquant_cycles_total 1" in text
+        assert "stratoquant_cycle_duration_seconds_count 1" in text
+        assert 'stratoquant_layer_latency_seconds_count{layer="RiskLayer"} 1' in text
+        assert 'stratoquant_queue_depth{queue="open_orders"} 0' in text
+        assert "stratoquant_order_fill_rate" in text
+
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_metrics_disabled(self) -> None:
+        """Test the registry stays empty unless metrics are enabled."""
+        engine = TradingEngine()
+
+        assert engine.metrics.render() == ""
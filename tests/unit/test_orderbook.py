@@ -0,0 +1,131 @@
+"""Unit tests for the L2 order book."""
+
+import pytest
+
+from stratoquant_nexus.layers.l0_data import DataLayer, DataLayerConfig
+from stratoquant_nexus.layers.l0_orderbook import BookUpdate, OrderBook
+
+
+@pytest.fixture
+def book() -> OrderBook:
+    """Create a synced book with three levels per side."""
+    book = OrderBook("BTC/USD")
+    book.apply_snapshot(
+        bids=[(99.0, 3.0), (100.0, 1.0), (98.0, 5.0)],
+        asks=[(101.0, 3.0), (102.0, 2.0), (103.0, 4.0)],
+        sequence=10,
+    )
+    return book
+
+
+class TestOrderBook:
+    """Tests for OrderBook."""
+
+    def test_snapshot_and_best_levels(self, book: OrderBook) -> None:
+        """Test a snapshot builds sorted sides."""
+        assert book.in_sync
+        assert book.best_bid == (100.0, 1.0)
+        assert book.best_ask == (101.0, 3.0)
+        assert book.bids.levels(3) == [(100.0, 1.0), (99.0, 3.0), (98.0, 5.0)]
+        assert book.asks.levels(2) == [(101.0, 3.0), (102.0, 2.0)]
+
+    def test_diff_updates_levels(self, book: OrderBook) -> None:
+        """Test diffs insert, resize and delete levels."""
+        applied = book.apply_diff(
+            bids=[(100.0, 0.0), (100.5, 2.0)], asks=[(101.0, 1.0)], sequence=11
+        )
+
+        assert applied
+        assert book.sequence == 11
+        assert book.best_bid == (100.5, 2.0)
+        assert book.best_ask == (101.0, 1.0)
+        assert len(book.bids) == 3
+
+    def test_sequence_gap_desyncs_until_snapshot(self, book: OrderBook) -> None:
+        """Test a skipped sequence stops diffs until the next snapshot."""
+        assert not book.apply_diff([(100.0, 9.0)], [], sequence=10)  # Stale
+        assert not book.apply_diff([(100.0, 9.0)], [], sequence=12)  # Gap
+        assert not book.apply_diff([(100.0, 9.0)], [], sequence=13)
+
+        assert not book.in_sync
+        assert book.gaps == 1
+        assert book.best_bid == (100.0, 1.0)
+
+        book.apply(BookUpdate("BTC/USD", 20, [(100.0, 2.0)], [(101.0, 1.0)], True))
+        assert book.apply_diff([], [(101.0, 0.0)], sequence=21)
+        assert book.best_ask is None
+
+    def test_features(self, book: OrderBook) -> None:
+        """Test spread, microprice, depth and imbalance."""
+        assert book.mid == 100.5
+        assert book.spread == 1.0
+        assert book.spread_bps == pytest.approx(1.0 / 100.5 * 10_000)
+        # Less size on the bid pulls the microprice towards it
+        assert book.microprice == pytest.approx((100.0 * 3.0 + 101.0 * 1.0) / 4.0)
+        assert book.depth(bps=150) == (4.0, 5.0)
+        assert book.imbalance() == pytest.approx((1.0 - 3.0) / 4.0)
+        assert book.imbalance(levels=3) == pytest.approx((9.0 - 9.0) / 18.0)
+        assert book.imbalance(bps=150) == pytest.approx((4.0 - 5.0) / 9.0)
+
+    def test_empty_book(self) -> None:
+        """Test features of an empty book."""
+        book = OrderBook("ETH/USD")
+
+        assert not book.in_sync
+        assert book.mid is None
+        assert book.spread_bps is None
+        assert book.microprice is None
+        assert book.depth(10) == (0.0, 0.0)
+        assert book.imbalance() == 0.0
+        assert not book.apply_diff([(1.0, 1.0)], [], sequence=1)
+
+    def test_max_levels(self) -> None:
+        """Test snapshots are truncated to the best levels."""
+        book = OrderBook("BTC/USD", max_levels=2)
+
+        book.apply_snapshot([(p, 1.0) for p in (97.0, 98.0, 99.0)], [], sequence=1)
+
+        assert book.bids.levels(5) == [(99.0, 1.0), (98.0, 1.0)]
+
+    def test_max_levels_kept_across_diffs(self) -> None:
+        """Test diffs keep the depth limit without leaving gaps."""
+        book = OrderBook("BTC/USD", max_levels=2)
+        book.apply_snapshot([(p, 1.0) for p in (97.0, 98.0, 99.0)], [], sequence=1)
+
+        book.apply_diff([(99.5, 2.0)], [], sequence=2)
+        assert book.bids.levels(5) == [(99.5, 2.0), (99.0, 1.0)]
+
+        # Below the worst kept level, 98.0 may still exist unseen
+        book.apply_diff([(99.5, 0.0), (97.5, 4.0)], [], sequence=3)
+        assert book.bids.levels(5) == [(99.0, 1.0)]
+        book.apply_diff([(99.0, 3.0)], [], sequence=4)
+        assert book.bids.levels(5) == [(99.0, 3.0)]
+
+        book.apply_snapshot([(98.0, 1.0)], [], sequence=5)
+        book.apply_diff([(97.0, 1.0), (96.0, 1.0)], [], sequence=6)
+        assert book.bids.levels(5) == [(98.0, 1.0), (97.0, 1.0)]
+
+
+class TestDataLayerOrderBooks:
+    """Tests for order books in the data layer."""
+
+    @pytest.mark.asyncio
+    async def test_process_book_updates(self) -> None:
+        """Test updates build books shared through market data."""
+        layer = DataLayer(DataLayerConfig(name="DataLayer", order_book_levels=10))
+
+        market_data = await layer.process(
+            [
+                BookUpdate("BTC/USD", 1, [(100.0, 1.0)], [(101.0, 1.0)], snapshot=True),
+                BookUpdate("BTC/USD", 2, [(100.5, 2.0)], []),
+            ]
+        )
+        book = layer.get_order_book("BTC/USD")
+
+        assert book is not None
+        assert market_data.order_books["BTC/USD"] is book
+        assert market_data.candles == []
+        assert book.best_bid == (100.5, 2.0)
+        assert book.max_levels == 10
+        assert not layer.apply_book_update(BookUpdate("BTC/USD", 5, [], []))
+        assert layer.get_order_book("ETH/USD") is None
@@ -0,0 +1,177 @@
+"""Unit tests for the Parquet historical candle loader."""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from stratoquant_nexus.layers.l0_archive import CandleArchive  # noqa: E402
+from stratoquant_nexus.layers.l0_data import (  # noqa: E402
+    DataLayer,
+    DataLayerConfig,
+    Timeframe,
+)
+from stratoquant_nexus.layers.l0_parquet import ParquetCandleLoader  # noqa: E402
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _write_dataset(root: Path, hours: int = 48) -> None:
+    """Write a hive-partitioned dataset of two symbols and two timeframes."""
+    rows: dict[str, list] = {
+        k: [] for k in ("timestamp", "open", "high", "low", "close", "volume")
+    }
+    rows["symbol"] = []
+    rows["timeframe"] = []
+    for symbol, base in (("BTC/USD", 40000.0), ("ETH/USD", 2000.0)):
+        for timeframe, step in (("1h", 1), ("4h", 4)):
+            for i in range(0, hours, step):
+                rows["timestamp"].append(START + timedelta(hours=i))
+                rows["open"].append(base + i)
+                rows["high"].append(base + i + 5)
+                rows["low"].append(base + i - 5)
+                rows["close"].append(base + i + 1)
+                rows["volume"].append(1.5)
+                rows["symbol"].append(symbol)
+                rows["timeframe"].append(timeframe)
+    table = pa.table(
+        {
+            **rows,
+            "timestamp": pa.array(rows["timestamp"], pa.timestamp("ns", tz="UTC")),
+        }
+    )
+    ds.write_dataset(
+        table,
+        root,
+        format="parquet",
+        partitioning=["symbol", "timeframe"],
+        partitioning_flavor="hive",
+        max_rows_per_group=8,
+        min_rows_per_group=8,
+    )
+
+
+class TestParquetCandleLoader:
+    """Tests for ParquetCandleLoader."""
+
+    def test_read_filters_series_and_range(self, tmp_path: Path) -> None:
+        """Test only the requested symbols, timeframes and range are read."""
+        _write_dataset(tmp_path)
+        loader = ParquetCandleLoader(tmp_path)
+
+        series = loader.read(
+            ["BTC/USD"],
+            [Timeframe.H1],
+            start=START + timedelta(hours=10),
+            end=START + timedelta(hours=20),
+        )
+
+        assert list(series) == [("BTC/USD", Timeframe.H1)]
+        records = series["BTC/USD", Timeframe.H1]
+        assert len(records) == 10
+        assert records["open"].tolist() == [40000.0 + i for i in range(10, 20)]
+        start_us = (START + timedelta(hours=10)).timestamp() * 1_000_000
+        assert records["timestamp"][0] == start_us
+        assert np.all(np.diff(records["timestamp"]) > 0)
+
+    def test_read_everything(self, tmp_path: Path) -> None:
+        """Test all series are returned without filters."""
+        _write_dataset(tmp_path)
+
+        series = ParquetCandleLoader(tmp_path).read()
+
+        assert sorted(series) == [
+            ("BTC/USD", Timeframe.H1),
+            ("BTC/USD", Timeframe.H4),
+            ("ETH/USD", Timeframe.H1),
+            ("ETH/USD", Timeframe.H4),
+        ]
+        assert len(series["ETH/USD", Timeframe.H4]) == 12
+
+    def test_renamed_columns(self, tmp_path: Path) -> None:
+        """Test column names can be mapped."""
+        table = pa.table(
+            {
+                "ts": pa.array([0, 3_600_000_000], pa.int64()),
+                "o": [1.0, 2.0],
+                "h": [1.5, 2.5],
+                "l": [0.5, 1.5],
+                "c": [1.2, 2.2],
+                "v": [10.0, 20.0],
+                "pair": ["SOL/USD", "SOL/USD"],
+                "tf": ["1h", "1h"],
+            }
+        )
+        pq.write_table(table, tmp_path / "sol.parquet")
+        loader = ParquetCandleLoader(
+            tmp_path / "sol.parquet",
+            partitioning=None,
+            columns={
+                "timestamp": "ts",
+                "open": "o",
+                "high": "h",
+                "low": "l",
+                "close": "c",
+                "volume": "v",
+                "symbol": "pair",
+                "timeframe": "tf",
+            },
+        )
+
+        series = loader.read(start=datetime(1970, 1, 1, 1, tzinfo=UTC))
+
+        assert series["SOL/USD", Timeframe.H1]["close"].tolist() == [2.2]
+
+
+class TestDataLayerParquet:
+    """Tests for loading Parquet history through the data layer."""
+
+    @pytest.mark.asyncio
+    async def test_load_parquet_into_archive(self, tmp_path: Path) -> None:
+        """Test history lands in the archive and can be range-read."""
+        _write_dataset(tmp_path / "history")
+        layer = DataLayer(
+            DataLayerConfig(name="DataLayer", archive_path=str(tmp_path / "archive"))
+        )
+        await layer.initialize()
+
+        loaded = layer.load_parquet(str(tmp_path / "history"), symbols=["ETH/USD"])
+        history = layer.get_history("ETH/USD", Timeframe.H1)
+
+        assert loaded == 48 + 12
+        assert history is not None
+        assert len(history) == 48
+        assert CandleArchive(tmp_path / "archive").count("BTC/USD", Timeframe.H1) == 0
+
+    @pytest.mark.asyncio
+    async def test_load_parquet_validates_records(self, tmp_path: Path) -> None:
+        """Test the configured validator checks history before archiving."""
+        _write_dataset(tmp_path / "history", hours=8)
+        layer = DataLayer(
+            DataLayerConfig(
+                name="DataLayer",
+                archive_path=str(tmp_path / "archive"),
+                validation={},
+            )
+        )
+        await layer.initialize()
+
+        loaded = layer.load_parquet(str(tmp_path / "history"))
+
+        assert loaded == 2 * (8 + 2)
+        assert layer.validation_counters["checked"] == loaded
+        assert layer.validation_counters["rejected"] == 0
+
+    @pytest.mark.asyncio
+    async def test_requires_archive(self, tmp_path: Path) -> None:
+        """Test loading without an archive is rejected."""
+        layer = DataLayer()
+        await layer.initialize()
+
+        with pytest.raises(RuntimeError, match="archive_path"):
+            layer.load_parquet(str(tmp_path))
@@ -0,0 +1,236 @@
+"""Unit tests for the layer registry and processing chain."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from stratoquant_nexus import TradingEngine
+from stratoquant_nexus.engine import EngineConfig
+from stratoquant_nexus.layers.base import BaseLayer, LayerConfig, LayerLevel
+from stratoquant_nexus.layers.l0_data import OHLCV
+from stratoquant_nexus.layers.l1_signals import SignalType, TradingSignal
+from stratoquant_nexus.layers.registry import LayerRegistry
+from stratoquant_nexus.monitoring.latency import LatencyRecorder
+
+
+class RecordingLayer(BaseLayer):
+    """Layer that records its inputs and applies a transform."""
+
+    def __init__(self, config: LayerConfig, transform: Any = None) -> None:
+        """Initialize the recording layer."""
+        super().__init__(config)
+        self.inputs: list[Any] = []
+        self.transform = transform or (lambda data: data)
+
+    async def initialize(self) -> None:
+        """Initialize the layer."""
+        self._initialized = True
+
+    async def process(self, data: Any) -> Any:
+        """Record and transform the input."""
+        self.inputs.append(data)
+        return self.transform(data)
+
+    async def shutdown(self) -> None:
+        """Shut down the layer."""
+        self._initialized = False
+
+
+def _layer(name: str, level: int, transform: Any = None, **kwargs: Any) -> Any:
+    """Create a recording layer."""
+    return RecordingLayer(LayerConfig(name=name, level=level, **kwargs), transform)
+
+
+class TestLayerRegistry:
+    """Tests for the LayerRegistry class."""
+
+    @pytest.mark.asyncio
+    async def test_chain_order(self) -> None:
+        """Test layers run by level, then order, feeding each other."""
+        registry = LayerRegistry()
+        registry.register(_layer("late", 42, lambda d: d + ["late"]))
+        registry.register(_layer("first", 0, lambda d: d + ["first"]))
+        registry.register(_layer("second", 0, lambda d: d + ["second"], order=1))
+        results: dict[str, list[Any]] = {}
+
+        await registry.run([], results, LatencyRecorder())
+
+        assert [layer.name for layer in registry] == ["first", "second", "late"]
+        assert results["late"] == ["first", "second", "late"]
+
+    @pytest.mark.asyncio
+    async def test_short_circuits_on_empty_output(self) -> None:
+        """Test downstream layers are skipped once a stage yields nothing."""
+        registry = LayerRegistry()
+        registry.register(_layer("filter", 1, lambda d: []))
+        downstream = _layer("downstream", 2)
+        registry.register(downstream)
+        results: dict[str, list[Any]] = {}
+
+        await registry.run([1, 2], results, LatencyRecorder())
+
+        assert results == {"filter": []}
+        assert downstream.inputs == []
+
+    @pytest.mark.asyncio
+    async def test_independent_layers_run_concurrently(self) -> None:
+        """Test independent layers overlap and do not feed the chain."""
+        started = asyncio.Event()
+
+        class WaitingLayer(RecordingLayer):
+            async def process(self, data: Any) -> Any:
+                await asyncio.wait_for(started.wait(), timeout=1)
+                return ["waited"]
+
+        class SignallingLayer(RecordingLayer):
+            async def process(self, data: Any) -> Any:
+                started.set()
+                return ["signalled"]
+
+        registry = LayerRegistry()
+        registry.register(_layer("main", 5, lambda d: d + ["main"]))
+        registry.register(
+            WaitingLayer(LayerConfig(name="tap_a", level=5, independent=True))
+        )
+        registry.register(
+            SignallingLayer(LayerConfig(name="tap_b", level=5, independent=True))
+        )
+        after = _layer("after", 6)
+        registry.register(after)
+        results: dict[str, list[Any]] = {}
+
+        await registry.run(["in"], results, LatencyRecorder())
+
+        assert results["tap_a"] == ["waited"]
+        assert results["tap_b"] == ["signalled"]
+        assert after.inputs == [["in", "main"]]
+
+    def test_register_conflicts(self) -> None:
+        """Test duplicate names and two chained layers in one stage fail."""
+        registry = LayerRegistry()
+        registry.register(_layer("a", 4))
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register(_layer("a", 5))
+        with pytest.raises(ValueError, match="both feed stage L4.0"):
+            registry.register(_layer("b", 4))
+        registry.register(_layer("c", 4, independent=True))
+        assert registry.unregister("a").name == "a"
+        assert "a" not in registry
+        assert len(registry) == 1
+
+    def test_disabled_layers_are_skipped(self) -> None:
+        """Test disabled layers stay registered but out of the chain."""
+        registry = LayerRegistry()
+        registry.register(_layer("off", 4, enabled=False))
+
+        assert registry.get("off") is not None
+        assert registry.stages == ()
+
+
+class TestLayerInitialization:
+    """Tests for dependency-aware concurrent initialization."""
+
+    @pytest.mark.asyncio
+    async def test_waves_respect_dependencies(self) -> None:
+        """Test independent layers initialize together, dependents after."""
+        registry = LayerRegistry()
+        registry.register(_layer("cache", 0))
+        registry.register(_layer("feed", 1))
+        registry.register(_layer("model", 2, depends_on=["cache", "feed"]))
+        registry.register(_layer("router", 3, depends_on=["model"]))
+
+        waves = registry.initialization_waves()
+        await registry.initialize()
+
+        assert [[layer.name for layer in wave] for wave in waves] == [
+            ["cache", "feed"],
+            ["model"],
+            ["router"],
+        ]
+        assert all(layer._initialized for layer in registry)
+
+    @pytest.mark.asyncio
+    async def test_initializes_concurrently(self) -> None:
+        """Test a wave's layers overlap instead of running one by one."""
+        running: list[str] = []
+        overlap: list[int] = []
+
+        class SlowLayer(RecordingLayer):
+            async def initialize(self) -> None:
+                running.append(self.name)
+                await asyncio.sleep(0.01)
+                overlap.append(len(running))
+                running.remove(self.name)
+
+        registry = LayerRegistry()
+        for level in range(3):
+            registry.register(SlowLayer(LayerConfig(name=f"L{level}", level=level)))
+
+        await registry.initialize()
+
+        assert max(overlap) == 3
+
+    def test_bad_dependencies(self) -> None:
+        """Test unknown and circular dependencies are rejected."""
+        registry = LayerRegistry()
+        registry.register(_layer("a", 4, depends_on=["b"]))
+        with pytest.raises(ValueError, match="unknown layer b"):
+            registry.initialization_waves()
+
+        registry.register(_layer("b", 5, depends_on=["a"]))
+        with pytest.raises(ValueError, match="Circular"):
+            registry.initialization_waves()
+
+
+class TestEngineLayerChain:
+    """Tests for custom layers in the TradingEngine."""
+
+    @pytest.mark.asyncio
+    async def test_guard_between_signals_and_risk(
+        self, sample_candles: list[OHLCV]
+    ) -> None:
+        """Test an inserted guard filters signals before the risk layer."""
+        guard = _layer(
+            "MicrostructureGuard",
+            LayerLevel.SIGNALS,
+            lambda signals: [],
+            order=1,
+        )
+        guard.result_key = "guarded_signals"
+        engine = TradingEngine()
+        engine.add_layer(guard)
+        await engine.start()
+
+        results = await engine.process_cycle(sample_candles)
+        health = await engine.health_check()
+        with pytest.raises(RuntimeError, match="while the engine is running"):
+            engine.add_layer(_layer("late", 50))
+        await engine.stop()
+
+        assert len(guard.inputs) == 1
+        assert results["guarded_signals"] == []
+        assert results["risk_assessments"] == []
+        assert results["execution_reports"] == []
+        assert health["MicrostructureGuard"]
+        assert engine.status.layers_initialized == 5
+
+    @pytest.mark.asyncio
+    async def test_process_signals_skips_upstream(
+        self, sample_buy_signal: TradingSignal
+    ) -> None:
+        """Test externally produced signals start the chain at the risk layer."""
+        engine = TradingEngine(
+            EngineConfig(enable_data_layer=False, enable_signal_layer=False)
+        )
+        await engine.start()
+
+        results = await engine.process_signals([sample_buy_signal])
+        empty = await engine.process_signals([])
+        await engine.stop()
+
+        assert sample_buy_signal.signal_type == SignalType.BUY
+        assert len(results["risk_assessments"]) == 1
+        assert empty["risk_assessments"] == []
+        assert engine.status.signals_generated == 1
@@ -0,0 +1,167 @@
+"""Unit tests for cycle record/replay."""
+
+import zlib
+from collections.abc import Callable
+from datetime import UTC
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from stratoquant_nexus import TradingEngine
+from stratoquant_nexus.engine import EngineConfig
+from stratoquant_nexus.layers.l0_aggregation import TradeBatch
+from stratoquant_nexus.layers.l0_data import (
+    OHLCV,
+    BarSpec,
+    BarType,
+    DataLayerConfig,
+)
+from stratoquant_nexus.layers.l2_risk import RiskLayerConfig
+from stratoquant_nexus.replay import CycleRecorder, CycleReplayer
+from stratoquant_nexus.replay.format import MAGIC, decode_block, encode_block
+
+
+@pytest.fixture
+def cycles(candle_series: Callable[..., list[OHLCV]]) -> list[list[OHLCV]]:
+    """Create a few cycles of two-symbol input."""
+    return [
+        candle_series("BTC/USD", 30, offset) + candle_series("ETH/USD", -30, offset)
+        for offset in (0, 50, 100)
+    ]
+
+
+async def _record(path: Path, cycles: list[list[OHLCV]]) -> list[dict]:
+    """Run the sample cycles through a recording engine."""
+    engine = TradingEngine(EngineConfig(record_path=str(path)))
+    await engine.start()
+    try:
+        return [await engine.process_cycle(candles) for candles in cycles]
+    finally:
+        await engine.stop()
+
+
+class TestFormat:
+    """Tests for the columnar block encoding."""
+
+    def test_block_round_trip(self, sample_candles: list[OHLCV]) -> None:
+        """Test candles and rows survive encoding, including aware timestamps."""
+        aware = [
+            c.model_copy(update={"timestamp": c.timestamp.replace(tzinfo=UTC)})
+            for c in sample_candles[:3]
+        ]
+        report = ("BTC/USD", "buy", "0.5", "filled", "0.5", "40000", 1)
+        block = encode_block([(sample_candles, [], [], []), (aware, [], [], [report])])
+
+        cycles = decode_block(zlib.decompress(block[8:]), first_index=10)
+
+        assert [c.index for c in cycles] == [10, 11]
+        assert cycles[0].candles == sample_candles
+        assert cycles[1].candles == aware
+        assert cycles[1].reports == [report]
+        assert cycles[0].signals == []
+
+
+class TestCycleReplayer:
+    """Tests for recording and replaying engine cycles."""
+
+    @pytest.mark.asyncio
+    async def test_replay_reproduces_recording(
+        self, tmp_path: Path, cycles: list[list[OHLCV]]
+    ) -> None:
+        """Test a replay into a fresh engine matches the recorded outputs."""
+        path = tmp_path / "cycles.sqrc"
+        recorded = await _record(path, cycles)
+
+        replayer = CycleReplayer(path)
+        engine = TradingEngine()
+        await engine.start()
+        result = await replayer.replay(engine)
+        await engine.stop()
+
+        assert sum(len(r["signals"]) for r in recorded) > 0
+        assert [c.candles for c in replayer.cycles()] == cycles
+        assert result.cycles == 3
+        assert result.matched, result.diffs
+        assert result.cycles_per_second > 0
+
+    @pytest.mark.asyncio
+    async def test_replay_detects_behaviour_change(
+        self, tmp_path: Path, cycles: list[list[OHLCV]]
+    ) -> None:
+        """Test a changed risk configuration shows up as a diff."""
+        path = tmp_path / "cycles.sqrc"
+        await _record(path, cycles)
+
+        engine = TradingEngine(
+            EngineConfig(
+                risk_config=RiskLayerConfig(
+                    name="RiskLayer", min_risk_reward_ratio=100.0
+                )
+            )
+        )
+        await engine.start()
+        result = await CycleReplayer(path).replay(engine, max_diffs=1)
+        await engine.stop()
+
+        assert not result.matched
+        assert len(result.diffs) == 1
+        assert result.diffs[0].layer == "risk_assessments"
+
+    @pytest.mark.asyncio
+    async def test_records_data_layer_output(self, tmp_path: Path) -> None:
+        """Test trade input is captured as the bars the data layer built."""
+        path = tmp_path / "cycles.sqrc"
+        config = EngineConfig(
+            record_path=str(path),
+            data_config=DataLayerConfig(
+                name="DataLayer",
+                trade_bars=BarSpec(bar_type=BarType.TICK, threshold=10),
+            ),
+        )
+        engine = TradingEngine(config)
+        await engine.start()
+        recorded = []
+        for offset in (0, 1):
+            trades = np.arange(100) + offset * 100
+            batch = TradeBatch(
+                "BTC/USD", trades * 1_000_000, 1000.0 + trades * 3, np.ones(100)
+            )
+            recorded.append(await engine.process_cycle(batch))
+        await engine.stop()
+
+        cycles = list(CycleReplayer(path).cycles())
+        replay_engine = TradingEngine(config.model_copy(update={"record_path": None}))
+        await replay_engine.start()
+        result = await CycleReplayer(path).replay(replay_engine)
+        await replay_engine.stop()
+
+        assert [len(c.candles) for c in cycles] == [10, 10]
+        assert cycles[1].candles == recorded[1]["market_data"][0].candles
+        assert result.matched, result.diffs[:3]
+
+    @pytest.mark.asyncio
+    async def test_truncated_tail_is_ignored(
+        self, tmp_path: Path, cycles: list[list[OHLCV]]
+    ) -> None:
+        """Test a capture torn mid-block still replays its complete blocks."""
+        path = tmp_path / "cycles.sqrc"
+        recorder = CycleRecorder(path, block_cycles=1)
+        recorder.open()
+        for candles in cycles:
+            recorder.record(candles, {})
+        recorder.close()
+        path.write_bytes(path.read_bytes()[:-5])
+
+        replayed = list(CycleReplayer(path).cycles())
+
+        assert recorder.cycles_recorded == 3
+        assert [c.index for c in replayed] == [0, 1]
+
+    def test_rejects_foreign_file(self, tmp_path: Path) -> None:
+        """Test files without the capture header are refused."""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not" + MAGIC)
+
+        with pytest.raises(ValueError, match="Not a StratoQuant cycle capture"):
+            list(CycleReplayer(path).cycles())
@@ -0,0 +1,179 @@
+"""Unit tests for multi-timeframe resampling."""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from stratoquant_nexus.layers.l0_data import (
+    OHLCV,
+    DataLayer,
+    DataLayerConfig,
+    MarketData,
+    Timeframe,
+)
+from stratoquant_nexus.layers.l0_resample import BarResampler, period_start
+from stratoquant_nexus.layers.l1_signals import SignalLayer
+
+START = datetime(2024, 1, 1, tzinfo=UTC)  # A Monday
+
+
+def _minutes(count: int, offset: int = 0, symbol: str = "BTC/USD") -> list[OHLCV]:
+    """Create rising one-minute candles."""
+    return [
+        OHLCV(
+            timestamp=START + timedelta(minutes=offset + i),
+            open=Decimal(100 + offset + i),
+            high=Decimal(102 + offset + i),
+            low=Decimal(99 + offset + i),
+            close=Decimal(101 + offset + i),
+            volume=Decimal("2"),
+            symbol=symbol,
+            timeframe=Timeframe.M1,
+        )
+        for i in range(count)
+    ]
+
+
+class TestBarResampler:
+    """Tests for BarResampler."""
+
+    def test_builds_closed_bars(self) -> None:
+        """Test bars close on their last base candle with aggregated values."""
+        resampler = BarResampler(Timeframe.M1, [Timeframe.M5, Timeframe.M15])
+
+        closed = resampler.update_many(_minutes(15))
+
+        assert [(b.timeframe, b.timestamp.minute) for b in closed] == [
+            (Timeframe.M5, 0),
+            (Timeframe.M5, 5),
+            (Timeframe.M5, 10),
+            (Timeframe.M15, 0),
+        ]
+        first = closed[0]
+        assert (first.open, first.high, first.low, first.close) == (
+            Decimal(100),
+            Decimal(106),
+            Decimal(99),
+            Decimal(105),
+        )
+        assert first.volume == Decimal("10")
+        assert closed[-1].close == Decimal(115)
+        assert resampler.partial("BTC/USD", Timeframe.M5) is None
+
+    def test_partial_bar_and_gap(self) -> None:
+        """Test a partial bar is visible and a gap closes it early."""
+        resampler = BarResampler(Timeframe.M1, [Timeframe.M5])
+
+        assert resampler.update_many(_minutes(3)) == []
+        partial = resampler.partial("BTC/USD", Timeframe.M5)
+        closed = resampler.update_many(_minutes(1, offset=7))
+
+        assert partial is not None
+        assert partial.close == Decimal(103)
+        assert len(closed) == 1
+        assert closed[0].close == Decimal(103)
+        assert closed[0].volume == Decimal("6")
+
+    def test_late_candles_are_dropped(self) -> None:
+        """Test candles from a closed period are ignored."""
+        resampler = BarResampler(Timeframe.M1, [Timeframe.M5])
+        resampler.update_many(_minutes(6))
+
+        closed = resampler.update_many(_minutes(1, offset=2) + _minutes(4, offset=6))
+
+        assert len(closed) == 1
+        assert closed[0].open == Decimal(105)
+
+    def test_symbols_are_independent(self) -> None:
+        """Test each symbol keeps its own partial bars."""
+        resampler = BarResampler(Timeframe.M1, [Timeframe.M5])
+
+        closed = resampler.update_many(_minutes(5) + _minutes(3, symbol="ETH/USD"))
+
+        assert [b.symbol for b in closed] == ["BTC/USD"]
+        assert resampler.partial("ETH/USD", Timeframe.M5) is not None
+
+    def test_rejects_unbuildable_targets(self) -> None:
+        """Test targets must be higher multiples of the base timeframe."""
+        with pytest.raises(ValueError, match="Cannot build 1m"):
+            BarResampler(Timeframe.M5, [Timeframe.M1])
+
+    def test_weeks_start_on_monday(self) -> None:
+        """Test weekly periods are aligned to Monday midnight UTC."""
+        wednesday = int((START + timedelta(days=2, hours=5)).timestamp())
+
+        assert period_start(wednesday, Timeframe.W1) == int(START.timestamp())
+        assert period_start(wednesday, Timeframe.H4) == wednesday - 3600
+
+
+class TestDataLayerResampling:
+    """Tests for resampling through the data and signal layers."""
+
+    @pytest.mark.asyncio
+    async def test_closed_bars_reach_signal_layer(self) -> None:
+        """Test one minute feed produces higher-timeframe bars and signals."""
+        data_layer = DataLayer(
+            DataLayerConfig(
+                name="DataLayer",
+                timeframes=[Timeframe.M1, Timeframe.M5],
+                resample_from=Timeframe.M1,
+            )
+        )
+        signal_layer = SignalLayer()
+
+        signals = []
+        for offset in range(0, 15, 5):
+            market_data = await data_layer.process(_minutes(5, offset=offset))
+            signals = await signal_layer.process(market_data)
+
+        assert [b.timeframe for b in market_data.closed_bars] == [Timeframe.M5]
+        stored = data_layer.get_market_data("BTC/USD")
+        assert stored is not None
+        assert len([c for c in stored.candles if c.timeframe == Timeframe.M5]) == 3
+        bar_signals = [s for s in signals if s.indicators.get("timeframe") == "5m"]
+        assert len(bar_signals) == 1
+        assert bar_signals[0].price == Decimal(115)
+
+    @pytest.mark.asyncio
+    async def test_signal_layer_keeps_closed_bars(self) -> None:
+        """Test closed-bar windows follow the config and survive a restart."""
+        from stratoquant_nexus.checkpoint import Checkpoint, CheckpointWriter
+
+        layer = SignalLayer()
+        for i in range(4):
+            bar = _minutes(1, offset=5 * i)[0]
+            await layer.process(
+                MarketData(
+                    closed_bars=[bar.model_copy(update={"timeframe": Timeframe.M5})]
+                )
+            )
+        config = layer.config.model_copy(update={"sma_long_period": 3})
+        layer.reconfigure(config, {"sma_long_period"})
+        writer = CheckpointWriter()
+        layer.save_checkpoint(writer)
+
+        restored = SignalLayer(config)  # type: ignore[arg-type]
+        restored.load_checkpoint(Checkpoint(writer.to_bytes()))
+
+        history = restored._closed_bars["BTC/USD", Timeframe.M5]
+        assert history.maxlen == 3
+        assert [b.close for b in history] == [Decimal(106), Decimal(111), Decimal(116)]
+        assert history == layer._closed_bars["BTC/USD", Timeframe.M5]
+
+    @pytest.mark.asyncio
+    async def test_reconfigure_retargets(self) -> None:
+        """Test changing timeframes keeps the resampler in step."""
+        layer = DataLayer(
+            DataLayerConfig(
+                name="DataLayer",
+                timeframes=[Timeframe.M1, Timeframe.M5],
+                resample_from=Timeframe.M1,
+            )
+        )
+        config = layer.config.model_copy(update={"timeframes": [Timeframe.M15]})
+
+        layer.reconfigure(config, {"timeframes"})
+        market_data = await layer.process(_minutes(15))
+
+        assert [b.timeframe for b in market_data.closed_bars] == [Timeframe.M15]
@@ -17,6 +17,7 @@ from stratoquant_nexus.layers.l2_risk import (
     RiskLayerConfig,
     RiskLevel,
 )
+from stratoquant_nexus.layers.l3_models import ExecutionReport, Order, OrderSide
 
 
 class TestRiskLayer:
@@ -126,6 +127,37 @@ class TestRiskLayer:
 
         assert risk_layer._portfolio_value == Decimal("500000")
 
+    def test_fills_update_restored_exposure(self, risk_layer: RiskLayer) -> None:
+        """Test exposure follows fills after positions are restored."""
+        risk_layer.restore_positions(
+            {
+                "BTC/USD": PositionSize(
+                    symbol="BTC/USD",
+                    units=Decimal("2"),
+                    notional_value=Decimal("200"),
+                    risk_amount=Decimal("10"),
+                    stop_loss_price=Decimal("95"),
+                    take_profit_price=Decimal("110"),
+                    risk_reward_ratio=2.0,
+                )
+            }
+        )
+
+        def report(side: OrderSide, quantity: str, price: str) -> ExecutionReport:
+            order = Order(symbol="BTC/USD", side=side, quantity=Decimal(quantity))
+            order.filled_quantity = order.quantity
+            order.average_price = Decimal(price)
+            return ExecutionReport(order=order, success=True, message="Filled")
+
+        risk_layer.apply_fills([report(OrderSide.SELL, "1", "120")])
+        position = risk_layer.active_positions["BTC/USD"]
+        assert position.units == Decimal("1")
+        assert risk_layer.current_exposure == Decimal("100.00")
+
+        risk_layer.apply_fills([report(OrderSide.SELL, "1", "120")])
+        assert "BTC/USD" not in risk_layer.active_positions
+        assert risk_layer.current_exposure == Decimal("0")
+
 
 class TestPositionSize:
     """Tests for the PositionSize model."""
@@ -0,0 +1,152 @@
+"""Unit tests for the sharded multi-process engine."""
+
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime
+from decimal import Decimal
+
+import pytest
+
+from stratoquant_nexus import TradingEngine
+from stratoquant_nexus.layers.l0_data import OHLCV
+from stratoquant_nexus.layers.l1_signals import TradingSignal
+from stratoquant_nexus.sharding import (
+    ShardedEngineConfig,
+    ShardedTradingEngine,
+    ShardError,
+    shard_for,
+)
+from stratoquant_nexus.sharding import engine as sharding_engine
+from stratoquant_nexus.sharding.codec import (
+    decode_candles,
+    decode_signals,
+    encode_candles,
+    encode_signals,
+)
+
+
+class TestCodec:
+    """Tests for the shard IPC encoding."""
+
+    def test_candle_round_trip(self, sample_candles: list[OHLCV]) -> None:
+        """Test candles survive encoding exactly, including naive timestamps."""
+        decoded = decode_candles(memoryview(encode_candles(sample_candles)))
+
+        assert decoded == sample_candles
+
+    def test_signal_round_trip(self, sample_buy_signal: TradingSignal) -> None:
+        """Test signals survive encoding exactly."""
+        signal = sample_buy_signal.model_copy(
+            update={
+                "timestamp": datetime(2024, 5, 1, 12, 30, 0, 123456, tzinfo=UTC),
+                "indicators": {"rsi": 35.5, "regime": "trend"},
+            }
+        )
+
+        decoded = decode_signals(memoryview(encode_signals([signal])))
+
+        assert decoded == [signal]
+
+
+class TestShardRouting:
+    """Tests for symbol partitioning."""
+
+    def test_shard_for_is_stable(self) -> None:
+        """Test routing is deterministic and in range."""
+        assert shard_for("BTC/USD", 4) == shard_for("BTC/USD", 4)
+        assert all(0 <= shard_for(f"S{i}", 3) < 3 for i in range(50))
+
+    def test_partition_keeps_symbols_together(
+        self, candle_series: Callable[..., list[OHLCV]]
+    ) -> None:
+        """Test all candles of a symbol go to one shard in order."""
+        engine = ShardedTradingEngine(ShardedEngineConfig(num_shards=3))
+        candles = candle_series("BTC/USD", 30) + candle_series("ETH/USD", -30)
+
+        batches = engine.partition(candles)
+
+        for symbol in ("BTC/USD", "ETH/USD"):
+            batch = batches[engine.shard_for(symbol)]
+            assert [c for c in batch if c.symbol == symbol] == [
+                c for c in candles if c.symbol == symbol
+            ]
+
+
+class TestShardedTradingEngine:
+    """Tests for the ShardedTradingEngine class."""
+
+    @pytest.mark.asyncio
+    async def test_matches_single_process_engine(
+        self, candle_series: Callable[..., list[OHLCV]]
+    ) -> None:
+        """Test sharded cycles produce the same signals and orders."""
+        candles = (
+            candle_series("BTC/USD", 30)
+            + candle_series("ETH/USD", -30)
+            + candle_series("SOL/USD", 1)
+        )
+        single = TradingEngine()
+        await single.start()
+        expected = await single.process_cycle(candles)
+        await single.stop()
+
+        sharded = ShardedTradingEngine(ShardedEngineConfig(num_shards=2))
+        await sharded.start()
+        try:
+            health = await sharded.health_check()
+            results = await sharded.process_cycle(candles)
+            second = await sharded.process_cycle(candles)
+        finally:
+            await sharded.stop()
+
+        def key(signal: TradingSignal) -> tuple[str, str, Decimal]:
+            return signal.symbol, signal.signal_type.value, signal.price
+
+        assert all(health.values())
+        assert sorted(map(key, results["signals"])) == sorted(
+            map(key, expected["signals"])
+        )
+        assert len(results["execution_reports"]) == len(expected["execution_reports"])
+        assert len(second["signals"]) == len(results["signals"])
+        assert sharded.status.signals_generated == 2 * len(results["signals"])
+        assert not sharded.is_running
+
+    @pytest.mark.asyncio
+    async def test_shard_error_drains_other_shards(
+        self,
+        candle_series: Callable[..., list[OHLCV]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a failing shard leaves no reader behind and pipes in step."""
+        candles = candle_series("BTC/USD", 30) + candle_series("ETH/USD", -30)
+        assert shard_for("BTC/USD", 2) != shard_for("ETH/USD", 2)
+
+        def encode(batch: list[OHLCV]) -> bytes:
+            if batch[0].symbol == "BTC/USD":
+                return b"corrupt"
+            return encode_candles(batch)
+
+        sharded = ShardedTradingEngine(ShardedEngineConfig(num_shards=2))
+        await sharded.start()
+        try:
+            with monkeypatch.context() as patch:
+                patch.setattr(sharding_engine, "encode_candles", encode)
+                with pytest.raises(ShardError):
+                    await sharded.process_cycle(candles)
+            leftover = [
+                t for t in asyncio.all_tasks() if t is not asyncio.current_task()
+            ]
+            results = await sharded.process_cycle(candles)
+        finally:
+            await sharded.stop()
+
+        assert leftover == []
+        assert {s.symbol for s in results["signals"]} == {"BTC/USD", "ETH/USD"}
+
+    @pytest.mark.asyncio
+    async def test_not_running(self) -> None:
+        """Test cycles are refused before start()."""
+        engine = ShardedTradingEngine(ShardedEngineConfig(num_shards=1))
+
+        with pytest.raises(RuntimeError, match="Engine is not running"):
+            await engine.process_cycle([])
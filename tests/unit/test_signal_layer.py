@@ -76,6 +76,21 @@ class TestSignalLayer:
 
         await signal_layer.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_keeps_only_latest_signal_per_symbol(
+        self, signal_layer: SignalLayer, sample_market_data: MarketData
+    ) -> None:
+        """Test repeated cycles do not grow the retained signal history."""
+        await signal_layer.initialize()
+        for _ in range(50):
+            signals = await signal_layer.process(sample_market_data)
+        assert signals
+
+        assert set(signal_layer._signals) == {s.symbol for s in signals}
+        assert signal_layer.get_latest_signal(signals[-1].symbol) is signals[-1]
+
+        await signal_layer.shutdown()
+
     @pytest.mark.asyncio
     async def test_rsi_calculation(
         self, signal_layer: SignalLayer, sample_candles: list[OHLCV]
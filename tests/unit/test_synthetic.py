@@ -0,0 +1,121 @@
+"""Unit tests for the synthetic market data generator."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from stratoquant_nexus.layers.l0_data import DataLayer, Timeframe
+from stratoquant_nexus.pine_executor.webhook import WebhookServer
+from stratoquant_nexus.synthetic import (
+    SyntheticBars,
+    SyntheticConfig,
+    SyntheticMarket,
+    crossover_alerts,
+)
+
+
+def _generate(**kwargs: object) -> SyntheticBars:
+    """Generate bars with a fixed seed."""
+    return SyntheticMarket(SyntheticConfig(seed=42, **kwargs)).generate()
+
+
+class TestSyntheticMarket:
+    """Tests for SyntheticMarket."""
+
+    def test_deterministic_with_seed(self) -> None:
+        """Test the same seed gives the same bars."""
+        first = _generate(symbols=3, bars=50, model="regime")
+        second = _generate(symbols=3, bars=50, model="regime")
+
+        np.testing.assert_array_equal(first.close, second.close)
+        np.testing.assert_array_equal(first.volume, second.volume)
+
+    def test_shape_and_invariants(self) -> None:
+        """Test every bar is present in time order with consistent prices."""
+        bars = _generate(symbols=4, bars=100, timeframe=Timeframe.M5)
+
+        assert len(bars) == 400
+        assert bars.symbols[0] == "SYN0000/USD"
+        assert np.all(np.diff(bars.timestamp) >= 0)
+        assert np.all(np.diff(np.unique(bars.timestamp)) == 300_000_000)
+        assert np.all(bars.low <= np.minimum(bars.open, bars.close))
+        assert np.all(bars.high >= np.maximum(bars.open, bars.close))
+        assert np.all(bars.volume > 0)
+
+    def test_regime_switching_changes_volatility(self) -> None:
+        """Test regime paths mix calm and volatile stretches."""
+        bars = _generate(
+            symbols=1,
+            bars=2000,
+            model="regime",
+            regimes=[(0.0, 0.001), (0.0, 0.05)],
+            regime_switch_probability=0.02,
+        )
+
+        moves = np.abs(np.diff(np.log(bars.close)))
+        assert np.quantile(moves, 0.9) > 10 * np.quantile(moves, 0.1)
+
+    def test_gaps_and_out_of_order(self) -> None:
+        """Test gaps drop bars and late bars arrive after their successor."""
+        bars = _generate(
+            symbols=5, bars=200, gap_probability=0.1, out_of_order_probability=0.1
+        )
+
+        assert 800 < len(bars) < 950
+        for index in range(5):
+            timestamps = bars.timestamp[bars.symbol == index]
+            assert np.any(np.diff(timestamps) < 0)
+            assert len(np.unique(timestamps)) == len(timestamps)
+
+
+class TestSyntheticBars:
+    """Tests for SyntheticBars conversions."""
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        """Test the npz round trip."""
+        bars = _generate(symbols=2, bars=20)
+        path = tmp_path / "bars.npz"
+
+        bars.save(path)
+        loaded = SyntheticBars.load(path)
+
+        assert loaded.symbols == bars.symbols
+        assert loaded.timeframe == Timeframe.H1
+        np.testing.assert_array_equal(loaded.timestamp, bars.timestamp)
+        np.testing.assert_array_equal(loaded.high, bars.high)
+
+    @pytest.mark.asyncio
+    async def test_store_into_data_layer(self) -> None:
+        """Test bars fill the data layer's candle history."""
+        layer = DataLayer()
+        bars = _generate(symbols=3, bars=30)
+
+        stored = bars.store_into(layer)
+
+        assert stored == 90
+        market_data = layer.get_market_data("SYN0001/USD")
+        assert market_data is not None
+        assert len(market_data.candles) == 30
+        candle = market_data.candles[-1]
+        assert candle.timeframe == Timeframe.H1
+        assert candle.low <= candle.close <= candle.high
+        assert str(candle.close) == f"{bars.close[bars.symbol == 1][-1]:.2f}"
+
+
+class TestCrossoverAlerts:
+    """Tests for the synthetic alert stream."""
+
+    def test_alerts_parse_as_webhooks(self) -> None:
+        """Test alerts are time ordered and accepted by the webhook parser."""
+        bars = _generate(symbols=3, bars=300)
+
+        alerts = crossover_alerts(bars)
+        server = WebhookServer()
+        parsed = [server.parse_alert(alert) for alert in alerts]
+
+        assert alerts
+        assert [a["time"] for a in alerts] == sorted(a["time"] for a in alerts)
+        assert {p.symbol for p in parsed} <= set(bars.symbols)
+        assert {p.alert_type.value for p in parsed} <= {"long_entry", "short_entry"}
+        assert len({p.alert_id for p in parsed}) == len(parsed)
@@ -0,0 +1,239 @@
+"""Unit tests for candle validation."""
+
+import math
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from stratoquant_nexus.layers.l0_data import (
+    OHLCV,
+    DataLayer,
+    DataLayerConfig,
+    Timeframe,
+    ValidationAction,
+    ValidationSpec,
+)
+from stratoquant_nexus.layers.l0_validation import CandleValidator
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _candle(
+    minute: int,
+    close: float = 100.0,
+    high: float | None = None,
+    low: float | None = None,
+    volume: str = "1",
+    symbol: str = "BTC/USD",
+) -> OHLCV:
+    """Create a one-minute candle opening and closing at the same price."""
+    return OHLCV(
+        timestamp=START + timedelta(minutes=minute),
+        open=Decimal(repr(close)),
+        high=Decimal(repr(close + 0.5 if high is None else high)),
+        low=Decimal(repr(close - 0.5 if low is None else low)),
+        close=Decimal(repr(close)),
+        volume=Decimal(volume),
+        symbol=symbol,
+        timeframe=Timeframe.M1,
+    )
+
+
+def _walk(count: int, offset: int = 0) -> list[OHLCV]:
+    """Create candles alternating 0.1% up and down."""
+    return [
+        _candle(offset + i, 100.0 * (1.001 if i % 2 else 1.0)) for i in range(count)
+    ]
+
+
+def _validator(action: str) -> CandleValidator:
+    """Create a validator with the given action."""
+    return CandleValidator(ValidationSpec(action=ValidationAction(action)))
+
+
+class TestCandleValidator:
+    """Tests for CandleValidator."""
+
+    def test_valid_batch_passes(self) -> None:
+        """Test clean candles pass through unchanged."""
+        validator = _validator("reject")
+        candles = _walk(30)
+
+        accepted, flagged = validator.validate(candles)
+
+        assert accepted == candles
+        assert flagged == []
+        assert validator.counters["checked"] == 30
+        assert validator.counters["rejected"] == 0
+
+    def test_reject_inconsistent_and_invalid(self) -> None:
+        """Test broken candles are dropped and counted."""
+        validator = _validator("reject")
+        batch = [
+            _candle(0),
+            _candle(1, high=99.0),  # High below the close
+            _candle(2, volume="-1"),
+            _candle(3, low=0.0),
+            _candle(4),
+        ]
+
+        accepted, _ = validator.validate(batch)
+
+        assert [c.timestamp.minute for c in accepted] == [0, 4]
+        assert validator.counters["ohlc"] == 1
+        assert validator.counters["invalid"] == 2
+        assert validator.counters["rejected"] == 3
+        # The dropped candles leave a gap
+        assert validator.counters["gap"] == 1
+
+    def test_repair_widens_high_and_low(self) -> None:
+        """Test repair rebuilds the range instead of dropping the candle."""
+        validator = _validator("repair")
+
+        accepted, _ = validator.validate([_candle(0, high=99.5, low=99.0)])
+
+        assert accepted[0].high == Decimal("100.0")
+        assert accepted[0].low == Decimal("99.0")
+        assert validator.counters["repaired"] == 1
+
+    def test_duplicates_and_out_of_order(self) -> None:
+        """Test ordering checks across batches under each action."""
+        batch = [_candle(0), _candle(2), _candle(1), _candle(2, close=101.0)]
+
+        reject = _validator("reject")
+        assert [c.timestamp.minute for c in reject.validate(batch)[0]] == [0, 2]
+        # An earlier batch's timestamps stay covered
+        assert reject.validate([_candle(2), _candle(3)])[0] == [_candle(3)]
+        assert reject.counters["duplicate"] == 2
+        assert reject.counters["out_of_order"] == 1
+
+        repair = _validator("repair")
+        repaired = repair.validate(batch)[0]
+        assert [c.timestamp.minute for c in repaired] == [0, 1, 2]
+        assert repaired[-1].close == Decimal("101.0")  # Last revision wins
+        assert repair.counters["repaired"] == 1
+        assert repair.counters["rejected"] == 1
+
+        flag = _validator("flag")
+        accepted, flagged = flag.validate(batch)
+        assert accepted == batch
+        assert flagged == batch[1:]  # The first minute 2 follows a gap
+
+    def test_spike_rejected_without_flagging_the_reversal(self) -> None:
+        """Test a one-candle spike is caught and the way back is not."""
+        validator = _validator("reject")
+        validator.validate(_walk(30))
+        batch = _walk(5, offset=30)
+        batch[2] = _candle(32, close=150.0, high=150.5)
+
+        accepted, _ = validator.validate(batch)
+
+        assert [c.timestamp.minute for c in accepted] == [30, 31, 33, 34]
+        assert validator.counters["spike"] == 1
+
+    def test_spike_needs_history(self) -> None:
+        """Test spikes are not judged before enough returns are seen."""
+        validator = _validator("flag")
+
+        _, flagged = validator.validate([_candle(0), _candle(1, close=150.0)])
+
+        assert flagged == []
+
+    def test_symbols_are_independent(self) -> None:
+        """Test ordering is checked per symbol."""
+        validator = _validator("reject")
+
+        accepted, _ = validator.validate(
+            [_candle(1), _candle(0, symbol="ETH/USD"), _candle(2)]
+        )
+
+        assert len(accepted) == 3
+
+    def test_check_columns(self) -> None:
+        """Test validating columns without candle models."""
+        validator = _validator("reject")
+        prices = np.array([100.0, math.nan, 100.0])
+
+        order, issues = validator.check(
+            [("BTC/USD", Timeframe.M1)] * 3,
+            np.array([0, 60, 120]) * 1_000_000,
+            prices,
+            prices + 1,
+            prices - 1,
+            prices,
+            np.ones(3),
+        )
+
+        assert order.tolist() == [0, 2]
+        assert issues.tolist() == [0, 1, 16]  # Dropping the NaN leaves a gap
+
+    def test_validate_records(self) -> None:
+        """Test archive records are validated like candles."""
+        from stratoquant_nexus.layers.l0_archive import RECORD_DTYPE
+
+        records = np.array(
+            [
+                (0, 100.0, 101.0, 99.0, 100.0, 1.0),
+                (60_000_000, 100.0, 99.5, 99.0, 100.0, 1.0),  # High below close
+                (120_000_000, 100.0, 101.0, 99.0, 100.0, 1.0),
+                (180_000_000, 100.0, 101.0, 99.0, 100.0, -1.0),
+            ],
+            dtype=RECORD_DTYPE,
+        )
+
+        reject = _validator("reject")
+        accepted, _ = reject.validate_records("BTC/USD", Timeframe.M1, records)
+        assert accepted["timestamp"].tolist() == [0, 120_000_000]
+        assert reject.counters["rejected"] == 2
+
+        repair = _validator("repair")
+        accepted, _ = repair.validate_records("BTC/USD", Timeframe.M1, records)
+        assert accepted["high"].tolist() == [101.0, 100.0, 101.0]
+        assert records["high"][1] == 99.5  # The input is left alone
+
+        flag = _validator("flag")
+        accepted, flagged = flag.validate_records("BTC/USD", Timeframe.M1, records)
+        assert len(accepted) == 4
+        assert flagged["timestamp"].tolist() == [60_000_000, 180_000_000]
+
+
+class TestDataLayerValidation:
+    """Tests for validation in the data layer."""
+
+    @pytest.mark.asyncio
+    async def test_process_flags_candles(self) -> None:
+        """Test flagged candles are reported alongside the batch."""
+        layer = DataLayer(
+            DataLayerConfig(name="DataLayer", validation=ValidationSpec(action="flag"))
+        )
+        batch = [_candle(0), _candle(1, high=99.0)]
+
+        market_data = await layer.process(batch)
+
+        assert market_data.candles == batch
+        assert market_data.flagged == batch[1:]
+        assert layer.validation_counters["flagged"] == 1
+
+    @pytest.mark.asyncio
+    async def test_process_rejects_candles(self) -> None:
+        """Test rejected candles are neither returned nor stored."""
+        layer = DataLayer(DataLayerConfig(name="DataLayer", validation={}))
+
+        market_data = await layer.process([_candle(0), _candle(0)])
+
+        assert len(market_data.candles) == 1
+        stored = layer.get_market_data("BTC/USD")
+        assert stored is not None
+        assert len(stored.candles) == 1
+
+    @pytest.mark.asyncio
+    async def test_validation_is_optional(self) -> None:
+        """Test candles are accepted as is without validation."""
+        layer = DataLayer()
+
+        market_data = await layer.process([_candle(0), _candle(0)])
+
+        assert len(market_data.candles) == 2
+        assert layer.validation_counters == {}
@@ -0,0 +1,92 @@
+"""Compare a benchmark run against the stored baseline.
+
+Usage:
+    pytest tests/benchmarks --benchmark-json=.benchmarks/current.json
+    python tools/bench_compare.py .benchmarks/current.json --threshold 25
+    python tools/bench_compare.py .benchmarks/current.json --update
+
+Exits with status 1 when any benchmark's median is slower than the
+baseline by more than the threshold (percent).
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+DEFAULT_BASELINE = Path(__file__).parents[1] / "tests" / "benchmarks" / "baseline.json"
+
+
+def load_run(path: Path, stat: str) -> dict[str, float]:
+    """Read one statistic per benchmark from pytest-benchmark JSON output."""
+    data = json.loads(path.read_text())
+    return {bench["name"]: bench["stats"][stat] for bench in data["benchmarks"]}
+
+
+def compare(
+    baseline: dict[str, float], current: dict[str, float], threshold_pct: float
+) -> list[str]:
+    """Print a comparison table and return the regressed benchmark names."""
+    regressed = []
+    width = max(len(name) for name in baseline.keys() | current.keys())
+    print(f"{'benchmark':<{width}}  {'baseline':>11}  {'current':>11}  {'change':>8}")
+    for name in sorted(baseline.keys() | current.keys()):
+        before = baseline.get(name)
+        after = current.get(name)
+        if before is None or after is None:
+            status = "new" if before is None else "missing"
+            value = after if after is not None else before
+            print(f"{name:<{width}}  {'':>11}  {value * 1000:9.3f}ms  {status:>8}")
+            continue
+        change = (after - before) / before * 100
+        flag = ""
+        if change > threshold_pct:
+            regressed.append(name)
+            flag = "  REGRESSED"
+        print(
+            f"{name:<{width}}  {before * 1000:9.3f}ms  {after * 1000:9.3f}ms  "
+            f"{change:+7.1f}%{flag}"
+        )
+    return regressed
+
+
+def main() -> int:
+    """Parse arguments and compare or update the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("current", type=Path, help="pytest-benchmark JSON output")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=25.0,
+        help="Allowed slowdown in percent (default: %(default)s)",
+    )
+    parser.add_argument("--stat", default="median", help="Statistic to compare")
+    parser.add_argument(
+        "--update", action="store_true", help="Store the run as the new baseline"
+    )
+    args = parser.parse_args()
+
+    current = load_run(args.current, args.stat)
+    if args.update:
+        args.baseline.write_text(
+            json.dumps({"stat": args.stat, "benchmarks": current}, indent=2) + "\n"
+        )
+        print(f"Baseline updated: {args.baseline} ({len(current)} benchmarks)")
+        return 0
+
+    stored = json.loads(args.baseline.read_text())
+    if stored["stat"] != args.stat:
+        current = load_run(args.current, stored["stat"])
+    regressed = compare(stored["benchmarks"], current, args.threshold)
+    if regressed:
+        print(
+            f"\n{len(regressed)} benchmark(s) regressed by more than "
+            f"{args.threshold:g}%: {', '.join(regressed)}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Measure order round-trip latency against the local mock exchange.
+
+Usage:
+    python tools/bench_exchange_latency.py --orders 2000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from decimal import Decimal
+
+from stratoquant_nexus.exchange import (
+    HttpExchangeAdapter,
+    HttpExchangeConfig,
+    MockExchangeServer,
+)
+from stratoquant_nexus.layers.l3_execution import Order, OrderSide
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    """Return the pct-th percentile of sorted samples."""
+    index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+    return samples[index]
+
+
+async def run(orders: int, concurrency: int, latency_ms: float) -> None:
+    """Submit orders through the pooled adapter and print latency stats."""
+    async with MockExchangeServer(latency_seconds=latency_ms / 1000) as server:
+        server.set_price("BTC/USD", Decimal("42000"))
+        adapter = HttpExchangeAdapter(
+            HttpExchangeConfig(
+                base_url=server.url,
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency,
+                rate_limit_weight=orders * 2,
+            )
+        )
+        await adapter.connect()
+        semaphore = asyncio.Semaphore(concurrency)
+        samples: list[float] = []
+
+        async def submit() -> None:
+            order = Order(symbol="BTC/USD", side=OrderSide.BUY, quantity=Decimal("1"))
+            async with semaphore:
+                start = time.perf_counter_ns()
+                await adapter.submit_order(order)
+                samples.append((time.perf_counter_ns() - start) / 1e6)
+
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(submit() for _ in range(orders)))
+        wall = time.perf_counter() - wall_start
+        await adapter.close()
+
+    samples.sort()
+    print(f"orders={orders} concurrency={concurrency}")
+    print(f"connections opened: {server.connections_opened}")
+    print(f"throughput: {orders / wall:,.0f} orders/s")
+    print(
+        f"latency ms: mean={statistics.fmean(samples):.3f} "
+        f"p50={_percentile(samples, 50):.3f} "
+        f"p99={_percentile(samples, 99):.3f} "
+        f"max={samples[-1]:.3f}"
+    )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Simulated venue latency"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.orders, args.concurrency, args.latency_ms))
+
+
+if __name__ == "__main__":
+    main()
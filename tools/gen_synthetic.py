@@ -0,0 +1,63 @@
+"""Generate synthetic bars and a matching TradingView alert stream.
+
+Bars are written as columnar ``.npz`` (load with ``SyntheticBars.load``);
+alerts as one webhook JSON payload per line, ready to POST at the webhook.
+
+Usage:
+    python tools/gen_synthetic.py bars.npz --symbols 2000 --bars 5000 --seed 1
+    python tools/gen_synthetic.py bars.npz --model regime --alerts alerts.jsonl
+"""
+
+import argparse
+import json
+import time
+
+from stratoquant_nexus.synthetic import (
+    PriceModel,
+    SyntheticConfig,
+    SyntheticMarket,
+    crossover_alerts,
+)
+
+
+def main() -> None:
+    """Parse arguments and write the generated data."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("out", help="Output .npz file")
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--bars", type=int, default=1000)
+    parser.add_argument("--timeframe", default="1h")
+    parser.add_argument("--model", choices=[m.value for m in PriceModel], default="gbm")
+    parser.add_argument("--gaps", type=float, default=0.0, help="Gap probability")
+    parser.add_argument(
+        "--out-of-order", type=float, default=0.0, help="Late arrival probability"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--alerts", help="Also write alerts to this .jsonl file")
+    args = parser.parse_args()
+
+    config = SyntheticConfig(
+        symbols=args.symbols,
+        bars=args.bars,
+        timeframe=args.timeframe,
+        model=args.model,
+        gap_probability=args.gaps,
+        out_of_order_probability=args.out_of_order,
+        seed=args.seed,
+    )
+    started = time.perf_counter()
+    bars = SyntheticMarket(config).generate()
+    elapsed = time.perf_counter() - started
+    bars.save(args.out)
+    print(f"bars={len(bars):,} generated in {elapsed:.2f}s -> {args.out}")
+
+    if args.alerts:
+        alerts = crossover_alerts(bars)
+        with open(args.alerts, "w") as f:
+            for alert in alerts:
+                f.write(json.dumps(alert) + "\n")
+        print(f"alerts={len(alerts):,} -> {args.alerts}")
+
+
+if __name__ == "__main__":
+    main()
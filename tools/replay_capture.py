@@ -0,0 +1,53 @@
+"""Replay a cycle capture through a fresh engine at maximum speed.
+
+Record a capture with ``EngineConfig(record_path=...)``, then run this
+against each build to compare throughput and spot behavioural changes.
+
+Usage:
+    python tools/replay_capture.py cycles.sqrc --max-diffs 5
+"""
+
+import argparse
+import asyncio
+
+from stratoquant_nexus import TradingEngine
+from stratoquant_nexus.engine import EngineConfig
+from stratoquant_nexus.replay import CycleReplayer
+
+
+async def run(path: str, compare: bool, max_diffs: int) -> int:
+    """Replay the capture and print throughput and differences."""
+    engine = TradingEngine(EngineConfig())
+    await engine.start()
+    try:
+        result = await CycleReplayer(path).replay(
+            engine, compare=compare, max_diffs=max_diffs
+        )
+    finally:
+        await engine.stop()
+
+    print(f"cycles={result.cycles} elapsed={result.elapsed_seconds:.3f}s")
+    print(f"throughput: {result.cycles_per_second:,.0f} cycles/s")
+    if compare:
+        print(f"mismatched cycles: {result.mismatched_cycles}")
+        for diff in result.diffs:
+            print(f"  cycle {diff.cycle} {diff.layer}:")
+            print(f"    expected {diff.expected}")
+            print(f"    actual   {diff.actual}")
+    return 0 if result.matched else 1
+
+
+def main() -> None:
+    """Parse arguments and run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", help="Capture file")
+    parser.add_argument(
+        "--no-compare", action="store_true", help="Only measure throughput"
+    )
+    parser.add_argument("--max-diffs", type=int, default=10)
+    args = parser.parse_args()
+    raise SystemExit(asyncio.run(run(args.path, not args.no_compare, args.max_diffs)))
+
+
+if __name__ == "__main__":
+    main()
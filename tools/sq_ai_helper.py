@@ -1,6 +1,12 @@
 import os
 from pathlib import Path
-from openai import OpenAI
+
+try:
+    from openai import OpenAI
+except ImportError as e:  # openai is an optional extra
+    raise SystemExit(
+        "sq_ai_helper needs the 'ai' extra: pip install 'stratoquant-nexus[ai]'"
+    ) from e
 
 # Read API key from environment variable
 client = OpenAI(api_key=os.environ["OPENAI_API_KEY"])